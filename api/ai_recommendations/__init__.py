@@ -4,11 +4,10 @@ AI Recommendations Endpoint
 Provides AI-powered recommendations for specific controls or gaps.
 """
 
-import json
 import azure.functions as func
-from pathlib import Path
-from collections import defaultdict
-from shared.utils import table_client, json_response
+from shared.seed_catalog import get_seed_catalog
+from shared.utils import table_client, json_response, query_partition_entities, query_tenant_entities
+from radar_coverage.scoring import compute_control_coverage  # path set up by shared
 
 # Optional AI service import
 try:
@@ -22,25 +21,13 @@ def _calculate_gaps_for_control(tenant_id: str, control_id: str, control_entity:
     Calculate gaps for a specific control (reusing logic from gaps endpoint)
     Returns: (hard_gaps, soft_gaps, coverage_score, tenant_tools_list)
     """
-    # Load seeds for tool capabilities and control requirements
-    root = Path(__file__).resolve().parents[1]
-    tool_caps = json.loads((root / "seeds_tool_capabilities.json").read_text())
-    toolcap = defaultdict(dict)
-    for t in tool_caps:
-        toolcap[t["vendorToolId"]][t["capabilityId"]] = float(t.get("strength", 0))
-
-    control_reqs = json.loads((root / "seeds_control_requirements.json").read_text())
-    reqs_by_control = defaultdict(list)
-    for r in control_reqs:
-        reqs_by_control[r["controlId"]].append(r)
-
-    # Load vendor tools catalog
-    vendor_tools = json.loads((root / "seeds_vendor_tools.json").read_text())
-    vendor_tools_dict = {t["id"]: t for t in vendor_tools}
+    # Indexed seed catalog (parsed once per process)
+    catalog = get_seed_catalog()
+    vendor_tools_dict = catalog.vendor_tools
 
     # Load tenant tools inventory
     tt = table_client("TenantTools")
-    tenant_tools_raw = [e for e in tt.list_entities() if e.get("PartitionKey") == tenant_id]
+    tenant_tools_raw = list(query_partition_entities(tt, tenant_id, select=["RowKey", "ConfigScore", "Enabled"]))
     tenant_tools = {e["RowKey"]: float(e.get("ConfigScore", 1.0)) 
                     for e in tenant_tools_raw if e.get("Enabled", True)}
     tenant_tools_list = [
@@ -53,34 +40,13 @@ def _calculate_gaps_for_control(tenant_id: str, control_id: str, control_entity:
     ]
 
     # Calculate gaps for this control
-    reqs = reqs_by_control.get(control_id, [])
+    reqs = catalog.reqs_by_control.get(control_id, [])
     if not reqs:
         return [], [], 0.0, tenant_tools_list
 
-    coverage_score = 0.0
-    sum_w = 0.0
-    hard_gaps = []
-    soft_gaps = []
-
-    for r in reqs:
-        cap = r["capabilityId"]
-        w = float(r.get("weight", 0))
-        min_s = float(r.get("minStrength", 0))
-        sum_w += w
-        best = 0.0
-        best_tool = None
-        for tool_id, cfg in tenant_tools.items():
-            s = toolcap.get(tool_id, {}).get(cap, 0.0) * cfg
-            if s > best:
-                best = s
-                best_tool = tool_id
-        coverage_score += w * best
-        if best == 0.0:
-            hard_gaps.append({"capabilityId": cap, "weight": w})
-        elif best < min_s:
-            soft_gaps.append({"capabilityId": cap, "weight": w, "best": best, "min": min_s, "tool": best_tool})
-
-    normalized = (coverage_score / sum_w) if sum_w > 0 else 0.0
+    normalized, hard_gaps, soft_gaps = compute_control_coverage(
+        reqs, tenant_tools, catalog.toolcap, catalog.capability_tools
+    )
     return hard_gaps, soft_gaps, normalized, tenant_tools_list
 
 def main(req: func.HttpRequest) -> func.HttpResponse:
@@ -115,11 +81,10 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         if control_id:
             # Load control details
             controls = table_client("Controls")
-            control = None
-            for e in controls.list_entities():
-                if e.get("RowKey") == control_id and str(e.get("PartitionKey", "")).startswith(f"{tenant_id}|"):
-                    control = e
-                    break
+            control = next(
+                query_tenant_entities(controls, tenant_id, extra_filter="RowKey eq @rk", parameters={"rk": control_id}),
+                None,
+            )
             
             if not control:
                 return func.HttpResponse(**json_response({"error": "Control not found"}, status=404))
@@ -159,12 +124,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                     }, status=404))
                 
                 # Get available tools for this capability
-                root = Path(__file__).resolve().parents[1]
-                tool_caps = json.loads((root / "seeds_tool_capabilities.json").read_text())
-                available_tools = [
-                    t["vendorToolId"] for t in tool_caps 
-                    if t["capabilityId"] == capability_id
-                ]
+                available_tools = get_seed_catalog().tools_for_capability(capability_id)
                 
                 explanation = ai_service.explain_gap(
                     control_id=control_id,
@@ -0,0 +1,150 @@
+"""
+Assessment Event Stream API Endpoint
+
+Server-sent events for live multi-agent assessment dashboards, fed by the in-process
+event broker (src/orchestrator/event_stream.py) that EventEmitter.emit_event and
+StateManager.add_event publish to.
+
+The Functions host buffers HTTP responses, so each request is one stream segment: it
+returns the events after Last-Event-ID, waiting up to ``wait`` seconds for the first
+one, and ends. EventSource reconnects after ``retry`` ms with the Last-Event-ID of the
+last event it received, so the client sees one continuous stream.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import azure.functions as func
+
+src_path = Path(__file__).resolve().parents[1] / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from shared.utils import cors_headers, json_response
+
+try:
+    from orchestrator.event_stream import StreamBatch, get_event_broker
+    EVENT_STREAM_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Event stream not available: {e}")
+    EVENT_STREAM_AVAILABLE = False
+    StreamBatch = None
+    get_event_broker = None
+
+DEFAULT_WAIT_SECONDS = 20.0
+MAX_WAIT_SECONDS = 60.0
+DEFAULT_LIMIT = 200
+MAX_LIMIT = 1000
+RETRY_MS = 1000
+
+
+def _stream_headers() -> Dict[str, str]:
+    headers = cors_headers()
+    # EventSource sends Last-Event-ID when it reconnects
+    headers["Access-Control-Allow-Headers"] += ", Last-Event-ID"
+    headers["Cache-Control"] = "no-cache"
+    headers["X-Accel-Buffering"] = "no"
+    return headers
+
+
+def _parse_event_id(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+
+def _bounded(value: Optional[str], default: float, maximum: float) -> float:
+    try:
+        return min(max(float(value), 0.0), maximum) if value not in (None, "") else default
+    except ValueError:
+        return default
+
+
+def _frame(data: Dict[str, Any], event_id: Optional[int] = None, event: Optional[str] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def format_sse(batch: "StreamBatch", retry_ms: int = RETRY_MS) -> str:
+    """
+    SSE body for one stream segment.
+
+    Events are default ("message") frames carrying the event id; ``reset`` tells the
+    client events were missed and it should reload the assessment once; ``end`` that
+    the assessment finished and the client can close the EventSource.
+    """
+    parts = [f"retry: {retry_ms}\n\n"]
+    if batch.reset:
+        resume_id = batch.events[0][0] - 1 if batch.events else batch.last_event_id
+        parts.append(_frame({"missed": batch.missed}, event_id=resume_id, event="reset"))
+    for event_id, event in batch.events:
+        parts.append(_frame(event, event_id=event_id))
+    if batch.closed:
+        parts.append(_frame({"last_event_id": batch.last_event_id}, event_id=batch.last_event_id, event="end"))
+    elif not batch.events and not batch.reset:
+        parts.append(": keepalive\n\n")
+    return "".join(parts)
+
+
+def main(req: func.HttpRequest) -> func.HttpResponse:
+    """
+    Stream assessment events.
+
+    Endpoints:
+    - GET /api/tenant/{tenantId}/multi-agent-assessment/{assessmentId}/events
+        Server-sent events after the Last-Event-ID header (or ?lastEventId=);
+        ?wait= seconds to wait for new events (default 20, max 60),
+        ?limit= most events per segment (default 200, max 1000)
+    """
+    if req.method == "OPTIONS":
+        return func.HttpResponse(status_code=200, headers=_stream_headers())
+
+    tenant_id = req.route_params.get("tenantId")
+    assessment_id = req.route_params.get("assessmentId")
+    if not tenant_id or not assessment_id:
+        return func.HttpResponse(
+            **json_response({"error": "tenantId and assessmentId are required"}, status=400)
+        )
+
+    if not EVENT_STREAM_AVAILABLE:
+        return func.HttpResponse(
+            **json_response({"error": "Event stream not available"}, status=503)
+        )
+
+    broker = get_event_broker()
+    if not broker.has_channel(assessment_id):
+        return func.HttpResponse(
+            **json_response({
+                "error": "No live event stream for assessment",
+                "assessment_id": assessment_id,
+                "message": "The assessment is not running on this instance; poll its status instead."
+            }, status=404)
+        )
+    if broker.tenant(assessment_id) not in (None, tenant_id):
+        return func.HttpResponse(
+            **json_response({"error": "Access denied"}, status=403)
+        )
+
+    last_event_id = _parse_event_id(req.headers.get("Last-Event-ID") or req.params.get("lastEventId"))
+    wait = _bounded(req.params.get("wait"), DEFAULT_WAIT_SECONDS, MAX_WAIT_SECONDS)
+    limit = int(_bounded(req.params.get("limit"), DEFAULT_LIMIT, MAX_LIMIT)) or 1
+
+    batch = broker.read(assessment_id, last_event_id, limit=limit, timeout=wait)
+    if batch is None:
+        # Evicted while waiting
+        batch = StreamBatch(last_event_id=last_event_id or 0, closed=True)
+
+    return func.HttpResponse(
+        body=format_sse(batch),
+        status_code=200,
+        mimetype="text/event-stream",
+        headers=_stream_headers(),
+    )
@@ -6,7 +6,7 @@ Returns controls for a tenant with optional filtering by domain, status, and sea
 
 import logging
 import azure.functions as func
-from shared.utils import table_client, json_response
+from shared.utils import table_client, json_response, query_tenant_entities
 
 logger = logging.getLogger(__name__)
 
@@ -43,12 +43,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             partition_key = f"{tenant_id}|{safe_domain}"
             entities = list(table.query_entities(f"PartitionKey eq '{partition_key}'"))
         else:
-            # List all for tenant (filter client-side)
-            prefix = f"{tenant_id}|"
-            entities = [
-                e for e in table.list_entities()
-                if str(e.get("PartitionKey", "")).startswith(prefix)
-            ]
+            # All domains for the tenant (PartitionKey range, server-side)
+            entities = list(query_tenant_entities(table, tenant_id))
         
         # Apply status filter
         if status:
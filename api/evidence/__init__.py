@@ -4,15 +4,18 @@ Evidence Upload and Management Endpoint
 Handles evidence file uploads to Blob Storage with auto-classification.
 """
 
+import binascii
 import json
 import logging
-import os
+import mimetypes
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 import azure.functions as func
-from azure.storage.blob import generate_container_sas, ContainerSasPermissions, BlobSasPermissions, generate_blob_sas
+from azure.storage.blob import ContentSettings
+from shared.evidence_catalog import PAGE_SIZE, SasSigner, evidence_prefix, list_evidence_page
 from shared.utils import table_client, json_response, blob_container
+from radar_storage.blob_upload import UploadTooLarge, base64_decoded_size, iter_base64, stream_upload  # path set up by shared
 
 # Optional AI service import for auto-classification
 try:
@@ -29,47 +32,15 @@ def _get_evidence_blob_path(tenant_id: str, control_id: str, filename: str) -> s
     """Generate blob path for evidence: assessments/{tenantId}/evidence/{controlId}/{filename}"""
     # Sanitize filename
     safe_filename = "".join(c for c in filename if c.isalnum() or c in ".-_")[:255]
-    return f"assessments/{tenant_id}/evidence/{control_id}/{safe_filename}"
+    return f"{evidence_prefix(tenant_id, control_id)}{safe_filename}"
 
 def _generate_sas_url(blob_name: str, permission: str = "read", expiry_hours: int = 24) -> str:
-    """Generate SAS URL for blob access"""
+    """Generate SAS URL for blob access (None if the blob client has no account key)"""
     try:
-        from azure.storage.blob import BlobServiceClient
-        from azure.core.credentials import AzureNamedKeyCredential
-        
-        account_key = os.getenv("BLOBS_CONN")
-        if not account_key:
-            return None
-        
-        # Parse connection string
-        blob_service = BlobServiceClient.from_connection_string(account_key)
-        container = blob_container()
-        
-        # Get account key from connection string
-        # Connection string format: "AccountName=...;AccountKey=...;EndpointSuffix=..."
-        conn_parts = dict(part.split('=', 1) for part in account_key.split(';') if '=' in part)
-        account_name = conn_parts.get('AccountName')
-        account_key_value = conn_parts.get('AccountKey')
-        
-        if not account_name or not account_key_value:
-            return None
-        
-        # Generate SAS token
-        sas_token = generate_blob_sas(
-            account_name=account_name,
-            container_name=container.container_name,
-            blob_name=blob_name,
-            account_key=account_key_value,
-            permission=BlobSasPermissions(read=True) if permission == "read" else BlobSasPermissions(read=True, write=True),
-            expiry=datetime.utcnow() + timedelta(hours=expiry_hours)
-        )
-        
-        # Build URL
-        endpoint_suffix = conn_parts.get('EndpointSuffix', 'core.windows.net')
-        blob_url = f"https://{account_name}.blob.{endpoint_suffix}/{container.container_name}/{blob_name}?{sas_token}"
-        return blob_url
+        return SasSigner(blob_container(), expiry_hours=expiry_hours, write=permission != "read").url(blob_name)
     except Exception as e:
         # Fallback: return blob path without SAS if generation fails
+        logging.warning("Could not generate SAS URL for %s: %s", blob_name, e)
         return None
 
 def main(req: func.HttpRequest) -> func.HttpResponse:
@@ -91,50 +62,31 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     try:
         container = blob_container()
         
-        # GET: List evidence for a control
+        # GET: List evidence for a control (paged; pass continuationToken for the next page)
         if req.method == "GET" and not filename:
-            evidence_list = []
-            prefix = _get_evidence_blob_path(tenant_id, control_id, "")
-            
-            # List blobs with this prefix
-            blobs = container.list_blobs(name_starts_with=prefix)
+            try:
+                page_size = int(req.params.get("pageSize") or PAGE_SIZE)
+            except ValueError:
+                return func.HttpResponse(**json_response({"error": "pageSize must be an integer"}, status=400))
             
-            # Also check Evidence table for metadata
+            # Evidence table holds classification metadata; listing still works without it
             try:
                 evidence_table = table_client("Evidence")
-                evidence_entities = [
-                    e for e in evidence_table.list_entities()
-                    if e.get("PartitionKey") == tenant_id and e.get("ControlID") == control_id
-                ]
-                metadata_by_filename = {e.get("FileName"): e for e in evidence_entities}
             except Exception as e:
                 logging.warning("Could not load evidence metadata: %s", e)
-                metadata_by_filename = {}
+                evidence_table = None
             
-            for blob in blobs:
-                blob_name = blob.name
-                file_name = blob_name.split("/")[-1]
-                
-                metadata = metadata_by_filename.get(file_name, {})
-                
-                # Generate download URL (SAS)
-                download_url = _generate_sas_url(blob_name, permission="read", expiry_hours=24)
-                
-                evidence_list.append({
-                    "fileName": file_name,
-                    "size": blob.size,
-                    "uploadedAt": blob.last_modified.isoformat() if blob.last_modified else None,
-                    "downloadUrl": download_url,
-                    "blobPath": blob_name,
-                    "classification": {
-                        "category": metadata.get("Category", "unknown"),
-                        "sensitivity_level": metadata.get("SensitivityLevel", "internal"),
-                        "content_type": metadata.get("ContentType", ""),
-                        "confidence": float(metadata.get("Confidence", 0.0))
-                    } if metadata else None
-                })
+            page = list_evidence_page(
+                container, evidence_table, tenant_id, control_id,
+                page_size=page_size,
+                continuation_token=req.params.get("continuationToken"),
+            )
             
-            return func.HttpResponse(**json_response({"items": evidence_list, "total": len(evidence_list)}))
+            return func.HttpResponse(**json_response({
+                "items": page.items,
+                "total": len(page.items),
+                "continuationToken": page.continuation_token,
+            }))
         
         # GET: Get download URL for specific file
         if req.method == "GET" and filename:
@@ -157,14 +109,11 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             
             # Check for base64 encoded file
             if "file" in body and "fileName" in body:
-                import base64
-                try:
-                    # Decode base64 file content
-                    file_content = base64.b64decode(body["file"])
-                    original_filename = body["fileName"]
-                except Exception as e:
+                encoded = body["file"]
+                original_filename = body["fileName"]
+                if not isinstance(encoded, str) or not isinstance(original_filename, str):
                     return func.HttpResponse(**json_response({
-                        "error": f"Invalid file data: {str(e)}"
+                        "error": "Invalid file data: 'file' and 'fileName' must be strings"
                     }, status=400))
             else:
                 # Try multipart form data (if supported)
@@ -180,7 +129,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                     "error": f"File type not allowed. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
                 }, status=400))
             
-            if len(file_content) > MAX_FILE_SIZE:
+            # Size check on the encoded length, before decoding anything
+            if base64_decoded_size(encoded) > MAX_FILE_SIZE:
                 return func.HttpResponse(**json_response({
                     "error": f"File too large. Max size: {MAX_FILE_SIZE / 1024 / 1024}MB"
                 }, status=400))
@@ -190,15 +140,47 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             if not safe_filename:
                 safe_filename = f"evidence_{uuid.uuid4().hex[:8]}{file_ext}"
             
-            # Upload to blob storage
+            # Stream to blob storage: decode and stage blocks chunk by chunk, hashing as we go
             blob_path = _get_evidence_blob_path(tenant_id, control_id, safe_filename)
             blob_client = container.get_blob_client(blob_path)
-            blob_client.upload_blob(file_content, overwrite=True)
+            try:
+                upload = stream_upload(
+                    blob_client,
+                    iter_base64(encoded),
+                    max_size=MAX_FILE_SIZE,
+                    content_settings=ContentSettings(
+                        content_type=mimetypes.guess_type(safe_filename)[0] or "application/octet-stream"
+                    ),
+                )
+            except (binascii.Error, UploadTooLarge) as e:
+                return func.HttpResponse(**json_response({
+                    "error": f"Invalid file data: {str(e)}"
+                }, status=400))
             
-            # Auto-classify using AI if available
-            classification = None
             description = body.get("description", "") or f"Evidence file: {safe_filename}"
-            if AI_AVAILABLE:
+            try:
+                evidence_table = table_client("Evidence")
+            except Exception as e:
+                logging.warning("Evidence table unavailable: %s", e)
+                evidence_table = None
+            
+            # Dedup: same file content and description as the stored row -> reuse its classification
+            classification = None
+            previous = None
+            if evidence_table is not None:
+                try:
+                    previous = evidence_table.get_entity(tenant_id, f"{control_id}|{safe_filename}")
+                except Exception:
+                    previous = None
+            if previous and previous.get("Sha256") == upload.sha256 and previous.get("Description") == description:
+                classification = {
+                    "category": previous.get("Category", "other"),
+                    "sensitivity_level": previous.get("SensitivityLevel", "internal"),
+                    "content_type": previous.get("ContentType", ""),
+                    "confidence": previous.get("Confidence", 0.0),
+                }
+            elif AI_AVAILABLE:
+                # Auto-classify using AI if available
                 try:
                     ai_service = get_ai_service()
                     classification = ai_service.classify_evidence(
@@ -211,14 +193,16 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             
             # Store metadata in Evidence table
             try:
-                evidence_table = table_client("Evidence")
+                if evidence_table is None:
+                    raise RuntimeError("Evidence table unavailable")
                 evidence_entity = {
                     "PartitionKey": tenant_id,
                     "RowKey": f"{control_id}|{safe_filename}",
                     "ControlID": control_id,
                     "FileName": safe_filename,
                     "BlobPath": blob_path,
-                    "Size": len(file_content),
+                    "Size": upload.size,
+                    "Sha256": upload.sha256,
                     "UploadedAt": datetime.utcnow().isoformat(),
                     "UploadedBy": req.headers.get("x-ms-client-principal-name", "unknown"),
                     "Category": classification.get("category", "other") if classification else "other",
@@ -239,7 +223,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 "success": True,
                 "fileName": safe_filename,
                 "blobPath": blob_path,
-                "size": len(file_content),
+                "size": upload.size,
+                "sha256": upload.sha256,
                 "downloadUrl": download_url,
                 "classification": classification
             }))
@@ -4,11 +4,12 @@ Import Controls Endpoint
 Imports controls from CSV or JSON into a tenant's assessment.
 """
 
-import csv
 import io
 import logging
 import azure.functions as func
 from shared.utils import table_client, json_response
+from radar_storage.control_import import BulkControlImporter, ImportReport, iter_csv_rows  # path set up by shared
+from radar_storage.control_summary import SUMMARY_TABLE, domain_of, refresh_domains
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +20,6 @@ EXPECTED_HEADERS = [
 ]
 
 
-def parse_csv_bytes(data: bytes) -> list:
-    """Parse CSV bytes into list of dicts."""
-    text = data.decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(text))
-    return list(reader)
-
-
 def main(req: func.HttpRequest) -> func.HttpResponse:
     """
     Import controls from CSV or JSON.
@@ -55,7 +49,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     content_type = req.headers.get("content-type", "")
     rows = []
     
-    # Parse input based on content type
+    # Parse input based on content type (CSV rows are streamed into the importer)
     try:
         if "application/json" in content_type:
             payload = req.get_json()
@@ -73,89 +67,36 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                     {"error": "Request body is empty"},
                     status=400
                 ))
-            rows = parse_csv_bytes(body)
+            # Decoded as it is parsed; bytes that are not UTF-8 are reported as a row error
+            rows = iter_csv_rows(io.BytesIO(body))
     except ValueError as e:
         return func.HttpResponse(**json_response(
             {"error": "Invalid JSON body", "message": str(e)},
             status=400
         ))
-    except UnicodeDecodeError as e:
-        return func.HttpResponse(**json_response(
-            {"error": "Invalid CSV encoding. Use UTF-8.", "message": str(e)},
-            status=400
-        ))
     except Exception as e:
         return func.HttpResponse(**json_response(
             {"error": "Invalid body. Send JSON array or CSV.", "message": str(e)},
             status=400
         ))
 
-    # Validate and upsert controls
-    inserted = 0
-    skipped = 0
-    errors = []
-    
-    for idx, row in enumerate(rows):
+    # Validate and upsert controls: batch transactions per partition, per-row errors
+    # (malformed CSV records and bad encoding included)
+    report = ImportReport()
+    try:
+        BulkControlImporter(table).run(tenant_id, rows, report)
+    except Exception as e:
+        logger.exception("Control import failed")
+        return func.HttpResponse(**json_response(
+            {"error": "Control import failed", "message": str(e), "inserted": report.inserted},
+            status=500
+        ))
+    finally:
+        # Keep the ControlSummary projection in step with whatever was written, even if
+        # the import stopped partway
         try:
-            # Get control ID
-            control_id = row.get("ControlID", "").strip()
-            if not control_id:
-                skipped += 1
-                continue
-            
-            # Derive domain code from ControlID (e.g., SEC-NET-0001 -> NET)
-            domain_code = ""
-            if control_id.startswith("SEC-") and "-" in control_id[4:]:
-                domain_code = control_id.split("-")[1]
-            else:
-                domain_code = row.get("DomainCode", "").strip()
-            
-            # Require domain
-            domain = row.get("Domain", "").strip()
-            if not domain:
-                errors.append(f"Row {idx + 1}: Missing Domain for {control_id}")
-                skipped += 1
-                continue
-            
-            # Parse numeric fields safely
-            def safe_float(val, default=0.0):
-                if val is None or str(val).strip() == "":
-                    return default
-                try:
-                    return float(val)
-                except (TypeError, ValueError):
-                    return default
-            
-            entity = {
-                "PartitionKey": f"{tenant_id}|{domain_code}",
-                "RowKey": control_id,
-                "Domain": domain,
-                "ControlTitle": row.get("ControlTitle", ""),
-                "ControlDescription": row.get("ControlDescription", ""),
-                "Question": row.get("Question", ""),
-                "RequiredEvidence": row.get("RequiredEvidence", ""),
-                "Status": row.get("Status", "NotStarted"),
-                "Owner": row.get("Owner", ""),
-                "Frequency": row.get("Frequency", ""),
-                "ScoreNumeric": safe_float(row.get("ScoreNumeric")),
-                "Weight": safe_float(row.get("Weight")),
-                "Notes": row.get("Notes", ""),
-                "SourceRef": row.get("SourceRef", ""),
-                "Tags": row.get("Tags", ""),
-                "UpdatedAt": row.get("UpdatedAt", "")
-            }
-            
-            table.upsert_entity(entity)
-            inserted += 1
-            
-        except Exception as e:
-            errors.append(f"Row {idx + 1}: {str(e)}")
-            skipped += 1
+            refresh_domains(table, table_client(SUMMARY_TABLE), tenant_id, (domain_of(pk) for pk in report.partitions))
+        except Exception:
+            logger.exception("Failed to refresh control summary for tenant %s", tenant_id)
     
-    return func.HttpResponse(**json_response({
-        "success": True,
-        "inserted": inserted,
-        "skipped": skipped,
-        "totalRows": len(rows),
-        "errors": errors[:10] if errors else None  # Limit error messages
-    }))
+    return func.HttpResponse(**json_response(report.to_dict()))
@@ -29,12 +29,20 @@ try:
     
     from orchestrator.initialize import initialize_orchestrator
     from orchestrator.state import StateManager
+    from orchestrator.event_stream import get_event_broker
     ORCHESTRATOR_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Orchestrator not available: {e}")
     ORCHESTRATOR_AVAILABLE = False
     initialize_orchestrator = None
     StateManager = None
+    get_event_broker = None
+
+try:
+    from models.providers import aclose_http_client
+except ImportError:
+    # Provider mode unavailable (openai / azure-identity missing)
+    aclose_http_client = None
 
 
 def main(req: func.HttpRequest) -> func.HttpResponse:
@@ -121,7 +129,14 @@ def _start_assessment(req: func.HttpRequest, tenant_id: str) -> func.HttpRespons
             try:
                 final_state = loop.run_until_complete(graph.run(initial_state))
             finally:
-                loop.close()
+                try:
+                    if aclose_http_client is not None:
+                        # Model HTTP pools are per loop; release this one's connections
+                        loop.run_until_complete(aclose_http_client())
+                finally:
+                    loop.close()
+                # Live subscribers (assessment_events) get an end frame
+                get_event_broker().close(assessment_id)
             
             # Extract results
             results = {
@@ -141,6 +156,11 @@ def _start_assessment(req: func.HttpRequest, tenant_id: str) -> func.HttpRespons
                 }
             }
             
+            # Retrieval decisions the local policy settled (one model call saved each)
+            rag_retriever = graph.config.rag_retriever
+            if hasattr(rag_retriever, "stats"):
+                results["retrieval_stats"] = rag_retriever.stats()
+            
             return func.HttpResponse(**json_response(results))
             
         except asyncio.TimeoutError:
@@ -4,11 +4,11 @@ Report Generation Endpoint
 Generates AI-powered executive summaries and assessment reports.
 """
 
-import json
 import azure.functions as func
-from pathlib import Path
 from collections import defaultdict
-from shared.utils import table_client, json_response
+from shared.seed_catalog import get_seed_catalog
+from shared.utils import table_client, json_response, query_partition_entities, query_tenant_entities
+from radar_coverage.coverage_engine import get_coverage_engine  # path set up by shared
 
 # Optional AI service import
 try:
@@ -35,7 +35,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     
     # Load summary data (by domain)
     table = table_client("Controls")
-    items = [e for e in table.list_entities() if str(e.get("PartitionKey", "")).startswith(f"{tenant_id}|")]
+    items = list(query_tenant_entities(table, tenant_id, select=["PartitionKey", "RowKey", "Status", "ControlTitle"]))
     agg = defaultdict(lambda: {"total": 0, "complete": 0, "inProgress": 0, "notStarted": 0})
     for e in items:
         domain = str(e["PartitionKey"]).split("|", 1)[1]
@@ -50,54 +50,24 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     
     summary_by_domain = [{"domain": d, **v} for d, v in agg.items()]
     
-    # Load gaps data
-    root = Path(__file__).resolve().parents[1]
-    tool_caps = json.loads((root / "seeds_tool_capabilities.json").read_text())
-    toolcap = defaultdict(dict)
-    for t in tool_caps:
-        toolcap[t["vendorToolId"]][t["capabilityId"]] = float(t.get("strength", 0))
-    
-    control_reqs = json.loads((root / "seeds_control_requirements.json").read_text())
-    reqs_by_control = defaultdict(list)
-    for r in control_reqs:
-        reqs_by_control[r["controlId"]].append(r)
+    # Load gaps data (indexed seed catalog, parsed once per process)
+    catalog = get_seed_catalog()
     
     # Load tenant tools inventory
     tt = table_client("TenantTools")
-    tenant_tools_raw = [e for e in tt.list_entities() if e.get("PartitionKey") == tenant_id]
+    tenant_tools_raw = list(query_partition_entities(tt, tenant_id, select=["RowKey", "ConfigScore", "Enabled"]))
     tenant_tools = {e["RowKey"]: float(e.get("ConfigScore", 1.0)) 
                     for e in tenant_tools_raw if e.get("Enabled", True)}
     
     # Calculate gaps for all controls
     gaps_summary = []
+    coverage = get_coverage_engine(catalog).evaluate(tenant_tools, (e["RowKey"] for e in items))
     for e in items:
         control_id = e["RowKey"]
-        reqs = reqs_by_control.get(control_id, [])
-        if not reqs:
+        if control_id not in coverage:
             continue
         
-        coverage_score = 0.0
-        sum_w = 0.0
-        hard_gaps = []
-        soft_gaps = []
-        
-        for r in reqs:
-            cap = r["capabilityId"]
-            w = float(r.get("weight", 0))
-            min_s = float(r.get("minStrength", 0))
-            sum_w += w
-            best = 0.0
-            for tool_id, cfg in tenant_tools.items():
-                s = toolcap.get(tool_id, {}).get(cap, 0.0) * cfg
-                if s > best:
-                    best = s
-            coverage_score += w * best
-            if best == 0.0:
-                hard_gaps.append({"capabilityId": cap, "weight": w})
-            elif best < min_s:
-                soft_gaps.append({"capabilityId": cap, "weight": w, "best": best, "min": min_s})
-        
-        normalized = (coverage_score / sum_w) if sum_w > 0 else 0.0
+        normalized, hard_gaps, soft_gaps = coverage[control_id]
         
         if hard_gaps or soft_gaps:
             gaps_summary.append({
@@ -4,8 +4,18 @@ SecAI Radar Shared Utilities
 Common utilities, services, and helpers used across API endpoints.
 """
 
+import sys
+from pathlib import Path
+
+# Shared packages from a repo checkout (the Functions build installs them into
+# .python_packages instead)
+_packages = Path(__file__).resolve().parents[2] / "packages"
+for _package in ("storage", "coverage"):
+    if (_packages / _package / "src").is_dir() and str(_packages / _package / "src") not in sys.path:
+        sys.path.insert(0, str(_packages / _package / "src"))
+
 from shared.utils import table_client, blob_container, json_response, cors_headers
-from shared.scoring import compute_control_coverage
+from radar_coverage.scoring import compute_control_coverage
 
 __all__ = [
     "table_client",
@@ -11,7 +11,7 @@ Provides AI-powered features including:
 import os
 from typing import List, Dict, Optional, Iterator
 from openai import AzureOpenAI
-from openai.types.chat import ChatCompletionChunk
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 # Import Key Vault service for secure secret retrieval
 try:
@@ -22,6 +22,9 @@ except ImportError:
     def get_secret_from_key_vault_or_env(secret_name: str, env_var_name: Optional[str] = None) -> Optional[str]:
         return os.getenv(env_var_name or secret_name)
 
+from shared.llm_cache import get_llm_cache
+
+
 class AzureOpenAIService:
     """Service for interacting with Azure OpenAI GPT models"""
     
@@ -49,6 +52,9 @@ class AzureOpenAIService:
             azure_endpoint=self.endpoint,
             api_key=self.api_key,
         )
+        
+        # Response cache for non-streaming calls (None when disabled)
+        self.cache = get_llm_cache()
     
     def chat_completion(
         self,
@@ -70,7 +76,21 @@ class AzureOpenAIService:
             
         Returns:
             Response object or stream iterator
+            
+        Non-streaming responses go through the LLM response cache (shared.llm_cache).
         """
+        lookup = None
+        if self.cache is not None and not stream:
+            lookup = self.cache.lookup(
+                "chat_completion", self.deployment, messages,
+                temperature=temperature, max_tokens=max_tokens, top_p=top_p,
+            )
+            if lookup.hit:
+                try:
+                    return ChatCompletion.model_validate_json(lookup.value)
+                except ValueError:
+                    pass  # written by an incompatible SDK version; refresh it
+        
         response = self.client.chat.completions.create(
             stream=stream,
             messages=messages,
@@ -79,6 +99,8 @@ class AzureOpenAIService:
             top_p=top_p,
             model=self.deployment,
         )
+        if lookup is not None and response.choices and response.choices[0].message.content:
+            self.cache.store(lookup, response.model_dump_json())
         return response
     
     def generate_recommendation(
@@ -0,0 +1,140 @@
+"""
+SecAI Radar Evidence Catalog
+
+Paged evidence listing for GET /tenant/{tenantId}/evidence/{controlId}:
+
+- Blobs are listed under the control's prefix one page at a time; the Blob service
+  continuation token is passed back to the client as ``continuationToken``.
+- Evidence metadata rows (PartitionKey=tenant, RowKey="{controlId}|{fileName}") are
+  read with a RowKey range covering just the files on the page.
+- SAS URLs for the page are signed with one SasSigner, which takes the account name
+  and key from the process-wide BlobServiceClient instead of re-parsing BLOBS_CONN
+  per file.
+
+Environment:
+    EVIDENCE_PAGE_SIZE: blobs per page when the client does not ask (default 100)
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
+from shared.utils import query_partition_entities
+
+PAGE_SIZE = int(os.getenv("EVIDENCE_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = 5000  # Blob service maximum per list page
+
+METADATA_COLUMNS = ["RowKey", "FileName", "Category", "SensitivityLevel", "ContentType", "Confidence"]
+
+
+def evidence_prefix(tenant_id: str, control_id: str) -> str:
+    """Blob prefix for a control's evidence: assessments/{tenantId}/evidence/{controlId}/"""
+    return f"assessments/{tenant_id}/evidence/{control_id}/"
+
+
+class SasSigner:
+    """Signs blob SAS URLs for one container with a single expiry and account key."""
+
+    def __init__(self, container, expiry_hours: int = 24, write: bool = False):
+        credential = getattr(container, "credential", None)
+        self.account_name = getattr(credential, "account_name", None) or getattr(container, "account_name", None)
+        self.account_key = getattr(credential, "account_key", None)
+        self.container_name = container.container_name
+        self.container_url = container.url.rstrip("/")
+        self.permission = BlobSasPermissions(read=True, write=write)
+        self.expiry = datetime.utcnow() + timedelta(hours=expiry_hours)
+
+    @property
+    def enabled(self) -> bool:
+        """False when the client has no shared key (e.g. SAS or AAD connection)."""
+        return bool(self.account_name and self.account_key)
+
+    def url(self, blob_name: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        token = generate_blob_sas(
+            account_name=self.account_name,
+            container_name=self.container_name,
+            blob_name=blob_name,
+            account_key=self.account_key,
+            permission=self.permission,
+            expiry=self.expiry,
+        )
+        return f"{self.container_url}/{quote(blob_name)}?{token}"
+
+
+@dataclass
+class EvidencePage:
+    items: List[Dict[str, Any]]
+    continuation_token: Optional[str]
+
+
+def _metadata_for(evidence_table, tenant_id: str, control_id: str, file_names: List[str]) -> Dict[str, Dict]:
+    """Evidence rows for the given files, via one RowKey range within the tenant partition."""
+    if not file_names:
+        return {}
+    entities = query_partition_entities(
+        evidence_table,
+        tenant_id,
+        select=METADATA_COLUMNS,
+        extra_filter="RowKey ge @rk_lo and RowKey le @rk_hi",
+        parameters={"rk_lo": f"{control_id}|{min(file_names)}", "rk_hi": f"{control_id}|{max(file_names)}"},
+    )
+    return {e.get("FileName") or e["RowKey"].split("|", 1)[-1]: e for e in entities}
+
+
+def _classification(metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not metadata:
+        return None
+    return {
+        "category": metadata.get("Category", "unknown"),
+        "sensitivity_level": metadata.get("SensitivityLevel", "internal"),
+        "content_type": metadata.get("ContentType", ""),
+        "confidence": float(metadata.get("Confidence", 0.0)),
+    }
+
+
+def list_evidence_page(
+    container,
+    evidence_table,
+    tenant_id: str,
+    control_id: str,
+    page_size: int = PAGE_SIZE,
+    continuation_token: Optional[str] = None,
+    signer: Optional[SasSigner] = None,
+) -> EvidencePage:
+    """
+    One page of evidence for a control.
+
+    ``evidence_table`` may be None (metadata unavailable); files are then returned
+    without classification.
+    """
+    prefix = evidence_prefix(tenant_id, control_id)
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    pages = container.list_blobs(name_starts_with=prefix, results_per_page=page_size).by_page(
+        continuation_token=continuation_token
+    )
+    blobs = list(next(pages, []))
+    next_token = pages.continuation_token
+
+    file_names = [blob.name[len(prefix):] for blob in blobs]
+    metadata = {}
+    if evidence_table is not None:
+        metadata = _metadata_for(evidence_table, tenant_id, control_id, file_names)
+
+    signer = signer or SasSigner(container)
+    items = []
+    for blob, file_name in zip(blobs, file_names):
+        items.append({
+            "fileName": file_name,
+            "size": blob.size,
+            "uploadedAt": blob.last_modified.isoformat() if blob.last_modified else None,
+            "downloadUrl": signer.url(blob.name),
+            "blobPath": blob.name,
+            "classification": _classification(metadata.get(file_name, {})),
+        })
+    return EvidencePage(items=items, continuation_token=next_token or None)
@@ -0,0 +1,280 @@
+"""
+SecAI Radar LLM Response Cache
+
+Caches chat completions under AzureOpenAIService.chat_completion and ModelLayer, so
+agents, evaluators and AI endpoints that resend the same prompt for the same controls
+and gaps (across tenants and reruns) skip the model call:
+
+1. Exact match: key = SHA-256 over the normalized (namespace, model, messages,
+   temperature, max_tokens, other parameters); message text is whitespace-normalized.
+2. Similar match (optional): for low-temperature calls, the last user message is
+   embedded and compared (cosine) with cached calls that share everything else, i.e.
+   the same model, parameters and preceding messages.
+3. Store: a SQLite file, so entries survive restarts and are shared by the workers of
+   one host. Entries expire after the TTL; the least recently used are evicted past
+   max_entries.
+
+Hit/miss counters are kept per process (stats()).
+
+Environment:
+    LLM_CACHE_TTL_HOURS: entry lifetime (default 24; 0 disables the cache)
+    LLM_CACHE_PATH: SQLite file (default <tempdir>/secai-llm-cache.sqlite3)
+    LLM_CACHE_MAX_ENTRIES: LRU bound (default 5000)
+    LLM_CACHE_EMBEDDING_DEPLOYMENT: Azure OpenAI embedding deployment; enables similar match
+    LLM_CACHE_SIMILARITY: min cosine similarity for a similar match (default 0.97)
+    LLM_CACHE_SEMANTIC_MAX_TEMPERATURE: similar match only at or below this (default 0.3)
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), "secai-llm-cache.sqlite3")
+# Similar-match candidates scanned per lookup (most recently used first)
+_MAX_CANDIDATES = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+def _normalize_text(text: Any) -> Any:
+    return _WHITESPACE.sub(" ", text).strip() if isinstance(text, str) else text
+
+
+def _normalize_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{k: _normalize_text(v) for k, v in sorted(m.items())} for m in messages]
+
+
+def _digest(payload: Dict[str, Any]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+@dataclass
+class CacheLookup:
+    """Result of LLMResponseCache.lookup; pass it back to store() on a miss."""
+    key: str
+    bucket: str
+    query: Optional[str]
+    value: Optional[str] = None
+    similar: bool = False
+    embedding: Optional[Sequence[float]] = None
+
+    @property
+    def hit(self) -> bool:
+        return self.value is not None
+
+
+class LLMResponseCache:
+    """Disk-backed exact (and optionally similar) match cache for chat completions."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 5000,
+        embed: Optional[Embedder] = None,
+        similarity: float = 0.97,
+        semantic_max_temperature: float = 0.3,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.embed = embed
+        self.similarity = similarity
+        self.semantic_max_temperature = semantic_max_temperature
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "similar_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0}
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL" if path != ":memory:" else "PRAGMA journal_mode=MEMORY")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, bucket TEXT NOT NULL, value TEXT NOT NULL,"
+            " embedding BLOB, created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_bucket ON responses (bucket, accessed)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def _count(self, name: str) -> None:
+        self._stats[name] += 1
+
+    def lookup(
+        self,
+        namespace: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **params: Any,
+    ) -> CacheLookup:
+        """Find a cached response for the call; ``lookup.hit`` tells whether one was found."""
+        normalized = _normalize_messages(messages)
+        call = {
+            "namespace": namespace,
+            "model": model,
+            "temperature": round(temperature, 3) if temperature is not None else None,
+            "max_tokens": max_tokens,
+            "params": params,
+        }
+        key = _digest({**call, "messages": normalized})
+        # Everything but the last user message: calls that may be answered by a similar one
+        last_user = max((i for i, m in enumerate(normalized) if m.get("role") == "user"), default=None)
+        query = normalized[last_user].get("content") if last_user is not None else None
+        context = [m for i, m in enumerate(normalized) if i != last_user]
+        result = CacheLookup(key=key, bucket=_digest({**call, "messages": context}), query=query)
+
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row and now - row[1] > self.ttl_seconds:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._count("expired")
+                row = None
+            if row:
+                self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                self._count("hits")
+                result.value = row[0]
+                return result
+
+        if self._semantic_enabled(temperature) and isinstance(query, str) and query:
+            self._similar(result, now)
+        with self._lock:
+            self._count("similar_hits" if result.hit else "misses")
+        return result
+
+    def _semantic_enabled(self, temperature: Optional[float]) -> bool:
+        return self.embed is not None and temperature is not None and temperature <= self.semantic_max_temperature
+
+    def _similar(self, result: CacheLookup, now: float) -> None:
+        try:
+            result.embedding = list(self.embed(result.query))
+        except Exception as e:
+            logger.warning("LLM cache embedding failed: %s", e)
+            return
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, value, embedding FROM responses"
+                " WHERE bucket = ? AND embedding IS NOT NULL AND created >= ?"
+                " ORDER BY accessed DESC LIMIT ?",
+                (result.bucket, now - self.ttl_seconds, _MAX_CANDIDATES),
+            ).fetchall()
+        best_key, best_value, best_score = None, None, self.similarity
+        for key, value, blob in rows:
+            score = _cosine(result.embedding, array("f", blob))
+            if score >= best_score:
+                best_key, best_value, best_score = key, value, score
+        if best_key is not None:
+            with self._lock:
+                self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, best_key))
+            result.value = best_value
+            result.similar = True
+
+    def store(self, lookup: CacheLookup, value: str) -> None:
+        """Cache the response for a missed lookup."""
+        if not value:
+            return
+        # Embedded at lookup, and only for calls eligible for a similar match
+        embedding = lookup.embedding
+        blob = array("f", embedding).tobytes() if embedding is not None else None
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, bucket, value, embedding, created, accessed)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (lookup.key, lookup.bucket, value, blob, now, now),
+            )
+            self._count("stores")
+            self._evict()
+
+    def _evict(self) -> None:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed ASC LIMIT ?)",
+                (excess,),
+            )
+            self._stats["evictions"] += excess
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns how many were removed."""
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl_seconds,))
+            self._stats["expired"] += cursor.rowcount
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """Process-local counters plus the current entry count and hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            (stats["entries"],) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        lookups = stats["hits"] + stats["similar_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["similar_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+def azure_openai_embedder(deployment: str) -> Embedder:
+    """Embedding function on the Azure OpenAI account configured for chat (AZURE_OPENAI_*)."""
+    from openai import AzureOpenAI
+
+    client = AzureOpenAI(
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT", "https://zimax.cognitiveservices.azure.com/"),
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+    )
+
+    def embed(text: str) -> Sequence[float]:
+        return client.embeddings.create(model=deployment, input=text).data[0].embedding
+
+    return embed
+
+
+_caches: Dict[str, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Process-wide cache for LLM_CACHE_PATH, or None when LLM_CACHE_TTL_HOURS <= 0."""
+    ttl_hours = float(os.getenv("LLM_CACHE_TTL_HOURS", "24"))
+    if ttl_hours <= 0:
+        return None
+    path = os.getenv("LLM_CACHE_PATH", DEFAULT_PATH)
+    with _caches_lock:
+        if path not in _caches:
+            deployment = os.getenv("LLM_CACHE_EMBEDDING_DEPLOYMENT")
+            try:
+                _caches[path] = LLMResponseCache(
+                    path=path,
+                    ttl_seconds=ttl_hours * 3600,
+                    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000")),
+                    embed=azure_openai_embedder(deployment) if deployment else None,
+                    similarity=float(os.getenv("LLM_CACHE_SIMILARITY", "0.97")),
+                    semantic_max_temperature=float(os.getenv("LLM_CACHE_SEMANTIC_MAX_TEMPERATURE", "0.3")),
+                )
+            except Exception as e:
+                logger.warning("LLM response cache unavailable: %s", e)
+                return None
+        return _caches[path]
@@ -0,0 +1,204 @@
+"""
+SecAI Radar Recommendation Pipeline
+
+Batch AI recommendations for gapped controls (/gaps?ai=true):
+
+1. Dedupe: requests with the same (control, title, gap set, tool set, deployment) share
+   one content hash and one model call.
+2. Cache: results are stored under that hash in the AiRecommendations table, so repeats
+   across invocations and tenants with identical inputs skip the LLM.
+3. Dispatch: remaining calls run on a bounded thread pool and are yielded as they
+   complete, so a request waits for roughly the slowest call, not the sum of all calls.
+
+Environment:
+    AI_RECOMMENDATION_WORKERS: max concurrent model calls (default 8)
+    AI_RECOMMENDATION_CACHE_TTL_HOURS: cache lifetime (default 168; 0 disables caching)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = int(os.getenv("AI_RECOMMENDATION_WORKERS", "8"))
+CACHE_TTL_HOURS = float(os.getenv("AI_RECOMMENDATION_CACHE_TTL_HOURS", "168"))
+CACHE_TABLE = "AiRecommendations"
+# Table string properties are capped at 64 KiB (UTF-16); larger texts are not cached
+_MAX_CACHED_CHARS = 30000
+
+
+@dataclass(frozen=True)
+class RecommendationRequest:
+    """Inputs to AzureOpenAIService.generate_recommendation for one control."""
+    control_id: str
+    control_title: str
+    gaps: Tuple[Dict, ...]
+    tenant_tools: Tuple[Dict, ...]
+
+    @classmethod
+    def build(cls, control_id: str, control_title: str, gaps: List[Dict], tenant_tools: List[Dict]):
+        return cls(control_id, control_title, tuple(gaps), tuple(tenant_tools))
+
+    def content_key(self, deployment: str = "") -> str:
+        """SHA-256 over the canonical inputs; gap and tool order do not matter."""
+        canonical = json.dumps(
+            {
+                "deployment": deployment,
+                "controlId": self.control_id,
+                "controlTitle": self.control_title,
+                "gaps": sorted(json.dumps(g, sort_keys=True, default=str) for g in self.gaps),
+                "tools": sorted(json.dumps(t, sort_keys=True, default=str) for t in self.tenant_tools),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class RecommendationResult:
+    """One completed recommendation; ``error`` is set instead of ``text`` on failure."""
+    key: str
+    text: Optional[str]
+    error: Optional[str] = None
+    cached: bool = False
+
+
+class MemoryRecommendationCache:
+    """In-process cache (tests, or when table storage is not configured)."""
+
+    def __init__(self):
+        self._items: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._items.get(key)
+
+    def set(self, key: str, text: str) -> None:
+        with self._lock:
+            self._items[key] = text
+
+
+class TableRecommendationCache:
+    """Persistent cache in the AiRecommendations table (PartitionKey=deployment, RowKey=hash)."""
+
+    def __init__(self, table, partition: str, ttl_hours: float = CACHE_TTL_HOURS):
+        self._table = table
+        self._partition = partition or "default"
+        self._ttl = timedelta(hours=ttl_hours)
+
+    def get(self, key: str) -> Optional[str]:
+        from azure.core.exceptions import ResourceNotFoundError
+        try:
+            entity = self._table.get_entity(self._partition, key)
+        except ResourceNotFoundError:
+            return None
+        created = entity.get("CreatedAt")
+        if created:
+            try:
+                created_at = datetime.fromisoformat(created)
+            except ValueError:
+                return None
+            if datetime.now(timezone.utc) - created_at > self._ttl:
+                return None
+        return entity.get("Text")
+
+    def set(self, key: str, text: str) -> None:
+        if len(text) > _MAX_CACHED_CHARS:
+            return
+        self._table.upsert_entity({
+            "PartitionKey": self._partition,
+            "RowKey": key,
+            "Text": text,
+            "CreatedAt": datetime.now(timezone.utc).isoformat(),
+        })
+
+
+def default_cache(deployment: str):
+    """Table-backed cache when storage is configured, else None (no caching)."""
+    if CACHE_TTL_HOURS <= 0:
+        return None
+    try:
+        from shared.utils import table_client
+        return TableRecommendationCache(table_client(CACHE_TABLE), deployment)
+    except Exception as e:
+        logger.warning("Recommendation cache unavailable: %s", e)
+        return None
+
+
+class RecommendationPipeline:
+    """Dedupe, cache and run recommendation calls concurrently."""
+
+    def __init__(self, ai_service, cache=None, max_workers: int = MAX_WORKERS):
+        self.ai_service = ai_service
+        self.cache = cache
+        self.max_workers = max(1, max_workers)
+        self.deployment = getattr(ai_service, "deployment", "")
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            logger.warning("Recommendation cache read failed: %s", e)
+            return None
+
+    def _cache_set(self, key: str, text: str) -> None:
+        if self.cache is None or not text:
+            return
+        try:
+            self.cache.set(key, text)
+        except Exception as e:
+            logger.warning("Recommendation cache write failed: %s", e)
+
+    def _generate(self, request: RecommendationRequest) -> str:
+        return self.ai_service.generate_recommendation(
+            control_id=request.control_id,
+            control_title=request.control_title,
+            gaps=list(request.gaps),
+            tenant_tools=list(request.tenant_tools),
+            stream=False,
+        )
+
+    def run(self, requests: Iterable[RecommendationRequest]) -> Iterator[Tuple[List[int], RecommendationResult]]:
+        """
+        Yield ``(indexes, result)`` as each unique recommendation is ready, where
+        ``indexes`` are the positions in ``requests`` that share the result.
+        Cache hits are yielded first; model calls follow in completion order.
+        """
+        by_key: Dict[str, List[int]] = {}
+        unique: Dict[str, RecommendationRequest] = {}
+        for i, request in enumerate(requests):
+            key = request.content_key(self.deployment)
+            by_key.setdefault(key, []).append(i)
+            unique.setdefault(key, request)
+
+        pending: Dict[str, RecommendationRequest] = {}
+        for key, request in unique.items():
+            text = self._cache_get(key)
+            if text is not None:
+                yield by_key[key], RecommendationResult(key, text, cached=True)
+            else:
+                pending[key] = request
+
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+            futures = {pool.submit(self._generate, request): key for key, request in pending.items()}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    text = future.result()
+                except Exception as e:
+                    yield by_key[key], RecommendationResult(key, None, error=str(e))
+                    continue
+                self._cache_set(key, text)
+                yield by_key[key], RecommendationResult(key, text)
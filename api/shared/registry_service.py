@@ -3,19 +3,56 @@ Agent Registry Service
 
 Centralized registry for all AI agents in SecAI Radar.
 Provides single source of truth for agent inventory, discoverability, and governance.
+
+Table layout (AgentRegistry):
+- PartitionKey "agents", RowKey agent_id: the agent entry
+- PartitionKey "cap|{capability}" / "col|{collection}", RowKey agent_id: inverted-index
+  rows for capability and collection lookups, kept in step by every write
+- PartitionKey "meta", RowKey "indexes": marker written once the index rows were
+  backfilled for agents registered before the indexes existed
+
+Listings push status/blueprint into the OData filter, resolve collection/capability
+through the index rows, and are cached in-process (REGISTRY_CACHE_TTL_SEC) with
+invalidation on every write made through this service, except last-active pings,
+which patch the cached entries instead. Listings return copies of cached entries.
 """
 
+import copy
 import os
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
 
-from shared.utils import table_client
+from azure.core.exceptions import ResourceNotFoundError
+
+from shared.utils import table_client, query_partition_entities
 
 logger = logging.getLogger(__name__)
 
+AGENTS_PARTITION = "agents"
+CAPABILITY_INDEX = "cap"
+COLLECTION_INDEX = "col"
+INDEX_MARKER = ("meta", "indexes")
+
+# Columns read for AgentRegistryEntry (skips Timestamp and ad-hoc properties)
+ENTRY_COLUMNS = [
+    "RowKey", "entra_agent_id", "name", "role", "status", "blueprint", "capabilities",
+    "collections", "last_active_at", "created_at", "updated_at", "metadata",
+]
+
+LIST_CACHE_TTL_SEC = float(os.getenv("REGISTRY_CACHE_TTL_SEC", "30"))
+
+# The Table service allows 15 comparisons per filter; leave room for PK/status/blueprint
+_ROWKEY_CHUNK = 12
+
+
+def _split_list(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
 
 class AgentStatus(str, Enum):
     """Agent status values"""
@@ -63,6 +100,9 @@ class RegistryService:
         """
         self.table_name = table_name
         self._table_client = None
+        self._lock = threading.Lock()
+        self._list_cache: Dict[Tuple, Tuple[float, List[AgentRegistryEntry]]] = {}
+        self._indexes_ready = False
     
     @property
     def table_client(self):
@@ -71,6 +111,107 @@ class RegistryService:
             self._table_client = table_client(self.table_name)
         return self._table_client
     
+    def _invalidate(self) -> None:
+        """Drop cached listings after a write."""
+        with self._lock:
+            self._list_cache.clear()
+    
+    def _touch_cached(self, agent_id: str, last_active_at: datetime) -> None:
+        """Patch last_active_at into cached listings (it never changes which listings match)."""
+        with self._lock:
+            for _, entries in self._list_cache.values():
+                for entry in entries:
+                    if entry.agent_id == agent_id:
+                        entry.last_active_at = last_active_at
+                        entry.updated_at = last_active_at
+    
+    def _set_index_rows(self, kind: str, values: Iterable[str], agent_id: str, present: bool) -> None:
+        """Add or remove inverted-index rows ({kind}|{value}, agent_id)."""
+        for value in values:
+            if present:
+                self.table_client.upsert_entity({"PartitionKey": f"{kind}|{value}", "RowKey": agent_id})
+            else:
+                self.table_client.delete_entity(partition_key=f"{kind}|{value}", row_key=agent_id)
+    
+    def _sync_index_rows(self, agent_id: str, kind: str, old: Iterable[str], new: Iterable[str]) -> None:
+        old, new = set(old), set(new)
+        self._set_index_rows(kind, new - old, agent_id, True)
+        self._set_index_rows(kind, old - new, agent_id, False)
+    
+    def ensure_indexes(self) -> None:
+        """Backfill index rows once for agents registered before the indexes existed."""
+        if self._indexes_ready:
+            return
+        try:
+            self.table_client.get_entity(partition_key=INDEX_MARKER[0], row_key=INDEX_MARKER[1])
+        except ResourceNotFoundError:
+            self.rebuild_indexes()
+        self._indexes_ready = True
+    
+    def rebuild_indexes(self) -> int:
+        """
+        Write index rows for every agent (idempotent; stale rows for removed
+        capabilities/collections are not swept). Returns the number of agents indexed.
+        """
+        count = 0
+        for entity in query_partition_entities(
+            self.table_client, AGENTS_PARTITION, select=["RowKey", "capabilities", "collections"]
+        ):
+            self._set_index_rows(CAPABILITY_INDEX, _split_list(entity.get("capabilities")), entity["RowKey"], True)
+            self._set_index_rows(COLLECTION_INDEX, _split_list(entity.get("collections")), entity["RowKey"], True)
+            count += 1
+        self.table_client.upsert_entity({
+            "PartitionKey": INDEX_MARKER[0],
+            "RowKey": INDEX_MARKER[1],
+            "rebuilt_at": datetime.utcnow().isoformat(),
+        })
+        self._invalidate()
+        return count
+    
+    def _indexed_ids(self, kind: str, value: str) -> Set[str]:
+        return {e["RowKey"] for e in query_partition_entities(self.table_client, f"{kind}|{value}", select=["RowKey"])}
+    
+    def _query_entries(
+        self,
+        status: Optional[str],
+        blueprint: Optional[str],
+        agent_ids: Optional[Set[str]] = None,
+    ) -> List[AgentRegistryEntry]:
+        """Agents matching status/blueprint server-side, optionally restricted to agent_ids."""
+        filters, params = [], {}
+        if status:
+            filters.append("status eq @status")
+            params["status"] = status
+        if blueprint:
+            filters.append("blueprint eq @blueprint")
+            params["blueprint"] = blueprint
+        
+        if agent_ids is None:
+            chunks: List[List[str]] = [[]]
+        else:
+            ids = sorted(agent_ids)
+            chunks = [ids[i:i + _ROWKEY_CHUNK] for i in range(0, len(ids), _ROWKEY_CHUNK)]
+        
+        entries = []
+        for chunk in chunks:
+            chunk_filters, chunk_params = list(filters), dict(params)
+            if chunk:
+                # Spaces around the parentheses keep the SDK's @param substitution working
+                ors = []
+                for i, agent_id in enumerate(chunk):
+                    ors.append(f"RowKey eq @id{i}")
+                    chunk_params[f"id{i}"] = agent_id
+                chunk_filters.append(f"( {' or '.join(ors)} )")
+            for entity in query_partition_entities(
+                self.table_client,
+                AGENTS_PARTITION,
+                select=ENTRY_COLUMNS,
+                extra_filter=" and ".join(chunk_filters) or None,
+                parameters=chunk_params,
+            ):
+                entries.append(self._entity_to_entry(entity))
+        return entries
+    
     def register_agent(
         self,
         agent_id: str,
@@ -117,7 +258,7 @@ class RegistryService:
         
         # Store in Table Storage
         entity = {
-            "PartitionKey": "agents",
+            "PartitionKey": AGENTS_PARTITION,
             "RowKey": agent_id,
             "entra_agent_id": entra_agent_id or "",
             "name": name,
@@ -133,11 +274,19 @@ class RegistryService:
         }
         
         try:
+            try:
+                previous = self.table_client.get_entity(partition_key=AGENTS_PARTITION, row_key=agent_id)
+            except ResourceNotFoundError:
+                previous = {}
             self.table_client.upsert_entity(entity)
+            self._sync_index_rows(agent_id, CAPABILITY_INDEX, _split_list(previous.get("capabilities")), entry.capabilities)
+            self._sync_index_rows(agent_id, COLLECTION_INDEX, _split_list(previous.get("collections")), entry.collections)
             logger.info(f"Registered agent in registry: {agent_id}")
         except Exception as e:
             logger.error(f"Failed to register agent {agent_id}: {e}")
             raise
+        finally:
+            self._invalidate()
         
         return entry
     
@@ -152,7 +301,7 @@ class RegistryService:
             AgentRegistryEntry or None if not found
         """
         try:
-            entity = self.table_client.get_entity(partition_key="agents", row_key=agent_id)
+            entity = self.table_client.get_entity(partition_key=AGENTS_PARTITION, row_key=agent_id)
             return self._entity_to_entry(entity)
         except Exception as e:
             logger.debug(f"Agent {agent_id} not found in registry: {e}")
@@ -177,32 +326,40 @@ class RegistryService:
         Returns:
             List of AgentRegistryEntry
         """
+        key = (status, collection, blueprint, capability)
+        now = time.monotonic()
+        with self._lock:
+            hit = self._list_cache.get(key)
+            if hit and hit[0] > now:
+                return [copy.deepcopy(e) for e in hit[1]]
+        
         try:
-            # Query all agents
-            entities = self.table_client.query_entities(
-                query_filter="PartitionKey eq 'agents'"
-            )
+            agent_ids: Optional[Set[str]] = None
+            if collection or capability:
+                self.ensure_indexes()
+                if collection:
+                    agent_ids = self._indexed_ids(COLLECTION_INDEX, collection)
+                if capability:
+                    cap_ids = self._indexed_ids(CAPABILITY_INDEX, capability)
+                    agent_ids = cap_ids if agent_ids is None else agent_ids & cap_ids
             
-            entries = []
-            for entity in entities:
-                entry = self._entity_to_entry(entity)
-                
-                # Apply filters
-                if status and entry.status != status:
-                    continue
-                if collection and collection not in entry.collections:
-                    continue
-                if blueprint and entry.blueprint != blueprint:
-                    continue
-                if capability and capability not in entry.capabilities:
-                    continue
-                
-                entries.append(entry)
-            
-            return entries
+            entries = [] if agent_ids == set() else self._query_entries(status, blueprint, agent_ids)
+            # Index rows can lag a failed write; the entry itself stays authoritative
+            entries = [
+                e for e in entries
+                if (not collection or collection in e.collections)
+                and (not capability or capability in e.capabilities)
+            ]
         except Exception as e:
             logger.error(f"Failed to list agents: {e}")
             return []
+        
+        if LIST_CACHE_TTL_SEC > 0:
+            with self._lock:
+                self._list_cache[key] = (now + LIST_CACHE_TTL_SEC, entries)
+            # Callers get copies, so the cached entries are only changed by _touch_cached
+            return [copy.deepcopy(e) for e in entries]
+        return entries
     
     def update_agent_status(
         self,
@@ -220,7 +377,7 @@ class RegistryService:
             True if updated successfully
         """
         try:
-            entity = self.table_client.get_entity(partition_key="agents", row_key=agent_id)
+            entity = self.table_client.get_entity(partition_key=AGENTS_PARTITION, row_key=agent_id)
             entity["status"] = status
             entity["updated_at"] = datetime.utcnow().isoformat()
             self.table_client.update_entity(entity)
@@ -229,6 +386,8 @@ class RegistryService:
         except Exception as e:
             logger.error(f"Failed to update agent {agent_id} status: {e}")
             return False
+        finally:
+            self._invalidate()
     
     def add_to_collection(
         self,
@@ -246,7 +405,7 @@ class RegistryService:
             True if added successfully
         """
         try:
-            entity = self.table_client.get_entity(partition_key="agents", row_key=agent_id)
+            entity = self.table_client.get_entity(partition_key=AGENTS_PARTITION, row_key=agent_id)
             collections = entity.get("collections", "").split(",")
             collections = [c.strip() for c in collections if c.strip()]
             
@@ -256,11 +415,14 @@ class RegistryService:
                 entity["updated_at"] = datetime.utcnow().isoformat()
                 self.table_client.update_entity(entity)
                 logger.info(f"Added agent {agent_id} to collection {collection_name}")
+            self._set_index_rows(COLLECTION_INDEX, [collection_name], agent_id, True)
             
             return True
         except Exception as e:
             logger.error(f"Failed to add agent {agent_id} to collection: {e}")
             return False
+        finally:
+            self._invalidate()
     
     def remove_from_collection(
         self,
@@ -278,7 +440,7 @@ class RegistryService:
             True if removed successfully
         """
         try:
-            entity = self.table_client.get_entity(partition_key="agents", row_key=agent_id)
+            entity = self.table_client.get_entity(partition_key=AGENTS_PARTITION, row_key=agent_id)
             collections = entity.get("collections", "").split(",")
             collections = [c.strip() for c in collections if c.strip()]
             
@@ -288,11 +450,14 @@ class RegistryService:
                 entity["updated_at"] = datetime.utcnow().isoformat()
                 self.table_client.update_entity(entity)
                 logger.info(f"Removed agent {agent_id} from collection {collection_name}")
+            self._set_index_rows(COLLECTION_INDEX, [collection_name], agent_id, False)
             
             return True
         except Exception as e:
             logger.error(f"Failed to remove agent {agent_id} from collection: {e}")
             return False
+        finally:
+            self._invalidate()
     
     def quarantine_agent(self, agent_id: str) -> bool:
         """
@@ -331,21 +496,24 @@ class RegistryService:
         Args:
             agent_id: Agent identifier
         """
+        now = datetime.utcnow()
         try:
-            entity = self.table_client.get_entity(partition_key="agents", row_key=agent_id)
-            entity["last_active_at"] = datetime.utcnow().isoformat()
-            entity["updated_at"] = datetime.utcnow().isoformat()
-            self.table_client.update_entity(entity)
+            # Merge just the timestamps (fails if the agent is not registered); the
+            # listing cache is patched rather than dropped, since this runs on every ping
+            self.table_client.update_entity({
+                "PartitionKey": AGENTS_PARTITION,
+                "RowKey": agent_id,
+                "last_active_at": now.isoformat(),
+                "updated_at": now.isoformat(),
+            })
+            self._touch_cached(agent_id, now)
         except Exception as e:
             logger.debug(f"Could not update last active for agent {agent_id}: {e}")
     
     def _entity_to_entry(self, entity: Dict[str, Any]) -> AgentRegistryEntry:
         """Convert Table Storage entity to AgentRegistryEntry"""
-        capabilities = entity.get("capabilities", "").split(",")
-        capabilities = [c.strip() for c in capabilities if c.strip()]
-        
-        collections = entity.get("collections", "").split(",")
-        collections = [c.strip() for c in collections if c.strip()]
+        capabilities = _split_list(entity.get("capabilities"))
+        collections = _split_list(entity.get("collections"))
         
         created_at = datetime.fromisoformat(entity.get("created_at", datetime.utcnow().isoformat()))
         updated_at = datetime.fromisoformat(entity.get("updated_at", datetime.utcnow().isoformat()))
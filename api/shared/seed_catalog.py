@@ -0,0 +1,18 @@
+"""
+SecAI Radar Seed Catalog (Functions API)
+
+The seeds_*.json files next to the app, loaded and indexed by radar_coverage.seed_catalog
+(packages/coverage): parsed once per process, re-read when a seed file's mtime changes.
+"""
+
+from pathlib import Path
+
+from radar_coverage.seed_catalog import SeedCatalog, get_seed_catalog as _get_seed_catalog
+
+API_DIR = Path(__file__).resolve().parents[1]
+SEED_PREFIX = "seeds_"
+
+
+def get_seed_catalog() -> SeedCatalog:
+    """Indexed seed catalog of the api directory."""
+    return _get_seed_catalog(API_DIR, SEED_PREFIX)
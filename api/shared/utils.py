@@ -7,11 +7,19 @@ Common utilities for Azure Table Storage, Blob Storage, and HTTP responses.
 import json
 import logging
 import os
+import threading
 from typing import Any, Dict, Optional
 
 from azure.core.exceptions import ResourceExistsError
 from azure.data.tables import TableServiceClient
 from azure.storage.blob import BlobServiceClient
+from radar_storage.tables import (  # noqa: F401 - re-exported for the endpoints
+    TABLE_PAGE_SIZE,
+    query_entities,
+    query_partition_entities,
+    query_tenant_entities,
+    tenant_partition_range,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +49,104 @@ def cors_headers(origin: Optional[str] = None) -> Dict[str, str]:
     }
 
 
+class StorageClients:
+    """
+    Process-wide registry of storage clients, reused across Functions invocations.
+
+    Service clients are created once per connection string (one HTTP connection pool
+    each); table and container clients derived from them share that pipeline and are
+    cached by name. Tables/containers are ensured once per process instead of issuing
+    create_* on every call. Thread-safe for the Functions thread pool.
+    """
+
+    def __init__(self, tables_conn: Optional[str], blobs_conn: Optional[str]):
+        self._tables_conn = tables_conn
+        self._blobs_conn = blobs_conn
+        self._lock = threading.Lock()
+        self._table_service: Optional[TableServiceClient] = None
+        self._blob_service: Optional[BlobServiceClient] = None
+        self._tables: Dict[str, Any] = {}
+        self._containers: Dict[str, Any] = {}
+
+    def table_service(self) -> TableServiceClient:
+        if not self._tables_conn:
+            raise ValueError("TABLES_CONN environment variable is not set")
+        if self._table_service is None:
+            with self._lock:
+                if self._table_service is None:
+                    self._table_service = TableServiceClient.from_connection_string(self._tables_conn)
+        return self._table_service
+
+    def blob_service(self) -> BlobServiceClient:
+        if not self._blobs_conn:
+            raise ValueError("BLOBS_CONN environment variable is not set")
+        if self._blob_service is None:
+            with self._lock:
+                if self._blob_service is None:
+                    self._blob_service = BlobServiceClient.from_connection_string(self._blobs_conn)
+        return self._blob_service
+
+    def table(self, table_name: str):
+        client = self._tables.get(table_name)
+        if client is not None:
+            return client
+        svc = self.table_service()
+        with self._lock:
+            client = self._tables.get(table_name)
+            if client is None:
+                try:
+                    svc.create_table_if_not_exists(table_name=table_name)
+                except ResourceExistsError:
+                    pass  # Table already exists, which is fine
+                except Exception as e:
+                    # Not cached, so the next call retries the ensure
+                    logger.warning("Could not create table %s: %s", table_name, e)
+                    return svc.get_table_client(table_name)
+                client = svc.get_table_client(table_name)
+                self._tables[table_name] = client
+        return client
+
+    def container(self, container_name: str):
+        client = self._containers.get(container_name)
+        if client is not None:
+            return client
+        svc = self.blob_service()
+        with self._lock:
+            client = self._containers.get(container_name)
+            if client is None:
+                try:
+                    svc.create_container(container_name)
+                except ResourceExistsError:
+                    pass  # Container already exists, which is fine
+                except Exception as e:
+                    logger.warning("Could not create container %s: %s", container_name, e)
+                    return svc.get_container_client(container_name)
+                client = svc.get_container_client(container_name)
+                self._containers[container_name] = client
+        return client
+
+
+_clients: Optional[StorageClients] = None
+_clients_lock = threading.Lock()
+
+
+def storage_clients() -> StorageClients:
+    """Get the process-wide StorageClients registry."""
+    global _clients
+    if _clients is None:
+        with _clients_lock:
+            if _clients is None:
+                _clients = StorageClients(TABLES_CONN, BLOBS_CONN)
+    return _clients
+
+
+def reset_storage_clients() -> None:
+    """Drop cached clients (tests, or after rotating connection strings)."""
+    global _clients
+    with _clients_lock:
+        _clients = None
+
+
 def table_client(table_name: str):
     """
     Get or create an Azure Table Storage client.
@@ -49,23 +155,12 @@ def table_client(table_name: str):
         table_name: Name of the table to access.
         
     Returns:
-        TableClient for the specified table.
+        TableClient for the specified table (cached per process).
         
     Raises:
         ValueError: If TABLES_CONN environment variable is not set.
     """
-    if not TABLES_CONN:
-        raise ValueError("TABLES_CONN environment variable is not set")
-    
-    svc = TableServiceClient.from_connection_string(TABLES_CONN)
-    try:
-        svc.create_table_if_not_exists(table_name=table_name)
-    except ResourceExistsError:
-        pass  # Table already exists, which is fine
-    except Exception as e:
-        logger.warning("Could not create table %s: %s", table_name, e)
-    
-    return svc.get_table_client(table_name)
+    return storage_clients().table(table_name)
 
 
 def blob_container():
@@ -73,23 +168,12 @@ def blob_container():
     Get or create an Azure Blob Storage container client.
     
     Returns:
-        ContainerClient for the configured container.
+        ContainerClient for the configured container (cached per process).
         
     Raises:
         ValueError: If BLOBS_CONN environment variable is not set.
     """
-    if not BLOBS_CONN:
-        raise ValueError("BLOBS_CONN environment variable is not set")
-    
-    svc = BlobServiceClient.from_connection_string(BLOBS_CONN)
-    try:
-        svc.create_container(BLOB_CONTAINER)
-    except ResourceExistsError:
-        pass  # Container already exists, which is fine
-    except Exception as e:
-        logger.warning("Could not create container %s: %s", BLOB_CONTAINER, e)
-    
-    return svc.get_container_client(BLOB_CONTAINER)
+    return storage_clients().container(BLOB_CONTAINER)
 
 
 def json_response(data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -1,13 +1,14 @@
 """
 Summary Endpoint
 
-Returns aggregated summary statistics for a tenant's security assessment.
+Returns aggregated summary statistics for a tenant's security assessment,
+read from the ControlSummary projection (see radar_storage.control_summary in packages/storage).
 """
 
 import logging
 import azure.functions as func
-from collections import defaultdict
 from shared.utils import table_client, json_response
+from radar_storage.control_summary import SUMMARY_TABLE, read_summary, rebuild_tenant_summary, summary_payload  # path set up by shared
 
 logger = logging.getLogger(__name__)
 
@@ -29,62 +30,13 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         ))
     
     try:
-        table = table_client("Controls")
-        prefix = f"{tenant_id}|"
-        items = [
-            e for e in table.list_entities()
-            if str(e.get("PartitionKey", "")).startswith(prefix)
-        ]
+        summary_table = table_client(SUMMARY_TABLE)
+        agg = read_summary(summary_table, tenant_id)
+        if not agg:
+            # Projection not built yet for this tenant (e.g. controls imported before it existed)
+            agg = rebuild_tenant_summary(table_client("Controls"), summary_table, tenant_id)
         
-        # Aggregate by domain
-        agg = defaultdict(lambda: {
-            "total": 0,
-            "complete": 0,
-            "inProgress": 0,
-            "notStarted": 0,
-            "notApplicable": 0
-        })
-        
-        for e in items:
-            partition_key = str(e.get("PartitionKey", ""))
-            domain = partition_key.split("|", 1)[1] if "|" in partition_key else "UNKNOWN"
-            agg[domain]["total"] += 1
-            
-            status = (e.get("Status") or "").lower()
-            if status == "complete":
-                agg[domain]["complete"] += 1
-            elif status == "inprogress":
-                agg[domain]["inProgress"] += 1
-            elif status == "notstarted":
-                agg[domain]["notStarted"] += 1
-            elif status == "notapplicable":
-                agg[domain]["notApplicable"] += 1
-        
-        by_domain = [{"domain": d, **v} for d, v in sorted(agg.items())]
-        
-        # Calculate totals
-        totals = {
-            "total": sum(d["total"] for d in by_domain),
-            "complete": sum(d["complete"] for d in by_domain),
-            "inProgress": sum(d["inProgress"] for d in by_domain),
-            "notStarted": sum(d["notStarted"] for d in by_domain),
-            "notApplicable": sum(d["notApplicable"] for d in by_domain),
-            "domainsCount": len(by_domain)
-        }
-        
-        # Calculate completion percentage
-        if totals["total"] > 0:
-            totals["completionPercent"] = round(
-                (totals["complete"] / totals["total"]) * 100, 1
-            )
-        else:
-            totals["completionPercent"] = 0
-        
-        return func.HttpResponse(**json_response({
-            "tenantId": tenant_id,
-            "byDomain": by_domain,
-            "totals": totals
-        }))
+        return func.HttpResponse(**json_response(summary_payload(tenant_id, agg)))
     
     except Exception as e:
         logger.exception("Error fetching summary for tenant %s", tenant_id)
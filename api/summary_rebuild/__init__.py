@@ -0,0 +1,33 @@
+"""
+Summary Rebuild Endpoint
+
+Recounts a tenant's ControlSummary rows from the Controls table to repair drift.
+"""
+
+import logging
+import azure.functions as func
+from shared.utils import table_client, json_response
+from radar_storage.control_summary import SUMMARY_TABLE, rebuild_tenant_summary, summary_payload  # path set up by shared
+
+logger = logging.getLogger(__name__)
+
+
+def main(req: func.HttpRequest) -> func.HttpResponse:
+    """Rebuild the summary projection for a tenant and return the fresh summary."""
+    tenant_id = req.route_params.get("tenantId")
+    
+    if not tenant_id:
+        return func.HttpResponse(**json_response(
+            {"error": "tenantId is required"},
+            status=400
+        ))
+    
+    try:
+        agg = rebuild_tenant_summary(table_client("Controls"), table_client(SUMMARY_TABLE), tenant_id)
+        return func.HttpResponse(**json_response(summary_payload(tenant_id, agg)))
+    except Exception as e:
+        logger.exception("Error rebuilding summary for tenant %s", tenant_id)
+        return func.HttpResponse(**json_response(
+            {"error": "Failed to rebuild summary", "message": str(e)},
+            status=500
+        ))
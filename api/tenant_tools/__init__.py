@@ -6,7 +6,7 @@ Manages the security tool inventory for a tenant.
 
 import logging
 import azure.functions as func
-from shared.utils import table_client, json_response
+from shared.utils import table_client, json_response, query_partition_entities
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         table = table_client("TenantTools")
         
         if req.method == "GET":
-            items = [e for e in table.list_entities() if e.get("PartitionKey") == tenant_id]
+            items = list(query_partition_entities(table, tenant_id))
             return func.HttpResponse(**json_response({
                 "tenantId": tenant_id,
                 "items": items,
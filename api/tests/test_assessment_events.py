@@ -0,0 +1,158 @@
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import azure.functions as func
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR))
+sys.path.insert(0, str(API_DIR.parent / "src"))
+import assessment_events
+from orchestrator.event_stream import EventBroker
+from orchestrator.events import EventEmitter, EventType
+from orchestrator.state import StateManager
+
+
+def _request(assessment_id="a1", tenant_id="CONTOSO", headers=None, params=None):
+    return func.HttpRequest(
+        method="GET",
+        url=f"/api/tenant/{tenant_id}/multi-agent-assessment/{assessment_id}/events",
+        headers=headers or {},
+        params={"wait": "0", **(params or {})},
+        route_params={"tenantId": tenant_id, "assessmentId": assessment_id},
+        body=b"",
+    )
+
+
+def _frames(body):
+    frames = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n") if not line.startswith(":"))
+        if "data" in fields:
+            frames.append(fields)
+    return frames
+
+
+class TestEventBroker(unittest.TestCase):
+    def test_resume_after_event_id(self):
+        broker = EventBroker()
+        for i in range(5):
+            broker.publish("a1", {"n": i})
+        batch = broker.read("a1", last_event_id=3)
+        self.assertEqual([event_id for event_id, _ in batch.events], [4, 5])
+        self.assertEqual(batch.last_event_id, 5)
+        self.assertFalse(batch.reset)
+
+    def test_slow_subscriber_is_reset_instead_of_blocking_publisher(self):
+        broker = EventBroker(buffer_size=3)
+        subscription = broker.subscribe("a1")
+        for i in range(10):
+            broker.publish("a1", {"n": i})
+        batch = subscription.poll()
+        self.assertTrue(batch.reset)
+        self.assertEqual(batch.missed, 7)
+        self.assertEqual([event["n"] for _, event in batch.events], [7, 8, 9])
+        self.assertEqual(subscription.poll().events, [])
+
+    def test_limit_bounds_each_batch(self):
+        broker = EventBroker()
+        for i in range(5):
+            broker.publish("a1", {"n": i})
+        subscription = broker.subscribe("a1")
+        self.assertEqual(len(subscription.poll(limit=2).events), 2)
+        self.assertEqual([event_id for event_id, _ in subscription.poll(limit=10).events], [3, 4, 5])
+
+    def test_unknown_event_id_replays_buffer(self):
+        broker = EventBroker()
+        broker.publish("a1", {"n": 0})
+        batch = broker.read("a1", last_event_id=42)
+        self.assertTrue(batch.reset)
+        self.assertEqual([event_id for event_id, _ in batch.events], [1])
+
+    def test_read_waits_for_publish(self):
+        broker = EventBroker()
+        broker.publish("a1", {"n": 0})
+        timer = threading.Timer(0.05, broker.publish, args=("a1", {"n": 1}))
+        timer.start()
+        started = time.monotonic()
+        batch = broker.read("a1", last_event_id=1, timeout=5)
+        timer.join()
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([event["n"] for _, event in batch.events], [1])
+
+    def test_closed_once_subscriber_has_everything(self):
+        broker = EventBroker()
+        broker.publish("a1", {"n": 0})
+        broker.publish("a1", {"n": 1})
+        broker.close("a1")
+        self.assertFalse(broker.read("a1", limit=1).closed)
+        self.assertTrue(broker.read("a1", last_event_id=1).closed)
+
+    def test_closed_channels_evicted_first(self):
+        broker = EventBroker(max_channels=2)
+        broker.publish("a1", {})
+        broker.publish("a2", {})
+        broker.close("a2")
+        broker.publish("a3", {})
+        self.assertTrue(broker.has_channel("a1"))
+        self.assertFalse(broker.has_channel("a2"))
+
+    def test_emitter_and_state_manager_publish(self):
+        broker = EventBroker()
+        state_manager = StateManager()
+        state = state_manager.create_initial_state(assessment_id="a1", tenant_id="CONTOSO", budget=100.0)
+        with mock.patch("orchestrator.event_stream.get_event_broker", return_value=broker):
+            EventEmitter.emit_event(state, EventType.TASK_STARTED, "leo", "Identity", "scan", 10.0, "Scan")
+            state_manager.add_event(state, "ravi", "Network", "scan", 5.0, "Scan")
+        batch = broker.read("a1")
+        self.assertEqual([event["agent_id"] for _, event in batch.events], ["leo", "ravi"])
+        self.assertEqual(broker.tenant("a1"), "CONTOSO")
+
+
+class TestAssessmentEventsEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.broker = EventBroker()
+        patcher = mock.patch.object(assessment_events, "get_event_broker", return_value=self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_streams_events_after_last_event_id(self):
+        for i in range(3):
+            self.broker.publish("a1", {"n": i}, tenant_id="CONTOSO")
+        response = assessment_events.main(_request(headers={"Last-Event-ID": "1"}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "text/event-stream")
+        frames = _frames(response.get_body().decode())
+        self.assertEqual([f["id"] for f in frames], ["2", "3"])
+        self.assertEqual(frames[0]["data"], '{"n": 1}')
+
+    def test_reset_and_end_frames(self):
+        self.broker = EventBroker(buffer_size=2)
+        with mock.patch.object(assessment_events, "get_event_broker", return_value=self.broker):
+            for i in range(4):
+                self.broker.publish("a1", {"n": i}, tenant_id="CONTOSO")
+            self.broker.close("a1")
+            body = assessment_events.main(_request()).get_body().decode()
+        frames = _frames(body)
+        self.assertEqual(frames[0]["event"], "reset")
+        self.assertEqual(frames[0]["id"], "2")
+        self.assertEqual([f["id"] for f in frames[1:3]], ["3", "4"])
+        self.assertEqual(frames[-1]["event"], "end")
+
+    def test_keepalive_when_no_new_events(self):
+        self.broker.publish("a1", {"n": 0}, tenant_id="CONTOSO")
+        body = assessment_events.main(_request(params={"lastEventId": "1"})).get_body().decode()
+        self.assertIn(": keepalive", body)
+        self.assertEqual(_frames(body), [])
+
+    def test_unknown_assessment_and_tenant_mismatch(self):
+        self.assertEqual(assessment_events.main(_request()).status_code, 404)
+        self.broker.publish("a1", {}, tenant_id="OTHER")
+        self.assertEqual(assessment_events.main(_request()).status_code, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()
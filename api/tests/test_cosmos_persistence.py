@@ -0,0 +1,221 @@
+import copy
+import json
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR.parent / "src"))
+from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceNotFoundError
+from orchestrator.cosmos_persistence import CosmosStatePersistence
+from orchestrator.event_store import EventLog
+from orchestrator.state import StateManager
+from orchestrator.state_delta import EVENTS_DOC_TYPE
+
+
+def _unpointer(path):
+    return [p.replace("~1", "/").replace("~0", "~") for p in path.split("/")[1:]]
+
+
+class FakeContainer:
+    """In-memory container: one partition per assessment, documents stored as JSON copies."""
+
+    def __init__(self):
+        self.items = {}
+        self.requests = []
+        # (operation, item id) -> "before" (fail, nothing applied) or "after" (applied, then fail)
+        self.failures = {}
+
+    def _fail(self, operation, item_id, when):
+        if self.failures.get((operation, item_id)) == when:
+            del self.failures[(operation, item_id)]
+            raise CosmosHttpResponseError(status_code=429 if when == "before" else 408, message=f"{operation} {item_id}")
+
+    def upsert_item(self, body):
+        self._fail("upsert", body["id"], "before")
+        self.requests.append(("upsert", body["id"]))
+        self.items[(body["assessment_id"], body["id"])] = json.loads(json.dumps(body, default=str))
+        self._fail("upsert", body["id"], "after")
+
+    def read_item(self, item, partition_key):
+        if (partition_key, item) not in self.items:
+            raise CosmosResourceNotFoundError(status_code=404, message=item)
+        return copy.deepcopy(self.items[(partition_key, item)])
+
+    def patch_item(self, item, partition_key, patch_operations):
+        if (partition_key, item) not in self.items:
+            raise CosmosResourceNotFoundError(status_code=404, message=item)
+        self._fail("patch", item, "before")
+        if len(patch_operations) > 10:
+            raise CosmosHttpResponseError(status_code=400, message="too many operations")
+        self.requests.append(("patch", item))
+        document = json.loads(json.dumps(self.items[(partition_key, item)]))
+        for operation in patch_operations:
+            *parents, last = _unpointer(operation["path"])
+            target = document
+            for part in parents:
+                target = target[part]
+            if operation["op"] == "remove":
+                del target[last]
+            elif operation["op"] == "add" and last == "-":
+                target.append(operation["value"])
+            else:
+                target[last] = operation["value"]
+        self.items[(partition_key, item)] = json.loads(json.dumps(document, default=str))
+        self._fail("patch", item, "after")
+
+    def query_items(self, query, parameters=None, partition_key=None, enable_cross_partition_query=False):
+        documents = [doc for (pk, _), doc in self.items.items() if pk == partition_key]
+        if "c.doc_type = @doc_type" in query:
+            documents = [doc for doc in documents if doc.get("doc_type") == parameters[0]["value"]]
+        elif "IS_DEFINED(c.doc_type)" in query:
+            documents = [doc for doc in documents if "doc_type" in doc]
+        if "ORDER BY c.page" in query:
+            documents.sort(key=lambda doc: doc["page"])
+        return [copy.deepcopy(doc) for doc in documents]
+
+    def delete_item(self, item, partition_key):
+        if self.items.pop((partition_key, item), None) is None:
+            raise CosmosResourceNotFoundError(status_code=404, message=item)
+
+    def event_ids(self, assessment_id):
+        pages = self.query_items("c.doc_type = @doc_type ORDER BY c.page",
+                                 [{"name": "@doc_type", "value": EVENTS_DOC_TYPE}], assessment_id)
+        return [event["id"] for page in pages for event in page["events"]]
+
+
+class TestIncrementalCosmosPersistence(unittest.TestCase):
+    def setUp(self):
+        self.state_manager = StateManager()
+        self.persistence = CosmosStatePersistence(
+            incremental=True, debounce_seconds=0, events_per_page=3, artifact_inline_limit=200
+        )
+        self.container = self.persistence.container = FakeContainer()
+        self.state = self.state_manager.create_initial_state(assessment_id="a1", tenant_id="CONTOSO", budget=100.0)
+
+    def _event(self, n=1):
+        events = EventLog.for_state(self.state)
+        for _ in range(n):
+            events.append({"id": f"event_{len(events) + 1}", "timestamp": datetime(2026, 1, 1).isoformat(),
+                           "agent_id": "leo", "domain": "Identity", "impact_score": 1.0})
+
+    def _persist(self):
+        return self.persistence.persist_state(self.state, self.state_manager)
+
+    def _load_fresh(self):
+        reader = CosmosStatePersistence(incremental=True, debounce_seconds=0)
+        reader.container = self.container
+        return reader.load_state("a1", StateManager())
+
+    def assertRoundTrips(self):
+        loaded = self.state_manager._state_to_dict(self._load_fresh())
+        loaded.pop("id")
+        self.assertEqual(loaded, self.state_manager._state_to_dict(self.state))
+
+    def test_events_are_paged_and_appended_across_pages(self):
+        self._event(2)
+        self.assertTrue(self._persist())
+        self._event(5)
+        self.state["budget_remaining"] = 80.0
+        self.assertTrue(self._persist())
+        self.assertEqual(self.persistence.write_stats["full_writes"], 1)
+        self.assertEqual(self.container.event_ids("a1"), [f"event_{i}" for i in range(1, 8)])
+        self.assertEqual(sorted(doc["page"] for doc in self.container.items.values() if "page" in doc), [0, 1, 2])
+        self.assertRoundTrips()
+
+    def test_large_artifacts_are_stored_by_reference(self):
+        self._persist()
+        big = {"id": "design", "body": "x" * 500}
+        self.state_manager.update_agent_context(self.state, "leo", task="design", artifact=big)
+        self.state_manager.update_agent_context(self.state, "leo", artifact={"id": "note", "body": "short"})
+        self.assertTrue(self._persist())
+        artifacts = self.container.items[("a1", "a1")]["agent_contexts"]["leo"]["artifacts"]
+        self.assertEqual(set(artifacts["design"]), {"artifact_ref"})
+        self.assertEqual(artifacts["note"]["body"], "short")
+        self.assertEqual(self.container.read_item(artifacts["design"]["artifact_ref"], "a1")["content"], big)
+        self.assertRoundTrips()
+
+    def test_removed_agent_context_is_removed_from_the_document(self):
+        self._persist()
+        removed = next(iter(self.state["agent_contexts"]))
+        del self.state["agent_contexts"][removed]
+        self.assertTrue(self._persist())
+        self.assertEqual(self.container.requests[-1], ("patch", "a1"))
+        self.assertNotIn(removed, self.container.items[("a1", "a1")]["agent_contexts"])
+        self.assertRoundTrips()
+
+    def test_removed_events_rewrite_everything(self):
+        self._event(4)
+        self._persist()
+        del self.state["events"][2:]
+        self.assertTrue(self._persist())
+        self.assertEqual(self.persistence.write_stats["full_writes"], 2)
+        self.assertRoundTrips()
+
+    def test_more_than_one_patch_request_of_changes_upserts_the_document(self):
+        self._persist()
+        self.state["findings"].extend({"id": f"finding_{i}"} for i in range(12))
+        self.assertTrue(self._persist())
+        self.assertEqual(self.container.requests[-1], ("upsert", "a1"))
+        self.assertEqual(self.persistence.write_stats["patch_requests"], 0)
+        self.assertRoundTrips()
+
+    def test_retry_after_failed_state_patch_does_not_duplicate_events(self):
+        self._event(1)
+        self._persist()
+        self._event(1)
+        self.state["findings"].append({"id": "finding_1"})
+        self.container.failures[("patch", "a1")] = "before"
+        self.assertFalse(self._persist())
+
+        self._event(1)
+        self.state["findings"].append({"id": "finding_2"})
+        self.assertTrue(self._persist())
+        self.assertEqual(self.container.event_ids("a1"), ["event_1", "event_2", "event_3"])
+        self.assertRoundTrips()
+
+    def test_retry_after_applied_but_failed_patch_does_not_apply_it_twice(self):
+        self._persist()
+        self.state["findings"].append({"id": "finding_1"})
+        self._event(1)
+        self.container.failures[("patch", "a1")] = "after"
+        self.assertFalse(self._persist())
+        # The pending view is retried as a whole-document upsert, not the same "add" again
+        self.assertTrue(self.persistence.flush("a1"))
+        self.assertEqual(self.container.requests[-1], ("upsert", "a1"))
+        self.assertEqual(self.container.items[("a1", "a1")]["findings"], [{"id": "finding_1"}])
+        self._event(1)
+        self.assertTrue(self._persist())
+        self.assertEqual(self.container.requests[-1], ("patch", "a1"))
+        self.assertRoundTrips()
+
+    def test_failed_event_page_write_is_retried(self):
+        self._event(2)
+        self._persist()
+        self._event(3)
+        self.container.failures[("upsert", "a1:events:000001")] = "before"
+        self.assertFalse(self._persist())
+        self.assertEqual(self.container.items[("a1", "a1")]["event_count"], 2)
+        self.assertTrue(self.persistence.flush("a1"))
+        self.assertEqual(self.container.event_ids("a1"), [f"event_{i}" for i in range(1, 6)])
+        self.assertRoundTrips()
+
+    def test_load_then_delta_and_delete(self):
+        self._event(2)
+        self._persist()
+        writer = CosmosStatePersistence(incremental=True, debounce_seconds=0, events_per_page=3)
+        writer.container = self.container
+        state = writer.load_state("a1", self.state_manager)
+        EventLog.for_state(state).append({"id": "event_3", "timestamp": datetime(2026, 1, 2).isoformat()})
+        self.assertTrue(writer.persist_state(state, self.state_manager))
+        self.assertEqual(writer.write_stats["full_writes"], 0)
+        self.assertEqual(self.container.event_ids("a1"), ["event_1", "event_2", "event_3"])
+
+        self.assertTrue(writer.delete_state("a1"))
+        self.assertEqual(self.container.items, {})
+        self.assertIsNone(writer.load_state("a1", self.state_manager))
+
+
+if __name__ == "__main__":
+    unittest.main()
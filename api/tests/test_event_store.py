@@ -0,0 +1,135 @@
+import random
+import sys
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR.parent / "src"))
+from orchestrator.event_store import EventLog
+
+START = datetime(2026, 1, 1)
+DOMAINS = ["Identity", "Network", "Data"]
+AGENTS = ["leo", "ravi", "aris"]
+TYPES = ["task_started", "task_completed", "finding_identified"]
+
+
+def _event(rng, seconds):
+    return {
+        # Whole seconds, so equal timestamps (ties) are common
+        "timestamp": (START + timedelta(seconds=seconds)).isoformat(),
+        "domain": rng.choice(DOMAINS),
+        "agent_id": rng.choice(AGENTS),
+        "type": rng.choice(TYPES),
+        "impact_score": rng.choice([0, 1.5, 5, 10]),
+    }
+
+
+def _newest_first(events):
+    """The reference order: timestamp, then later position in the log, descending."""
+    return [e for _, e in sorted(enumerate(events), key=lambda p: (p[1]["timestamp"], p[0]), reverse=True)]
+
+
+def _stats(events, key):
+    stats = {}
+    for e in events:
+        entry = stats.setdefault(e[key], {"count": 0, "impact_sum": 0.0})
+        entry["count"] += 1
+        entry["impact_sum"] += e["impact_score"]
+    return stats
+
+
+class TestEventLogParity(unittest.TestCase):
+    """EventLog queries against a plain list of the same events, on random logs."""
+
+    def assertMatches(self, log, events, cutoffs):
+        self.assertEqual(list(log), events)
+        newest = _newest_first(events)
+        for limit in (1, 3, log.recent_capacity, log.recent_capacity + 1, len(events) + 5):
+            self.assertEqual(log.recent(limit), newest[:limit], limit)
+        for cutoff in cutoffs:
+            expected = [e for e in newest if datetime.fromisoformat(e["timestamp"]) >= cutoff]
+            self.assertEqual(log.since(cutoff), expected, cutoff)
+        for domain in DOMAINS:
+            self.assertEqual(log.by_domain(domain), [e for e in events if e["domain"] == domain])
+        for agent_id in AGENTS:
+            self.assertEqual(log.by_agent(agent_id), [e for e in events if e["agent_id"] == agent_id])
+        self.assertEqual(log.domain_stats(), _stats(events, "domain"))
+        self.assertEqual(log.agent_stats(), _stats(events, "agent_id"))
+        self.assertEqual(log.type_counts(), {t: sum(e["type"] == t for e in events) for t in TYPES
+                                             if any(e["type"] == t for e in events)})
+        self.assertAlmostEqual(log.impact_sum, sum(e["impact_score"] for e in events))
+
+    def _cutoffs(self, rng, horizon):
+        return [START - timedelta(seconds=1), START + timedelta(seconds=horizon + 1)] + [
+            START + timedelta(seconds=rng.randint(0, horizon)) for _ in range(4)
+        ]
+
+    def test_appends_past_the_ring_buffer(self):
+        for seed in range(20):
+            rng = random.Random(seed)
+            log, events, clock = EventLog(recent_capacity=8), [], 0
+            for _ in range(rng.randint(1, 40)):
+                clock += rng.choice([0, 0, 1, 2])
+                event = _event(rng, clock)
+                log.append(event)
+                events.append(event)
+            self.assertMatches(log, events, self._cutoffs(rng, clock))
+
+    def test_out_of_order_inserts_from_merged_branches(self):
+        for seed in range(20):
+            rng = random.Random(seed)
+            base = [_event(rng, s) for s in sorted(rng.randint(0, 20) for _ in range(rng.randint(0, 10)))]
+            log, events = EventLog(base, recent_capacity=6), list(base)
+            # Branches started from the same state; each one's events are merged after the
+            # previous branch's, although their timestamps interleave
+            for _ in range(rng.randint(1, 4)):
+                branch = [_event(rng, s) for s in sorted(rng.randint(0, 40) for _ in range(rng.randint(0, 8)))]
+                log.extend(branch)
+                events.extend(branch)
+            self.assertMatches(log, events, self._cutoffs(rng, 40))
+
+    def test_reindexes_after_stale_mutations(self):
+        for seed in range(20):
+            rng = random.Random(seed)
+            events = [_event(rng, rng.randint(0, 30)) for _ in range(rng.randint(5, 25))]
+            log = EventLog(events, recent_capacity=5)
+            events = list(events)
+            self.assertMatches(log, events, self._cutoffs(rng, 30))
+            for _ in range(6):
+                op = rng.choice(["insert", "remove", "pop", "setitem", "delitem", "sort", "append"])
+                if op == "insert":
+                    position, event = rng.randint(0, len(events)), _event(rng, rng.randint(0, 30))
+                    log.insert(position, event)
+                    events.insert(position, event)
+                elif op == "append" or not events:
+                    event = _event(rng, rng.randint(0, 30))
+                    log.append(event)
+                    events.append(event)
+                elif op == "remove":
+                    event = rng.choice(events)
+                    log.remove(event)
+                    events.remove(event)
+                elif op == "pop":
+                    position = rng.randrange(len(events))
+                    self.assertIs(log.pop(position), events.pop(position))
+                elif op == "setitem":
+                    position, event = rng.randrange(len(events)), _event(rng, rng.randint(0, 30))
+                    log[position] = event
+                    events[position] = event
+                elif op == "delitem":
+                    position = rng.randrange(len(events))
+                    del log[position:position + 2]
+                    del events[position:position + 2]
+                else:
+                    log.sort(key=lambda e: e["domain"])
+                    events.sort(key=lambda e: e["domain"])
+                # Appends after a stale mutation are picked up by the rebuild too
+                extra = _event(rng, rng.randint(0, 30))
+                log.append(extra)
+                events.append(extra)
+                self.assertMatches(log, events, self._cutoffs(rng, 30))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import sys
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from azure.data.tables._serialize import _parameter_filter_substitution
+from azure.storage.blob import BlobServiceClient
+from shared.evidence_catalog import SasSigner, evidence_prefix, list_evidence_page
+
+CONN = (
+    "DefaultEndpointsProtocol=https;AccountName=acct;"
+    "AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;"
+    "EndpointSuffix=core.windows.net"
+)
+
+
+class _BlobPages:
+    """Mimics ItemPaged.by_page(): string continuation tokens are offsets."""
+
+    def __init__(self, blobs, size, token):
+        self._blobs, self._size = blobs, size
+        self._offset = int(token or 0)
+        self.continuation_token = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._offset >= len(self._blobs):
+            raise StopIteration
+        page = self._blobs[self._offset:self._offset + self._size]
+        self._offset += self._size
+        self.continuation_token = str(self._offset) if self._offset < len(self._blobs) else None
+        return iter(page)
+
+
+class _Container:
+    def __init__(self, names):
+        real = BlobServiceClient.from_connection_string(CONN).get_container_client("assessments")
+        self.container_name, self.url, self.credential = real.container_name, real.url, real.credential
+        self.blobs = [SimpleNamespace(name=n, size=10, last_modified=datetime(2026, 1, 1, tzinfo=timezone.utc))
+                      for n in sorted(names)]
+        self.list_calls = []
+
+    def list_blobs(self, name_starts_with, results_per_page):
+        self.list_calls.append((name_starts_with, results_per_page))
+        matching = [b for b in self.blobs if b.name.startswith(name_starts_with)]
+        return SimpleNamespace(by_page=lambda continuation_token=None: _BlobPages(matching, results_per_page, continuation_token))
+
+
+class _EvidenceTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def query_entities(self, query_filter, parameters=None, select=None, results_per_page=None):
+        self.queries.append(_parameter_filter_substitution(parameters, query_filter))
+        p = parameters
+        rows = [r for r in self.rows if r["PartitionKey"] == p["pk"] and p["rk_lo"] <= r["RowKey"] <= p["rk_hi"]]
+        return SimpleNamespace(by_page=lambda: iter([[{k: r.get(k) for k in select} for r in rows]]))
+
+
+class TestEvidenceCatalog(unittest.TestCase):
+    def setUp(self):
+        prefix = evidence_prefix("NICO", "SEC-NET-0001")
+        self.container = _Container(
+            [f"{prefix}file{i}.pdf" for i in range(5)] + [evidence_prefix("NICO", "SEC-NET-0002") + "other.pdf"]
+        )
+        self.table = _EvidenceTable([
+            {"PartitionKey": "NICO", "RowKey": "SEC-NET-0001|file1.pdf", "FileName": "file1.pdf", "Category": "policy", "Confidence": 0.9},
+            {"PartitionKey": "NICO", "RowKey": "SEC-NET-0001|file4.pdf", "FileName": "file4.pdf", "Category": "log"},
+            {"PartitionKey": "OTHER", "RowKey": "SEC-NET-0001|file1.pdf", "FileName": "file1.pdf", "Category": "leak"},
+        ])
+
+    def test_pages_with_continuation_and_scoped_metadata(self):
+        seen, token, pages = [], None, 0
+        while True:
+            page = list_evidence_page(self.container, self.table, "NICO", "SEC-NET-0001", page_size=2, continuation_token=token)
+            seen += page.items
+            pages += 1
+            token = page.continuation_token
+            if not token:
+                break
+        self.assertEqual(pages, 3)
+        self.assertEqual([i["fileName"] for i in seen], [f"file{i}.pdf" for i in range(5)])
+        self.assertEqual(self.container.list_calls[0], ("assessments/NICO/evidence/SEC-NET-0001/", 2))
+        self.assertEqual(self.table.queries[0],
+                         "PartitionKey eq 'NICO' and RowKey ge 'SEC-NET-0001|file0.pdf' and RowKey le 'SEC-NET-0001|file1.pdf'")
+        by_name = {i["fileName"]: i["classification"] for i in seen}
+        self.assertEqual(by_name["file1.pdf"]["category"], "policy")
+        self.assertEqual(by_name["file4.pdf"]["confidence"], 0.0)
+        self.assertIsNone(by_name["file0.pdf"])
+
+    def test_sas_urls_share_one_signer(self):
+        signer = SasSigner(self.container, expiry_hours=1)
+        page = list_evidence_page(self.container, None, "NICO", "SEC-NET-0001", page_size=10, signer=signer)
+        urls = [i["downloadUrl"] for i in page.items]
+        self.assertTrue(urls[0].startswith("https://acct.blob.core.windows.net/assessments/assessments/NICO/evidence/"))
+        expiries = {parse_qs(urlsplit(u).query)["se"][0] for u in urls}
+        self.assertEqual(len(expiries), 1)
+        self.assertEqual({parse_qs(urlsplit(u).query)["sp"][0] for u in urls}, {"r"})
+        self.assertIsNone(page.continuation_token)
+
+    def test_signer_disabled_without_account_key(self):
+        container = SimpleNamespace(container_name="c", url="https://x/c", credential=None, account_name="x")
+        self.assertIsNone(SasSigner(container).url("a.pdf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
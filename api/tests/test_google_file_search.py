@@ -0,0 +1,112 @@
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR.parent / "src"))
+from rag.google_file_search import GoogleFileSearchRetriever
+
+
+def _handle(name, expires_in=timedelta(hours=48), version=0):
+    expires = datetime.now(timezone.utc) + expires_in if expires_in is not None else None
+    return SimpleNamespace(name=name, expiration_time=expires, version=version)
+
+
+class FakeClient:
+    """get_file counts its calls per file (and can fail one); generate_content records the handles."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.get_file_calls = {}
+        self.generated_with = []
+        self._lock = threading.Lock()
+
+    def get_file(self, name):
+        with self._lock:
+            self.get_file_calls[name] = self.get_file_calls.get(name, 0) + 1
+            version = self.get_file_calls[name]
+        # Slow enough that concurrent retrieve() calls overlap the fetch
+        time.sleep(0.02)
+        if name in self.failing:
+            raise RuntimeError(f"{name} is gone")
+        return _handle(name, version=version)
+
+    def GenerativeModel(self, model_name):
+        def generate_content(content):
+            self.generated_with.append([handle.name for handle in content[1:]])
+            return SimpleNamespace(text=f"answer from {len(content) - 1} files")
+
+        return SimpleNamespace(generate_content=generate_content)
+
+
+class TestFileHandleRefresh(unittest.TestCase):
+    def _retriever(self, handles, failing=()):
+        retriever = GoogleFileSearchRetriever(api_key="test-key")
+        retriever.client = FakeClient(failing)
+        retriever.uploaded_files = [handle.name for handle in handles]
+        retriever._file_handles = {handle.name: handle for handle in handles}
+        return retriever
+
+    def test_cached_handles_are_reused(self):
+        retriever = self._retriever([_handle("files/a"), _handle("files/b", expires_in=None)])
+        for _ in range(3):
+            self.assertEqual(asyncio.run(retriever.retrieve("mfa")), "answer from 2 files")
+        self.assertEqual(retriever.client.get_file_calls, {})
+        self.assertEqual(retriever.client.generated_with, [["files/a", "files/b"]] * 3)
+
+    def test_only_expiring_handles_are_refetched(self):
+        retriever = self._retriever([
+            _handle("files/fresh"),
+            _handle("files/expiring", expires_in=timedelta(minutes=2)),
+            _handle("files/expired", expires_in=timedelta(minutes=-1)),
+        ])
+        retriever._file_handles["files/missing"] = None
+        retriever.uploaded_files.append("files/missing")
+        self.assertEqual(asyncio.run(retriever.retrieve("mfa")), "answer from 4 files")
+        self.assertEqual(retriever.client.get_file_calls,
+                         {"files/expiring": 1, "files/expired": 1, "files/missing": 1})
+        self.assertEqual(retriever._file_handles["files/expiring"].version, 1)
+        self.assertEqual(retriever._file_handles["files/fresh"].version, 0)
+
+        # The refreshed handles are good for another 48 hours
+        asyncio.run(retriever.retrieve("mfa"))
+        self.assertEqual(sum(retriever.client.get_file_calls.values()), 3)
+
+    def test_concurrent_retrieves_share_one_refresh(self):
+        retriever = self._retriever([_handle("files/a", expires_in=timedelta(0)), _handle("files/b")])
+
+        async def run():
+            return await asyncio.gather(*(retriever.retrieve(f"query {i}") for i in range(5)))
+
+        self.assertEqual(asyncio.run(run()), ["answer from 2 files"] * 5)
+        self.assertEqual(retriever.client.get_file_calls, {"files/a": 1})
+        self.assertEqual(retriever._refreshing, {})
+
+    def test_failed_refresh_drops_only_that_file(self):
+        retriever = self._retriever([
+            _handle("files/a", expires_in=timedelta(0)),
+            _handle("files/gone", expires_in=timedelta(0)),
+            _handle("files/c"),
+        ], failing={"files/gone"})
+        self.assertEqual(asyncio.run(retriever.retrieve("mfa")), "answer from 2 files")
+        self.assertEqual(retriever.client.generated_with, [["files/a", "files/c"]])
+        self.assertNotIn("files/gone", retriever._file_handles)
+        self.assertEqual(retriever._refreshing, {})
+
+        # The dropped file is tried again on the next retrieve; the others stay cached
+        asyncio.run(retriever.retrieve("mfa"))
+        self.assertEqual(retriever.client.get_file_calls, {"files/a": 1, "files/gone": 2})
+
+    def test_nothing_left_returns_none(self):
+        retriever = self._retriever([_handle("files/gone", expires_in=timedelta(0))], failing={"files/gone"})
+        self.assertIsNone(asyncio.run(retriever.retrieve("mfa")))
+        self.assertEqual(retriever.client.generated_with, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import math
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR.parent / "src"))
+from rag.hybrid_retriever import HybridRetriever, bm25_terms, make_snippet
+from rag.local_vector_index import LocalVectorRetriever, chunk_text, hashing_embedder
+
+CONTROL = "Control SEC-NET-0001 requires network segmentation between the hub and every spoke."
+SIBLING = "Control SEC-NET-0002 requires flow logs on every network security group."
+FIREWALL = "Azure Firewall inspects outbound traffic and blocks known malicious destinations."
+IDENTITY = "Privileged identity management grants admin roles just in time, with approval."
+
+
+def _reference_bm25(documents, query, k1=1.5, b=0.75):
+    """BM25 over the given documents' terms, straight from the formula."""
+    docs = [bm25_terms(d) for d in documents]
+    avg_length = sum(map(len, docs)) / len(docs)
+    scores = []
+    for terms in docs:
+        score = 0.0
+        for term in set(bm25_terms(query)):
+            df = sum(term in d for d in docs)
+            if not df:
+                continue
+            idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+            tf = terms.count(term)
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(terms) / avg_length))
+        scores.append(score)
+    return scores
+
+
+class TestHybridRetriever(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.vector = LocalVectorRetriever(tmp.name, embed=hashing_embedder(64))
+        for name, text in (("control.md", CONTROL), ("sibling.md", SIBLING),
+                           ("firewall.md", FIREWALL), ("identity.md", IDENTITY)):
+            self.vector.add_text(text, name)
+        self.hybrid = HybridRetriever(self.vector)
+
+    def _bm25(self, query):
+        self.hybrid._sync()
+        return self.hybrid._bm25(bm25_terms(query), self.vector._removed)
+
+    def test_identifiers_are_indexed_whole_and_in_parts(self):
+        self.assertEqual(bm25_terms("Check SEC-NET-0001 on the network"),
+                         ["check", "sec-net-0001", "sec", "net", "0001", "network"])
+        self.assertEqual(bm25_terms("Defender for Cloud"), ["defender", "cloud"])
+
+        whole = self._bm25("SEC-NET-0001")
+        self.assertEqual(int(whole.argmax()), 0)
+        self.assertGreater(whole[1], 0)  # "sec" and "net" match the sibling control
+        self.assertGreater(whole[0], whole[1])
+        self.assertEqual(self.hybrid.search("SEC-NET-0001", top_k=1)[0]["source"], "control.md")
+        self.assertEqual(self.hybrid.search("sec-net-0002 flow logs", top_k=1)[0]["bm25_rank"], 1)
+
+    def test_bm25_scores_match_the_formula(self):
+        for query in ("network segmentation", "SEC-NET-0001 hub", "admin roles approval", "the and of"):
+            expected = _reference_bm25([CONTROL, SIBLING, FIREWALL, IDENTITY], query)
+            for row, score in enumerate(self._bm25(query)):
+                self.assertAlmostEqual(float(score), expected[row], places=4, msg=(query, row))
+
+    def test_removed_rows_do_not_score_or_count(self):
+        self.vector.add_text(FIREWALL + " Updated nightly.", "sibling.md")
+        scores = self._bm25("network security group flow logs")
+        self.assertEqual(float(scores[1]), 0.0)
+        live = [CONTROL, FIREWALL, IDENTITY, FIREWALL + " Updated nightly."]
+        expected = _reference_bm25(live, "azure firewall")
+        self.assertAlmostEqual(float(self._bm25("azure firewall")[4]), expected[3], places=4)
+
+    def test_results_are_ordered_by_reciprocal_rank_fusion(self):
+        results = self.hybrid.search("network segmentation firewall", top_k=4)
+        for result in results:
+            ranks = [r for r in (result["bm25_rank"], result["vector_rank"]) if r is not None]
+            self.assertAlmostEqual(result["score"], sum(1.0 / (self.hybrid.rrf_k + r) for r in ranks))
+        self.assertEqual([r["score"] for r in results], sorted((r["score"] for r in results), reverse=True))
+
+        # A chunk both lists rank first beats any chunk only one list found
+        top = self.hybrid.search(CONTROL, top_k=4)[0]
+        self.assertEqual((top["source"], top["bm25_rank"], top["vector_rank"]), ("control.md", 1, 1))
+        self.assertEqual(top["score"], 2.0 / (self.hybrid.rrf_k + 1))
+
+    def test_cache_is_invalidated_when_the_index_changes(self):
+        first = self.hybrid.search("segmentation", top_k=2)
+        self.assertEqual(self.hybrid.search("  Segmentation ", top_k=2), first)
+        self.assertEqual(self.hybrid.cache_stats()["hits"], 1)
+
+        self.vector.add_text("Microsegmentation and segmentation of workloads.", "segments.md")
+        added = self.hybrid.search("segmentation", top_k=2)
+        self.assertEqual(self.hybrid.cache_stats()["misses"], 2)
+        self.assertIn("segments.md", [r["source"] for r in added])
+
+        # Replacing a document changes only the removed rows, which also invalidates
+        self.vector.add_text(IDENTITY, "segments.md")
+        self.assertNotIn("segments.md", [r["source"] for r in self.hybrid.search("segmentation", top_k=2)])
+        self.assertEqual(self.hybrid.cache_stats()["misses"], 3)
+
+    def test_search_returns_a_copy_of_the_cached_results(self):
+        results = self.hybrid.search("network", top_k=3)
+        results.reverse()
+        results.pop()
+        cached = self.hybrid.search("network", top_k=3)
+        self.assertEqual(len(cached), 3)
+        self.assertEqual(cached[0]["score"], max(r["score"] for r in cached))
+        cached.clear()
+        self.assertEqual(len(self.hybrid.search("network", top_k=3)), 3)
+
+    def test_retrieve_formats_citations(self):
+        context = asyncio.run(self.hybrid.retrieve("SEC-NET-0001", top_k=1))
+        self.assertEqual(context, f"[1] control.md #0\n{CONTROL}")
+
+
+class TestSnippetsAndChunks(unittest.TestCase):
+    def test_short_text_is_its_own_snippet(self):
+        self.assertEqual(make_snippet(CONTROL, ["segmentation"]), CONTROL)
+
+    def test_snippet_centres_on_the_first_matched_term_at_word_breaks(self):
+        words = [f"word{i}" for i in range(200)]
+        words[120] = "SEC-NET-0001"
+        text = " ".join(words)
+        snippet = make_snippet(text, ["missing", "sec-net-0001", "word5"], length=80)
+        self.assertTrue(snippet.startswith("...") and snippet.endswith("..."))
+        self.assertIn("SEC-NET-0001", snippet)
+        self.assertLessEqual(len(snippet), 80 + 6)
+        for word in snippet.strip(".").split():
+            self.assertIn(word, words)
+
+        self.assertTrue(make_snippet(text, ["word0"], length=80).startswith("word0 "))
+        self.assertTrue(make_snippet(text, ["word199"], length=80).endswith("word199"))
+        self.assertTrue(make_snippet(text, ["absent"], length=80).startswith("word0 "))
+
+    def test_chunks_break_and_overlap_at_word_boundaries(self):
+        words = [f"term{i:03d}" for i in range(300)]
+        text = " ".join(words)
+        chunks = chunk_text(text, chunk_size=200, chunk_overlap=50)
+        self.assertGreater(len(chunks), 5)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 200)
+            self.assertTrue(all(word in words for word in chunk.split()), chunk)
+        for previous, current in zip(chunks, chunks[1:]):
+            # Each chunk starts on a whole word repeated from the end of the previous one
+            previous_words, first = previous.split(), current.split()[0]
+            self.assertIn(first, previous_words)
+            overlap = " ".join(previous_words[previous_words.index(first):])
+            self.assertTrue(0 < len(overlap) <= 50, overlap)
+        self.assertEqual(chunks[-1].split()[-1], "term299")
+        self.assertEqual(chunk_text("  short text  ", chunk_size=200), ["short text"])
+        self.assertEqual(chunk_text("   "), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
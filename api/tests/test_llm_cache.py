@@ -0,0 +1,151 @@
+import os
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared import llm_cache
+from shared.llm_cache import LLMResponseCache
+
+
+def _messages(user, system="You are a security consultant."):
+    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+
+def _bag_of_words(text):
+    vocab = ["control", "sec-net-0001", "sec-idn-0002", "gap", "firewall", "mfa", "explain"]
+    words = re.findall(r"[\w-]+", text.lower())
+    return [float(words.count(w)) for w in vocab]
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def lookup(self, cache, user, temperature=0.7, **kwargs):
+        return cache.lookup("test", "gpt", _messages(user, **kwargs), temperature=temperature, max_tokens=100)
+
+    def test_exact_match_normalizes_whitespace(self):
+        cache = LLMResponseCache(path=":memory:")
+        first = self.lookup(cache, "Explain the gap for control SEC-NET-0001")
+        self.assertFalse(first.hit)
+        cache.store(first, "answer")
+
+        again = self.lookup(cache, "  Explain the gap\nfor control   SEC-NET-0001 ")
+        self.assertTrue(again.hit)
+        self.assertEqual(again.value, "answer")
+        self.assertFalse(self.lookup(cache, "Explain the gap for control SEC-NET-0001", temperature=0.2).hit)
+        self.assertFalse(self.lookup(cache, "Explain the gap for control SEC-IDN-0002").hit)
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"], stats["entries"]), (1, 3, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.25)
+
+    def test_entries_expire_after_ttl(self):
+        cache = LLMResponseCache(path=":memory:", ttl_seconds=60)
+        with mock.patch.object(llm_cache.time, "time", return_value=1000.0):
+            cache.store(self.lookup(cache, "q"), "answer")
+            self.assertTrue(self.lookup(cache, "q").hit)
+        with mock.patch.object(llm_cache.time, "time", return_value=1061.0):
+            self.assertFalse(self.lookup(cache, "q").hit)
+        self.assertEqual(cache.stats()["expired"], 1)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = LLMResponseCache(path=":memory:", max_entries=2)
+        clock = iter(range(1000, 2000))
+        with mock.patch.object(llm_cache.time, "time", side_effect=lambda: float(next(clock))):
+            for q in ("a", "b"):
+                cache.store(self.lookup(cache, q), q.upper())
+            self.assertTrue(self.lookup(cache, "a").hit)  # "b" is now least recently used
+            cache.store(self.lookup(cache, "c"), "C")
+            self.assertTrue(self.lookup(cache, "a").hit)
+            self.assertFalse(self.lookup(cache, "b").hit)
+            self.assertTrue(self.lookup(cache, "c").hit)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_similar_match_only_for_low_temperature_and_same_context(self):
+        embedded = []
+
+        def embed(text):
+            embedded.append(text)
+            return _bag_of_words(text)
+
+        cache = LLMResponseCache(path=":memory:", embed=embed, similarity=0.95, semantic_max_temperature=0.3)
+        first = self.lookup(cache, "Explain the gap for control SEC-NET-0001 firewall", temperature=0.0)
+        cache.store(first, "firewall answer")
+
+        similar = self.lookup(cache, "Explain gap: control SEC-NET-0001, firewall.", temperature=0.0)
+        self.assertTrue(similar.hit)
+        self.assertTrue(similar.similar)
+        self.assertEqual(similar.value, "firewall answer")
+
+        self.assertFalse(self.lookup(cache, "Explain the gap for control SEC-IDN-0002 mfa", temperature=0.0).hit)
+        self.assertFalse(self.lookup(cache, "Explain gap: control SEC-NET-0001, firewall.", temperature=0.0,
+                                     system="You are a classifier.").hit)
+        calls = len(embedded)
+        self.assertFalse(self.lookup(cache, "Explain gap: control SEC-NET-0001, firewall.", temperature=0.7).hit)
+        self.assertEqual(len(embedded), calls)  # no embedding above the temperature cut-off
+        self.assertEqual(cache.stats()["similar_hits"], 1)
+
+    def test_entries_persist_on_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite3")
+            writer = LLMResponseCache(path=path)
+            writer.store(self.lookup(writer, "q"), "answer")
+            reader = LLMResponseCache(path=path)
+            self.assertEqual(self.lookup(reader, "q").value, "answer")
+            writer._db.close()
+            reader._db.close()
+
+    def test_get_llm_cache_disabled_by_zero_ttl(self):
+        with mock.patch.dict(os.environ, {"LLM_CACHE_TTL_HOURS": "0"}):
+            self.assertIsNone(llm_cache.get_llm_cache())
+
+
+class TestChatCompletionCache(unittest.TestCase):
+    def setUp(self):
+        from openai.types.chat import ChatCompletion
+        from shared.ai_service import AzureOpenAIService
+
+        self.calls = []
+
+        def create(**kwargs):
+            self.calls.append(kwargs)
+            return ChatCompletion.model_validate({
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": kwargs["model"],
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": f"answer {len(self.calls)}"},
+                }],
+            })
+
+        self.service = AzureOpenAIService.__new__(AzureOpenAIService)
+        self.service.deployment = "test-deployment"
+        self.service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        self.service.cache = LLMResponseCache(path=":memory:")
+
+    def test_repeated_prompts_skip_the_model(self):
+        gap = dict(control_id="SEC-NET-0001", capability_id="fw", gap_type="hard",
+                   current_coverage=0.0, min_required=0.5, available_tools=["azure-firewall"])
+        first = self.service.explain_gap(**gap)
+        second = self.service.explain_gap(**gap)
+        self.assertEqual(first, "answer 1")
+        self.assertEqual(second, "answer 1")
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.service.cache.stats()["hits"], 1)
+
+    def test_streaming_calls_bypass_the_cache(self):
+        for _ in range(2):
+            self.service.chat_completion(_messages("q"), stream=True)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.service.cache.stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
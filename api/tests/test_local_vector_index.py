@@ -0,0 +1,106 @@
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR.parent / "src"))
+from rag.local_vector_index import LocalVectorRetriever, hashing_embedder
+
+IDENTITY = "Enforce multifactor authentication for every privileged identity and admin account."
+NETWORK = "Segment the network with firewalls and deny inbound traffic from the internet by default."
+DATA = "Encrypt data at rest with customer managed keys and rotate the keys every year."
+
+
+def _keyword_embedder(calls):
+    """Offline embedder with a name, counting the texts it embeds."""
+    vocab = ["identity", "network", "firewall", "data", "keys", "encrypt", "authentication"]
+
+    def embed(texts):
+        calls.append(len(texts))
+        return [[float(text.lower().count(word)) for word in vocab] for text in texts]
+
+    embed.name = "keywords-7"
+    return embed
+
+
+class TestLocalVectorRetriever(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.index_dir = tmp.name
+
+    def _index(self, **kwargs):
+        return LocalVectorRetriever(self.index_dir, embed=kwargs.pop("embed", hashing_embedder(64)), **kwargs)
+
+    def test_incremental_adds_survive_reopening(self):
+        index = self._index()
+        self.assertEqual(index.add_text(IDENTITY, "identity.md"), 1)
+        self.assertEqual(index.add_text(NETWORK, "network.md"), 1)
+        self.assertEqual(index.search("multifactor authentication privileged", top_k=1)[0]["source"], "identity.md")
+
+        reopened = self._index()
+        self.assertEqual(reopened.add_text(DATA, "data.md"), 1)
+        self.assertEqual(reopened.meta["count"], 3)
+        self.assertEqual([c["source"] for c in reopened.chunks], ["identity.md", "network.md", "data.md"])
+        self.assertEqual(reopened.search("encrypt data keys", top_k=1)[0]["source"], "data.md")
+        self.assertEqual(reopened.search("deny inbound internet traffic", top_k=1)[0]["row"], 1)
+
+    def test_reupload_replaces_changed_documents_and_skips_unchanged(self):
+        index = self._index()
+        index.add_text(IDENTITY, "policy.md")
+        self.assertEqual(index.add_text(IDENTITY, "policy.md"), 0)
+        self.assertEqual(index.add_text(NETWORK, "policy.md"), 1)
+
+        reopened = self._index()
+        self.assertEqual(reopened.meta["removed"], [0])
+        results = reopened.search("multifactor authentication", top_k=5)
+        self.assertEqual([r["row"] for r in results], [1])
+        self.assertEqual(results[0]["text"], NETWORK)
+
+    def test_rows_past_the_committed_count_are_cut_on_load(self):
+        index = self._index()
+        index.add_text(IDENTITY, "identity.md")
+        committed = (Path(self.index_dir) / "vectors.f32").stat().st_size
+        # A crash after the rows were written but before meta.json was replaced
+        with open(Path(self.index_dir) / "vectors.f32", "ab") as f:
+            f.write(np.ones((2, 64), dtype=np.float32).tobytes())
+        with open(Path(self.index_dir) / "chunks.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps({"source": "orphan.md", "chunk": 0, "text": "orphan"}) + "\n")
+            f.write('{"source": "orph')
+
+        reopened = self._index()
+        self.assertEqual((Path(self.index_dir) / "vectors.f32").stat().st_size, committed)
+        reopened.add_text(NETWORK, "network.md")
+        self.assertEqual([c["source"] for c in reopened.chunks], ["identity.md", "network.md"])
+        lines = (Path(self.index_dir) / "chunks.jsonl").read_text(encoding="utf-8").splitlines()
+        self.assertEqual([json.loads(line)["source"] for line in lines], ["identity.md", "network.md"])
+        self.assertEqual(self._index().search(NETWORK, top_k=1)[0]["source"], "network.md")
+
+    def test_pluggable_embedder_runs_offline_in_batches(self):
+        calls = []
+        index = self._index(embed=_keyword_embedder(calls), chunk_size=100, chunk_overlap=20, batch_size=2)
+        text = " ".join([IDENTITY, NETWORK, DATA, IDENTITY])
+        added = index.add_text(text, "all.md")
+        self.assertGreater(added, 2)
+        self.assertEqual(sum(calls), added)
+        self.assertTrue(all(n <= 2 for n in calls))
+        self.assertEqual(index.meta["embedder"], "keywords-7")
+        self.assertEqual(index.meta["dimensions"], 7)
+
+        context = asyncio.run(index.retrieve("encrypt keys", top_k=1))
+        self.assertTrue(context.startswith("[all.md] "))
+        self.assertIn("keys", context)
+
+    def test_index_refuses_another_embedder(self):
+        self._index().add_text(IDENTITY, "identity.md")
+        with self.assertRaises(ValueError):
+            self._index(embed=_keyword_embedder([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR))
+sys.path.insert(0, str(API_DIR.parent / "src"))
+from models import providers
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-test",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so the pool holds connections between calls
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps(COMPLETION).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestProvidersAcrossEventLoops(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        providers._providers.clear()
+        env = mock.patch.dict(os.environ, {"AZURE_OPENAI_API_KEY": "test-key"})
+        env.start()
+        self.addCleanup(env.stop)
+        role = SimpleNamespace(
+            deployment="gpt-test", account="test", tenant_id=None,
+            endpoint=f"http://127.0.0.1:{self.server.server_address[1]}",
+        )
+        self.provider = providers.create_provider("azure_openai", role, {"auth_method": "api_key"})
+        self.addCleanup(providers._providers.clear)
+
+    def _run_on_new_loop(self, close_pool):
+        # As multi_agent_assessment does: a fresh loop per request
+        loop = asyncio.new_event_loop()
+        try:
+            async def call():
+                response = await self.provider.chat_completion([{"role": "user", "content": "hi"}], "sys", {})
+                pool = providers.get_http_client()
+                if close_pool:
+                    await providers.aclose_http_client()
+                return response, pool
+            return loop.run_until_complete(call())
+        finally:
+            loop.close()
+
+    def test_sequential_loops_share_provider_not_pool(self):
+        first, first_pool = self._run_on_new_loop(close_pool=False)
+        # The first loop is closed with its keep-alive connection still pooled
+        second, second_pool = self._run_on_new_loop(close_pool=False)
+        self.assertEqual((first["content"], second["content"]), ("ok", "ok"))
+        self.assertIsNot(first_pool, second_pool)
+
+    def test_aclose_releases_only_the_running_loops_pool(self):
+        _, pool = self._run_on_new_loop(close_pool=True)
+        self.assertTrue(pool.is_closed)
+        response, _ = self._run_on_new_loop(close_pool=True)
+        self.assertEqual(response["content"], "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
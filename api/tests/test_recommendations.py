@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.recommendations import (
+    MemoryRecommendationCache,
+    RecommendationPipeline,
+    RecommendationRequest,
+)
+
+
+class _FakeChatServer(ThreadingHTTPServer):
+    """Minimal Azure OpenAI chat-completions endpoint that records concurrency."""
+
+    daemon_threads = True
+
+    def __init__(self, delay: float):
+        super().__init__(("127.0.0.1", 0), _ChatHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][-1]["content"]
+        control = prompt.split("Control: ", 1)[1].split(" - ", 1)[0]
+        with server.lock:
+            server.calls += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if control == "FAIL-1":
+                self.send_response(400)
+                payload = {"error": {"message": "bad request", "type": "invalid_request_error"}}
+            else:
+                self.send_response(200)
+                payload = {
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": body.get("model", "test"),
+                    "choices": [{
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": f"Recommendation for {control}"},
+                    }],
+                }
+            data = json.dumps(payload).encode()
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+def _request(control_id, gaps=None):
+    gaps = gaps or [{"capabilityId": "siem", "weight": 0.5}]
+    tools = [{"id": "google-secops", "name": "Google SecOps", "configScore": 0.8}]
+    return RecommendationRequest.build(control_id, f"{control_id} title", gaps, tools)
+
+
+class TestRecommendationPipeline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = _FakeChatServer(delay=0.2)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        env = {
+            "AZURE_OPENAI_ENDPOINT": f"http://127.0.0.1:{cls.server.server_address[1]}/",
+            "AZURE_OPENAI_API_KEY": "test-key",
+            "AZURE_OPENAI_DEPLOYMENT": "test-deployment",
+            "LLM_CACHE_TTL_HOURS": "0",  # count every model call
+        }
+        with mock.patch.dict(os.environ, env):
+            from shared.ai_service import AzureOpenAIService
+            cls.ai = AzureOpenAIService()
+        cls.ai.client = cls.ai.client.with_options(max_retries=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.calls = 0
+        self.server.max_in_flight = 0
+
+    def test_dedupes_runs_concurrently_and_caches(self):
+        cache = MemoryRecommendationCache()
+        pipeline = RecommendationPipeline(self.ai, cache=cache, max_workers=3)
+        gap_a = {"capabilityId": "siem", "weight": 0.5}
+        gap_b = {"capabilityId": "edr", "weight": 0.5}
+        requests = [_request(f"ID-{i}") for i in range(5)]
+        # Same inputs with gaps in a different order share a result
+        requests += [_request("DUP", [gap_a, gap_b]), _request("DUP", [gap_b, gap_a])]
+
+        started = time.perf_counter()
+        texts = {}
+        for indexes, result in pipeline.run(requests):
+            self.assertIsNone(result.error)
+            for i in indexes:
+                texts[i] = result.text
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(texts), len(requests))
+        self.assertEqual(texts[5], texts[6])
+        self.assertEqual(texts[0], "Recommendation for ID-0")
+        self.assertEqual(self.server.calls, 6)
+        self.assertEqual(self.server.max_in_flight, 3)
+        self.assertLess(elapsed, 6 * 0.2)  # serial would take >= 1.2 s
+
+        self.server.calls = 0
+        again = list(pipeline.run(requests))
+        self.assertEqual(self.server.calls, 0)
+        self.assertTrue(all(result.cached for _, result in again))
+
+    def test_failed_call_is_reported_and_not_cached(self):
+        cache = MemoryRecommendationCache()
+        pipeline = RecommendationPipeline(self.ai, cache=cache, max_workers=2)
+        results = {tuple(i): r for i, r in pipeline.run([_request("FAIL-1"), _request("OK-1")])}
+        self.assertIsNone(results[(0,)].text)
+        self.assertTrue(results[(0,)].error)
+        self.assertEqual(results[(1,)].text, "Recommendation for OK-1")
+        self.assertIsNone(cache.get(results[(0,)].key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import re
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from azure.core.exceptions import ResourceNotFoundError
+from azure.data.tables._serialize import _parameter_filter_substitution
+from shared.registry_service import RegistryService
+
+
+class _Pager:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def by_page(self):
+        return iter([self._rows])
+
+
+class _MemoryTable:
+    """Evaluates the simple OData filters the registry emits (eq/and/or/parentheses)."""
+
+    def __init__(self):
+        self.rows = {}
+        self.queries = []
+
+    def query_entities(self, query_filter, parameters=None, select=None, results_per_page=None):
+        odata = _parameter_filter_substitution(parameters or {}, query_filter)
+        self.queries.append((odata, select))
+        expr = re.sub(r"(\w+) eq '([^']*)'", r"(e.get('\1') == '\2')", odata)
+        rows = [dict(e) for _, e in sorted(self.rows.items()) if eval(expr, {"e": e})]
+        if select:
+            rows = [{k: r.get(k) for k in select} for r in rows]
+        return _Pager(rows)
+
+    def get_entity(self, partition_key, row_key):
+        try:
+            return dict(self.rows[(partition_key, row_key)])
+        except KeyError:
+            raise ResourceNotFoundError("ResourceNotFound")
+
+    def upsert_entity(self, entity):
+        key = (entity["PartitionKey"], entity["RowKey"])
+        self.rows[key] = {**self.rows.get(key, {}), **entity}
+
+    def update_entity(self, entity):
+        key = (entity["PartitionKey"], entity["RowKey"])
+        if key not in self.rows:
+            raise ResourceNotFoundError("ResourceNotFound")
+        self.upsert_entity(entity)
+
+    def delete_entity(self, partition_key, row_key):
+        self.rows.pop((partition_key, row_key), None)
+
+
+def _registry():
+    registry = RegistryService()
+    registry._table_client = _MemoryTable()
+    return registry
+
+
+def _register(registry, agent_id, blueprint="core", capabilities=("research",), collections=None):
+    registry.register_agent(agent_id, None, agent_id.title(), "role", blueprint, list(capabilities), collections)
+
+
+class TestRegistryService(unittest.TestCase):
+    def test_filters_are_pushed_down_and_indexed(self):
+        registry = _registry()
+        for i in range(30):
+            _register(registry, f"agent-{i:02d}", blueprint="core" if i % 2 else "edge",
+                      capabilities=["research"] + (["triage"] if i % 3 == 0 else []))
+        table = registry.table_client
+        registry.ensure_indexes()  # one-time backfill scan
+
+        table.queries.clear()
+        triage = registry.list_agents(capability="triage", blueprint="edge")
+        self.assertEqual([a.agent_id for a in triage], [f"agent-{i:02d}" for i in range(0, 30, 6)])
+        index_query, entry_queries = table.queries[0], table.queries[1:]
+        self.assertEqual(index_query, ("PartitionKey eq 'cap|triage'", ["RowKey"]))
+        # 10 indexed ids -> one chunk, blueprint in the filter, only entry columns selected
+        self.assertEqual(len(entry_queries), 1)
+        self.assertIn("blueprint eq 'edge'", entry_queries[0][0])
+        self.assertIn("RowKey eq 'agent-27'", entry_queries[0][0])
+        self.assertNotIn("Timestamp", entry_queries[0][1])
+
+        registry.update_agent_status("agent-01", "disabled")
+        disabled = registry.list_agents(status="disabled")
+        self.assertEqual([a.agent_id for a in disabled], ["agent-01"])
+        self.assertIn("status eq 'disabled'", table.queries[-1][0])
+
+        self.assertEqual(len(registry.list_agents(collection="secai-core", capability="research")), 30)
+
+    def test_listing_cache_and_invalidation(self):
+        registry = _registry()
+        _register(registry, "alpha")
+        _register(registry, "beta")
+        table = registry.table_client
+
+        self.assertEqual(len(registry.list_agents(collection="secai-core")), 2)
+        queries = len(table.queries)
+        self.assertEqual(len(registry.list_agents(collection="secai-core")), 2)
+        self.assertEqual(len(table.queries), queries)  # served from cache
+
+        self.assertTrue(registry.quarantine_agent("beta"))
+        self.assertEqual([a.agent_id for a in registry.list_agents(collection="quarantine")], ["beta"])
+        self.assertEqual([a.agent_id for a in registry.list_agents(status="quarantined")], ["beta"])
+
+        registry.unquarantine_agent("beta")
+        self.assertEqual(registry.list_agents(collection="quarantine"), [])
+        self.assertNotIn(("col|quarantine", "beta"), table.rows)
+
+        # Re-registering with different capabilities moves the index rows
+        _register(registry, "alpha", capabilities=["triage"])
+        self.assertEqual(registry.list_agents(capability="research")[0].agent_id, "beta")
+        self.assertEqual(registry.list_agents(capability="triage")[0].agent_id, "alpha")
+
+    def test_last_active_patches_cache_and_listings_are_copies(self):
+        registry = _registry()
+        _register(registry, "alpha")
+        _register(registry, "beta")
+        table = registry.table_client
+
+        listed = registry.list_agents(collection="secai-core")
+        before = [a.last_active_at for a in listed]
+        queries = len(table.queries)
+
+        registry.update_last_active("alpha")
+        registry.update_last_active("ghost")  # unregistered: no row is created
+        self.assertNotIn(("agents", "ghost"), table.rows)
+        self.assertEqual(table.rows[("agents", "alpha")]["name"], "Alpha")  # merged, not replaced
+
+        cached = registry.list_agents(collection="secai-core")
+        self.assertEqual(len(table.queries), queries)  # still served from cache
+        self.assertGreater(cached[0].last_active_at, before[0])
+        self.assertEqual(cached[1].last_active_at, before[1])
+        self.assertEqual(listed[0].last_active_at, before[0])  # earlier results are not mutated
+
+        cached[0].collections.append("mutated")
+        cached[0].metadata["k"] = "v"
+        again = registry.list_agents(collection="secai-core")
+        self.assertNotIn("mutated", again[0].collections)
+        self.assertEqual(again[0].metadata, cached[1].metadata)
+
+    def test_backfills_indexes_for_existing_agents(self):
+        registry = _registry()
+        registry.table_client.upsert_entity({
+            "PartitionKey": "agents", "RowKey": "legacy", "name": "Legacy", "status": "active",
+            "blueprint": "core", "capabilities": "research", "collections": "secai-core",
+            "created_at": "2025-01-01T00:00:00", "updated_at": "2025-01-01T00:00:00",
+        })
+        self.assertEqual([a.agent_id for a in registry.list_agents(capability="research")], ["legacy"])
+        self.assertIn(("meta", "indexes"), registry.table_client.rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
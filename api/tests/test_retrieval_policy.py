@@ -0,0 +1,161 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR.parent / "src"))
+from rag.agentic_retrieval import AgenticRetriever
+from rag.base_retriever import BaseRetriever
+from rag.retrieval_policy import RetrievalPolicy, tfidf_relevance
+
+KB_TASK = "Review the Azure landing zone security guidance"
+VAGUE_TASK = "Think about what comes next for the team"
+RELEVANT = (
+    "Landing zone guidance: deploy Azure policy assignments and security baselines at the "
+    "management group.\n\nBilling scopes follow the customer agreement."
+)
+UNRELATED = "The cafeteria menu changes weekly.\n\nParking permits renew in spring."
+
+
+class _StubModelLayer:
+    """Answers each agentic prompt and counts the calls, tracking how many overlap."""
+
+    def __init__(self, retrieve="yes", query="landing zone guidance", relevance="relevant"):
+        self.answers = {"needs to search": retrieve, "search query": query, "relevant to this task": relevance}
+        self.calls = {key: 0 for key in self.answers}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def reasoning(self, prompt):
+        key = next(k for k in self.answers if k in prompt)
+        self.calls[key] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {"content": self.answers[key]}
+
+
+class _StubRetriever(BaseRetriever):
+    def __init__(self, content):
+        self.content = content
+        self.queries = []
+
+    async def retrieve(self, query, context=None, top_k=5):
+        self.queries.append(query)
+        return self.content
+
+    async def upload_document(self, document_path, metadata=None):
+        return True
+
+
+class _CountingPolicy(RetrievalPolicy):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.evaluated = {"should_retrieve": 0, "generate_query": 0}
+
+    def should_retrieve(self, task_description, agent_context=""):
+        self.evaluated["should_retrieve"] += 1
+        return super().should_retrieve(task_description, agent_context)
+
+    def generate_query(self, task_description, agent_context=None):
+        self.evaluated["generate_query"] += 1
+        return super().generate_query(task_description, agent_context)
+
+
+class TestRetrievalPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetrievalPolicy()
+
+    def test_should_retrieve_keywords(self):
+        kb = self.policy.should_retrieve(KB_TASK)
+        self.assertEqual((kb.value, self.policy.confident(kb)), (True, True))
+        internal = self.policy.should_retrieve("Collate the status report for the steering group")
+        self.assertEqual((internal.value, self.policy.confident(internal)), (False, True))
+        mixed = self.policy.should_retrieve("Track Azure policy compliance")
+        self.assertFalse(self.policy.confident(mixed))
+        context_only = self.policy.should_retrieve(VAGUE_TASK, "earlier notes mention the landing zone")
+        self.assertEqual((context_only.value, self.policy.confident(context_only)), (True, False))
+        self.assertFalse(self.policy.confident(self.policy.should_retrieve(VAGUE_TASK)))
+
+    def test_query_is_trimmed_to_key_terms(self):
+        decision = self.policy.generate_query("Please provide the Azure landing zone guidance for the landing zone")
+        self.assertEqual(decision.value, "azure landing zone guidance")
+        self.assertTrue(self.policy.confident(decision))
+
+        long_task = "Azure " + " ".join(f"term{i}" for i in range(20))
+        self.assertFalse(self.policy.confident(self.policy.generate_query(long_task)))
+        self.assertFalse(self.policy.confident(self.policy.generate_query(VAGUE_TASK)))
+        self.assertEqual(self.policy.generate_query("the of and").confidence, 0.0)
+
+    def test_relevance_thresholds(self):
+        accepted = self.policy.evaluate_relevance(RELEVANT, KB_TASK)
+        self.assertEqual((accepted.value, self.policy.confident(accepted)), (True, True))
+        rejected = self.policy.evaluate_relevance(UNRELATED, KB_TASK)
+        self.assertEqual((rejected.value, self.policy.confident(rejected)), (False, True))
+        self.assertFalse(self.policy.evaluate_relevance("  ", KB_TASK).value)
+
+        score = tfidf_relevance(KB_TASK, RELEVANT)
+        self.assertTrue(RetrievalPolicy(relevance_accept=score).evaluate_relevance(RELEVANT, KB_TASK).value)
+        at_reject = RetrievalPolicy(relevance_accept=1.0, relevance_reject=score).evaluate_relevance(RELEVANT, KB_TASK)
+        self.assertEqual((at_reject.value, at_reject.confidence), (False, 0.85))
+        between = RetrievalPolicy(relevance_accept=score + 0.1, relevance_reject=score - 0.1)
+        self.assertFalse(between.confident(between.evaluate_relevance(RELEVANT, KB_TASK)))
+
+
+class TestAgenticRetriever(unittest.TestCase):
+    def test_confident_decisions_skip_the_model(self):
+        model, retriever, policy = _StubModelLayer(), _StubRetriever(RELEVANT), _CountingPolicy()
+        agentic = AgenticRetriever(retriever, model, policy)
+        self.assertEqual(asyncio.run(agentic.agentic_retrieve(KB_TASK)), RELEVANT)
+        self.assertEqual(sum(model.calls.values()), 0)
+        self.assertEqual(retriever.queries, ["review azure landing zone security guidance"])
+        # Each local decision is made once per agentic_retrieve
+        self.assertEqual(policy.evaluated, {"should_retrieve": 1, "generate_query": 1})
+        stats = agentic.stats()
+        self.assertEqual(stats["model_calls"], 0)
+        self.assertEqual(stats["model_calls_saved_by_tier"],
+                         {"should_retrieve": 1, "generate_query": 1, "evaluate_relevance": 1})
+
+    def test_unsure_decisions_escalate_together_and_concurrently(self):
+        model, retriever = _StubModelLayer(), _StubRetriever(RELEVANT)
+        # Relevance is asked of the model too (nothing is sure about the vague task)
+        policy = _CountingPolicy(relevance_accept=2.0, relevance_reject=-1.0)
+        agentic = AgenticRetriever(retriever, model, policy)
+        self.assertEqual(asyncio.run(agentic.agentic_retrieve(VAGUE_TASK)), RELEVANT)
+        self.assertEqual(model.calls["needs to search"], 1)
+        self.assertEqual(model.calls["search query"], 1)
+        self.assertEqual(model.calls["relevant to this task"], 1)
+        self.assertEqual(model.max_in_flight, 2)
+        self.assertEqual(retriever.queries, ["landing zone guidance"])
+        self.assertEqual(policy.evaluated, {"should_retrieve": 1, "generate_query": 1})
+        tiers = agentic.stats()["tiers"]
+        self.assertEqual(tiers["should_retrieve"], {"local": 0, "model": 1})
+        self.assertEqual(tiers["generate_query"], {"local": 0, "model": 1})
+
+    def test_model_decline_discards_the_query(self):
+        model, retriever = _StubModelLayer(retrieve="no"), _StubRetriever(RELEVANT)
+        agentic = AgenticRetriever(retriever, model, RetrievalPolicy())
+        self.assertIsNone(asyncio.run(agentic.agentic_retrieve(VAGUE_TASK)))
+        self.assertEqual(retriever.queries, [])
+        self.assertEqual(agentic.stats()["model_calls"], 2)
+
+    def test_unsure_relevance_is_asked_of_the_model(self):
+        model, retriever = _StubModelLayer(relevance="not relevant"), _StubRetriever(RELEVANT)
+        policy = RetrievalPolicy(relevance_accept=1.0, relevance_reject=0.0)
+        agentic = AgenticRetriever(retriever, model, policy)
+        self.assertIsNone(asyncio.run(agentic.agentic_retrieve(KB_TASK)))
+        self.assertEqual(model.calls, {"needs to search": 0, "search query": 0, "relevant to this task": 1})
+        self.assertEqual(agentic.stats()["tiers"]["evaluate_relevance"], {"local": 0, "model": 1})
+
+    def test_without_a_model_local_decisions_stand(self):
+        retriever = _StubRetriever(RELEVANT)
+        agentic = AgenticRetriever(retriever, None, RetrievalPolicy())
+        self.assertIsNone(asyncio.run(agentic.agentic_retrieve(VAGUE_TASK)))
+        self.assertEqual(agentic.stats()["tiers"]["should_retrieve"], {"local": 1, "model": 0})
+        self.assertEqual(AgenticRetriever(retriever).stats(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
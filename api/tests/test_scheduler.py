@@ -0,0 +1,118 @@
+import copy
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+API_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(API_DIR))
+sys.path.insert(0, str(API_DIR.parent / "src"))
+from orchestrator.event_store import EventLog
+from orchestrator.event_stream import EventBroker
+from orchestrator.events import EventEmitter, EventType
+from orchestrator.scheduler import _merge_list, _renumber, merge_states
+from orchestrator.state import StateManager
+
+
+def _finding(state, title):
+    state["findings"].append({"id": f"finding_{len(state['findings']) + 1}", "title": title})
+
+
+class TestMergeList(unittest.TestCase):
+    def test_keeps_base_items_no_branch_removed_and_appends_in_branch_order(self):
+        base = ["a", "b", "c"]
+        merged = _merge_list(base, [["a", "b", "c", "x"], ["a", "c", "y", "z"], ["a", "b", "c"]])
+        self.assertEqual(merged, ["a", "c", "x", "y", "z"])
+        self.assertEqual(base, ["a", "b", "c"])
+
+    def test_renumber_copies_only_items_whose_id_changes(self):
+        items = [{"id": "finding_3"}, {"id": "finding_3"}, {"id": "custom"}, "plain"]
+        renumbered = _renumber(items, 2, "finding_")
+        self.assertIs(renumbered[0], items[0])
+        self.assertEqual(renumbered[1], {"id": "finding_4"})
+        self.assertIsNot(renumbered[1], items[1])
+        self.assertEqual(items[1], {"id": "finding_3"})
+        self.assertEqual(renumbered[2:], [{"id": "custom"}, "plain"])
+
+
+class TestMergeStates(unittest.TestCase):
+    def setUp(self):
+        self.broker = EventBroker()
+        patcher = mock.patch("orchestrator.event_stream.get_event_broker", return_value=self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.state_manager = StateManager()
+        self.base = self.state_manager.create_initial_state(assessment_id="a1", tenant_id="CONTOSO", budget=100.0)
+        _finding(self.base, "seed")
+
+    def _branches(self, n):
+        return [copy.deepcopy(self.base) for _ in range(n)]
+
+    def test_budget_deltas_are_summed(self):
+        first, second = self._branches(2)
+        first["budget_remaining"] -= 10.0
+        second["budget_remaining"] -= 2.5
+        merged = merge_states(self.base, [first, second])
+        self.assertEqual(merged["budget_remaining"], 87.5)
+        self.assertEqual(self.base["budget_remaining"], 100.0)
+
+    def test_findings_and_conflicts_are_renumbered_without_touching_branches(self):
+        first, second = self._branches(2)
+        _finding(first, "identity")
+        _finding(second, "network")
+        _finding(second, "data")
+        second["active_conflicts"].append({"id": "conflict_1", "topic": "scope"})
+        first["active_conflicts"].append({"id": "conflict_1", "topic": "budget"})
+        second_findings = copy.deepcopy(second["findings"])
+
+        merged = merge_states(self.base, [first, second])
+        self.assertEqual([(f["id"], f["title"]) for f in merged["findings"]], [
+            ("finding_1", "seed"), ("finding_2", "identity"), ("finding_3", "network"), ("finding_4", "data"),
+        ])
+        self.assertEqual([(c["id"], c["topic"]) for c in merged["active_conflicts"]],
+                         [("conflict_1", "budget"), ("conflict_2", "scope")])
+        self.assertEqual(second["findings"], second_findings)
+
+    def test_removed_finding_is_dropped_and_new_ones_follow_the_kept(self):
+        first, second = self._branches(2)
+        first["findings"].clear()
+        _finding(first, "replacement")
+        _finding(second, "network")
+        merged = merge_states(self.base, [first, second])
+        self.assertEqual([(f["id"], f["title"]) for f in merged["findings"]],
+                         [("finding_1", "replacement"), ("finding_2", "network")])
+
+    def test_events_are_renumbered_as_copies_of_published_events(self):
+        EventEmitter.emit_event(self.base, EventType.TASK_STARTED, "supervisor", "General", "plan", 1.0, "Plan")
+        first, second = self._branches(2)
+        EventEmitter.emit_event(first, EventType.TASK_COMPLETED, "leo", "Identity", "scan", 10.0, "Scan")
+        EventEmitter.emit_event(second, EventType.TASK_COMPLETED, "ravi", "Network", "scan", 5.0, "Scan")
+        EventEmitter.emit_event(second, EventType.FINDING_IDENTIFIED, "ravi", "Network", "flag", 7.0, "Flag")
+
+        merged = merge_states(self.base, [first, second])
+        events = merged["events"]
+        self.assertIsInstance(events, EventLog)
+        self.assertEqual([e["id"] for e in events], ["event_1", "event_2", "event_3", "event_4"])
+        self.assertEqual([e["agent_id"] for e in events], ["supervisor", "leo", "ravi", "ravi"])
+        self.assertEqual(events.domain_stats()["Network"], {"count": 2, "impact_sum": 12.0})
+
+        # Subscribers keep the ids they were sent; the branch state is untouched too
+        published = [event for _, event in self.broker.read("a1").events]
+        self.assertEqual([e["id"] for e in published], ["event_1", "event_2", "event_2", "event_3"])
+        self.assertEqual([e["id"] for e in second["events"]], ["event_1", "event_2", "event_3"])
+
+    def test_agent_contexts_last_writer_wins(self):
+        first, second, third = self._branches(3)
+        self.state_manager.update_agent_context(first, "leo", task="identity")
+        self.state_manager.update_agent_context(second, "ravi", task="network")
+        self.state_manager.update_agent_context(third, "leo", task="identity-2")
+        third["phase"] = "analysis"
+
+        merged = merge_states(self.base, [first, second, third])
+        self.assertEqual(merged["agent_contexts"]["leo"], third["agent_contexts"]["leo"])
+        self.assertEqual(merged["agent_contexts"]["ravi"], second["agent_contexts"]["ravi"])
+        self.assertEqual(merged["phase"], "analysis")
+
+
+if __name__ == "__main__":
+    unittest.main()
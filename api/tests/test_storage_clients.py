@@ -0,0 +1,50 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared import utils
+from shared.utils import StorageClients
+
+
+class TestStorageClients(unittest.TestCase):
+    def test_table_clients_are_created_and_ensured_once(self):
+        with mock.patch.object(utils, "TableServiceClient") as svc_cls:
+            svc = svc_cls.from_connection_string.return_value
+            clients = StorageClients("UseDevelopmentStorage=true", None)
+            first = clients.table("Controls")
+            second = clients.table("Controls")
+            clients.table("TenantTools")
+
+        self.assertIs(first, second)
+        svc_cls.from_connection_string.assert_called_once()
+        self.assertEqual(svc.create_table_if_not_exists.call_count, 2)
+
+    def test_failed_ensure_is_retried(self):
+        with mock.patch.object(utils, "TableServiceClient") as svc_cls:
+            svc = svc_cls.from_connection_string.return_value
+            svc.create_table_if_not_exists.side_effect = [RuntimeError("throttled"), None]
+            clients = StorageClients("UseDevelopmentStorage=true", None)
+            clients.table("Controls")
+            clients.table("Controls")
+            clients.table("Controls")
+        self.assertEqual(svc.create_table_if_not_exists.call_count, 2)
+
+    def test_container_is_ensured_once(self):
+        with mock.patch.object(utils, "BlobServiceClient") as svc_cls:
+            svc = svc_cls.from_connection_string.return_value
+            clients = StorageClients(None, "UseDevelopmentStorage=true")
+            self.assertIs(clients.container("assessments"), clients.container("assessments"))
+        svc.create_container.assert_called_once_with("assessments")
+
+    def test_missing_connection_string_raises(self):
+        clients = StorageClients(None, None)
+        with self.assertRaises(ValueError):
+            clients.table("Controls")
+        with self.assertRaises(ValueError):
+            clients.container("assessments")
+
+
+if __name__ == "__main__":
+    unittest.main()
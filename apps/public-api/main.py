@@ -9,11 +9,13 @@ from fastapi.exceptions import RequestValidationError
 from datetime import datetime
 from src.middleware.etag import etag_middleware
 from src.middleware.rate_limit import rate_limit_middleware
+from src.serialization import FastJSONResponse
 
 app = FastAPI(
     title="SecAI Radar Public API",
     description="Public read-only API for Verified MCP Trust Hub",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse,
 )
 
 # CORS middleware - must be added first to apply to all responses
@@ -82,6 +84,14 @@ app.include_router(well_known.router)
 app.include_router(status.router)
 app.include_router(pipeline.router)
 
+
+@app.on_event("shutdown")
+async def close_async_pool():
+    """Release pooled asyncpg connections on worker shutdown."""
+    from src.database import dispose_async_engine
+    await dispose_async_engine()
+
+
 # Graph router (optional)
 try:
     from src.routers import graph
@@ -0,0 +1,13 @@
+-- Precomputed public feeds (feed.xml / feed.json), written by the publisher once per brief
+-- and streamed as stored bytes by GET /mcp/feed.xml and /mcp/feed.json.
+
+CREATE TABLE IF NOT EXISTS feed_artifacts (
+    feed_name VARCHAR(32) PRIMARY KEY,        -- 'feed.xml' | 'feed.json'
+    content_type VARCHAR(100) NOT NULL,
+    body BYTEA NOT NULL,
+    digest CHAR(64) NOT NULL,                 -- SHA-256 of body
+    etag VARCHAR(80) NOT NULL,                -- quoted, sent as-is in the ETag header
+    latest_brief_date DATE,
+    item_count INTEGER NOT NULL DEFAULT 0,
+    generated_at TIMESTAMPTZ NOT NULL
+);
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark: sync Session vs AsyncSession on the rankings query.
+
+Simulates N concurrent requests inside one event loop (one uvicorn worker) and reports
+wall time, per-request latency and the worst event-loop stall. In sync mode every query
+blocks the loop, so latency grows with concurrency; in async mode requests overlap up to
+the pool size (DB_POOL_SIZE + DB_MAX_OVERFLOW).
+
+Usage (from apps/public-api, same DATABASE_URL as migrate.py/seed.py):
+    python scripts/bench_db_concurrency.py --concurrency 50 --rounds 3
+    python scripts/bench_db_concurrency.py --mode async --page-size 100
+    python scripts/bench_db_concurrency.py --server-latency-ms 20   # emulate a remote/slow DB
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text  # noqa: E402
+
+from src.database import SessionLocal, get_async_sessionmaker, dispose_async_engine  # noqa: E402
+from src.services.rankings import rankings_page_query  # noqa: E402
+
+
+async def _loop_monitor(stop: asyncio.Event, interval: float, stalls: list) -> None:
+    """Record how late the loop wakes up; large values mean something blocked it."""
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(interval)
+        stalls.append(time.perf_counter() - t0 - interval)
+
+
+async def _sync_request(page_size: int, latency_s: float) -> float:
+    db = SessionLocal()
+    try:
+        if latency_s:
+            db.execute(text("SELECT pg_sleep(:s)"), {"s": latency_s})
+        db.execute(rankings_page_query(page_size=page_size)).all()
+    finally:
+        db.close()
+    return time.perf_counter()
+
+
+async def _async_request(page_size: int, latency_s: float) -> float:
+    async with get_async_sessionmaker()() as db:
+        if latency_s:
+            await db.execute(text("SELECT pg_sleep(:s)"), {"s": latency_s})
+        (await db.execute(rankings_page_query(page_size=page_size))).all()
+    return time.perf_counter()
+
+
+async def run_mode(
+    mode: str, concurrency: int, rounds: int, page_size: int, latency_s: float = 0.0
+) -> dict:
+    request = _sync_request if mode == "sync" else _async_request
+    await request(page_size, 0.0)  # warm the pool
+
+    latencies: list = []
+    stalls: list = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_loop_monitor(stop, 0.005, stalls))
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        # Latency is measured from dispatch, so time spent queued behind a blocked loop counts.
+        dispatched = time.perf_counter()
+        finished = await asyncio.gather(*(request(page_size, latency_s) for _ in range(concurrency)))
+        latencies.extend(done - dispatched for done in finished)
+    wall = time.perf_counter() - t0
+    stop.set()
+    await monitor
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "wall_s": wall,
+        "rps": len(latencies) / wall if wall else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_loop_stall_ms": max(stalls, default=0.0) * 1000,
+    }
+
+
+async def main_async(args) -> int:
+    modes = ["sync", "async"] if args.mode == "both" else [args.mode]
+    print(
+        f"Rankings query, pageSize={args.page_size}, concurrency={args.concurrency}, "
+        f"rounds={args.rounds}, serverLatency={args.server_latency_ms}ms, "
+        f"pool={os.getenv('DB_POOL_SIZE', '5')}+{os.getenv('DB_MAX_OVERFLOW', '10')}"
+    )
+    print(f"{'mode':<6} {'reqs':>5} {'wall s':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'max stall ms':>13}")
+    try:
+        for mode in modes:
+            r = await run_mode(
+                mode, args.concurrency, args.rounds, args.page_size, args.server_latency_ms / 1000
+            )
+            print(
+                f"{r['mode']:<6} {r['requests']:>5} {r['wall_s']:>8.2f} {r['rps']:>8.1f} "
+                f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['max_loop_stall_ms']:>13.1f}"
+            )
+    finally:
+        await dispose_async_engine()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare sync vs async DB sessions under concurrency")
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--server-latency-ms", type=float, default=0.0,
+                        help="Extra pg_sleep per request to emulate network/slow-query latency")
+    args = parser.parse_args()
+    try:
+        return asyncio.run(main_async(args))
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Serializer benchmark over real rankings payloads.
+
+Compares the previous response path (jsonable_encoder -> stdlib json render -> ETag
+json.loads + json.dumps(sort_keys) + md5) with the orjson path (one encode, md5 of the
+bytes). Payloads come from the rankings service (pageSize=100) wrapped in the same
+JSON-LD envelope as GET /mcp/rankings; --synthetic N repeats rows when the DB is small.
+
+Usage (from apps/public-api, same DATABASE_URL as migrate.py/seed.py):
+    python scripts/bench_serialization.py --iterations 500
+    python scripts/bench_serialization.py --synthetic 100
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from src.constants.attestation import (  # noqa: E402
+    build_attestation_envelope,
+    build_decay_parameters,
+    record_integrity_digest,
+)
+from src.database import get_async_sessionmaker, dispose_async_engine  # noqa: E402
+from src.serialization import dumps, etag_for_bytes  # noqa: E402
+from src.services.rankings import get_rankings  # noqa: E402
+
+
+async def _load_items(page_size: int) -> list:
+    try:
+        async with get_async_sessionmaker()() as db:
+            return (await get_rankings(db, page_size=page_size))["servers"]
+    finally:
+        await dispose_async_engine()
+
+
+def _envelope(items: list) -> dict:
+    now = datetime.utcnow()
+    for it in items:
+        it["integrityDigest"] = record_integrity_digest(
+            it["serverId"], it["trustScore"], it["tier"], it["evidenceIds"], now
+        )
+    return {
+        "@context": {
+            "@vocab": "https://schema.org/",
+            "secai": "https://secairadar.cloud/ontology/",
+            "trustScore": "secai:trustScore",
+            "domainScores": "secai:domainScores",
+            "integrityDigest": "secai:integrityDigest",
+            "evidenceClass": "secai:evidenceClass",
+        },
+        "attestation": build_attestation_envelope("v1.0", as_of=now),
+        "decayParameters": build_decay_parameters(),
+        "methodologyVersion": "v1.0",
+        "generatedAt": now.isoformat(),
+        "data": {"items": items},
+        "meta": {"total": len(items), "page": 1, "pageSize": len(items)},
+    }
+
+
+def _stdlib_path(payload: dict) -> str:
+    body = json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+    content = json.dumps(json.loads(body), sort_keys=True)
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+def _orjson_path(payload: dict) -> str:
+    return etag_for_bytes(dumps(payload))
+
+
+def _time(fn, payload: dict, iterations: int) -> float:
+    fn(payload)
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        fn(payload)
+    return (time.perf_counter() - t0) / iterations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark rankings payload serialization")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Repeat DB rows until the payload has this many items")
+    args = parser.parse_args()
+
+    try:
+        items = asyncio.run(_load_items(args.page_size))
+    except Exception as e:
+        print(f"❌ Error loading rankings: {e}", file=sys.stderr)
+        return 1
+    if not items:
+        print("❌ No ranked servers; seed the DB first (scripts/seed.py --refresh)", file=sys.stderr)
+        return 1
+    if args.synthetic and len(items) < args.synthetic:
+        items = [dict(items[i % len(items)]) for i in range(args.synthetic)]
+
+    payload = _envelope(items)
+    size = len(dumps(payload))
+    stdlib_s = _time(_stdlib_path, payload, args.iterations)
+    orjson_s = _time(_orjson_path, payload, args.iterations)
+    print(f"Rankings payload: {len(items)} items, {size / 1024:.1f} KiB, {args.iterations} iterations")
+    print(f"  stdlib encode + ETag re-dump : {stdlib_s * 1000:8.3f} ms/response")
+    print(f"  orjson encode + ETag on bytes: {orjson_s * 1000:8.3f} ms/response")
+    print(f"  speedup: {stdlib_s / orjson_s:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,42 +3,66 @@ ETag and caching middleware
 """
 
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-import hashlib
-import json
+from src.serialization import dumps, etag_for_bytes
+
+CACHE_CONTROL = "public, max-age=300"  # 5 minutes
 
 
 def generate_etag(data: dict) -> str:
     """Generate ETag from response data"""
-    content = json.dumps(data, sort_keys=True)
-    return hashlib.md5(content.encode()).hexdigest()
+    return etag_for_bytes(dumps(data, sort_keys=True))
+
+
+def stored_response(request: Request, body: bytes, media_type: str, etag: str) -> Response:
+    """
+    Response for pre-encoded bytes with a precomputed (quoted) ETag, honouring
+    If-None-Match. Used for publisher-materialized feeds.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and etag.strip('"') in (t.strip().strip('"') for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
 
 
 async def etag_middleware(request: Request, call_next):
-    """ETag middleware for caching"""
+    """
+    ETag middleware for caching.
+    Hashes the already-encoded JSON body (no parse/re-dump); routes that set their own
+    Cache-Control (e.g. /status no-store) keep it. Responses that already carry an ETag
+    (stored feeds) are passed through without buffering.
+    """
     response = await call_next(request)
-    
-    # Only add ETag for GET requests with JSON responses
-    if request.method == "GET" and isinstance(response, JSONResponse):
-        body = response.body
-        if body:
-            try:
-                data = json.loads(body)
-                etag = generate_etag(data)
-                response.headers["ETag"] = f'"{etag}"'
-                response.headers["Cache-Control"] = "public, max-age=300"  # 5 minutes
-                
-                # Check If-None-Match header
-                if_none_match = request.headers.get("If-None-Match")
-                if if_none_match and if_none_match.strip('"') == etag:
-                    return Response(
-                        status_code=304,
-                        headers={
-                            "ETag": f'"{etag}"',
-                            "Cache-Control": "public, max-age=300",
-                        },
-                    )
-            except:
-                pass
-    
-    return response
+
+    # Only add ETag for successful GET requests with JSON responses
+    if request.method != "GET" or response.status_code != 200:
+        return response
+    if "etag" in response.headers:
+        return response
+    if not response.headers.get("content-type", "").startswith("application/json"):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    buffered = Response(content=body, status_code=response.status_code)
+    # Raw header list, so repeated headers (several set-cookie) survive
+    buffered.raw_headers = [(k, v) for k, v in response.raw_headers if k.lower() != b"content-length"]
+    headers = buffered.headers
+    headers["content-length"] = str(len(body))
+    if body:
+        etag = etag_for_bytes(body)
+        headers["ETag"] = f'"{etag}"'
+        if "cache-control" not in headers:
+            headers["cache-control"] = CACHE_CONTROL
+
+        # Check If-None-Match header
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and if_none_match.strip('"') == etag:
+            return Response(
+                status_code=304,
+                headers={
+                    "ETag": f'"{etag}"',
+                    "Cache-Control": headers["cache-control"],
+                },
+            )
+
+    return buffered
@@ -11,7 +11,7 @@ from fastapi.responses import JSONResponse
 
 
 # Limits per IP per minute (req/min)
-LIMIT_FEED = 10
+LIMIT_FEED = 60  # feeds are served from publisher-materialized bytes (feed_artifacts)
 LIMIT_HEALTH = 20
 LIMIT_HEALTH_STATUS = 20
 LIMIT_HEAVY = 50   # search / rankings
@@ -1,29 +1,107 @@
 """
 Redaction middleware - removes private data from public responses
+
+Schema-driven: REDACTION_PATHS lists, per endpoint, the only places private fields can
+appear. Redactors are compiled once at import and strip those keys in place, so payloads
+without private paths (rankings, summary, server detail) are returned untouched instead
+of being rebuilt by a full recursive walk.
 """
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+PRIVATE_FIELDS = ("blob_ref", "workspace_id", "internal_notes", "submitted_by")
+
+# Path segments are dict keys; "*" means every element of a list.
+Path = Tuple[str, ...]
+
+REDACTION_PATHS: Dict[str, Tuple[Path, ...]] = {
+    "summary": (),
+    "rankings": (),
+    "recently_updated": (),
+    "server_detail": (),
+    "server_evidence": (("evidenceItems", "*"), ("claims", "*")),
+    "server_graph": (("nodes", "*", "properties"),),
+}
+
+
+def _strip(node: Any, path: Path, depth: int) -> None:
+    if depth == len(path):
+        if isinstance(node, dict):
+            for field in PRIVATE_FIELDS:
+                node.pop(field, None)
+        return
+    key = path[depth]
+    if key == "*":
+        if isinstance(node, list):
+            for item in node:
+                _strip(item, path, depth + 1)
+    elif isinstance(node, dict):
+        child = node.get(key)
+        if child is not None:
+            _strip(child, path, depth + 1)
+
+
+def compile_redactor(paths: Iterable[Path]) -> Callable[[Any], Any]:
+    """Build an in-place redactor for a fixed set of paths."""
+    paths = tuple(tuple(p) for p in paths)
+    if not paths:
+        return lambda data: data
+
+    def redact(data: Any) -> Any:
+        for path in paths:
+            _strip(data, path, 0)
+        return data
+
+    return redact
+
+
+_REDACTORS: Dict[str, Callable[[Any], Any]] = {
+    endpoint: compile_redactor(paths) for endpoint, paths in REDACTION_PATHS.items()
+}
+
+
+def redact_for(endpoint: str, data: Any) -> Any:
+    """
+    Strip private fields in place using the endpoint's precompiled paths.
+    Unknown endpoints fall back to the full recursive walk.
+    """
+    redactor = _REDACTORS.get(endpoint)
+    if redactor is None:
+        return redact_response(data)
+    return redactor(data)
+
+
+def model_to_public_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Column values of an ORM row without private fields (excluded at serialization time,
+    so no copy-then-delete and no SQLAlchemy instance state in the payload).
+    """
+    return {
+        attr.key: getattr(obj, attr.key)
+        for attr in obj.__mapper__.column_attrs
+        if attr.key not in PRIVATE_FIELDS
+    }
 
 
 def redact_evidence_item(item: Dict[str, Any]) -> Dict[str, Any]:
     """
     Redact private fields from evidence item for public API
-    
+
     Removes:
     - blob_ref (private Azure Storage path)
     - Any internal metadata
     """
     redacted = item.copy()
-    
+
     # Remove private blob references
     if "blob_ref" in redacted:
         del redacted["blob_ref"]
-    
+
     # Remove any other private fields
     private_fields = ["internal_notes", "workspace_id", "submitted_by"]
     for field in private_fields:
         redacted.pop(field, None)
-    
+
     return redacted
 
 
@@ -36,7 +114,7 @@ def redact_response(data: Any) -> Any:
             data["evidenceItems"] = [redact_evidence_item(item) for item in data["evidenceItems"]]
         if "evidence_items" in data:
             data["evidence_items"] = [redact_evidence_item(item) for item in data["evidence_items"]]
-        
+
         # Recursively process nested dicts
         return {k: redact_response(v) for k, v in data.items()}
     elif isinstance(data, list):
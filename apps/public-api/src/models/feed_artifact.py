@@ -0,0 +1,20 @@
+"""
+Feed artifact model - precomputed feed.xml / feed.json bytes written by the publisher.
+"""
+
+from sqlalchemy import Column, String, Integer, Date, DateTime, LargeBinary
+from .base import Base
+
+
+class FeedArtifact(Base):
+    """Rendered public feed with its digest and ETag (one row per feed)."""
+    __tablename__ = "feed_artifacts"
+
+    feed_name = Column(String(32), primary_key=True)
+    content_type = Column(String(100), nullable=False)
+    body = Column(LargeBinary, nullable=False)
+    digest = Column(String(64), nullable=False)
+    etag = Column(String(80), nullable=False)
+    latest_brief_date = Column(Date, nullable=True)
+    item_count = Column(Integer, nullable=False, default=0)
+    generated_at = Column(DateTime(timezone=True), nullable=False)
@@ -5,10 +5,11 @@ Agents API routes.
 from fastapi import APIRouter, Query, HTTPException, Depends
 from typing import Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import select, func, desc, or_
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import get_db
+from src.database import get_async_db
+from src.serialization import FastJSONResponse
 from src.constants.attestation import (
     VERIFIED_RECENCY_DAYS,
     VERIFIED_MIN_EVIDENCE_CONFIDENCE,
@@ -33,19 +34,25 @@ METHODOLOGY_VERSION = "v1.0"
 async def get_agent_rankings(
     page: int = Query(1, ge=1),
     pageSize: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get verified agents rankings with pagination."""
     # Simple query for agents and their latest scores
-    query = db.query(Agent, AgentScoreSnapshot).outerjoin(
+    query = select(Agent, AgentScoreSnapshot).outerjoin(
         AgentLatestScore, Agent.agent_id == AgentLatestScore.agent_id
     ).outerjoin(
         AgentScoreSnapshot, AgentLatestScore.score_id == AgentScoreSnapshot.score_id
     )
     
-    total = query.count()
+    total = (
+        await db.execute(select(func.count()).select_from(Agent))
+    ).scalar_one()
     offset = (page - 1) * pageSize
-    results = query.order_by(desc(AgentScoreSnapshot.trust_score)).offset(offset).limit(pageSize).all()
+    results = (
+        await db.execute(
+            query.order_by(desc(AgentScoreSnapshot.trust_score)).offset(offset).limit(pageSize)
+        )
+    ).all()
 
     now = datetime.utcnow()
     items = []
@@ -91,7 +98,7 @@ async def get_agent_rankings(
             "integrityDigest": integrity_digest
         })
 
-    return {
+    return FastJSONResponse({
         "@context": {
             "@vocab": "https://schema.org/",
             "secai": "https://secairadar.cloud/ontology/",
@@ -110,28 +117,38 @@ async def get_agent_rankings(
             "page": page,
             "pageSize": pageSize,
         },
-    }
+    })
 
 
 @router.get("/agents/{idOrSlug}")
-async def get_agent(idOrSlug: str, db: Session = Depends(get_db)):
+async def get_agent(idOrSlug: str, db: AsyncSession = Depends(get_async_db)):
     """Get agent detail by ID or slug."""
     # Fetch agent
-    agent = db.query(Agent).filter(
-        (Agent.agent_id == idOrSlug) | (Agent.agent_slug == idOrSlug)
-    ).first()
+    agent = (
+        await db.execute(
+            select(Agent).where(or_(Agent.agent_id == idOrSlug, Agent.agent_slug == idOrSlug)).limit(1)
+        )
+    ).scalars().first()
     
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
         
-    latest = db.query(AgentLatestScore).filter(AgentLatestScore.agent_id == agent.agent_id).first()
-    score = None
-    if latest:
-        score = db.query(AgentScoreSnapshot).filter(AgentScoreSnapshot.score_id == latest.score_id).first()
+    score = (
+        await db.execute(
+            select(AgentScoreSnapshot)
+            .join(AgentLatestScore, AgentLatestScore.score_id == AgentScoreSnapshot.score_id)
+            .where(AgentLatestScore.agent_id == agent.agent_id)
+        )
+    ).scalars().first()
 
     now = datetime.utcnow()
-    evidence_items = db.query(AgentEvidenceItem).filter(AgentEvidenceItem.agent_id == agent.agent_id).all()
-    evidence_ids = [str(e.evidence_id) for e in evidence_items]
+    evidence_ids = [
+        str(eid) for eid in (
+            await db.execute(
+                select(AgentEvidenceItem.evidence_id).where(AgentEvidenceItem.agent_id == agent.agent_id)
+            )
+        ).scalars().all()
+    ]
     
     agent_obj = {
         "agentId": agent.agent_id,
@@ -4,43 +4,35 @@ Returns latest snapshot redacted; 200 with empty nodes/edges when missing.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from datetime import datetime, timezone
-from src.database import get_db
+from src.database import get_async_db
+from src.serialization import FastJSONResponse
 from src.services.server import get_server_by_id_or_slug
+from src.middleware.redaction import redact_for
 
 router = APIRouter(prefix="/api/v1/public/mcp", tags=["public"])
 
 
-def _redact(graph: dict) -> dict:
-    if not isinstance(graph, dict):
-        return graph
-    for node in graph.get("nodes", []):
-        props = node.get("properties") or {}
-        props.pop("blob_ref", None)
-        props.pop("workspace_id", None)
-    return graph
-
-
 @router.get("/servers/{idOrSlug}/graph")
 async def get_server_graph(
     idOrSlug: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get server graph (redacted). 200 with empty data when no snapshot."""
-    server = get_server_by_id_or_slug(db, idOrSlug)
+    server = await get_server_by_id_or_slug(db, idOrSlug)
     if not server:
         raise HTTPException(status_code=404, detail="Server not found")
     server_id = getattr(server, "server_id", server) if hasattr(server, "server_id") else str(server)
 
-    row = db.execute(
+    row = (await db.execute(
         text("""
             SELECT graph_json FROM server_graph_snapshots
             WHERE server_id = :sid ORDER BY assessed_at DESC LIMIT 1
         """),
         {"sid": server_id},
-    ).first()
+    )).first()
 
     if not row or not row[0]:
         return {
@@ -50,10 +42,10 @@ async def get_server_graph(
             "meta": {"hasSnapshot": False},
         }
 
-    graph = _redact(dict(row[0]) if hasattr(row[0], "items") else (row[0] or {"nodes": [], "edges": []}))
-    return {
+    graph = redact_for("server_graph", dict(row[0]) if hasattr(row[0], "items") else (row[0] or {"nodes": [], "edges": []}))
+    return FastJSONResponse({
         "methodologyVersion": "v1.0",
         "generatedAt": datetime.now(timezone.utc).isoformat(),
         "data": graph,
         "meta": {"hasSnapshot": True},
-    }
+    })
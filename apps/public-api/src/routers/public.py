@@ -5,13 +5,15 @@ Verified badge and attestation follow the definition in docs/VERIFIED-DEFINITION
 (via src.constants.attestation).
 """
 
-from fastapi import APIRouter, Query, HTTPException, Depends
+from fastapi import APIRouter, Query, HTTPException, Depends, Request
 from pydantic import BaseModel, HttpUrl, EmailStr
 from typing import Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import get_db
+from src.database import get_db, get_async_db
+from src.serialization import FastJSONResponse
 from src.constants.attestation import (
     VERIFIED_RECENCY_DAYS,
     VERIFIED_MIN_EVIDENCE_CONFIDENCE,
@@ -65,7 +67,7 @@ async def create_submission(request: SubmissionRequest, db: Session = Depends(ge
 @router.get("/mcp/summary")
 async def get_summary(
     window: str = Query("24h", regex="^(24h|7d|30d)$"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get summary KPIs and highlights. Verified status uses evidenceConfidence >= 2
@@ -73,10 +75,10 @@ async def get_summary(
     Window: 24h, 7d, or 30d.
     """
     from src.services.summary import get_summary_data
-    from src.middleware.redaction import redact_response
+    from src.middleware.redaction import redact_for
     
-    data = get_summary_data(db, window)
-    redacted_data = redact_response(data)
+    data = await get_summary_data(db, window)
+    redacted_data = redact_for("summary", data)
     now = datetime.utcnow()
     return {
         "attestation": build_attestation_envelope(METHODOLOGY_VERSION, as_of=now),
@@ -94,10 +96,10 @@ async def get_recently_updated(
 ):
     """Get recently updated servers. Frontend expects data.items."""
     from src.services.recently_updated import get_recently_updated as get_recently_updated_data
-    from src.middleware.redaction import redact_response
+    from src.middleware.redaction import redact_for
     
     items = get_recently_updated_data(db, limit)
-    redacted_items = redact_response(items)
+    redacted_items = redact_for("recently_updated", items)
     now = datetime.utcnow()
     return {
         "attestation": build_attestation_envelope(METHODOLOGY_VERSION, as_of=now),
@@ -115,15 +117,15 @@ async def get_rankings(
     page: int = Query(1, ge=1),
     pageSize: int = Query(20, ge=1, le=100),
     sort: str = Query("trustScore", regex="^(trustScore|evidenceConfidence|lastAssessedAt)$"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get rankings with filters and pagination. Verified: evidenceConfidence >= 2,
     lastVerifiedAt within 7 days (docs/VERIFIED-DEFINITION.md)."""
     from src.services.rankings import get_rankings as get_rankings_data
-    from src.middleware.redaction import redact_response
+    from src.middleware.redaction import redact_for
     
-    data = get_rankings_data(db, q, category, tier, page, pageSize, sort)
-    redacted_data = redact_response(data)
+    data = await get_rankings_data(db, q, category, tier, page, pageSize, sort)
+    redacted_data = redact_for("rankings", data)
     # Frontend expects data.items and meta.{total,page,pageSize}
     items = redacted_data.get("servers") or redacted_data.get("items") or []
     now = datetime.utcnow()
@@ -133,7 +135,8 @@ async def get_rankings(
         t = it.get("tier") or "D"
         eids = it.get("evidenceIds") or it.get("evidence_ids") or []
         it["integrityDigest"] = record_integrity_digest(sid, ts, t, eids, now)
-    return {
+    # Returned as a Response so the large JSON-LD payload skips jsonable_encoder
+    return FastJSONResponse({
         "@context": {
             "@vocab": "https://schema.org/",
             "secai": "https://secairadar.cloud/ontology/",
@@ -152,47 +155,47 @@ async def get_rankings(
             "page": redacted_data.get("page", 1),
             "pageSize": redacted_data.get("pageSize", pageSize),
         },
-    }
+    })
 
 
 @router.get("/mcp/servers/{idOrSlug}")
-async def get_server(idOrSlug: str, db: Session = Depends(get_db)):
+async def get_server(idOrSlug: str, db: AsyncSession = Depends(get_async_db)):
     """Get server detail by ID or slug. Verified badge follows docs/VERIFIED-DEFINITION.md
     (evidenceConfidence >= 2, lastVerifiedAt within 7 days). Optional integrityDigest (A3)."""
-    from src.services.server import get_server_by_id_or_slug, get_latest_score, get_server_evidence_ids
-    from src.middleware.redaction import redact_response
+    from src.services.server_detail import get_server_detail
+    from src.middleware.redaction import redact_for
 
-    server = get_server_by_id_or_slug(db, idOrSlug)
-    if not server:
+    # Server, provider, latest snapshot, evidence IDs and drift summary in one round trip
+    detail = await get_server_detail(db, idOrSlug)
+    if not detail:
         raise HTTPException(status_code=404, detail="Server not found")
-    score = get_latest_score(db, server.server_id)
+    server, provider, score = detail.server, detail.provider, detail.score
     now = datetime.utcnow()
-    evidence_ids = get_server_evidence_ids(db, server.server_id)
+    evidence_ids = detail.evidence_ids
     
     # Build server object
-    provider = server.provider if hasattr(server, 'provider') and server.provider else None
     server_obj = {
-        "serverId": server.server_id,
-        "serverSlug": server.server_slug or server.server_id,
-        "serverName": server.server_name or server.server_slug or server.server_id,
-        "providerId": server.provider_id,
-        "categoryPrimary": server.category_primary or "Unknown",
-        "tags": server.tags or [],
-        "deploymentType": server.deployment_type or "Unknown",
-        "authModel": server.auth_model or "Unknown",
-        "toolAgency": server.tool_agency or "Unknown",
+        "serverId": server["server_id"],
+        "serverSlug": server["server_slug"] or server["server_id"],
+        "serverName": server["server_name"] or server["server_slug"] or server["server_id"],
+        "providerId": server["provider_id"],
+        "categoryPrimary": server["category_primary"] or "Unknown",
+        "tags": server["tags"] or [],
+        "deploymentType": server["deployment_type"] or "Unknown",
+        "authModel": server["auth_model"] or "Unknown",
+        "toolAgency": server["tool_agency"] or "Unknown",
         "endpoints": [],  # TODO: Populate from server_endpoints table if needed
-        "repoUrl": server.repo_url,
-        "docsUrl": server.docs_url,
-        "status": server.status or "Unknown",
-        "firstSeenAt": server.first_seen_at.isoformat() if server.first_seen_at else None,
-        "lastSeenAt": server.last_seen_at.isoformat() if server.last_seen_at else None,
+        "repoUrl": server["repo_url"],
+        "docsUrl": server["docs_url"],
+        "status": server["status"] or "Unknown",
+        "firstSeenAt": server["first_seen_at"].isoformat() if server["first_seen_at"] else None,
+        "lastSeenAt": server["last_seen_at"].isoformat() if server["last_seen_at"] else None,
         "provider": {
-            "providerId": provider.provider_id if provider else server.provider_id,
-            "providerName": provider.provider_name if provider else "Unknown",
-            "primaryDomain": provider.primary_domain if provider else "",
+            "providerId": provider["provider_id"] if provider else server["provider_id"],
+            "providerName": provider["provider_name"] if provider else "Unknown",
+            "primaryDomain": provider["primary_domain"] if provider else "",
         } if provider else {
-            "providerId": server.provider_id,
+            "providerId": server["provider_id"],
             "providerName": "Unknown",
             "primaryDomain": "",
         },
@@ -200,52 +203,52 @@ async def get_server(idOrSlug: str, db: Session = Depends(get_db)):
     
     # Build latestScore object
     if score:
-        base_trust_score = float(score.trust_score) if score.trust_score else 0.0
-        tier = (score.tier if score.tier else "D") or "D"
+        base_trust_score = float(score["trust_score"]) if score["trust_score"] else 0.0
+        tier = (score["tier"] if score["tier"] else "D") or "D"
         
         evidence_class = "C"
-        if score.explainability_json:
-            evidence_class = score.explainability_json.get("dominant_evidence_class", "C")
+        if score["explainability_json"]:
+            evidence_class = score["explainability_json"].get("dominant_evidence_class", "C")
             
         trust_score = calculate_decayed_score(
             base_score=base_trust_score,
             evidence_class=evidence_class,
-            assessed_at=score.assessed_at if score.assessed_at else now,
+            assessed_at=score["assessed_at"] if score["assessed_at"] else now,
             query_time=now
         )
         
         integrity_digest = record_integrity_digest(
-            server.server_id, trust_score, tier, evidence_ids, now
+            server["server_id"], trust_score, tier, evidence_ids, now
         )
         latest_score_obj = {
-            "scoreId": score.score_id,
-            "serverId": score.server_id,
-            "methodologyVersion": score.methodology_version or METHODOLOGY_VERSION,
-            "assessedAt": score.assessed_at.isoformat() if score.assessed_at else None,
-            "d1": float(score.d1) if score.d1 else 0.0,
-            "d2": float(score.d2) if score.d2 else 0.0,
-            "d3": float(score.d3) if score.d3 else 0.0,
-            "d4": float(score.d4) if score.d4 else 0.0,
-            "d5": float(score.d5) if score.d5 else 0.0,
-            "d6": float(score.d6) if score.d6 else 0.0,
+            "scoreId": score["score_id"],
+            "serverId": score["server_id"],
+            "methodologyVersion": score["methodology_version"] or METHODOLOGY_VERSION,
+            "assessedAt": score["assessed_at"].isoformat() if score["assessed_at"] else None,
+            "d1": float(score["d1"]) if score["d1"] else 0.0,
+            "d2": float(score["d2"]) if score["d2"] else 0.0,
+            "d3": float(score["d3"]) if score["d3"] else 0.0,
+            "d4": float(score["d4"]) if score["d4"] else 0.0,
+            "d5": float(score["d5"]) if score["d5"] else 0.0,
+            "d6": float(score["d6"]) if score["d6"] else 0.0,
             "trustScore": trust_score,
             "baseTrustScore": base_trust_score,
             "evidenceClass": evidence_class,
             "tier": tier,
-            "enterpriseFit": (score.enterprise_fit if score.enterprise_fit else None) or "Experimental",
-            "evidenceConfidence": int(score.evidence_confidence) if score.evidence_confidence else 0,
-            "failFastFlags": score.fail_fast_flags if score.fail_fast_flags else [],
-            "riskFlags": score.risk_flags if score.risk_flags else [],
-            "explainability": score.explainability_json if score.explainability_json else {},
+            "enterpriseFit": (score["enterprise_fit"] if score["enterprise_fit"] else None) or "Experimental",
+            "evidenceConfidence": int(score["evidence_confidence"]) if score["evidence_confidence"] else 0,
+            "failFastFlags": score["fail_fast_flags"] if score["fail_fast_flags"] else [],
+            "riskFlags": score["risk_flags"] if score["risk_flags"] else [],
+            "explainability": score["explainability_json"] if score["explainability_json"] else {},
         }
     else:
         # Default score if none exists
         integrity_digest = record_integrity_digest(
-            server.server_id, 0.0, "D", evidence_ids, now
+            server["server_id"], 0.0, "D", evidence_ids, now
         )
         latest_score_obj = {
             "scoreId": "",
-            "serverId": server.server_id,
+            "serverId": server["server_id"],
             "methodologyVersion": METHODOLOGY_VERSION,
             "assessedAt": None,
             "d1": 0.0,
@@ -268,41 +271,40 @@ async def get_server(idOrSlug: str, db: Session = Depends(get_db)):
     data = {
         "server": server_obj,
         "latestScore": latest_score_obj,
+        "driftSummary": detail.drift_summary,
     }
     
     return {
         "attestation": build_attestation_envelope(METHODOLOGY_VERSION, as_of=now),
         "methodologyVersion": METHODOLOGY_VERSION,
         "generatedAt": now.isoformat(),
-        "data": redact_response(data),
+        "data": redact_for("server_detail", data),
     }
 
 
 @router.get("/mcp/servers/{idOrSlug}/evidence")
 async def get_server_evidence(
     idOrSlug: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get server evidence list"""
     from src.services.server import get_server_by_id_or_slug, get_server_evidence
-    from src.middleware.redaction import redact_evidence_item
-    from src.middleware.redaction import redact_response
+    from src.middleware.redaction import redact_for, model_to_public_dict
     
-    server = get_server_by_id_or_slug(db, idOrSlug)
+    server = await get_server_by_id_or_slug(db, idOrSlug)
     if not server:
         raise HTTPException(status_code=404, detail="Server not found")
     
-    evidence_data = get_server_evidence(db, server.server_id)
-    
-    # Redact evidence items
-    redacted_items = [redact_evidence_item(item.__dict__) for item in evidence_data["evidenceItems"]]
+    evidence_data = await get_server_evidence(db, server.server_id)
     
+    # Private columns are excluded while converting rows; redact_for strips any that
+    # arrive through other paths (e.g. claim values) in place.
     data = {
-        "evidenceItems": redacted_items,
-        "claims": [claim.__dict__ for claim in evidence_data["claims"]]
+        "evidenceItems": [model_to_public_dict(item) for item in evidence_data["evidenceItems"]],
+        "claims": [model_to_public_dict(claim) for claim in evidence_data["claims"]]
     }
     
-    redacted_data = redact_response(data)
+    redacted_data = redact_for("server_evidence", data)
     now = datetime.utcnow()
     return {
         "attestation": build_attestation_envelope(METHODOLOGY_VERSION, as_of=now),
@@ -375,25 +377,30 @@ async def get_daily_brief(
 
 
 @router.get("/mcp/feed.xml")
-async def get_rss_feed(db: Session = Depends(get_db)):
-    """Get RSS/Atom feed. Items include provenance and integrityDigest per docs/VERIFIED-DEFINITION.md."""
-    from src.services.feeds import generate_rss_feed
+async def get_rss_feed(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Get RSS/Atom feed. Items include provenance and integrityDigest per docs/VERIFIED-DEFINITION.md.
+    Streams the publisher-materialized bytes; renders live only until the first publish."""
+    from src.services.feeds import FEED_XML, generate_rss_feed, get_feed_artifact
+    from src.middleware.etag import stored_response
     from fastapi.responses import Response
-    xml = generate_rss_feed(db)
+
+    artifact = await get_feed_artifact(db, FEED_XML)
+    if artifact is not None:
+        return stored_response(request, artifact.body, artifact.content_type, artifact.etag)
+    xml = await db.run_sync(generate_rss_feed)
     return Response(content=xml, media_type="application/rss+xml")
 
 
 @router.get("/mcp/feed.json")
-async def get_json_feed(db: Session = Depends(get_db)):
+async def get_json_feed(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get JSON Feed. Items include provenance and integrityDigest per
-    docs/VERIFIED-DEFINITION.md and Pivot_Strategy_Reuse_Ideas."""
-    from src.services.feeds import generate_json_feed
-    
-    feed = generate_json_feed(db)
-    now = datetime.utcnow()
-    return {
-        "attestation": build_attestation_envelope(METHODOLOGY_VERSION, as_of=now),
-        "methodologyVersion": METHODOLOGY_VERSION,
-        "generatedAt": now.isoformat(),
-        **feed,
-    }
+    docs/VERIFIED-DEFINITION.md and Pivot_Strategy_Reuse_Ideas.
+    Streams the publisher-materialized bytes; renders live only until the first publish."""
+    from src.services.feeds import FEED_JSON, generate_json_feed, get_feed_artifact
+    from src.middleware.etag import stored_response
+
+    artifact = await get_feed_artifact(db, FEED_JSON)
+    if artifact is not None:
+        return stored_response(request, artifact.body, artifact.content_type, artifact.etag)
+    feed = await db.run_sync(generate_json_feed)
+    return FastJSONResponse(feed)
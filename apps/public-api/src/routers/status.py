@@ -4,17 +4,17 @@ Status endpoint (T-081). Returns last successful pipeline run for stale-data ban
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from datetime import datetime
 from typing import Optional
-from src.database import get_db
+from src.database import get_async_db
 
 router = APIRouter(prefix="/api/v1/public", tags=["public"])
 
 
 @router.get("/status")
-async def get_status(db: Session = Depends(get_db)):
+async def get_status(db: AsyncSession = Depends(get_async_db)):
     """
     Get system status including last successful pipeline run and current run progress.
     FE uses lastSuccessfulRun to show a stale-data banner when >24h.
@@ -25,38 +25,38 @@ async def get_status(db: Session = Depends(get_db)):
     
     try:
         # Get last successful run (supports legacy and newer status values)
-        r = db.execute(
+        r = (await db.execute(
             text("""
                 SELECT completed_at FROM pipeline_runs
                 WHERE LOWER(status) IN ('completed', 'success', 'succeeded')
                   AND completed_at IS NOT NULL
                 ORDER BY completed_at DESC LIMIT 1
             """)
-        ).first()
+        )).first()
         if r and r[0]:
             last_success = r[0].isoformat() if hasattr(r[0], "isoformat") else str(r[0])
 
         # Get most recent pipeline run (regardless of success/failure)
-        latest = db.execute(
+        latest = (await db.execute(
             text("""
                 SELECT COALESCE(completed_at, started_at) AS run_at
                 FROM pipeline_runs
                 ORDER BY COALESCE(completed_at, started_at) DESC
                 LIMIT 1
             """)
-        ).first()
+        )).first()
         if latest and latest[0]:
             last_pipeline_run = latest[0].isoformat() if hasattr(latest[0], "isoformat") else str(latest[0])
         
         # Get current running pipeline (if any)
-        current = db.execute(
+        current = (await db.execute(
             text("""
                 SELECT run_id, status, started_at, stages_json, errors_json
                 FROM pipeline_runs
                 WHERE LOWER(status) IN ('running', 'in_progress', 'processing')
                 ORDER BY started_at DESC LIMIT 1
             """)
-        ).first()
+        )).first()
         
         if current:
             import json
@@ -0,0 +1,55 @@
+"""
+Fast JSON serialization for public responses (orjson).
+
+One encoder is shared by the default response class and the ETag middleware so large
+payloads (rankings pageSize=100, feed.json, graph) are encoded once and hashed as bytes.
+datetime/date/UUID are handled natively by orjson; Decimal (Numeric columns) and sets
+fall back to ``_default``.
+
+Integrity digests in src.constants.attestation intentionally keep the stdlib canonical
+form (``json.dumps(..., sort_keys=True)``) because consumers recompute them.
+"""
+
+import hashlib
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson does not serialize on its own."""
+    if isinstance(obj, Decimal):
+        # Same rule as fastapi.encoders.decimal_encoder: Numeric(1, 0) -> int, Numeric(5, 2) -> float
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(data: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact JSON bytes."""
+    option = _OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _OPTIONS
+    return orjson.dumps(data, default=_default, option=option)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON bytes/str."""
+    return orjson.loads(data)
+
+
+def etag_for_bytes(body: bytes) -> str:
+    """Weak-cache validator for an already-encoded body."""
+    return hashlib.md5(body).hexdigest()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (default response class for the public API)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
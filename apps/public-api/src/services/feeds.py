@@ -3,59 +3,54 @@ Feed generation services (RSS and JSON Feed).
 
 Each feed item includes Gk-like attestation fields: provenance, integrityDigest,
 security_context (see Pivot_Strategy_Reuse_Ideas.md).
+
+The publisher renders both feeds once per brief into feed_artifacts (migration 012);
+the routes stream those stored bytes and only fall back to the live generators below
+when no artifact exists yet. Both render with packages/feeds (radar_feeds), so stored
+and live feeds cannot drift apart.
 """
 
-import hashlib
-import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from src.models.daily_brief import DailyBrief
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
 
-METHODOLOGY_VERSION = "v1.0"
-CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+from src.models.daily_brief import DailyBrief
+from src.models.feed_artifact import FeedArtifact
 
+# Add feeds package to path (installed in the image; the path serves a repo checkout)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../../../packages/feeds/src"))
 
-def _item_integrity_digest(
-    date_str: str,
-    headline: str,
-    narrative_short: str,
-    methodology_version: str,
-    generated_at: str,
-) -> str:
-    """SHA-256 of canonical item fields for tamper check."""
-    canonical = f"{date_str}|{headline}|{narrative_short}|{methodology_version}|{generated_at}"
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+from radar_feeds import (  # noqa: E402
+    FEED_JSON,
+    FEED_LIMIT,
+    FEED_XML,
+    brief_fields,
+    json_feed_document,
+    render_rss_feed,
+)
 
 
-def _item_attestation_fields(
-    date_str: str,
-    headline: str,
-    narrative_short: str,
-    methodology_version: str,
-    generated_at: datetime,
-) -> Dict[str, Any]:
-    """Provenance, integrityDigest, security_context for one feed item."""
-    as_of = generated_at.isoformat() if hasattr(generated_at, "isoformat") else str(generated_at)
-    digest = _item_integrity_digest(
-        date_str, headline, narrative_short or "", methodology_version or METHODOLOGY_VERSION, as_of
-    )
-    return {
-        "provenance": {
-            "sourceId": "secai-radar",
-            "asOf": as_of,
-            "methodologyVersion": methodology_version or METHODOLOGY_VERSION,
-        },
-        "integrityDigest": digest,
-        "security_context": {"assessor": "SecAI Radar", "scope": "public-ranking"},
-    }
+def _recent_briefs(db: Session, limit: int = FEED_LIMIT) -> List[Dict[str, Any]]:
+    """Recent daily briefs, newest first, as radar_feeds brief dicts."""
+    cutoff = datetime.utcnow().date() - timedelta(days=limit)
+    briefs = db.query(DailyBrief).filter(
+        DailyBrief.date >= cutoff
+    ).order_by(DailyBrief.date.desc()).limit(limit).all()
+    return [
+        brief_fields(b.date, b.headline, b.narrative_short, b.methodology_version, b.generated_at)
+        for b in briefs
+    ]
 
 
-def generate_rss_feed(db: Session, limit: int = 30) -> str:
+def generate_rss_feed(db: Session, limit: int = FEED_LIMIT) -> str:
     """
-    Generate RSS/Atom feed XML
+    Generate RSS feed XML
     
     Args:
         db: Database session
@@ -64,49 +59,10 @@ def generate_rss_feed(db: Session, limit: int = 30) -> str:
     Returns:
         RSS feed XML string
     """
-    # Get recent daily briefs
-    cutoff = datetime.utcnow().date() - timedelta(days=limit)
-    briefs = db.query(DailyBrief).filter(
-        DailyBrief.date >= cutoff
-    ).order_by(DailyBrief.date.desc()).limit(limit).all()
-    
-    # Build RSS feed (content namespace for attestation in each item)
-    rss = ET.Element("rss", version="2.0")
-    rss.set("xmlns:content", CONTENT_NS)
-    channel = ET.SubElement(rss, "channel")
-    
-    ET.SubElement(channel, "title").text = "SecAI Radar MCP Daily Brief"
-    ET.SubElement(channel, "link").text = "https://secairadar.cloud/mcp"
-    ET.SubElement(channel, "description").text = (
-        "SecAI Radar attests to the evidence and context behind each score. "
-        "Independent attestation of MCP server trust posture. Daily briefs, rankings, evidence, and drift tracking."
-    )
-    ET.SubElement(channel, "language").text = "en-US"
-    ET.SubElement(channel, "lastBuildDate").text = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
-    
-    for brief in briefs:
-        date_str = brief.date.isoformat()
-        gen_at = brief.generated_at
-        gen_at_iso = gen_at.isoformat() if hasattr(gen_at, "isoformat") else str(gen_at)
-        att = _item_attestation_fields(
-            date_str, brief.headline, brief.narrative_short or "", brief.methodology_version or METHODOLOGY_VERSION, gen_at
-        )
-        item = ET.SubElement(channel, "item")
-        ET.SubElement(item, "title").text = brief.headline
-        ET.SubElement(item, "link").text = f"https://secairadar.cloud/mcp/daily/{date_str}"
-        ET.SubElement(item, "description").text = brief.narrative_short or ""
-        ET.SubElement(item, "pubDate").text = gen_at.strftime("%a, %d %b %Y %H:%M:%S GMT") if hasattr(gen_at, "strftime") else gen_at_iso
-        ET.SubElement(item, "guid", isPermaLink="true").text = f"https://secairadar.cloud/mcp/daily/{date_str}"
-        enc = ET.SubElement(item, f"{{{CONTENT_NS}}}encoded")
-        enc.text = json.dumps(att)
-    
-    # Convert to string
-    rough_string = ET.tostring(rss, encoding="unicode")
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ")
+    return render_rss_feed(_recent_briefs(db, limit), datetime.now(timezone.utc)).decode("utf-8")
 
 
-def generate_json_feed(db: Session, limit: int = 30) -> dict:
+def generate_json_feed(db: Session, limit: int = FEED_LIMIT) -> dict:
     """
     Generate JSON Feed
     
@@ -115,41 +71,19 @@ def generate_json_feed(db: Session, limit: int = 30) -> dict:
         limit: Maximum number of items
     
     Returns:
-        JSON Feed dictionary
+        JSON Feed dictionary (with the attestation envelope)
     """
-    # Get recent daily briefs
-    cutoff = datetime.utcnow().date() - timedelta(days=limit)
-    briefs = db.query(DailyBrief).filter(
-        DailyBrief.date >= cutoff
-    ).order_by(DailyBrief.date.desc()).limit(limit).all()
-    
-    items = []
-    for brief in briefs:
-        date_str = brief.date.isoformat()
-        gen_at = brief.generated_at
-        gen_at_iso = gen_at.isoformat() if hasattr(gen_at, "isoformat") else str(gen_at)
-        att = _item_attestation_fields(
-            date_str, brief.headline, brief.narrative_short or "", brief.methodology_version or METHODOLOGY_VERSION, gen_at
-        )
-        items.append({
-            "id": f"https://secairadar.cloud/mcp/daily/{date_str}",
-            "url": f"https://secairadar.cloud/mcp/daily/{date_str}",
-            "title": brief.headline,
-            "content_text": brief.narrative_short or "",
-            "date_published": gen_at_iso,
-            "provenance": att["provenance"],
-            "integrityDigest": att["integrityDigest"],
-            "security_context": att["security_context"],
-        })
-    
-    return {
-        "version": "https://jsonfeed.org/version/1.1",
-        "title": "SecAI Radar MCP Daily Brief",
-        "description": (
-            "SecAI Radar attests to the evidence and context behind each score. "
-            "Independent attestation of MCP server trust posture. Daily briefs, rankings, evidence, and drift tracking."
-        ),
-        "feed_url": "https://secairadar.cloud/mcp/feed.json",
-        "home_page_url": "https://secairadar.cloud/mcp",
-        "items": items
-    }
+    return json_feed_document(_recent_briefs(db, limit), datetime.now(timezone.utc))
+
+
+async def get_feed_artifact(db: AsyncSession, feed_name: str) -> Optional[FeedArtifact]:
+    """
+    Stored feed bytes written by the publisher, or None when not materialized yet
+    (no publish since migration 012, or the table does not exist).
+    """
+    try:
+        result = await db.execute(select(FeedArtifact).where(FeedArtifact.feed_name == feed_name))
+    except ProgrammingError:
+        await db.rollback()
+        return None
+    return result.scalar_one_or_none()
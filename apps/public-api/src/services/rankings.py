@@ -2,10 +2,10 @@
 Rankings service - business logic for rankings endpoint
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, case, desc, cast, Integer
+from sqlalchemy import select, func, or_, case, cast, Integer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
 from typing import Dict, Any, List, Optional
-import json
 from src.models.server import MCPServer
 from src.models.score_snapshot import ScoreSnapshot
 from src.models.latest_score import LatestScore
@@ -14,41 +14,46 @@ from src.constants.attestation import calculate_decayed_score
 from datetime import datetime
 
 
-def get_rankings(
-    db: Session,
+def rankings_base_query(
     q: Optional[str] = None,
     category: Optional[str] = None,
     tier: Optional[str] = None,
-    page: int = 1,
-    page_size: int = 20,
-    sort: str = "trustScore"
-) -> Dict[str, Any]:
-    """
-    Get rankings with filters, pagination, and sorting.
-    Uses latest_scores + score_snapshots for latest score per server.
-    """
+) -> Select:
+    """Filtered (server, latest snapshot, provider) select shared by count and page queries."""
     base = (
-        db.query(MCPServer, ScoreSnapshot, Provider)
+        select(MCPServer, ScoreSnapshot, Provider)
         .select_from(MCPServer)
         .join(LatestScore, MCPServer.server_id == LatestScore.server_id)
         .join(ScoreSnapshot, LatestScore.score_id == ScoreSnapshot.score_id)
         .join(Provider, MCPServer.provider_id == Provider.provider_id)
-        .filter(MCPServer.status == 'Active')  # Only show active servers in rankings
+        .where(MCPServer.status == 'Active')  # Only show active servers in rankings
     )
     if tier:
-        base = base.filter(ScoreSnapshot.tier == tier)
+        base = base.where(ScoreSnapshot.tier == tier)
     if category:
-        base = base.filter(MCPServer.category_primary == category)
+        base = base.where(MCPServer.category_primary == category)
     if q and q.strip():
         pat = f"%{q.strip()}%"
-        base = base.filter(
+        base = base.where(
             or_(
                 MCPServer.server_name.ilike(pat),
                 MCPServer.server_slug.ilike(pat),
             )
         )
-    total = base.count()
-    
+    return base
+
+
+def rankings_page_query(
+    q: Optional[str] = None,
+    category: Optional[str] = None,
+    tier: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 20,
+    sort: str = "trustScore"
+) -> Select:
+    """Ordered, paginated rankings select (usable from sync or async sessions)."""
+    base = rankings_base_query(q, category, tier)
+
     # Multi-factor sorting:
     # 1. Primary: trust_score (or user-specified sort)
     # 2. Secondary: evidence_confidence
@@ -88,7 +93,7 @@ def get_rankings(
     )
     
     # Apply multi-factor ordering
-    rows = (
+    return (
         base.order_by(
             primary_sort.desc().nulls_last(),  # Primary sort
             ScoreSnapshot.evidence_confidence.desc().nulls_last(),  # Secondary
@@ -98,8 +103,31 @@ def get_rankings(
         )
         .offset((page - 1) * page_size)
         .limit(page_size)
-        .all()
     )
+
+
+async def get_rankings(
+    db: AsyncSession,
+    q: Optional[str] = None,
+    category: Optional[str] = None,
+    tier: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 20,
+    sort: str = "trustScore"
+) -> Dict[str, Any]:
+    """
+    Get rankings with filters, pagination, and sorting.
+    Uses latest_scores + score_snapshots for latest score per server.
+    """
+    base = rankings_base_query(q, category, tier)
+    total = (
+        await db.execute(select(func.count()).select_from(
+            base.with_only_columns(MCPServer.server_id).subquery()
+        ))
+    ).scalar_one()
+    rows = (
+        await db.execute(rankings_page_query(q, category, tier, page, page_size, sort))
+    ).all()
     now = datetime.utcnow()
     servers: List[Dict[str, Any]] = []
     for server, score, provider in rows:
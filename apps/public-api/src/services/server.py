@@ -2,8 +2,9 @@
 Server service - business logic for server endpoints
 """
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import select, and_, or_, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import Any, Dict, List, Optional
 from src.models.server import MCPServer
 from src.models.score_snapshot import ScoreSnapshot
@@ -12,46 +13,59 @@ from src.models.evidence import EvidenceItem, ExtractedClaim
 from src.models.drift import DriftEvent
 
 
-def get_server_by_id_or_slug(db: Session, id_or_slug: str) -> Optional[MCPServer]:
-    """Get server by ID or slug"""
-    # Try ID first
-    server = db.query(MCPServer).filter(MCPServer.server_id == id_or_slug).first()
-    if server:
-        return server
-    
-    # Try slug
-    server = db.query(MCPServer).filter(MCPServer.server_slug == id_or_slug).first()
-    return server
+async def get_server_by_id_or_slug(db: AsyncSession, id_or_slug: str) -> Optional[MCPServer]:
+    """Get server by ID or slug (ID match wins). Provider is eager-loaded for async access."""
+    result = await db.execute(
+        select(MCPServer)
+        .options(joinedload(MCPServer.provider))
+        .where(or_(MCPServer.server_id == id_or_slug, MCPServer.server_slug == id_or_slug))
+        .order_by(case((MCPServer.server_id == id_or_slug, 0), else_=1))
+        .limit(1)
+    )
+    return result.scalars().first()
 
 
-def get_latest_score(db: Session, server_id: str) -> Optional[ScoreSnapshot]:
+async def get_latest_score(db: AsyncSession, server_id: str) -> Optional[ScoreSnapshot]:
     """Get latest score snapshot for a server (uses latest_scores when populated)."""
-    ptr = db.query(LatestScore).filter(LatestScore.server_id == server_id).first()
-    if ptr:
-        return db.query(ScoreSnapshot).filter(ScoreSnapshot.score_id == ptr.score_id).first()
-    return db.query(ScoreSnapshot).filter(
-        ScoreSnapshot.server_id == server_id
-    ).order_by(ScoreSnapshot.assessed_at.desc()).first()
+    score = (
+        await db.execute(
+            select(ScoreSnapshot)
+            .join(LatestScore, LatestScore.score_id == ScoreSnapshot.score_id)
+            .where(LatestScore.server_id == server_id)
+        )
+    ).scalars().first()
+    if score:
+        return score
+    return (
+        await db.execute(
+            select(ScoreSnapshot)
+            .where(ScoreSnapshot.server_id == server_id)
+            .order_by(ScoreSnapshot.assessed_at.desc())
+            .limit(1)
+        )
+    ).scalars().first()
 
 
-def get_server_evidence_ids(db: Session, server_id: str) -> List[str]:
+async def get_server_evidence_ids(db: AsyncSession, server_id: str) -> List[str]:
     """Lightweight list of evidence IDs for a server (e.g. for integrity digest)."""
-    rows = db.query(EvidenceItem.evidence_id).filter(
-        EvidenceItem.server_id == server_id
-    ).all()
-    return [r[0] for r in rows]
+    rows = await db.execute(
+        select(EvidenceItem.evidence_id).where(EvidenceItem.server_id == server_id)
+    )
+    return list(rows.scalars().all())
 
 
-def get_server_evidence(db: Session, server_id: str) -> Dict[str, Any]:
+async def get_server_evidence(db: AsyncSession, server_id: str) -> Dict[str, Any]:
     """Get evidence items and claims for a server"""
-    evidence_items = db.query(EvidenceItem).filter(
-        EvidenceItem.server_id == server_id
-    ).all()
+    evidence_items = (
+        await db.execute(select(EvidenceItem).where(EvidenceItem.server_id == server_id))
+    ).scalars().all()
 
     evidence_ids = [item.evidence_id for item in evidence_items]
-    claims = db.query(ExtractedClaim).filter(
-        ExtractedClaim.evidence_id.in_(evidence_ids)
-    ).all() if evidence_ids else []
+    claims = (
+        await db.execute(
+            select(ExtractedClaim).where(ExtractedClaim.evidence_id.in_(evidence_ids))
+        )
+    ).scalars().all() if evidence_ids else []
     
     return {
         "evidenceItems": evidence_items,
@@ -59,8 +73,8 @@ def get_server_evidence(db: Session, server_id: str) -> Dict[str, Any]:
     }
 
 
-def get_server_drift(
-    db: Session,
+async def get_server_drift(
+    db: AsyncSession,
     server_id: str,
     window_days: int = 30
 ) -> List[DriftEvent]:
@@ -69,9 +83,12 @@ def get_server_drift(
     
     cutoff = datetime.utcnow() - timedelta(days=window_days)
     
-    return db.query(DriftEvent).filter(
-        and_(
-            DriftEvent.server_id == server_id,
-            DriftEvent.detected_at >= cutoff
-        )
-    ).order_by(DriftEvent.detected_at.desc()).all()
+    result = await db.execute(
+        select(DriftEvent).where(
+            and_(
+                DriftEvent.server_id == server_id,
+                DriftEvent.detected_at >= cutoff
+            )
+        ).order_by(DriftEvent.detected_at.desc())
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,164 @@
+"""
+Server detail read model - one round trip for GET /mcp/servers/{idOrSlug}
+
+Server (by ID or slug), provider, latest score snapshot (latest_scores pointer, falling
+back to newest assessed_at), evidence IDs (json_agg) and a drift summary are fetched in a
+single CTE query. Results are kept in a small in-process LRU with TTL for the most-viewed
+slugs; decay and integrity digests are still computed per request by the router.
+
+Cache sizing: SERVER_DETAIL_CACHE_SIZE (entries, 0 disables), SERVER_DETAIL_CACHE_TTL_SEC.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, func, or_, case, true, literal_column, JSON
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.models.server import MCPServer
+from src.models.provider import Provider
+from src.models.score_snapshot import ScoreSnapshot
+from src.models.latest_score import LatestScore
+from src.models.evidence import EvidenceItem
+from src.models.drift import DriftEvent
+
+CACHE_SIZE = int(os.getenv("SERVER_DETAIL_CACHE_SIZE", "256"))
+CACHE_TTL_SEC = float(os.getenv("SERVER_DETAIL_CACHE_TTL_SEC", "60"))
+
+
+@dataclass(frozen=True)
+class ServerDetail:
+    """Plain-data snapshot of everything the server detail route renders."""
+    server: Dict[str, Any]
+    provider: Optional[Dict[str, Any]]
+    score: Optional[Dict[str, Any]]
+    evidence_ids: List[str]
+    drift_summary: Dict[str, Any]
+
+
+# id_or_slug -> (detail, expires_at); most recently used last
+_cache: "OrderedDict[str, Tuple[ServerDetail, float]]" = OrderedDict()
+
+
+def _columns(obj: Any) -> Optional[Dict[str, Any]]:
+    if obj is None:
+        return None
+    return {attr.key: getattr(obj, attr.key) for attr in obj.__mapper__.column_attrs}
+
+
+def server_detail_query(id_or_slug: str, now: Optional[datetime] = None):
+    """Single statement: server/provider/latest score plus json_agg evidence IDs and drift counts."""
+    now = now or datetime.utcnow()
+
+    srv_cte = (
+        select(MCPServer)
+        .where(or_(MCPServer.server_id == id_or_slug, MCPServer.server_slug == id_or_slug))
+        .order_by(case((MCPServer.server_id == id_or_slug, 0), else_=1))
+        .limit(1)
+        .cte("srv")
+    )
+    srv = aliased(MCPServer, srv_cte)
+
+    score_cte = (
+        select(ScoreSnapshot)
+        .join(srv_cte, ScoreSnapshot.server_id == srv_cte.c.server_id)
+        .outerjoin(LatestScore, LatestScore.server_id == srv_cte.c.server_id)
+        .order_by(
+            case((ScoreSnapshot.score_id == LatestScore.score_id, 0), else_=1),
+            ScoreSnapshot.assessed_at.desc(),
+        )
+        .limit(1)
+        .cte("score")
+    )
+    score = aliased(ScoreSnapshot, score_cte)
+
+    evidence_cte = (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(EvidenceItem.evidence_id, EvidenceItem.evidence_id)),
+                literal_column("'[]'::json"),
+                type_=JSON,
+            ).label("evidence_ids")
+        )
+        .join(srv_cte, EvidenceItem.server_id == srv_cte.c.server_id)
+        .cte("evidence")
+    )
+
+    drift_cte = (
+        select(
+            func.count().filter(DriftEvent.detected_at >= now - timedelta(days=7)).label("drift_7d"),
+            func.count().filter(DriftEvent.detected_at >= now - timedelta(days=30)).label("drift_30d"),
+            func.max(DriftEvent.detected_at).label("last_drift_at"),
+        )
+        .join(srv_cte, DriftEvent.server_id == srv_cte.c.server_id)
+        .cte("drift")
+    )
+
+    return (
+        select(
+            srv,
+            Provider,
+            score,
+            evidence_cte.c.evidence_ids,
+            drift_cte.c.drift_7d,
+            drift_cte.c.drift_30d,
+            drift_cte.c.last_drift_at,
+        )
+        .select_from(srv)
+        .outerjoin(Provider, Provider.provider_id == srv.provider_id)
+        .outerjoin(score, true())
+        .join(evidence_cte, true())
+        .join(drift_cte, true())
+    )
+
+
+async def fetch_server_detail(db: AsyncSession, id_or_slug: str) -> Optional[ServerDetail]:
+    """Run the read-model query (no cache)."""
+    row = (await db.execute(server_detail_query(id_or_slug))).first()
+    if row is None:
+        return None
+    server, provider, score, evidence_ids, drift_7d, drift_30d, last_drift_at = row
+    return ServerDetail(
+        server=_columns(server),
+        provider=_columns(provider),
+        score=_columns(score),
+        evidence_ids=list(evidence_ids or []),
+        drift_summary={
+            "driftEvents7d": int(drift_7d or 0),
+            "driftEvents30d": int(drift_30d or 0),
+            "lastDriftAt": last_drift_at.isoformat() if last_drift_at else None,
+        },
+    )
+
+
+async def get_server_detail(db: AsyncSession, id_or_slug: str) -> Optional[ServerDetail]:
+    """Cached server detail by ID or slug. Misses (404s) are not cached."""
+    if CACHE_SIZE <= 0:
+        return await fetch_server_detail(db, id_or_slug)
+
+    now = time.monotonic()
+    hit = _cache.get(id_or_slug)
+    if hit and hit[1] > now:
+        _cache.move_to_end(id_or_slug)
+        return hit[0]
+
+    detail = await fetch_server_detail(db, id_or_slug)
+    if detail is None:
+        _cache.pop(id_or_slug, None)
+        return None
+    _cache[id_or_slug] = (detail, now + CACHE_TTL_SEC)
+    _cache.move_to_end(id_or_slug)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return detail
+
+
+def clear_server_detail_cache() -> None:
+    """Drop all cached entries (e.g. after a publisher flip in-process, or in tests)."""
+    _cache.clear()
@@ -5,8 +5,8 @@ Summary service - business logic for summary endpoint
 import json
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.server import MCPServer
 from src.models.score_snapshot import ScoreSnapshot
@@ -15,8 +15,8 @@ from src.models.provider import Provider
 from src.models.daily_brief import DailyBrief
 
 
-def _enrich_server_data(
-    db: Session,
+async def _enrich_server_data(
+    db: AsyncSession,
     items: List[Dict[str, Any]],
     server_id_key: str = "server_id"
 ) -> List[Dict[str, Any]]:
@@ -33,11 +33,12 @@ def _enrich_server_data(
     
     # Query servers with providers
     servers = (
-        db.query(MCPServer, Provider)
-        .join(Provider, MCPServer.provider_id == Provider.provider_id)
-        .filter(MCPServer.server_id.in_(server_ids))
-        .all()
-    )
+        await db.execute(
+            select(MCPServer, Provider)
+            .join(Provider, MCPServer.provider_id == Provider.provider_id)
+            .where(MCPServer.server_id.in_(server_ids))
+        )
+    ).all()
     
     # Create lookup map
     server_map = {
@@ -73,7 +74,7 @@ def _enrich_server_data(
     return enriched
 
 
-def get_summary_data(db: Session, window: str) -> Dict[str, Any]:
+async def get_summary_data(db: AsyncSession, window: str) -> Dict[str, Any]:
     """
     Get summary KPIs and highlights for a given time window.
     Shape matches frontend SummaryResponse (serversTracked, topMovers, etc.).
@@ -88,21 +89,28 @@ def get_summary_data(db: Session, window: str) -> Dict[str, Any]:
     cutoff_time = datetime.utcnow() - delta
 
     # 1. Query active servers count
-    servers_tracked = db.query(MCPServer).filter(MCPServer.status == 'Active').count()
+    servers_tracked = (
+        await db.execute(
+            select(func.count()).select_from(MCPServer).where(MCPServer.status == 'Active')
+        )
+    ).scalar_one()
     
     # 2. Query providers count
-    providers_tracked = db.query(Provider).count()
+    providers_tracked = (
+        await db.execute(select(func.count()).select_from(Provider))
+    ).scalar_one()
     
     # 3. Query tier distribution from latest scores
     tier_counts = {"A": 0, "B": 0, "C": 0, "D": 0}
     tier_results = (
-        db.query(ScoreSnapshot.tier, func.count())
-        .join(LatestScore, ScoreSnapshot.score_id == LatestScore.score_id)
-        .join(MCPServer, LatestScore.server_id == MCPServer.server_id)
-        .filter(MCPServer.status == 'Active')
-        .group_by(ScoreSnapshot.tier)
-        .all()
-    )
+        await db.execute(
+            select(ScoreSnapshot.tier, func.count())
+            .join(LatestScore, ScoreSnapshot.score_id == LatestScore.score_id)
+            .join(MCPServer, LatestScore.server_id == MCPServer.server_id)
+            .where(MCPServer.status == 'Active')
+            .group_by(ScoreSnapshot.tier)
+        )
+    ).all()
     for tier, count in tier_results:
         if tier in tier_counts:
             tier_counts[tier] = count
@@ -110,34 +118,38 @@ def get_summary_data(db: Session, window: str) -> Dict[str, Any]:
     # 4. Query evidence confidence distribution
     evidence_counts = {"0": 0, "1": 0, "2": 0, "3": 0}
     evidence_results = (
-        db.query(ScoreSnapshot.evidence_confidence, func.count())
-        .join(LatestScore, ScoreSnapshot.score_id == LatestScore.score_id)
-        .join(MCPServer, LatestScore.server_id == MCPServer.server_id)
-        .filter(MCPServer.status == 'Active')
-        .group_by(ScoreSnapshot.evidence_confidence)
-        .all()
-    )
+        await db.execute(
+            select(ScoreSnapshot.evidence_confidence, func.count())
+            .join(LatestScore, ScoreSnapshot.score_id == LatestScore.score_id)
+            .join(MCPServer, LatestScore.server_id == MCPServer.server_id)
+            .where(MCPServer.status == 'Active')
+            .group_by(ScoreSnapshot.evidence_confidence)
+        )
+    ).all()
     for confidence, count in evidence_results:
         confidence_str = str(int(confidence)) if confidence is not None else "0"
         if confidence_str in evidence_counts:
             evidence_counts[confidence_str] = count
     
     # 5. Query fail-fast count (servers with any fail-fast flags)
-    # Get all active servers with scores, then filter in Python (simpler than JSONB query)
-    all_scored_servers = (
-        db.query(MCPServer, ScoreSnapshot)
-        .join(LatestScore, MCPServer.server_id == LatestScore.server_id)
-        .join(ScoreSnapshot, LatestScore.score_id == ScoreSnapshot.score_id)
-        .filter(MCPServer.status == 'Active')
-        .all()
-    )
+    # Only the flags column is needed; filter non-empty lists in Python (simpler than JSON query)
+    all_fail_fast_flags = (
+        await db.execute(
+            select(ScoreSnapshot.fail_fast_flags)
+            .join(LatestScore, ScoreSnapshot.score_id == LatestScore.score_id)
+            .join(MCPServer, LatestScore.server_id == MCPServer.server_id)
+            .where(MCPServer.status == 'Active')
+        )
+    ).scalars().all()
     fail_fast_count = sum(
-        1 for server, score in all_scored_servers
-        if score.fail_fast_flags and len(score.fail_fast_flags) > 0
+        1 for flags in all_fail_fast_flags
+        if flags and len(flags) > 0
     )
     
     # 6. Get latest daily brief and extract movers/downgrades/newEntrants/notableDrift
-    latest_brief = db.query(DailyBrief).order_by(DailyBrief.date.desc()).first()
+    latest_brief = (
+        await db.execute(select(DailyBrief).order_by(DailyBrief.date.desc()).limit(1))
+    ).scalars().first()
     
     top_movers: List[Dict[str, Any]] = []
     top_downgrades: List[Dict[str, Any]] = []
@@ -157,7 +169,7 @@ def get_summary_data(db: Session, window: str) -> Dict[str, Any]:
         if isinstance(payload, dict):
             movers_raw = payload.get("movers", [])
             if movers_raw:
-                top_movers = _enrich_server_data(db, movers_raw, "server_id")
+                top_movers = await _enrich_server_data(db, movers_raw, "server_id")
                 # Format for frontend: ensure serverName, providerName, delta, score fields
                 top_movers = [
                     {
@@ -177,7 +189,7 @@ def get_summary_data(db: Session, window: str) -> Dict[str, Any]:
             # Extract downgrades
             downgrades_raw = payload.get("downgrades", [])
             if downgrades_raw:
-                top_downgrades = _enrich_server_data(db, downgrades_raw, "server_id")
+                top_downgrades = await _enrich_server_data(db, downgrades_raw, "server_id")
                 # Format for frontend
                 top_downgrades = [
                     {
@@ -207,7 +219,7 @@ def get_summary_data(db: Session, window: str) -> Dict[str, Any]:
                         seen_server_ids.add(server_id)
                         deduplicated_raw.append(entry)
                 
-                new_entrants = _enrich_server_data(db, deduplicated_raw, "server_id")
+                new_entrants = await _enrich_server_data(db, deduplicated_raw, "server_id")
                 # Format for frontend
                 new_entrants = [
                     {
@@ -227,7 +239,7 @@ def get_summary_data(db: Session, window: str) -> Dict[str, Any]:
             # Extract notable drift
             notable_drift_raw = payload.get("notableDrift", [])
             if notable_drift_raw:
-                notable_drift = _enrich_server_data(db, notable_drift_raw, "server_id")
+                notable_drift = await _enrich_server_data(db, notable_drift_raw, "server_id")
                 # Format for frontend
                 notable_drift = [
                     {
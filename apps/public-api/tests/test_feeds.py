@@ -0,0 +1,87 @@
+import os
+import sys
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from starlette.requests import Request
+
+from src.middleware.etag import stored_response
+from src.serialization import dumps
+from src.services.feeds import _recent_briefs, json_feed_document, render_rss_feed
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../workers/publisher/src"))
+import publisher  # noqa: E402
+
+
+def _request(headers=None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_stored_response_sets_etag_and_honours_if_none_match():
+    ok = stored_response(_request(), b"<rss/>", "application/rss+xml", '"abc"')
+    assert ok.status_code == 200
+    assert ok.body == b"<rss/>"
+    assert ok.headers["etag"] == '"abc"'
+
+    hit = stored_response(_request({"If-None-Match": '"zzz", "abc"'}), b"<rss/>", "application/rss+xml", '"abc"')
+    assert hit.status_code == 304
+    assert hit.body == b""
+
+
+class _Query:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, sql, params=None):
+        pass
+
+    def fetchall(self):
+        return self.rows
+
+
+def test_publisher_and_api_render_the_same_briefs():
+    gen_at = datetime(2026, 1, 2, 6, 0, tzinfo=timezone.utc)
+    row = (date(2026, 1, 2), "MCP Trust Radar — 2026-01-02", None, None, gen_at)
+    orm_row = SimpleNamespace(date=row[0], headline=row[1], narrative_short=row[2],
+                              methodology_version=row[3], generated_at=row[4])
+    db = SimpleNamespace(query=lambda model: _Query([orm_row]))
+
+    api_briefs = _recent_briefs(db)
+    assert api_briefs == publisher._fetch_feed_briefs(_Cursor([row]))
+    assert api_briefs[0]["methodology_version"] == "v1.0"
+
+    built_at = datetime(2026, 1, 2, 7, 0, tzinfo=timezone.utc)
+    assert publisher.render_rss_feed is render_rss_feed
+    assert dumps(json_feed_document(api_briefs, built_at)) == publisher.render_json_feed(api_briefs, built_at)
+
+
+def test_publisher_refreshes_feeds_when_validation_fails(monkeypatch):
+    conn = mock.MagicMock()
+    monkeypatch.setattr(publisher.psycopg2, "connect", lambda url: conn)
+    monkeypatch.setattr(publisher, "_staging_exists", lambda db: False)
+    monkeypatch.setattr(publisher, "validate_dataset", lambda db: (False, ["broken"]))
+    monkeypatch.setattr(publisher, "refresh_feed_artifacts", lambda db: (2, []))
+
+    result = publisher.publish()
+    assert result["success"] is False
+    assert result["feedsMaterialized"] == 2
+    conn.commit.assert_called_once()
@@ -0,0 +1,59 @@
+from src.middleware.redaction import (
+    PRIVATE_FIELDS,
+    REDACTION_PATHS,
+    compile_redactor,
+    redact_for,
+    redact_response,
+)
+
+
+def _evidence_payload():
+    return {
+        "evidenceItems": [
+            {"evidenceId": "e1", "blob_ref": "private/x", "workspace_id": "w1", "url": "https://a"},
+            {"evidenceId": "e2", "internal_notes": "n", "submitted_by": "u"},
+        ],
+        "claims": [{"claimId": "c1", "workspace_id": "w1"}],
+    }
+
+
+def test_evidence_paths_strip_private_fields_in_place():
+    data = _evidence_payload()
+    items = data["evidenceItems"]
+    result = redact_for("server_evidence", data)
+    assert result is data
+    assert result["evidenceItems"] is items
+    for item in result["evidenceItems"] + result["claims"]:
+        assert not set(item) & set(PRIVATE_FIELDS)
+    assert result["evidenceItems"][0]["url"] == "https://a"
+
+
+def test_matches_recursive_redaction_for_evidence_items():
+    expected = redact_response(_evidence_payload())
+    assert redact_for("server_evidence", _evidence_payload())["evidenceItems"] == expected["evidenceItems"]
+
+
+def test_graph_node_properties_redacted():
+    graph = {
+        "nodes": [
+            {"id": "n1", "properties": {"blob_ref": "x", "workspace_id": "w", "name": "tool"}},
+            {"id": "n2", "properties": None},
+            {"id": "n3"},
+        ],
+        "edges": [],
+    }
+    redact_for("server_graph", graph)
+    assert graph["nodes"][0]["properties"] == {"name": "tool"}
+    assert graph["nodes"][1]["properties"] is None
+
+
+def test_endpoints_without_private_paths_are_passthrough():
+    data = {"servers": [{"serverId": "s1"}], "total": 1}
+    assert REDACTION_PATHS["rankings"] == ()
+    assert redact_for("rankings", data) is data
+    assert compile_redactor(())(data) is data
+
+
+def test_unknown_endpoint_falls_back_to_recursive_walk():
+    data = {"nested": {"evidence_items": [{"blob_ref": "x", "id": 1}]}}
+    assert redact_for("unknown", data) == {"nested": {"evidence_items": [{"id": 1}]}}
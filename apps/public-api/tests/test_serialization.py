@@ -0,0 +1,66 @@
+import json
+from datetime import datetime, date
+from decimal import Decimal
+
+from src.serialization import dumps, loads, etag_for_bytes, FastJSONResponse
+from src.middleware.etag import generate_etag
+
+
+def test_dumps_matches_stdlib_compact_output():
+    """orjson output is byte-identical to the stdlib compact form for plain payloads"""
+    payload = {"trustScore": 85.46, "tier": "A", "tags": ["x", "ü"], "meta": {"total": 3}}
+    expected = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert dumps(payload) == expected
+
+
+def test_dumps_handles_datetime_and_decimal():
+    """Numeric columns and timestamps serialize without jsonable_encoder"""
+    payload = {
+        "assessedAt": datetime(2026, 1, 2, 3, 4, 5),
+        "date": date(2026, 1, 2),
+        "trust_score": Decimal("85.50"),
+        "evidence_confidence": Decimal("3"),
+    }
+    data = loads(dumps(payload))
+    assert data["assessedAt"] == "2026-01-02T03:04:05"
+    assert data["date"] == "2026-01-02"
+    assert data["trust_score"] == 85.5
+    assert data["evidence_confidence"] == 3
+    assert isinstance(data["evidence_confidence"], int)
+
+
+def test_generate_etag_ignores_key_order():
+    assert generate_etag({"a": 1, "b": 2}) == generate_etag({"b": 2, "a": 1})
+    assert generate_etag({"a": 1}) == etag_for_bytes(b'{"a":1}')
+
+
+def test_fast_json_response_renders_bytes():
+    response = FastJSONResponse({"value": Decimal("1.5")})
+    assert response.body == b'{"value":1.5}'
+    assert response.media_type == "application/json"
+
+
+
+def test_etag_middleware_keeps_repeated_headers():
+    import asyncio
+    from starlette.requests import Request
+    from starlette.responses import StreamingResponse
+    from src.middleware.etag import etag_middleware
+
+    async def body():
+        yield b'{"a":1}'
+
+    async def call_next(request):
+        response = StreamingResponse(body(), media_type="application/json")
+        response.set_cookie("first", "1")
+        response.set_cookie("second", "2")
+        return response
+
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    response = asyncio.run(etag_middleware(request, call_next))
+    cookies = [v for k, v in response.raw_headers if k == b"set-cookie"]
+    assert len(cookies) == 2
+    assert response.body == b'{"a":1}'
+    assert response.headers["etag"] == '"%s"' % etag_for_bytes(b'{"a":1}')
+    assert response.headers["content-length"] == "7"
+    assert response.headers["content-type"] == "application/json"
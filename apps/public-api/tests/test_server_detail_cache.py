@@ -0,0 +1,58 @@
+import asyncio
+
+from src.services import server_detail
+from src.services.server_detail import ServerDetail, get_server_detail, clear_server_detail_cache
+
+
+def _detail(server_id: str) -> ServerDetail:
+    return ServerDetail(
+        server={"server_id": server_id},
+        provider=None,
+        score=None,
+        evidence_ids=[],
+        drift_summary={"driftEvents7d": 0, "driftEvents30d": 0, "lastDriftAt": None},
+    )
+
+
+def _fake_fetch(calls):
+    async def fetch(db, id_or_slug):
+        calls.append(id_or_slug)
+        return None if id_or_slug == "missing" else _detail(id_or_slug)
+    return fetch
+
+
+def test_hot_slugs_served_from_cache(monkeypatch):
+    calls = []
+    clear_server_detail_cache()
+    monkeypatch.setattr(server_detail, "fetch_server_detail", _fake_fetch(calls))
+    first = asyncio.run(get_server_detail(None, "filesystem"))
+    second = asyncio.run(get_server_detail(None, "filesystem"))
+    assert first is second
+    assert calls == ["filesystem"]
+
+
+def test_misses_are_not_cached(monkeypatch):
+    calls = []
+    clear_server_detail_cache()
+    monkeypatch.setattr(server_detail, "fetch_server_detail", _fake_fetch(calls))
+    assert asyncio.run(get_server_detail(None, "missing")) is None
+    assert asyncio.run(get_server_detail(None, "missing")) is None
+    assert calls == ["missing", "missing"]
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    calls = []
+    clear_server_detail_cache()
+    monkeypatch.setattr(server_detail, "fetch_server_detail", _fake_fetch(calls))
+    monkeypatch.setattr(server_detail, "CACHE_SIZE", 2)
+    for slug in ["a", "b", "a", "c"]:  # "b" is least recently used when "c" arrives
+        asyncio.run(get_server_detail(None, slug))
+    asyncio.run(get_server_detail(None, "a"))
+    asyncio.run(get_server_detail(None, "b"))
+    assert calls == ["a", "b", "c", "b"]
+
+    monkeypatch.setattr(server_detail, "CACHE_TTL_SEC", -1)
+    clear_server_detail_cache()
+    asyncio.run(get_server_detail(None, "a"))
+    asyncio.run(get_server_detail(None, "a"))
+    assert calls[-2:] == ["a", "a"]
@@ -2,7 +2,11 @@
 Registry API routes (private). All require workspace_id (query or X-Workspace-Id header) and enforce workspace-scoped RBAC via DB roles.
 """
 
+import os
+import sys
+
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
@@ -16,6 +20,9 @@ from src.repositories import evidence_packs as evidence_repo
 from src.repositories import exports as exports_repo
 from src.repositories import audit_log as audit_repo
 
+# Add storage package to path (installed in the image; the path serves a repo checkout)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../../../packages/storage/src"))
+
 router = APIRouter(prefix="/api/v1/private/registry", tags=["registry"])
 
 # All roles (any member) for read-only list endpoints
@@ -139,18 +146,22 @@ async def deny_policy(
     return {"approvalId": row["approvalId"], "policyId": policy_id, "decision": "Denied"}
 
 
-def _upload_blob_or_placeholder(workspace_id: str, pack_id: str, contents: bytes, filename: str) -> str:
-    """Return blob path. If Azure Storage configured, upload and return path; else return placeholder path."""
+def _upload_blob_or_placeholder(workspace_id: str, pack_id: str, stream, filename: str) -> str:
+    """
+    Return blob path. If Azure Storage configured, stream the upload (staged blocks, not
+    read into memory) and return path; else return placeholder path.
+    """
     import os
     try:
         conn = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
         container = os.getenv("AZURE_EVIDENCE_CONTAINER", "evidence-packs")
         if conn and container:
             from azure.storage.blob import BlobServiceClient
+            from radar_storage.blob_upload import stream_upload
             client = BlobServiceClient.from_connection_string(conn)
             blob_path = f"{workspace_id}/{pack_id}/{filename or 'upload'}"
             blob = client.get_container_client(container).get_blob_client(blob_path)
-            blob.upload_blob(contents, overwrite=True)
+            stream_upload(blob, stream)
             return blob_path
     except Exception:
         pass
@@ -180,13 +191,13 @@ async def upload_evidence_pack(
     server_id = inv_repo.resolve_server_id(db, serverId)
     if not server_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Server not found")
-    contents = b""
+    stream = [b""]
     filename = "upload"
     if file:
-        contents = await file.read()
+        stream = file.file
         filename = file.filename or "upload"
     pack_id = ("ep" + __import__("secrets").token_hex(6))[:16]
-    blob_ref = _upload_blob_or_placeholder(ctx["workspace_id"], pack_id, contents, filename)
+    blob_ref = await run_in_threadpool(_upload_blob_or_placeholder, ctx["workspace_id"], pack_id, stream, filename)
     row = evidence_repo.create_pack(db, ctx["workspace_id"], server_id, blob_ref, pack_id=pack_id)
     audit_repo.log(db, ctx["workspace_id"], ctx["user_id"], "evidence.upload", "evidence_pack", row["packId"], {"serverId": server_id})
     db.commit()
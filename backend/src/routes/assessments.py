@@ -5,14 +5,18 @@ Provides endpoints for controls, tools, gaps, summary, and evidence management
 
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-import io
-import csv
 import json
-from collections import defaultdict
+import logging
 
-from ..services.storage import get_storage_service
+from ..services.storage import get_storage_service, query_partition_entities, query_tenant_entities
 from ..services.seed_data import get_seed_data_service
+from radar_coverage.coverage_engine import get_coverage_engine
+from radar_storage.control_import import BulkControlImporter, ImportReport, iter_csv_rows
+from radar_storage.control_summary import SUMMARY_TABLE, domain_of, read_summary, rebuild_tenant_summary, refresh_domains
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/tenant/{tenant_id}", tags=["assessments"])
 
@@ -71,13 +75,9 @@ async def get_controls(
         table = storage.get_controls_table()
         
         if domain:
-            partition_key = f"{tenant_id}|{domain}"
-            entities = list(table.query_entities(f"PartitionKey eq '{partition_key}'"))
+            entities = list(query_partition_entities(table, f"{tenant_id}|{domain}"))
         else:
-            entities = [
-                e for e in table.list_entities()
-                if str(e.get("PartitionKey", "")).startswith(f"{tenant_id}|")
-            ]
+            entities = list(query_tenant_entities(table, tenant_id))
         
         # Filter by status
         if status:
@@ -102,16 +102,11 @@ async def import_controls(
     file: Optional[UploadFile] = File(None),
     body: Optional[List[Dict[str, Any]]] = None
 ):
-    """Import controls from CSV or JSON"""
+    """Import controls from CSV or JSON (batched per partition, per-row error report)"""
     try:
-        rows = []
-        
         if file:
-            # Parse CSV
-            content = await file.read()
-            text = content.decode("utf-8-sig")
-            reader = csv.DictReader(io.StringIO(text))
-            rows = [dict(row) for row in reader]
+            # Parse CSV incrementally from the spooled upload (bad UTF-8 is a row error)
+            rows = iter_csv_rows(file.file)
         elif body:
             rows = body
         else:
@@ -120,47 +115,21 @@ async def import_controls(
         storage = get_storage_service()
         table = storage.get_controls_table()
         
-        inserted = 0
-        for row in rows:
-            control_id = row.get("ControlID") or ""
-            domain = row.get("Domain") or ""
-            
-            if not control_id or not domain:
-                continue
-            
-            # Derive domain code from ControlID or use provided DomainCode
-            domain_code = ""
-            if control_id.startswith("SEC-") and "-" in control_id[4:]:
-                domain_code = control_id.split("-")[1]
-            else:
-                domain_code = row.get("DomainCode", "")
-            
-            if not domain_code:
-                continue
-            
-            entity = {
-                "PartitionKey": f"{tenant_id}|{domain_code}",
-                "RowKey": control_id,
-                "Domain": domain,
-                "ControlTitle": row.get("ControlTitle", ""),
-                "ControlDescription": row.get("ControlDescription", ""),
-                "Question": row.get("Question", ""),
-                "RequiredEvidence": row.get("RequiredEvidence", ""),
-                "Status": row.get("Status", "NotStarted"),
-                "Owner": row.get("Owner", ""),
-                "Frequency": row.get("Frequency", ""),
-                "ScoreNumeric": float(row.get("ScoreNumeric") or 0) if str(row.get("ScoreNumeric") or "").strip() != "" else 0.0,
-                "Weight": float(row.get("Weight") or 0) if str(row.get("Weight") or "").strip() != "" else 0.0,
-                "Notes": row.get("Notes", ""),
-                "SourceRef": row.get("SourceRef", ""),
-                "Tags": row.get("Tags", ""),
-                "UpdatedAt": row.get("UpdatedAt", "")
-            }
-            
-            table.upsert_entity(entity)
-            inserted += 1
-        
-        return {"ok": True, "inserted": inserted}
+        report = ImportReport()
+        try:
+            await run_in_threadpool(BulkControlImporter(table).run, tenant_id, rows, report)
+        finally:
+            # Recount whatever was written, even if the import stopped partway
+            try:
+                await run_in_threadpool(
+                    refresh_domains, table, storage.get_table_client(SUMMARY_TABLE), tenant_id,
+                    [domain_of(pk) for pk in report.partitions],
+                )
+            except Exception:
+                logger.exception("Failed to refresh control summary for tenant %s", tenant_id)
+        return {"ok": True, **report.to_dict()}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -173,10 +142,7 @@ async def get_tenant_tools(tenant_id: str):
         storage = get_storage_service()
         table = storage.get_tenant_tools_table()
         
-        items = [
-            dict(e) for e in table.list_entities()
-            if e.get("PartitionKey") == tenant_id
-        ]
+        items = [dict(e) for e in query_partition_entities(table, tenant_id)]
         
         return {"items": items, "total": len(items)}
     except Exception as e:
@@ -217,35 +183,40 @@ async def get_vendor_tools():
 
 
 # Summary Endpoint
+@router.post("/summary/rebuild")
+async def rebuild_summary(tenant_id: str):
+    """Recount the tenant's ControlSummary rows from Controls (repairs drift)"""
+    try:
+        storage = get_storage_service()
+        counts = rebuild_tenant_summary(
+            storage.get_controls_table(), storage.get_table_client(SUMMARY_TABLE), tenant_id
+        )
+        return {"ok": True, "domains": len(counts), "controls": sum(c["total"] for c in counts.values())}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/summary")
 async def get_summary(tenant_id: str) -> SummaryResponse:
     """Get assessment summary by domain"""
     try:
         storage = get_storage_service()
         table = storage.get_controls_table()
+        summary_table = storage.get_table_client(SUMMARY_TABLE)
         
-        items = [
-            e for e in table.list_entities()
-            if str(e.get("PartitionKey", "")).startswith(f"{tenant_id}|")
-        ]
-        
-        agg = defaultdict(lambda: {"total": 0, "complete": 0, "inProgress": 0, "notStarted": 0})
+        counts = read_summary(summary_table, tenant_id)
+        if not counts:
+            counts = rebuild_tenant_summary(table, summary_table, tenant_id)
         
-        for item in items:
-            partition_key = str(item.get("PartitionKey", ""))
-            if "|" not in partition_key:
-                continue
-            
-            domain = partition_key.split("|", 1)[1]
-            agg[domain]["total"] += 1
-            
-            status = str(item.get("Status", "")).lower()
-            if status == "complete":
-                agg[domain]["complete"] += 1
-            elif status == "inprogress":
-                agg[domain]["inProgress"] += 1
-            else:
-                agg[domain]["notStarted"] += 1
+        agg = {
+            d: {
+                "total": c["total"],
+                "complete": c["complete"],
+                "inProgress": c["inProgress"],
+                "notStarted": c["total"] - c["complete"] - c["inProgress"],
+            }
+            for d, c in counts.items()
+        }
         
         result = [{"domain": d, **v} for d, v in agg.items()]
         return SummaryResponse(byDomain=result)
@@ -264,17 +235,15 @@ async def get_gaps(
         seed_service = get_seed_data_service()
         storage = get_storage_service()
         
-        # Load seed data
-        tool_cap_map = seed_service.get_tool_capability_map()
-        control_reqs_map = seed_service.get_control_requirements_map()
-        vendor_tools_dict = seed_service.get_vendor_tools_dict()
+        # Indexed seed catalog (parsed once per process)
+        catalog = seed_service.get_catalog()
+        vendor_tools_dict = catalog.vendor_tools
         
         # Load tenant tools
         tools_table = storage.get_tenant_tools_table()
-        tenant_tools_raw = [
-            e for e in tools_table.list_entities()
-            if e.get("PartitionKey") == tenant_id
-        ]
+        tenant_tools_raw = list(
+            query_partition_entities(tools_table, tenant_id, select=["RowKey", "ConfigScore", "Enabled"])
+        )
         
         tenant_tools = {
             e["RowKey"]: float(e.get("ConfigScore", 1.0))
@@ -294,54 +263,19 @@ async def get_gaps(
         
         # Load controls
         controls_table = storage.get_controls_table()
-        control_rows = [
-            e for e in controls_table.list_entities()
-            if str(e.get("PartitionKey", "")).startswith(f"{tenant_id}|")
-        ]
+        control_rows = list(query_tenant_entities(
+            controls_table, tenant_id, select=["PartitionKey", "RowKey", "ControlTitle"]
+        ))
+        
+        # Coverage and gaps for every control in one pass (same engine as the Functions API)
+        coverage = get_coverage_engine(catalog).evaluate(tenant_tools, (c["RowKey"] for c in control_rows))
         
         results = []
         for control in control_rows:
             control_id = control.get("RowKey")
-            reqs = control_reqs_map.get(control_id, [])
-            
-            if not reqs:
-                continue
-            
-            # Calculate coverage and gaps
-            coverage_score = 0.0
-            sum_w = 0.0
-            hard_gaps = []
-            soft_gaps = []
-            
-            for req in reqs:
-                cap = req.get("capabilityId")
-                w = float(req.get("weight", 0))
-                min_s = float(req.get("minStrength", 0))
-                sum_w += w
-                
-                best = 0.0
-                best_tool = None
-                
-                for tool_id, cfg_score in tenant_tools.items():
-                    strength = tool_cap_map.get(tool_id, {}).get(cap, 0.0) * cfg_score
-                    if strength > best:
-                        best = strength
-                        best_tool = tool_id
-                
-                coverage_score += w * best
-                
-                if best == 0.0:
-                    hard_gaps.append({"capabilityId": cap, "weight": w})
-                elif best < min_s:
-                    soft_gaps.append({
-                        "capabilityId": cap,
-                        "weight": w,
-                        "best": best,
-                        "min": min_s,
-                        "tool": best_tool
-                    })
-            
-            normalized = (coverage_score / sum_w) if sum_w > 0 else 0.0
+            if control_id not in coverage:
+                continue  # no capability requirements for this control
+            normalized, hard_gaps, soft_gaps = coverage[control_id]
             
             result = {
                 "ControlID": control_id,
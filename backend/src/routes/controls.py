@@ -5,9 +5,11 @@ Provides endpoints for individual control management and evidence collection
 
 from typing import Optional, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from ..services.storage import get_storage_service
+from ..services.storage import get_storage_service, query_tenant_entities
+from radar_storage.control_summary import SUMMARY_TABLE, domain_of, refresh_domains
 
 router = APIRouter(prefix="/api/tenant/{tenant_id}", tags=["controls"])
 
@@ -34,11 +36,10 @@ async def get_control_detail(tenant_id: str, control_id: str):
         storage = get_storage_service()
         table = storage.get_controls_table()
         
-        # Find control by scanning partitions (we need to find which domain it's in)
-        controls = [
-            e for e in table.list_entities()
-            if str(e.get("PartitionKey", "")).startswith(f"{tenant_id}|") and e.get("RowKey") == control_id
-        ]
+        # Control's domain partition is unknown; range over the tenant's partitions by RowKey
+        controls = list(query_tenant_entities(
+            table, tenant_id, extra_filter="RowKey eq @rk", parameters={"rk": control_id}
+        ))
         
         if not controls:
             raise HTTPException(status_code=404, detail="Control not found")
@@ -64,10 +65,9 @@ async def update_control(tenant_id: str, control_id: str, update: ControlUpdate)
         table = storage.get_controls_table()
         
         # Find the control
-        controls = [
-            e for e in table.list_entities()
-            if str(e.get("PartitionKey", "")).startswith(f"{tenant_id}|") and e.get("RowKey") == control_id
-        ]
+        controls = list(query_tenant_entities(
+            table, tenant_id, extra_filter="RowKey eq @rk", parameters={"rk": control_id}
+        ))
         
         if not controls:
             raise HTTPException(status_code=404, detail="Control not found")
@@ -86,6 +86,13 @@ async def update_control(tenant_id: str, control_id: str, update: ControlUpdate)
         
         table.upsert_entity(control)
         
+        # Status changes move the control between ControlSummary counters
+        if update.Status is not None:
+            refresh_domains(
+                table, storage.get_table_client(SUMMARY_TABLE), tenant_id,
+                [domain_of(str(control["PartitionKey"]))],
+            )
+        
         return {"ok": True, "control": control}
     except HTTPException:
         raise
@@ -103,17 +110,16 @@ async def upload_evidence(
     """Upload evidence for a control"""
     try:
         storage = get_storage_service()
-        container = storage.get_blob_container()
         
         # Generate blob name: tenant/control_id/timestamp_filename
         import datetime
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         blob_name = f"{tenant_id}/{control_id}/{timestamp}_{file.filename}"
         
-        # Upload file to blob storage
-        blob_client = container.get_blob_client(blob_name)
-        content = await file.read()
-        blob_client.upload_blob(content, overwrite=True)
+        # Stream the spooled upload to blob storage as staged blocks (not read into memory)
+        blob_client, upload = await run_in_threadpool(
+            storage.upload_blob_stream, blob_name, file.file, file.content_type
+        )
         
         # Get blob URL
         blob_url = blob_client.url
@@ -128,6 +134,8 @@ async def upload_evidence(
                 "file_url": blob_url,
                 "evidence_type": file.content_type or "application/octet-stream",
                 "description": description,
+                "size": upload.size,
+                "sha256": upload.sha256,
                 "uploaded_at": timestamp
             }
         }
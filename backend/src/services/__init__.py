@@ -1,2 +1,10 @@
 # Services package
 
+import sys
+from pathlib import Path
+
+# Shared packages from a repo checkout
+_packages = Path(__file__).resolve().parents[3] / "packages"
+for _package in ("storage", "coverage"):
+    if (_packages / _package / "src").is_dir() and str(_packages / _package / "src") not in sys.path:
+        sys.path.insert(0, str(_packages / _package / "src"))
@@ -4,11 +4,19 @@ Provides table and blob storage clients for controls, tools, and evidence
 """
 
 import os
-from typing import Optional
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 from azure.data.tables import TableServiceClient, TableClient
-from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.storage.blob import BlobServiceClient, ContainerClient, ContentSettings
 from azure.core.exceptions import ResourceExistsError
 
+from radar_storage.blob_upload import UploadResult, stream_upload
+from radar_storage.tables import (  # noqa: F401 - re-exported for the routes
+    query_entities,
+    query_partition_entities,
+    query_tenant_entities,
+    tenant_partition_range,
+)
+
 # Environment variables
 TABLES_CONN_STR = os.getenv("TABLES_CONN")
 BLOBS_CONN_STR = os.getenv("BLOBS_CONN")
@@ -25,34 +33,41 @@ class StorageService:
     def __init__(self):
         self._table_service: Optional[TableServiceClient] = None
         self._blob_service: Optional[BlobServiceClient] = None
-        self._initialized_tables = set()
+        self._table_clients: Dict[str, TableClient] = {}
+        self._container_client: Optional[ContainerClient] = None
     
     def get_table_client(self, table_name: str) -> TableClient:
-        """Get or create a table client"""
+        """Get or create a table client (ensured and cached once per table)"""
         if not TABLES_CONN_STR:
             raise ValueError("TABLES_CONN environment variable is not set")
         
+        client = self._table_clients.get(table_name)
+        if client is not None:
+            return client
+        
         if not self._table_service:
             self._table_service = TableServiceClient.from_connection_string(TABLES_CONN_STR)
         
-        # Create table if it doesn't exist (only once per table)
-        if table_name not in self._initialized_tables:
-            try:
-                self._table_service.create_table_if_not_exists(table_name=table_name)
-                self._initialized_tables.add(table_name)
-            except ResourceExistsError:
-                self._initialized_tables.add(table_name)
-            except Exception as e:
-                # Table might already exist, continue
-                self._initialized_tables.add(table_name)
+        try:
+            self._table_service.create_table_if_not_exists(table_name=table_name)
+        except ResourceExistsError:
+            pass
+        except Exception:
+            # Not cached, so the next call retries the ensure
+            return self._table_service.get_table_client(table_name)
         
-        return self._table_service.get_table_client(table_name)
+        client = self._table_service.get_table_client(table_name)
+        self._table_clients[table_name] = client
+        return client
     
     def get_blob_container(self) -> ContainerClient:
-        """Get or create a blob container client"""
+        """Get or create the blob container client (ensured and cached once)"""
         if not BLOBS_CONN_STR:
             raise ValueError("BLOBS_CONN environment variable is not set")
         
+        if self._container_client is not None:
+            return self._container_client
+        
         if not self._blob_service:
             self._blob_service = BlobServiceClient.from_connection_string(BLOBS_CONN_STR)
         
@@ -61,9 +76,27 @@ class StorageService:
         except ResourceExistsError:
             pass
         except Exception:
-            pass
+            return self._blob_service.get_container_client(BLOB_CONTAINER_NAME)
         
-        return self._blob_service.get_container_client(BLOB_CONTAINER_NAME)
+        self._container_client = self._blob_service.get_container_client(BLOB_CONTAINER_NAME)
+        return self._container_client
+    
+    def upload_blob_stream(
+        self,
+        blob_name: str,
+        stream: BinaryIO,
+        content_type: Optional[str] = None,
+        max_size: Optional[int] = None,
+    ) -> Tuple[Any, UploadResult]:
+        """Stream a file into the container as staged blocks; returns (blob_client, UploadResult)"""
+        blob_client = self.get_blob_container().get_blob_client(blob_name)
+        result = stream_upload(
+            blob_client,
+            stream,
+            max_size=max_size,
+            content_settings=ContentSettings(content_type=content_type) if content_type else None,
+        )
+        return blob_client, result
     
     def get_controls_table(self) -> TableClient:
         """Get the controls table client"""
@@ -0,0 +1,8 @@
+"""
+Control coverage for gap analysis, shared by the Functions API (api/) and the backend.
+Import the submodules directly:
+
+    radar_coverage.coverage_engine  every control of a tenant at once (NumPy)
+    radar_coverage.scoring          compute_control_coverage for one control
+    radar_coverage.seed_catalog     indexed seed catalogs (memoized by file mtime)
+"""
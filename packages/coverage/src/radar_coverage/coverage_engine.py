@@ -0,0 +1,151 @@
+"""
+SecAI Radar Coverage Engine
+
+Matrix form of radar_coverage.scoring.compute_control_coverage for whole-tenant gap analysis.
+
+The capability×tool strength matrix and the padded per-control requirement arrays are
+built once per seed catalog. Per tenant, the matrix is multiplied by the config-score
+vector (tenant tool order), so the best effective strength per capability and its tool
+come from one max/argmax; weighted coverage for every control is then accumulated
+column by column in requirement order, which keeps the float results bit-for-bit equal
+to the scalar implementation.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .seed_catalog import SeedCatalog
+
+Coverage = Tuple[float, List[Dict], List[Dict]]
+
+
+class CoverageEngine:
+    """Vectorized control coverage for one seed catalog."""
+
+    def __init__(self, catalog: SeedCatalog):
+        self.catalog = catalog
+
+        capabilities = sorted(
+            {cap for caps in catalog.toolcap.values() for cap in caps}
+            | {r["capabilityId"] for reqs in catalog.reqs_by_control.values() for r in reqs}
+        )
+        self._cap_index = {cap: i for i, cap in enumerate(capabilities)}
+        self._tool_index = {tool_id: i for i, tool_id in enumerate(catalog.toolcap)}
+
+        # strengths[capability, tool]
+        self._strengths = np.zeros((len(capabilities), len(self._tool_index)))
+        for tool_id, caps in catalog.toolcap.items():
+            for cap, strength in caps.items():
+                self._strengths[self._cap_index[cap], self._tool_index[tool_id]] = float(strength)
+
+        # Requirements padded to the longest control; padding has weight 0 and is masked out
+        self._control_ids = list(catalog.reqs_by_control)
+        self._control_row = {control_id: i for i, control_id in enumerate(self._control_ids)}
+        width = max((len(reqs) for reqs in catalog.reqs_by_control.values()), default=0)
+        n = len(self._control_ids)
+        self._req_cap = np.zeros((n, width), dtype=np.intp)
+        self._req_weight = np.zeros((n, width))
+        self._req_min = np.zeros((n, width))
+        self._req_len = np.zeros(n, dtype=np.intp)
+        for row, control_id in enumerate(self._control_ids):
+            reqs = catalog.reqs_by_control[control_id]
+            self._req_len[row] = len(reqs)
+            for j, r in enumerate(reqs):
+                self._req_cap[row, j] = self._cap_index[r["capabilityId"]]
+                self._req_weight[row, j] = float(r.get("weight", 0))
+                self._req_min[row, j] = float(r.get("minStrength", 0))
+
+    def _best_per_capability(self, tenant_tools: Dict[str, float]) -> Tuple[np.ndarray, List[Optional[str]]]:
+        """Best effective strength per capability and the first tenant tool reaching it."""
+        known = [(tool_id, float(cfg)) for tool_id, cfg in tenant_tools.items() if tool_id in self._tool_index]
+        n_caps = self._strengths.shape[0]
+        if not known:
+            return np.zeros(n_caps), [None] * n_caps
+        columns = [self._tool_index[tool_id] for tool_id, _ in known]
+        effective = self._strengths[:, columns] * np.array([cfg for _, cfg in known])
+        best_col = effective.argmax(axis=1)  # first maximum = first tool in tenant order
+        best = effective[np.arange(n_caps), best_col]
+        # Scalar loop starts at 0.0 and only moves on a strictly greater value
+        improved = best > 0.0
+        best = np.where(improved, best, 0.0)
+        tools = [known[col][0] if ok else None for col, ok in zip(best_col.tolist(), improved.tolist())]
+        return best, tools
+
+    def evaluate(
+        self,
+        tenant_tools: Dict[str, float],
+        control_ids: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Coverage]:
+        """
+        Coverage for many controls at once.
+
+        Args:
+            tenant_tools: {toolId: configScore} for enabled tenant tools, in inventory order.
+            control_ids: Controls to evaluate (default: every control with requirements).
+                Controls without requirements are omitted from the result.
+
+        Returns:
+            {controlId: (normalized_coverage, hard_gaps, soft_gaps)}, same values as
+            compute_control_coverage(reqs, tenant_tools, toolcap).
+        """
+        if control_ids is None:
+            ids = self._control_ids
+        else:
+            ids = [c for c in control_ids if c in self._control_row]
+        if not ids:
+            return {}
+        rows = np.array([self._control_row[c] for c in ids], dtype=np.intp)
+
+        best_cap, best_tool_cap = self._best_per_capability(tenant_tools)
+        req_cap = self._req_cap[rows]
+        weight = self._req_weight[rows]
+        best = best_cap[req_cap]
+
+        # Column-wise accumulation keeps the scalar summation order (no pairwise sum)
+        coverage = np.zeros(len(rows))
+        sum_w = np.zeros(len(rows))
+        for j in range(weight.shape[1]):
+            coverage = coverage + weight[:, j] * best[:, j]
+            sum_w = sum_w + weight[:, j]
+        safe_w = np.where(sum_w > 0, sum_w, 1.0)
+        normalized = np.where(sum_w > 0, coverage / safe_w, 0.0)
+
+        minimum = self._req_min[rows]
+        results: Dict[str, Coverage] = {}
+        for i, control_id in enumerate(ids):
+            hard_gaps: List[Dict] = []
+            soft_gaps: List[Dict] = []
+            row = rows[i]
+            for j in range(self._req_len[row]):
+                b = float(best[i, j])
+                w = float(weight[i, j])
+                if b == 0.0:
+                    hard_gaps.append({"capabilityId": self.catalog.reqs_by_control[control_id][j]["capabilityId"], "weight": w})
+                elif b < minimum[i, j]:
+                    soft_gaps.append({
+                        "capabilityId": self.catalog.reqs_by_control[control_id][j]["capabilityId"],
+                        "weight": w,
+                        "best": b,
+                        "min": float(minimum[i, j]),
+                        "tool": best_tool_cap[req_cap[i, j]],
+                    })
+            results[control_id] = (float(normalized[i]), hard_gaps, soft_gaps)
+        return results
+
+
+_lock = threading.Lock()
+_engine: Optional[CoverageEngine] = None
+
+
+def get_coverage_engine(catalog: SeedCatalog) -> CoverageEngine:
+    """Engine for the current seed catalog; rebuilt when the catalog is reloaded."""
+    global _engine
+    engine = _engine
+    if engine is not None and engine.catalog is catalog:
+        return engine
+    with _lock:
+        if _engine is None or _engine.catalog is not catalog:
+            _engine = CoverageEngine(catalog)
+        return _engine
@@ -5,13 +5,14 @@ Provides deterministic, rule-based scoring for control coverage based on
 capability requirements and tenant tool inventory.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 def compute_control_coverage(
     reqs: List[Dict],
     tenant_tools: Dict[str, float],
-    toolcap: Dict[str, Dict[str, float]]
+    toolcap: Dict[str, Dict[str, float]],
+    capability_tools: Optional[Dict[str, List[Tuple[str, float]]]] = None,
 ) -> Tuple[float, List[Dict], List[Dict]]:
     """
     Compute control coverage score based on capability requirements and available tools.
@@ -30,6 +31,9 @@ def compute_control_coverage(
         tenant_tools: Dict mapping tool IDs to their configuration scores (0.0-1.0)
         toolcap: Nested dict mapping tool IDs to capability strengths:
             {toolId: {capabilityId: strength}}
+        capability_tools: Optional reverse index {capabilityId: [(toolId, strength), ...]}
+            (see radar_coverage.seed_catalog). When given, only tenant tools that provide each
+            capability are scanned; results, including tie-breaks, are unchanged.
     
     Returns:
         Tuple of (normalized_coverage, hard_gaps, soft_gaps):
@@ -48,6 +52,7 @@ def compute_control_coverage(
     sum_w = 0.0
     hard_gaps: List[Dict] = []
     soft_gaps: List[Dict] = []
+    order = {tool_id: i for i, tool_id in enumerate(tenant_tools)} if capability_tools is not None else None
 
     for r in reqs:
         cap = r["capabilityId"]
@@ -58,7 +63,16 @@ def compute_control_coverage(
         # Find best tool for this capability
         best = 0.0
         best_tool = None
-        for tool_id, cfg in tenant_tools.items():
+        if order is None:
+            candidates = tenant_tools
+        else:
+            # Visit in tenant order so the first strongest tool wins, as in the full scan
+            candidates = sorted(
+                {tool_id for tool_id, _ in capability_tools.get(cap, ()) if tool_id in order},
+                key=order.__getitem__,
+            )
+        for tool_id in candidates:
+            cfg = tenant_tools[tool_id]
             strength = float(toolcap.get(tool_id, {}).get(cap, 0.0))
             effective_strength = strength * float(cfg)
             if effective_strength > best:
@@ -0,0 +1,106 @@
+"""
+SecAI Radar Seed Catalog
+
+Loads the JSON seed catalogs (tool capabilities, control requirements, vendor tools)
+once per process and indexes them for gap analysis. The parsed catalog is memoized
+and rebuilt only when one of the seed files' mtime changes, so redeploying seeds
+does not need a worker restart.
+
+The Functions API keeps its seeds next to the app as ``seeds_<name>.json``; the backend
+reads ``<name>.json`` from a seeds directory. Both pass their directory and prefix.
+"""
+
+import json
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+TOOL_CAPABILITIES_FILE = "tool_capabilities.json"
+CONTROL_REQUIREMENTS_FILE = "control_requirements.json"
+VENDOR_TOOLS_FILE = "vendor_tools.json"
+_SEED_FILES = (TOOL_CAPABILITIES_FILE, CONTROL_REQUIREMENTS_FILE, VENDOR_TOOLS_FILE)
+
+
+@dataclass(frozen=True)
+class SeedCatalog:
+    """
+    Indexed seed data. Treat the maps as read-only; they are shared across requests.
+
+    Attributes:
+        toolcap: {vendorToolId: {capabilityId: strength}}
+        capability_tools: {capabilityId: [(vendorToolId, strength), ...]} strongest first
+        reqs_by_control: {controlId: [requirement, ...]} in seed order
+        vendor_tools: {vendorToolId: tool}
+    """
+    toolcap: Dict[str, Dict[str, float]]
+    capability_tools: Dict[str, List[Tuple[str, float]]]
+    reqs_by_control: Dict[str, List[Dict]]
+    vendor_tools: Dict[str, Dict]
+
+    def tools_for_capability(self, capability_id: str) -> List[str]:
+        """Vendor tool IDs that provide a capability, strongest first."""
+        return [tool_id for tool_id, _ in self.capability_tools.get(capability_id, [])]
+
+
+def build_seed_catalog(
+    tool_caps: List[Dict],
+    control_reqs: List[Dict],
+    vendor_tools: List[Dict],
+) -> SeedCatalog:
+    """Index already-parsed seed lists."""
+    toolcap: Dict[str, Dict[str, float]] = defaultdict(dict)
+    capability_tools: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+    for t in tool_caps:
+        strength = float(t.get("strength", 0))
+        toolcap[t["vendorToolId"]][t["capabilityId"]] = strength
+        capability_tools[t["capabilityId"]].append((t["vendorToolId"], strength))
+    for tools in capability_tools.values():
+        tools.sort(key=lambda item: -item[1])
+
+    reqs_by_control: Dict[str, List[Dict]] = defaultdict(list)
+    for r in control_reqs:
+        reqs_by_control[r["controlId"]].append(r)
+
+    return SeedCatalog(
+        toolcap=dict(toolcap),
+        capability_tools=dict(capability_tools),
+        reqs_by_control=dict(reqs_by_control),
+        vendor_tools={t["id"]: t for t in vendor_tools},
+    )
+
+
+_lock = threading.Lock()
+_cached: Dict[Tuple[Path, str], Tuple[Tuple[int, ...], SeedCatalog]] = {}
+
+
+def _mtimes(root: Path, prefix: str) -> Tuple[int, ...]:
+    return tuple(os.stat(root / f"{prefix}{name}").st_mtime_ns for name in _SEED_FILES)
+
+
+def get_seed_catalog(root: Path, prefix: str = "") -> SeedCatalog:
+    """
+    Get the indexed seed catalog from ``root``/``prefix``<name>.json.
+
+    One stat() per seed file per call; files are re-read only when an mtime changes.
+    Raises FileNotFoundError if a seed file is missing.
+    """
+    root = Path(root)
+    key = (root, prefix)
+    stamp = _mtimes(root, prefix)
+    hit = _cached.get(key)
+    if hit and hit[0] == stamp:
+        return hit[1]
+    with _lock:
+        hit = _cached.get(key)
+        if hit and hit[0] == stamp:
+            return hit[1]
+        catalog = build_seed_catalog(
+            json.loads((root / f"{prefix}{TOOL_CAPABILITIES_FILE}").read_text()),
+            json.loads((root / f"{prefix}{CONTROL_REQUIREMENTS_FILE}").read_text()),
+            json.loads((root / f"{prefix}{VENDOR_TOOLS_FILE}").read_text()),
+        )
+        _cached[key] = (stamp, catalog)
+        return catalog
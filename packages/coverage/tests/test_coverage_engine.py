@@ -0,0 +1,85 @@
+import random
+import unittest
+from pathlib import Path
+
+from radar_coverage.coverage_engine import CoverageEngine, get_coverage_engine
+from radar_coverage.scoring import compute_control_coverage
+from radar_coverage.seed_catalog import build_seed_catalog, get_seed_catalog
+
+# The repository's seed files (the Functions API ships copies as api/seeds_*.json)
+SEEDS_DIR = Path(__file__).resolve().parents[3] / "seeds"
+
+
+def _random_catalog(rng, n_tools=12, n_caps=15, n_controls=40):
+    tools = [f"tool-{i}" for i in range(n_tools)]
+    caps = [f"cap-{i}" for i in range(n_caps)]
+    # Coarse strengths so ties between tools are common
+    tool_caps = [
+        {"vendorToolId": t, "capabilityId": c, "strength": rng.choice([0.0, 0.3, 0.5, 0.7, 0.9])}
+        for t in tools for c in rng.sample(caps, rng.randint(0, 6))
+    ]
+    control_reqs = [
+        {
+            "controlId": f"CTRL-{k}",
+            "capabilityId": c,
+            "weight": rng.choice([0.1, 0.2, 0.25, 0.3, 1 / 3, 0.6]),
+            "minStrength": rng.choice([0.0, 0.5, 0.6, 0.7]),
+        }
+        for k in range(n_controls) for c in rng.sample(caps + ["cap-unmapped"], rng.randint(1, 12))
+    ]
+    vendor_tools = [{"id": t, "name": t} for t in tools]
+    return build_seed_catalog(tool_caps, control_reqs, vendor_tools), tools
+
+
+class TestCoverageEngineParity(unittest.TestCase):
+    def assertMatchesScalar(self, catalog, engine, tenant_tools):
+        results = engine.evaluate(tenant_tools)
+        self.assertEqual(set(results), set(catalog.reqs_by_control))
+        for control_id, reqs in catalog.reqs_by_control.items():
+            expected = compute_control_coverage(reqs, tenant_tools, catalog.toolcap)
+            self.assertEqual(results[control_id], expected, control_id)
+
+    def test_random_catalogs_match_exactly(self):
+        rng = random.Random(1234)
+        for _ in range(20):
+            catalog, tools = _random_catalog(rng)
+            engine = CoverageEngine(catalog)
+            for _ in range(10):
+                chosen = rng.sample(tools + ["not-in-catalog"], rng.randint(0, len(tools)))
+                tenant_tools = {t: rng.choice([0.0, 0.5, 0.8, 1.0]) for t in chosen}
+                self.assertMatchesScalar(catalog, engine, tenant_tools)
+
+    @unittest.skipUnless((SEEDS_DIR / "tool_capabilities.json").exists(), "needs a repo checkout")
+    def test_seed_catalog_matches_exactly(self):
+        catalog = get_seed_catalog(SEEDS_DIR)
+        engine = CoverageEngine(catalog)
+        rng = random.Random(99)
+        tools = sorted(catalog.toolcap)
+        for _ in range(25):
+            tenant_tools = {t: rng.choice([0.6, 0.8, 1.0]) for t in rng.sample(tools, rng.randint(0, len(tools)))}
+            self.assertMatchesScalar(catalog, engine, tenant_tools)
+
+    def test_control_subset_and_unknown_controls(self):
+        catalog, _ = _random_catalog(random.Random(5))
+        engine = CoverageEngine(catalog)
+        some = list(catalog.reqs_by_control)[:3]
+        results = engine.evaluate({}, some + ["NOT-A-CONTROL"])
+        self.assertEqual(list(results), some)
+        for control_id in some:
+            coverage, hard, soft = results[control_id]
+            self.assertEqual(coverage, 0.0)
+            self.assertEqual(len(hard), len(catalog.reqs_by_control[control_id]))
+            self.assertEqual(soft, [])
+
+    def test_engine_is_rebuilt_only_for_a_new_catalog(self):
+        rng = random.Random(3)
+        first, _ = _random_catalog(rng)
+        engine = get_coverage_engine(first)
+        self.assertIs(get_coverage_engine(first), engine)
+        second, _ = _random_catalog(rng)
+        self.assertIsNot(get_coverage_engine(second), engine)
+        self.assertIs(get_coverage_engine(second).catalog, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
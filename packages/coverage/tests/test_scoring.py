@@ -1,10 +1,6 @@
 import unittest
-import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from shared.scoring import compute_control_coverage
+from radar_coverage.scoring import compute_control_coverage
 
 class TestScoring(unittest.TestCase):
     def test_hard_and_soft_gaps(self):
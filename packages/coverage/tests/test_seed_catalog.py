@@ -0,0 +1,93 @@
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from radar_coverage.scoring import compute_control_coverage
+from radar_coverage.seed_catalog import (
+    CONTROL_REQUIREMENTS_FILE,
+    TOOL_CAPABILITIES_FILE,
+    VENDOR_TOOLS_FILE,
+    get_seed_catalog,
+)
+
+
+def _seeds(rng, n_tools=10, n_caps=12, n_controls=30):
+    tools = [f"tool-{i}" for i in range(n_tools)]
+    caps = [f"cap-{i}" for i in range(n_caps)]
+    tool_caps = [
+        {"vendorToolId": t, "capabilityId": c, "strength": rng.choice([0.3, 0.5, 0.7, 0.9])}
+        for t in tools for c in rng.sample(caps, rng.randint(0, 5))
+    ]
+    control_reqs = [
+        {"controlId": f"CTRL-{k}", "capabilityId": c, "weight": rng.choice([0.2, 0.3, 0.5]),
+         "minStrength": rng.choice([0.0, 0.5, 0.7])}
+        for k in range(n_controls) for c in rng.sample(caps, rng.randint(1, 6))
+    ]
+    vendor_tools = [{"id": t, "name": t.title()} for t in tools]
+    return {TOOL_CAPABILITIES_FILE: tool_caps, CONTROL_REQUIREMENTS_FILE: control_reqs, VENDOR_TOOLS_FILE: vendor_tools}
+
+
+class TestSeedCatalog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.seeds = _seeds(random.Random(7))
+        for name, rows in self.seeds.items():
+            (self.tmp / f"seeds_{name}").write_text(json.dumps(rows))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_memoized_until_seed_file_changes(self):
+        first = get_seed_catalog(self.tmp, "seeds_")
+        self.assertIs(get_seed_catalog(self.tmp, "seeds_"), first)
+
+        path = self.tmp / f"seeds_{TOOL_CAPABILITIES_FILE}"
+        caps = json.loads(path.read_text())
+        caps.append({"vendorToolId": "new-tool", "capabilityId": "new-cap", "strength": 0.5})
+        path.write_text(json.dumps(caps))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = get_seed_catalog(self.tmp, "seeds_")
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded.tools_for_capability("new-cap"), ["new-tool"])
+
+    def test_prefix_selects_the_seed_files(self):
+        for name, rows in self.seeds.items():
+            (self.tmp / name).write_text(json.dumps(rows[:1]))
+        plain = get_seed_catalog(self.tmp)
+        self.assertEqual(len(plain.vendor_tools), 1)
+        self.assertEqual(len(get_seed_catalog(self.tmp, "seeds_").vendor_tools), len(self.seeds[VENDOR_TOOLS_FILE]))
+        with self.assertRaises(FileNotFoundError):
+            get_seed_catalog(self.tmp, "missing_")
+
+    def test_indexes_match_seed_rows(self):
+        catalog = get_seed_catalog(self.tmp, "seeds_")
+        for t in self.seeds[TOOL_CAPABILITIES_FILE]:
+            self.assertIn(t["vendorToolId"], catalog.tools_for_capability(t["capabilityId"]))
+        for tools in catalog.capability_tools.values():
+            strengths = [s for _, s in tools]
+            self.assertEqual(strengths, sorted(strengths, reverse=True))
+        self.assertEqual(sum(len(reqs) for reqs in catalog.reqs_by_control.values()),
+                         len(self.seeds[CONTROL_REQUIREMENTS_FILE]))
+
+    def test_indexed_coverage_matches_full_scan(self):
+        catalog = get_seed_catalog(self.tmp, "seeds_")
+        tool_ids = sorted(catalog.toolcap) + ["unknown-tool"]
+        rng = random.Random(7)
+        for _ in range(50):
+            chosen = rng.sample(tool_ids, rng.randint(0, min(8, len(tool_ids))))
+            tenant_tools = {t: rng.choice([0.5, 0.8, 1.0]) for t in chosen}
+            for reqs in catalog.reqs_by_control.values():
+                self.assertEqual(
+                    compute_control_coverage(reqs, tenant_tools, catalog.toolcap, catalog.capability_tools),
+                    compute_control_coverage(reqs, tenant_tools, catalog.toolcap),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+MCP daily brief feed rendering
+"""
+
+from .render import (
+    ASSESSED_BY,
+    CONTENT_NS,
+    FEED_DESCRIPTION,
+    FEED_JSON,
+    FEED_LIMIT,
+    FEED_TITLE,
+    FEED_XML,
+    JSON_CONTENT_TYPE,
+    METHODOLOGY_VERSION,
+    RSS_CONTENT_TYPE,
+    SITE_URL,
+    brief_fields,
+    item_attestation_fields,
+    item_integrity_digest,
+    json_feed_document,
+    render_json_feed,
+    render_rss_feed,
+)
+
+__all__ = [
+    "ASSESSED_BY",
+    "CONTENT_NS",
+    "FEED_DESCRIPTION",
+    "FEED_JSON",
+    "FEED_LIMIT",
+    "FEED_TITLE",
+    "FEED_XML",
+    "JSON_CONTENT_TYPE",
+    "METHODOLOGY_VERSION",
+    "RSS_CONTENT_TYPE",
+    "SITE_URL",
+    "brief_fields",
+    "item_attestation_fields",
+    "item_integrity_digest",
+    "json_feed_document",
+    "render_json_feed",
+    "render_rss_feed",
+]
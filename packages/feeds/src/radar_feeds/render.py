@@ -0,0 +1,140 @@
+"""
+Feed rendering for the MCP daily brief.
+
+Each feed item includes Gk-like attestation fields: provenance, integrityDigest,
+security_context (see Pivot_Strategy_Reuse_Ideas.md). Briefs are plain dicts (see
+brief_fields()) so the publisher (psycopg2 rows) and the public API (ORM objects)
+render identical bytes.
+"""
+
+import hashlib
+import json
+import xml.etree.ElementTree as ET
+from datetime import date, datetime
+from typing import Any, Dict, List, Union
+from xml.dom import minidom
+
+FEED_LIMIT = 30
+METHODOLOGY_VERSION = "v1.0"
+ASSESSED_BY = "SecAI Radar"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+FEED_XML = "feed.xml"
+FEED_JSON = "feed.json"
+RSS_CONTENT_TYPE = "application/rss+xml"
+JSON_CONTENT_TYPE = "application/json"
+
+SITE_URL = "https://secairadar.cloud/mcp"
+FEED_TITLE = "SecAI Radar MCP Daily Brief"
+FEED_DESCRIPTION = (
+    "SecAI Radar attests to the evidence and context behind each score. "
+    "Independent attestation of MCP server trust posture. Daily briefs, rankings, evidence, and drift tracking."
+)
+
+
+def _isoformat(value: Union[datetime, str]) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def brief_fields(
+    brief_date: date,
+    headline: str,
+    narrative_short: str,
+    methodology_version: str,
+    generated_at: Union[datetime, str],
+) -> Dict[str, Any]:
+    """One daily brief as the dict the renderers take (defaults applied)."""
+    return {
+        "date": brief_date,
+        "headline": headline,
+        "narrative_short": narrative_short or "",
+        "methodology_version": methodology_version or METHODOLOGY_VERSION,
+        "generated_at": generated_at,
+    }
+
+
+def item_integrity_digest(brief: Dict[str, Any]) -> str:
+    """SHA-256 of canonical item fields for tamper check."""
+    canonical = (
+        f"{brief['date'].isoformat()}|{brief['headline']}|{brief['narrative_short']}|"
+        f"{brief['methodology_version']}|{_isoformat(brief['generated_at'])}"
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def item_attestation_fields(brief: Dict[str, Any]) -> Dict[str, Any]:
+    """Provenance, integrityDigest, security_context for one feed item."""
+    return {
+        "provenance": {
+            "sourceId": "secai-radar",
+            "asOf": _isoformat(brief["generated_at"]),
+            "methodologyVersion": brief["methodology_version"],
+        },
+        "integrityDigest": item_integrity_digest(brief),
+        "security_context": {"assessor": ASSESSED_BY, "scope": "public-ranking"},
+    }
+
+
+def render_rss_feed(briefs: List[Dict[str, Any]], built_at: datetime) -> bytes:
+    """RSS 2.0 feed; attestation fields go in each item's content:encoded."""
+    rss = ET.Element("rss", version="2.0")
+    rss.set("xmlns:content", CONTENT_NS)
+    channel = ET.SubElement(rss, "channel")
+    ET.SubElement(channel, "title").text = FEED_TITLE
+    ET.SubElement(channel, "link").text = SITE_URL
+    ET.SubElement(channel, "description").text = FEED_DESCRIPTION
+    ET.SubElement(channel, "language").text = "en-US"
+    ET.SubElement(channel, "lastBuildDate").text = built_at.strftime("%a, %d %b %Y %H:%M:%S GMT")
+    for brief in briefs:
+        link = f"{SITE_URL}/daily/{brief['date'].isoformat()}"
+        gen_at = brief["generated_at"]
+        item = ET.SubElement(channel, "item")
+        ET.SubElement(item, "title").text = brief["headline"]
+        ET.SubElement(item, "link").text = link
+        ET.SubElement(item, "description").text = brief["narrative_short"]
+        ET.SubElement(item, "pubDate").text = (
+            gen_at.strftime("%a, %d %b %Y %H:%M:%S GMT") if hasattr(gen_at, "strftime") else str(gen_at)
+        )
+        ET.SubElement(item, "guid", isPermaLink="true").text = link
+        ET.SubElement(item, f"{{{CONTENT_NS}}}encoded").text = json.dumps(item_attestation_fields(brief))
+    pretty = minidom.parseString(ET.tostring(rss, encoding="unicode")).toprettyxml(indent="  ")
+    return pretty.encode("utf-8")
+
+
+def json_feed_document(briefs: List[Dict[str, Any]], built_at: datetime) -> Dict[str, Any]:
+    """JSON Feed 1.1 document with the public API attestation envelope."""
+    items = []
+    for brief in briefs:
+        link = f"{SITE_URL}/daily/{brief['date'].isoformat()}"
+        att = item_attestation_fields(brief)
+        items.append({
+            "id": link,
+            "url": link,
+            "title": brief["headline"],
+            "content_text": brief["narrative_short"],
+            "date_published": _isoformat(brief["generated_at"]),
+            "provenance": att["provenance"],
+            "integrityDigest": att["integrityDigest"],
+            "security_context": att["security_context"],
+        })
+    return {
+        "attestation": {
+            "assessedBy": ASSESSED_BY,
+            "methodologyVersion": METHODOLOGY_VERSION,
+            "asOf": built_at.isoformat(),
+        },
+        "methodologyVersion": METHODOLOGY_VERSION,
+        "generatedAt": built_at.replace(tzinfo=None).isoformat(),
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": FEED_TITLE,
+        "description": FEED_DESCRIPTION,
+        "feed_url": f"{SITE_URL}/{FEED_JSON}",
+        "home_page_url": SITE_URL,
+        "items": items,
+    }
+
+
+def render_json_feed(briefs: List[Dict[str, Any]], built_at: datetime) -> bytes:
+    """JSON Feed as compact UTF-8 (the same bytes the API's orjson response produces)."""
+    document = json_feed_document(briefs, built_at)
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,57 @@
+"""
+Unit tests for feed rendering
+"""
+
+import json
+from datetime import date, datetime, timezone
+
+from radar_feeds import (
+    brief_fields,
+    item_attestation_fields,
+    json_feed_document,
+    render_json_feed,
+    render_rss_feed,
+)
+
+BUILT_AT = datetime(2026, 1, 2, 7, 0, tzinfo=timezone.utc)
+
+
+def _brief(**overrides):
+    fields = dict(
+        brief_date=date(2026, 1, 2),
+        headline="MCP Trust Radar — 2026-01-02",
+        narrative_short="No movers.",
+        methodology_version="v1.0",
+        generated_at=datetime(2026, 1, 2, 6, 0, tzinfo=timezone.utc),
+    )
+    fields.update(overrides)
+    return brief_fields(**fields)
+
+
+def test_brief_fields_applies_defaults():
+    brief = _brief(narrative_short=None, methodology_version=None)
+    assert brief["narrative_short"] == ""
+    assert brief["methodology_version"] == "v1.0"
+
+
+def test_item_digest_covers_canonical_fields():
+    att = item_attestation_fields(_brief())
+    assert att["provenance"]["asOf"] == "2026-01-02T06:00:00+00:00"
+    assert att["integrityDigest"] != item_attestation_fields(_brief(headline="Changed"))["integrityDigest"]
+
+
+def test_rss_feed_items_carry_attestation():
+    xml = render_rss_feed([_brief()], BUILT_AT).decode("utf-8")
+    assert "<lastBuildDate>Fri, 02 Jan 2026 07:00:00 GMT</lastBuildDate>" in xml
+    assert "https://secairadar.cloud/mcp/daily/2026-01-02" in xml
+    assert item_attestation_fields(_brief())["integrityDigest"] in xml
+
+
+def test_json_feed_bytes_match_document():
+    body = render_json_feed([_brief()], BUILT_AT)
+    feed = json.loads(body)
+    assert feed == json.loads(json.dumps(json_feed_document([_brief()], BUILT_AT)))
+    assert feed["attestation"]["asOf"] == BUILT_AT.isoformat()
+    assert feed["generatedAt"] == "2026-01-02T07:00:00"
+    assert feed["items"][0]["integrityDigest"] == item_attestation_fields(_brief())["integrityDigest"]
+    assert b"\xe2\x80\x94" in body  # UTF-8, not \u escapes
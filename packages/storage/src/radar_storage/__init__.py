@@ -0,0 +1,9 @@
+"""
+Azure Storage helpers shared by the Functions API (api/), the backend and the
+registry API. Import the submodules directly:
+
+    radar_storage.blob_upload     streaming block-blob uploads
+    radar_storage.control_import  bulk control import
+    radar_storage.control_summary ControlSummary projection
+    radar_storage.tables          tenant-scoped, paged table queries
+"""
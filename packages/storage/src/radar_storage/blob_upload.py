@@ -0,0 +1,135 @@
+"""
+Streaming Blob Upload
+
+Uploads evidence as a block blob without holding the whole file in memory:
+chunks are read from a stream, staged as blocks on a small thread pool (bounded
+in-flight, so memory stays around block_size * (max_workers + 1)), hashed as they
+pass through, and committed with one Put Block List. The SHA-256 is stored as blob
+metadata and returned so callers can dedupe and classify without re-reading.
+
+Environment:
+    BLOB_UPLOAD_BLOCK_SIZE: bytes per staged block (default 4 MiB)
+    BLOB_UPLOAD_WORKERS: concurrent Put Block requests (default 4)
+"""
+
+import base64
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator, Optional, Union
+
+BLOCK_SIZE = int(os.getenv("BLOB_UPLOAD_BLOCK_SIZE", str(4 * 1024 * 1024)))
+MAX_WORKERS = int(os.getenv("BLOB_UPLOAD_WORKERS", "4"))
+
+
+class UploadTooLarge(ValueError):
+    """The stream exceeded max_size; nothing was committed."""
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    size: int
+    sha256: str
+    blocks: int
+
+
+def iter_stream(source: Union[BinaryIO, Iterable[bytes]], read_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """Chunks from a file-like object (read(n)) or an iterable of bytes."""
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(read_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source
+
+
+def iter_base64(encoded: str, chunk_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """Decode a base64 string slice by slice instead of materializing the whole file."""
+    if any(c in encoded for c in "\r\n \t"):
+        encoded = "".join(encoded.split())
+    step = 4 * max(1, chunk_size // 3)  # 4 characters per 3 decoded bytes
+    for i in range(0, len(encoded), step):
+        yield base64.b64decode(encoded[i:i + step])
+
+
+def base64_decoded_size(encoded: str) -> int:
+    """Decoded length of a base64 string (whitespace ignored), without decoding it."""
+    n = len(encoded) - sum(encoded.count(c) for c in "\r\n \t")
+    return (n * 3) // 4 - encoded.rstrip()[-2:].count("=")
+
+
+def _rechunk(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        while len(buf) >= size:
+            yield bytes(buf[:size])
+            del buf[:size]
+    if buf:
+        yield bytes(buf)
+
+
+def _block_id(index: int) -> str:
+    # All block IDs of a blob must have the same length
+    return base64.b64encode(f"{index:08d}".encode()).decode()
+
+
+def stream_upload(
+    blob_client,
+    source: Union[BinaryIO, Iterable[bytes]],
+    block_size: int = BLOCK_SIZE,
+    max_workers: int = MAX_WORKERS,
+    max_size: Optional[int] = None,
+    content_settings=None,
+    metadata: Optional[dict] = None,
+) -> UploadResult:
+    """
+    Stage ``source`` as blocks of ``block_size`` and commit them (overwrites the blob).
+
+    Raises UploadTooLarge if more than ``max_size`` bytes arrive; staged blocks that
+    are never committed are discarded by the service.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    block_ids = []
+    slots = threading.BoundedSemaphore(max(1, max_workers) + 1)
+    futures = []
+
+    def stage(block_id: str, data: bytes) -> None:
+        try:
+            blob_client.stage_block(block_id=block_id, data=data, length=len(data))
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        try:
+            for data in _rechunk(iter_stream(source, block_size), block_size):
+                size += len(data)
+                if max_size is not None and size > max_size:
+                    raise UploadTooLarge(f"Upload exceeds {max_size} bytes")
+                digest.update(data)
+                block_id = _block_id(len(block_ids))
+                block_ids.append(block_id)
+                slots.acquire()
+                futures.append(pool.submit(stage, block_id, data))
+                # Surface a failed block early instead of streaming the rest
+                while futures and futures[0].done():
+                    futures.pop(0).result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        for future in futures:
+            future.result()
+
+    sha256 = digest.hexdigest()
+    blob_client.commit_block_list(
+        block_ids,
+        content_settings=content_settings,
+        metadata={**(metadata or {}), "sha256": sha256},
+    )
+    return UploadResult(size=size, sha256=sha256, blocks=len(block_ids))
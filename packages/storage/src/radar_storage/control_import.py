@@ -0,0 +1,255 @@
+"""
+Bulk Control Import
+
+Streaming importer for framework CSV/JSON uploads (POST /tenant/{id}/import in the
+Functions API and the backend):
+
+1. Rows are parsed one at a time (csv.DictReader over the upload stream, decoded as it
+   is read, or a JSON array) and mapped to Controls entities. A malformed CSV record or
+   bytes that are not UTF-8 are reported as a row error like any other invalid row.
+2. Entities are grouped by PartitionKey (tenant|domain); every 100 rows of a partition
+   (the Table service limit per transaction) are flushed as one batch transaction.
+3. Batches run concurrently on a bounded thread pool. A rejected batch is retried
+   entity by entity, so one bad row is reported without aborting the rest.
+
+Environment:
+    IMPORT_WORKERS: max concurrent batch transactions (default 8)
+"""
+
+import csv
+import io
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = int(os.getenv("IMPORT_WORKERS", "8"))
+# Table service limit: 100 operations per transaction, all in one partition
+BATCH_SIZE = 100
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportRowError(ValueError):
+    """A row that cannot be mapped to a control entity."""
+
+
+@dataclass
+class ImportReport:
+    """Outcome of one import; ``errors`` holds at most MAX_REPORTED_ERRORS entries."""
+    total_rows: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    batches: int = 0
+    error_count: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    # PartitionKeys written to (for the ControlSummary refresh)
+    partitions: Set[str] = field(default_factory=set)
+
+    def add_error(self, row: int, control_id: str, message: str) -> None:
+        self.error_count += 1
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "controlId": control_id, "error": message})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "inserted": self.inserted,
+            "skipped": self.skipped,
+            "totalRows": self.total_rows,
+            "batches": self.batches,
+            "errorCount": self.error_count,
+            "errors": sorted(self.errors, key=lambda e: e["row"]) or None,
+        }
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[Union[Dict[str, str], ImportRowError]]:
+    """
+    Yield CSV rows as dicts, decoding a binary stream (UTF-8, BOM optional) as it is read.
+
+    A record the csv module rejects is yielded as an ImportRowError in its place (and
+    parsing continues with the next record), since the rows before it may already be
+    written by the time it is reached. Bytes that are not UTF-8 are reported the same
+    way and end the import: the stream is decoded in blocks, so the rows from the start
+    of the block holding them on are not read. The stream is left open.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    try:
+        while True:
+            # DictReader.line_num only updates on success; the underlying reader's always does
+            line_num = reader.reader.line_num
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except UnicodeDecodeError as e:
+                yield ImportRowError(f"Invalid CSV encoding after line {line_num} (use UTF-8): {e}")
+                return
+            except csv.Error as e:
+                yield ImportRowError(f"Invalid CSV at line {reader.reader.line_num}: {e}")
+                if reader.reader.line_num == line_num:
+                    return  # no progress; stop rather than loop on the same record
+                continue
+            yield row
+    finally:
+        # Hand the stream back to the caller instead of closing it with the wrapper
+        text.detach()
+
+
+def _safe_float(val, default=0.0):
+    if val is None or str(val).strip() == "":
+        return default
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return default
+
+
+def control_entity(tenant_id: str, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Map an import row to a Controls entity.
+
+    Returns None for rows without a ControlID (silently skipped) and raises
+    ImportRowError for rows that cannot be imported (including the parse errors
+    iter_csv_rows yields).
+    """
+    if isinstance(row, ImportRowError):
+        raise row
+    if not isinstance(row, dict):
+        raise ImportRowError("Row must be an object")
+    control_id = str(row.get("ControlID") or "").strip()
+    if not control_id:
+        return None
+
+    # Derive domain code from ControlID (e.g., SEC-NET-0001 -> NET)
+    if control_id.startswith("SEC-") and "-" in control_id[4:]:
+        domain_code = control_id.split("-")[1]
+    else:
+        domain_code = str(row.get("DomainCode") or "").strip()
+    if not domain_code:
+        raise ImportRowError(f"Missing DomainCode for {control_id}")
+
+    domain = str(row.get("Domain") or "").strip()
+    if not domain:
+        raise ImportRowError(f"Missing Domain for {control_id}")
+
+    return {
+        "PartitionKey": f"{tenant_id}|{domain_code}",
+        "RowKey": control_id,
+        "Domain": domain,
+        "ControlTitle": row.get("ControlTitle", ""),
+        "ControlDescription": row.get("ControlDescription", ""),
+        "Question": row.get("Question", ""),
+        "RequiredEvidence": row.get("RequiredEvidence", ""),
+        "Status": row.get("Status", "NotStarted"),
+        "Owner": row.get("Owner", ""),
+        "Frequency": row.get("Frequency", ""),
+        "ScoreNumeric": _safe_float(row.get("ScoreNumeric")),
+        "Weight": _safe_float(row.get("Weight")),
+        "Notes": row.get("Notes", ""),
+        "SourceRef": row.get("SourceRef", ""),
+        "Tags": row.get("Tags", ""),
+        "UpdatedAt": row.get("UpdatedAt", ""),
+    }
+
+
+# (1-based row number, entity)
+_Item = Tuple[int, Dict[str, Any]]
+
+
+class BulkControlImporter:
+    """Upsert control entities with per-partition batch transactions."""
+
+    def __init__(self, table, max_workers: int = MAX_WORKERS, batch_size: int = BATCH_SIZE):
+        self.table = table
+        self.max_workers = max(1, max_workers)
+        self.batch_size = max(1, min(batch_size, BATCH_SIZE))
+        self._lock = threading.Lock()
+
+    def _upsert_batch(self, items: List[_Item], report: ImportReport, after: List[Future]) -> None:
+        for future in after:
+            future.result()  # earlier batches writing the same RowKeys: keep row order
+        try:
+            self.table.submit_transaction([("upsert", entity) for _, entity in items])
+            with self._lock:
+                report.inserted += len(items)
+                report.batches += 1
+            return
+        except Exception as e:
+            # Transactions are all-or-nothing; retry rows one by one to isolate the failure
+            logger.warning("Batch of %d rows for %s rejected, retrying per row: %s",
+                           len(items), items[0][1]["PartitionKey"], e)
+        for row, entity in items:
+            try:
+                self.table.upsert_entity(entity)
+                with self._lock:
+                    report.inserted += 1
+            except Exception as e:
+                with self._lock:
+                    report.add_error(row, entity["RowKey"], str(e))
+
+    def run(
+        self,
+        tenant_id: str,
+        rows: Iterable[Dict[str, Any]],
+        report: Optional[ImportReport] = None,
+    ) -> ImportReport:
+        """
+        Import rows (streamed) for a tenant and return the per-row report.
+
+        Pass ``report`` to keep the partial report (``partitions`` in particular, for
+        the ControlSummary refresh) if the import raises partway through.
+        """
+        report = report if report is not None else ImportReport()
+        # PartitionKey -> {RowKey: item}; a later duplicate row replaces the earlier one
+        pending: Dict[str, Dict[str, _Item]] = {}
+        # (PartitionKey, RowKey) -> batch that last wrote it
+        written_by: Dict[Tuple[str, str], Future] = {}
+        futures: List[Future] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            def flush(pk: str) -> None:
+                items = list(pending.pop(pk).values())
+                report.partitions.add(pk)
+                keys = [(pk, entity["RowKey"]) for _, entity in items]
+                after = {written_by[k] for k in keys if k in written_by}
+                future = pool.submit(self._upsert_batch, items, report, list(after))
+                for k in keys:
+                    written_by[k] = future
+                futures.append(future)
+
+            for idx, row in enumerate(rows, start=1):
+                error = None
+                try:
+                    entity = control_entity(tenant_id, row)
+                except ImportRowError as e:
+                    entity, error = None, str(e)
+                with self._lock:
+                    report.total_rows += 1
+                    if error:
+                        control_id = row.get("ControlID") if isinstance(row, dict) else ""
+                        report.add_error(idx, str(control_id or ""), error)
+                    elif entity is None:
+                        report.skipped += 1
+                if entity is None:
+                    continue
+
+                pk = entity["PartitionKey"]
+                batch = pending.setdefault(pk, {})
+                if entity["RowKey"] in batch:
+                    with self._lock:
+                        report.inserted += 1  # superseded by this row, as with sequential upserts
+                batch[entity["RowKey"]] = (idx, entity)
+                if len(batch) >= self.batch_size:
+                    flush(pk)
+
+            for pk in list(pending):
+                flush(pk)
+            for future in futures:
+                future.result()
+        return report
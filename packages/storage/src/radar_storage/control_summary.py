@@ -0,0 +1,119 @@
+"""
+Control Summary Projection
+
+Per-tenant, per-domain status counters kept in the ControlSummary table
+(PartitionKey=tenant, RowKey=domain code), so GET /tenant/{id}/summary reads one
+partition of a handful of rows instead of every control.
+
+Writers that change controls call refresh_domains() for the domains they touched;
+each touched domain is recounted from its Controls partition and written with a
+replace upsert, so a retried or repeated refresh converges to the same row.
+rebuild_tenant_summary() recounts the whole tenant to repair drift.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List
+
+from azure.data.tables import UpdateMode
+
+from .tables import query_partition_entities, query_tenant_entities
+
+SUMMARY_TABLE = "ControlSummary"
+
+# Controls.Status (lower-case) -> counter
+STATUS_COUNTERS = {
+    "complete": "complete",
+    "inprogress": "inProgress",
+    "notstarted": "notStarted",
+    "notapplicable": "notApplicable",
+}
+COUNTERS = ("total", "complete", "inProgress", "notStarted", "notApplicable")
+# counter -> ControlSummary property ("inProgress" -> "InProgress")
+_PROPERTIES = {c: c[0].upper() + c[1:] for c in COUNTERS}
+
+
+def _empty() -> Dict[str, int]:
+    return {c: 0 for c in COUNTERS}
+
+
+def domain_of(partition_key: str) -> str:
+    """Domain code of a Controls PartitionKey ("tenant|NET" -> "NET")."""
+    return partition_key.split("|", 1)[1] if "|" in partition_key else "UNKNOWN"
+
+
+def count_statuses(entities: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    """{domain: counters} for Controls entities projected to PartitionKey and Status."""
+    agg: Dict[str, Dict[str, int]] = defaultdict(_empty)
+    for e in entities:
+        counters = agg[domain_of(str(e.get("PartitionKey", "")))]
+        counters["total"] += 1
+        key = STATUS_COUNTERS.get(str(e.get("Status") or "").lower())
+        if key:
+            counters[key] += 1
+    return dict(agg)
+
+
+def _write_domain(summary_table, tenant_id: str, domain: str, counters: Dict[str, int]) -> None:
+    if counters["total"] == 0:
+        summary_table.delete_entity(tenant_id, domain)  # no-op if absent
+        return
+    summary_table.upsert_entity({
+        "PartitionKey": tenant_id,
+        "RowKey": domain,
+        **{prop: counters[c] for c, prop in _PROPERTIES.items()},
+        "UpdatedAt": datetime.now(timezone.utc).isoformat(),
+    }, mode=UpdateMode.REPLACE)
+
+
+def refresh_domains(controls_table, summary_table, tenant_id: str, domains: Iterable[str]) -> None:
+    """Recount the given domains of a tenant and write their summary rows."""
+    for domain in sorted(set(domains)):
+        entities = query_partition_entities(controls_table, f"{tenant_id}|{domain}", select=["PartitionKey", "Status"])
+        counters = count_statuses(entities).get(domain, _empty())
+        _write_domain(summary_table, tenant_id, domain, counters)
+
+
+def rebuild_tenant_summary(controls_table, summary_table, tenant_id: str) -> Dict[str, Dict[str, int]]:
+    """Recount every domain of a tenant, drop rows for domains that no longer exist."""
+    agg = count_statuses(query_tenant_entities(controls_table, tenant_id, select=["PartitionKey", "Status"]))
+    for domain, counters in agg.items():
+        _write_domain(summary_table, tenant_id, domain, counters)
+    stale = [row["RowKey"] for row in query_partition_entities(summary_table, tenant_id, select=["RowKey"])]
+    for domain in stale:
+        if domain not in agg:
+            _write_domain(summary_table, tenant_id, domain, _empty())
+    return agg
+
+
+def read_summary(summary_table, tenant_id: str) -> Dict[str, Dict[str, int]]:
+    """{domain: counters} from the tenant's summary partition."""
+    return {
+        row["RowKey"]: {c: int(row.get(prop) or 0) for c, prop in _PROPERTIES.items()}
+        for row in query_partition_entities(summary_table, tenant_id)
+    }
+
+
+def summary_payload(tenant_id: str, agg: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+    """Response body of GET /tenant/{id}/summary."""
+    by_domain: List[Dict[str, Any]] = [{"domain": d, **v} for d, v in sorted(agg.items())]
+    totals: Dict[str, Any] = {c: sum(d[c] for d in by_domain) for c in COUNTERS}
+    totals["domainsCount"] = len(by_domain)
+    if totals["total"] > 0:
+        totals["completionPercent"] = round((totals["complete"] / totals["total"]) * 100, 1)
+    else:
+        totals["completionPercent"] = 0
+    return {"tenantId": tenant_id, "byDomain": by_domain, "totals": totals}
+
+
+if __name__ == "__main__":
+    # Repair drift from a shell: TABLES_CONN=... python -m radar_storage.control_summary TENANT [TENANT ...]
+    import os
+    import sys
+    from azure.data.tables import TableServiceClient
+
+    service = TableServiceClient.from_connection_string(os.environ["TABLES_CONN"])
+    controls, summary = service.get_table_client("Controls"), service.get_table_client(SUMMARY_TABLE)
+    for tenant in sys.argv[1:]:
+        counts = rebuild_tenant_summary(controls, summary, tenant)
+        print(f"{tenant}: {len(counts)} domains, {sum(c['total'] for c in counts.values())} controls")
@@ -0,0 +1,89 @@
+"""
+Table Storage Queries
+
+Tenant-scoped, server-side filtered and projected entity queries over an
+azure.data.tables TableClient (or anything with the same query_entities/by_page API).
+"""
+
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Page size for table queries (service maximum is 1000 entities per page)
+TABLE_PAGE_SIZE = int(os.getenv("TABLE_PAGE_SIZE", "1000"))
+
+
+def tenant_partition_range(tenant_id: str) -> Tuple[str, str]:
+    """
+    PartitionKey bounds covering every "{tenant_id}|..." partition.
+
+    "}" is the character after "|", so ``ge '{tenant}|' and lt '{tenant}}'`` is exactly
+    the set of keys starting with "{tenant}|" and can be served by the partition index.
+    """
+    return f"{tenant_id}|", f"{tenant_id}}}"
+
+
+def query_entities(
+    table,
+    query_filter: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    select: Optional[List[str]] = None,
+    page_size: int = TABLE_PAGE_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Server-side filtered, projected, paged entity iterator.
+
+    Pages are fetched lazily as the iterator is consumed. Values go through
+    ``parameters`` (@name placeholders) so the SDK handles OData quoting; the SDK
+    substitutes whitespace-separated tokens, so keep placeholders unparenthesized. Include
+    PartitionKey/RowKey in ``select`` if callers read them. The service returns
+    selected-but-absent properties as null; those are dropped so ``e.get(key, default)``
+    behaves as it does on unprojected entities.
+    """
+    pager = table.query_entities(
+        query_filter,
+        parameters=parameters,
+        select=select,
+        results_per_page=page_size,
+    )
+    for page in pager.by_page():
+        for entity in page:
+            if select:
+                for key in [k for k, v in entity.items() if v is None]:
+                    del entity[key]
+            yield entity
+
+
+def query_tenant_entities(
+    table,
+    tenant_id: str,
+    select: Optional[List[str]] = None,
+    extra_filter: Optional[str] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+    page_size: int = TABLE_PAGE_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Entities in the tenant's "{tenant_id}|<domain>" partitions (e.g. Controls),
+    via a PartitionKey range filter instead of a full-table scan.
+    """
+    lo, hi = tenant_partition_range(tenant_id)
+    query_filter = "PartitionKey ge @pk_lo and PartitionKey lt @pk_hi"
+    if extra_filter:
+        query_filter = f"{query_filter} and {extra_filter}"
+    params = {"pk_lo": lo, "pk_hi": hi, **(parameters or {})}
+    return query_entities(table, query_filter, params, select, page_size)
+
+
+def query_partition_entities(
+    table,
+    partition_key: str,
+    select: Optional[List[str]] = None,
+    extra_filter: Optional[str] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+    page_size: int = TABLE_PAGE_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Entities in a single partition (e.g. TenantTools, Evidence keyed by tenant)."""
+    query_filter = "PartitionKey eq @pk"
+    if extra_filter:
+        query_filter = f"{query_filter} and {extra_filter}"
+    params = {"pk": partition_key, **(parameters or {})}
+    return query_entities(table, query_filter, params, select, page_size)
@@ -0,0 +1,96 @@
+import base64
+import hashlib
+import io
+import os
+import threading
+import time
+import unittest
+
+from radar_storage.blob_upload import (
+    UploadTooLarge,
+    base64_decoded_size,
+    iter_base64,
+    stream_upload,
+)
+
+
+class _FakeBlob:
+    """Records staged blocks and the committed block list."""
+
+    def __init__(self, delay=0.0, fail_block=None):
+        self.delay = delay
+        self.fail_block = fail_block
+        self.staged = {}
+        self.committed = None
+        self.metadata = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def stage_block(self, block_id, data, length):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if self.fail_block is not None and len(self.staged) >= self.fail_block:
+                raise IOError("stage failed")
+            assert length == len(data)
+            with self._lock:
+                self.staged[block_id] = data
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def commit_block_list(self, block_list, content_settings=None, metadata=None):
+        self.committed = b"".join(self.staged[b] for b in block_list)
+        self.metadata = metadata
+
+
+class TestStreamUpload(unittest.TestCase):
+    def test_stages_in_parallel_and_commits_in_order(self):
+        payload = os.urandom(10 * 1024 + 17)
+        blob = _FakeBlob(delay=0.01)
+        # Odd-sized reads are re-chunked into fixed blocks
+        result = stream_upload(blob, (payload[i:i + 333] for i in range(0, len(payload), 333)),
+                               block_size=1024, max_workers=3)
+        self.assertEqual(blob.committed, payload)
+        self.assertEqual(result.size, len(payload))
+        self.assertEqual(result.blocks, 11)
+        self.assertEqual(result.sha256, hashlib.sha256(payload).hexdigest())
+        self.assertEqual(blob.metadata["sha256"], result.sha256)
+        self.assertGreater(blob.max_in_flight, 1)
+        self.assertLessEqual(blob.max_in_flight, 3)
+        self.assertEqual(len({len(b) for b in blob.staged}), 1)  # equal-length block IDs
+
+    def test_file_like_source_and_empty_file(self):
+        blob = _FakeBlob()
+        self.assertEqual(stream_upload(blob, io.BytesIO(b"abc"), block_size=2).blocks, 2)
+        self.assertEqual(blob.committed, b"abc")
+        empty = _FakeBlob()
+        self.assertEqual(stream_upload(empty, io.BytesIO(b"")).size, 0)
+        self.assertEqual(empty.committed, b"")
+
+    def test_too_large_or_failed_block_is_not_committed(self):
+        blob = _FakeBlob()
+        with self.assertRaises(UploadTooLarge):
+            stream_upload(blob, io.BytesIO(b"x" * 5000), block_size=1000, max_size=4500)
+        self.assertIsNone(blob.committed)
+
+        failing = _FakeBlob(fail_block=2)
+        with self.assertRaises(IOError):
+            stream_upload(failing, io.BytesIO(b"y" * 10000), block_size=1000, max_workers=1)
+        self.assertIsNone(failing.committed)
+
+    def test_base64_slices(self):
+        payload = os.urandom(5000)
+        encoded = base64.b64encode(payload).decode()
+        self.assertEqual(b"".join(iter_base64(encoded, chunk_size=700)), payload)
+        self.assertEqual(base64_decoded_size(encoded), len(payload))
+        wrapped = base64.encodebytes(payload).decode()  # 76-char lines
+        self.assertEqual(b"".join(iter_base64(wrapped, chunk_size=700)), payload)
+        self.assertEqual(base64_decoded_size(wrapped), len(payload))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+import csv
+import io
+import os
+import threading
+import time
+import unittest
+import uuid
+
+from radar_storage.control_import import BulkControlImporter, ImportReport, iter_csv_rows
+
+
+class _FakeTable:
+    """Table client stand-in: atomic transactions, rejects entities whose Notes == 'bad'."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.entities = {}
+        self.transactions = []
+        self.single_upserts = 0
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _check(self, entity):
+        if entity.get("Notes") == "bad":
+            raise ValueError("InvalidInput")
+
+    def submit_transaction(self, operations):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            entities = [entity for _, entity in operations]
+            assert len(entities) <= 100
+            assert len({e["PartitionKey"] for e in entities}) == 1
+            assert len({e["RowKey"] for e in entities}) == len(entities)
+            for entity in entities:
+                self._check(entity)
+            with self._lock:
+                self.transactions.append(entities)
+                for entity in entities:
+                    self.entities[(entity["PartitionKey"], entity["RowKey"])] = entity
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def upsert_entity(self, entity):
+        self._check(entity)
+        with self._lock:
+            self.single_upserts += 1
+            self.entities[(entity["PartitionKey"], entity["RowKey"])] = entity
+
+
+def _csv_bytes(rows):
+    header = "ControlID,Domain,ControlTitle,Notes,ScoreNumeric\n"
+    return ("﻿" + header + "".join(",".join(r) + "\n" for r in rows)).encode("utf-8")
+
+
+def _csv(rows):
+    """An upload stream holding the rows as UTF-8 CSV (with a BOM, as Excel writes it)."""
+    return io.BytesIO(_csv_bytes(rows))
+
+
+class TestBulkControlImport(unittest.TestCase):
+    def test_batches_per_partition_concurrently(self):
+        rows = [(f"SEC-{d}-{i:04d}", d, f"t{i}", "", str(i % 5)) for d in ("NET", "IAM", "DATA") for i in range(250)]
+        table = _FakeTable(delay=0.02)
+        report = BulkControlImporter(table, max_workers=4).run("NICO", iter_csv_rows(_csv(rows)))
+
+        self.assertEqual(report.total_rows, 750)
+        self.assertEqual(report.inserted, 750)
+        self.assertEqual(report.error_count, 0)
+        # 250 rows per partition -> 100 + 100 + 50
+        self.assertEqual(report.batches, 9)
+        self.assertEqual(sorted(len(t) for t in table.transactions), [50] * 3 + [100] * 6)
+        self.assertEqual(table.single_upserts, 0)
+        self.assertGreater(table.max_in_flight, 1)
+        self.assertLessEqual(table.max_in_flight, 4)
+        entity = table.entities[("NICO|NET", "SEC-NET-0007")]
+        self.assertEqual(entity["ScoreNumeric"], 2.0)
+        self.assertEqual(entity["Status"], "NotStarted")
+
+    def test_row_errors_do_not_abort_import(self):
+        rows = [
+            ("SEC-NET-0001", "Network", "ok", "", "1"),
+            ("SEC-NET-0002", "", "no domain", "", "1"),
+            ("SEC-NET-0003", "Network", "rejected", "bad", "1"),
+            ("", "Network", "no id", "", "1"),
+            ("SEC-NET-0004", "Network", "ok", "", "x"),
+        ]
+        table = _FakeTable()
+        report = BulkControlImporter(table).run("NICO", iter_csv_rows(_csv(rows))).to_dict()
+
+        self.assertEqual(report["totalRows"], 5)
+        self.assertEqual(report["inserted"], 2)
+        self.assertEqual(report["skipped"], 3)
+        self.assertEqual(report["errorCount"], 2)
+        self.assertEqual([(e["row"], e["controlId"]) for e in report["errors"]],
+                         [(2, "SEC-NET-0002"), (3, "SEC-NET-0003")])
+        self.assertIn("Missing Domain", report["errors"][0]["error"])
+        self.assertEqual(set(table.entities), {("NICO|NET", "SEC-NET-0001"), ("NICO|NET", "SEC-NET-0004")})
+
+    def test_duplicate_rows_last_one_wins(self):
+        rows = [{"ControlID": f"SEC-NET-{i % 3:04d}", "Domain": "Network", "ControlTitle": str(i)} for i in range(9)]
+        table = _FakeTable()
+        report = BulkControlImporter(table, batch_size=2).run("NICO", iter(rows))
+        self.assertEqual(report.inserted, 9)
+        self.assertEqual({k[1]: e["ControlTitle"] for k, e in table.entities.items()},
+                         {"SEC-NET-0000": "6", "SEC-NET-0001": "7", "SEC-NET-0002": "8"})
+
+    def test_missing_domain_code_is_a_row_error(self):
+        rows = [
+            {"ControlID": "NET-1", "Domain": "Network", "DomainCode": "NET"},
+            {"ControlID": "NET-2", "Domain": "Network"},
+        ]
+        table = _FakeTable()
+        report = BulkControlImporter(table).run("NICO", iter(rows))
+        self.assertEqual(report.inserted, 1)
+        self.assertEqual([(e["row"], e["controlId"]) for e in report.errors], [(2, "NET-2")])
+        self.assertIn("Missing DomainCode", report.errors[0]["error"])
+        self.assertEqual(set(table.entities), {("NICO|NET", "NET-1")})
+
+    def test_malformed_csv_record_is_a_row_error(self):
+        data = _csv_bytes([("SEC-NET-0001", "Network", "ok", "", "1")]) + b"SEC-NET-0002,Network," + b"x" * (csv.field_size_limit() + 1) + b",,1\n"
+        data += "SEC-IAM-0001,Identity,ok,,1\n".encode()
+        table = _FakeTable()
+        report = BulkControlImporter(table).run("NICO", iter_csv_rows(io.BytesIO(data)))
+        self.assertEqual(report.total_rows, 3)
+        self.assertEqual(report.inserted, 2)
+        self.assertEqual(report.error_count, 1)
+        self.assertEqual(report.errors[0]["row"], 2)
+        self.assertIn("Invalid CSV at line 3", report.errors[0]["error"])
+        self.assertEqual(report.partitions, {"NICO|NET", "NICO|IAM"})
+
+    def test_invalid_utf8_is_a_row_error_after_the_rows_before_it(self):
+        rows = [(f"SEC-NET-{i:04d}", "Network", "ok", "", "1") for i in range(1000)]
+        # Past the decoder's first 8 KiB block, so the rows in earlier blocks are imported
+        data = _csv_bytes(rows) + "SEC-IAM-0001,Identity,caf\xe9,,1\n".encode("latin-1")
+        data += "SEC-IAM-0002,Identity,ok,,1\n".encode()
+        stream = io.BytesIO(data)
+        table = _FakeTable()
+        report = BulkControlImporter(table).run("NICO", iter_csv_rows(stream))
+        self.assertEqual(report.error_count, 1)
+        self.assertIn("Invalid CSV encoding", report.errors[0]["error"])
+        self.assertEqual(report.inserted, report.total_rows - 1)
+        self.assertGreater(report.inserted, 0)
+        self.assertNotIn(("NICO|IAM", "SEC-IAM-0002"), table.entities)
+        # The caller's stream is left open
+        self.assertFalse(stream.closed)
+
+    def test_invalid_utf8_in_the_header_imports_nothing(self):
+        table = _FakeTable()
+        report = BulkControlImporter(table).run("NICO", iter_csv_rows(io.BytesIO(b"Control\xffID,Domain\nSEC-NET-0001,Network\n")))
+        self.assertEqual((report.total_rows, report.inserted, report.error_count), (1, 0, 1))
+        self.assertEqual(report.errors[0]["row"], 1)
+        self.assertIn("Invalid CSV encoding after line 0", report.errors[0]["error"])
+        self.assertEqual(table.entities, {})
+
+    def test_partial_report_survives_a_failed_import(self):
+        rows = [{"ControlID": f"SEC-{d}-{i:04d}", "Domain": d} for d in ("NET", "IAM") for i in range(2)]
+
+        def interrupted():
+            yield from rows
+            raise RuntimeError("stream lost")
+
+        table = _FakeTable()
+        report = ImportReport()
+        with self.assertRaises(RuntimeError):
+            BulkControlImporter(table, batch_size=2).run("NICO", interrupted(), report)
+        # Both partitions were written before the failure and still need a summary refresh
+        self.assertEqual(report.partitions, {"NICO|NET", "NICO|IAM"})
+        self.assertEqual(len(table.entities), 4)
+
+@unittest.skipUnless(os.getenv("AZURITE_TABLES_CONN"), "set AZURITE_TABLES_CONN to run against the Azurite emulator")
+class TestBulkControlImportAzurite(unittest.TestCase):
+    def setUp(self):
+        from azure.data.tables import TableServiceClient
+        self.svc = TableServiceClient.from_connection_string(os.environ["AZURITE_TABLES_CONN"])
+        self.name = "I" + uuid.uuid4().hex[:12]
+        self.table = self.svc.create_table(self.name)
+
+    def tearDown(self):
+        self.svc.delete_table(self.name)
+
+    def test_import_round_trip(self):
+        rows = [(f"SEC-{d}-{i:04d}", d, f"t{i}", "", "1") for d in ("NET", "IAM") for i in range(150)]
+        report = BulkControlImporter(self.table).run("NICO", iter_csv_rows(_csv(rows)))
+        self.assertEqual(report.inserted, 300)
+        self.assertEqual(report.batches, 4)
+        self.assertEqual(report.error_count, 0)
+        stored = list(self.table.query_entities("PartitionKey eq @pk", parameters={"pk": "NICO|NET"}))
+        self.assertEqual(len(stored), 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+
+from radar_storage.control_import import BulkControlImporter
+from radar_storage.control_summary import (
+    count_statuses,
+    read_summary,
+    rebuild_tenant_summary,
+    refresh_domains,
+    summary_payload,
+)
+from radar_storage.tables import query_tenant_entities
+
+
+class _Pager:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def by_page(self):
+        return iter([self._rows])
+
+
+class _MemoryTable:
+    """Just enough of TableClient for partition/range queries, upserts and deletes."""
+
+    def __init__(self):
+        self.rows = {}
+        self.queries = []
+
+    def query_entities(self, query_filter, parameters=None, select=None, results_per_page=None):
+        self.queries.append(query_filter)
+        p = parameters or {}
+        if query_filter.startswith("PartitionKey eq @pk"):
+            match = lambda pk: pk == p["pk"]
+        else:
+            match = lambda pk: p["pk_lo"] <= pk < p["pk_hi"]
+        rows = [dict(e) for (pk, _), e in sorted(self.rows.items()) if match(pk)]
+        if select:
+            rows = [{k: r.get(k) for k in select} for r in rows]
+        return _Pager(rows)
+
+    def upsert_entity(self, entity, mode=None):
+        self.rows[(entity["PartitionKey"], entity["RowKey"])] = dict(entity)
+
+    def submit_transaction(self, operations):
+        for _, entity in operations:
+            self.upsert_entity(entity)
+
+    def delete_entity(self, partition_key, row_key):
+        self.rows.pop((partition_key, row_key), None)
+
+
+def _control(cid, status):
+    return {"ControlID": cid, "Domain": cid.split("-")[1], "Status": status}
+
+
+class TestControlSummary(unittest.TestCase):
+    def setUp(self):
+        self.controls = _MemoryTable()
+        self.summary = _MemoryTable()
+
+    def _import(self, tenant, rows):
+        report = BulkControlImporter(self.controls).run(tenant, rows)
+        refresh_domains(self.controls, self.summary, tenant, (pk.split("|", 1)[1] for pk in report.partitions))
+
+    def test_import_maintains_counters_and_reads_one_partition(self):
+        self._import("NICO", [
+            _control("SEC-NET-0001", "Complete"),
+            _control("SEC-NET-0002", "InProgress"),
+            _control("SEC-IAM-0001", "NotApplicable"),
+            _control("SEC-IAM-0002", "Unknown"),
+        ])
+        self._import("OTHER", [_control("SEC-NET-0001", "Complete")])
+
+        # Status update via re-import moves a control between counters
+        self._import("NICO", [_control("SEC-NET-0002", "Complete")])
+
+        self.summary.queries.clear()
+        agg = read_summary(self.summary, "NICO")
+        self.assertEqual(self.summary.queries, ["PartitionKey eq @pk"])
+        self.assertEqual(agg["NET"], {"total": 2, "complete": 2, "inProgress": 0, "notStarted": 0, "notApplicable": 0})
+        self.assertEqual(agg["IAM"], {"total": 2, "complete": 0, "inProgress": 0, "notStarted": 0, "notApplicable": 1})
+
+        payload = summary_payload("NICO", agg)
+        self.assertEqual([d["domain"] for d in payload["byDomain"]], ["IAM", "NET"])
+        self.assertEqual(payload["totals"]["total"], 4)
+        self.assertEqual(payload["totals"]["completionPercent"], 50.0)
+
+    def test_refresh_is_idempotent_and_matches_full_count(self):
+        self._import("NICO", [_control(f"SEC-NET-{i:04d}", "Complete" if i % 2 else "NotStarted") for i in range(10)])
+        before = dict(self.summary.rows)
+        refresh_domains(self.controls, self.summary, "NICO", ["NET", "NET"])
+        self.assertEqual(
+            {k: {p: v for p, v in e.items() if p != "UpdatedAt"} for k, e in self.summary.rows.items()},
+            {k: {p: v for p, v in e.items() if p != "UpdatedAt"} for k, e in before.items()},
+        )
+        full = count_statuses(query_tenant_entities(self.controls, "NICO", select=["PartitionKey", "Status"]))
+        self.assertEqual(read_summary(self.summary, "NICO"), full)
+
+    def test_rebuild_repairs_drift(self):
+        self._import("NICO", [_control("SEC-NET-0001", "Complete")])
+        # Drift: a stale domain row and a control written without updating the projection
+        self.summary.upsert_entity({"PartitionKey": "NICO", "RowKey": "OLD", "Total": 3})
+        self.controls.upsert_entity({"PartitionKey": "NICO|NET", "RowKey": "SEC-NET-0002", "Status": "InProgress"})
+
+        rebuild_tenant_summary(self.controls, self.summary, "NICO")
+        agg = read_summary(self.summary, "NICO")
+        self.assertEqual(set(agg), {"NET"})
+        self.assertEqual((agg["NET"]["total"], agg["NET"]["inProgress"]), (2, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
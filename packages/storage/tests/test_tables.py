@@ -0,0 +1,96 @@
+import os
+import unittest
+import uuid
+
+from radar_storage.tables import (
+    query_partition_entities,
+    query_tenant_entities,
+    tenant_partition_range,
+)
+
+
+class _Pager:
+    def __init__(self, pages):
+        self._pages = pages
+
+    def by_page(self):
+        return iter(self._pages)
+
+
+class _FakeTable:
+    """Records query_entities calls and returns canned pages."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def query_entities(self, query_filter, **kwargs):
+        self.calls.append((query_filter, kwargs))
+        return _Pager(self.pages)
+
+
+class TestTenantQueries(unittest.TestCase):
+    def test_partition_range_covers_only_tenant_prefix(self):
+        lo, hi = tenant_partition_range("NICO")
+        self.assertEqual((lo, hi), ("NICO|", "NICO}"))
+        for key in ("NICO|ID", "NICO|NS", "NICO|zz~"):
+            self.assertTrue(lo <= key < hi, key)
+        for key in ("NICO", "NICO2|ID", "NICOLE|ID", "NICO}"):
+            self.assertFalse(lo <= key < hi, key)
+
+    def test_tenant_query_uses_server_side_range_and_projection(self):
+        table = _FakeTable([[{"PartitionKey": "NICO|ID", "Status": "Complete"}]])
+        rows = list(query_tenant_entities(table, "NICO", select=["PartitionKey", "Status"], page_size=50))
+        self.assertEqual(rows, [{"PartitionKey": "NICO|ID", "Status": "Complete"}])
+        query_filter, kwargs = table.calls[0]
+        self.assertEqual(query_filter, "PartitionKey ge @pk_lo and PartitionKey lt @pk_hi")
+        self.assertEqual(kwargs["parameters"], {"pk_lo": "NICO|", "pk_hi": "NICO}"})
+        self.assertEqual(kwargs["select"], ["PartitionKey", "Status"])
+        self.assertEqual(kwargs["results_per_page"], 50)
+
+    def test_extra_filter_and_parameters(self):
+        table = _FakeTable([[]])
+        list(query_partition_entities(table, "NICO", extra_filter="ControlID eq @cid", parameters={"cid": "ID-1"}))
+        query_filter, kwargs = table.calls[0]
+        self.assertEqual(query_filter, "PartitionKey eq @pk and ControlID eq @cid")
+        self.assertEqual(kwargs["parameters"], {"pk": "NICO", "cid": "ID-1"})
+
+    def test_pages_are_chained_and_null_projections_dropped(self):
+        table = _FakeTable([
+            [{"RowKey": "a", "Enabled": None, "ConfigScore": 0.5}],
+            [{"RowKey": "b", "Enabled": False, "ConfigScore": None}],
+        ])
+        rows = list(query_partition_entities(table, "NICO", select=["RowKey", "Enabled", "ConfigScore"]))
+        self.assertEqual([r["RowKey"] for r in rows], ["a", "b"])
+        self.assertTrue(rows[0].get("Enabled", True))
+        self.assertEqual(rows[1].get("ConfigScore", 1.0), 1.0)
+
+
+@unittest.skipUnless(os.getenv("AZURITE_TABLES_CONN"), "set AZURITE_TABLES_CONN to run against the Azurite emulator")
+class TestTenantQueriesAzurite(unittest.TestCase):
+    """
+    Integration check against Azurite, e.g.
+    AZURITE_TABLES_CONN="DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=...;TableEndpoint=http://127.0.0.1:10002/devstoreaccount1;"
+    """
+
+    def setUp(self):
+        from azure.data.tables import TableServiceClient
+        self.svc = TableServiceClient.from_connection_string(os.environ["AZURITE_TABLES_CONN"])
+        self.name = "Q" + uuid.uuid4().hex[:12]
+        self.table = self.svc.create_table(self.name)
+        for pk, rk in [("NICO|ID", "ID-1"), ("NICO|NS", "NS-1"), ("NICO2|ID", "ID-1"), ("NICOLE|ID", "ID-1"), ("NICO", "tool")]:
+            self.table.create_entity({"PartitionKey": pk, "RowKey": rk, "Status": "Complete", "Notes": "x"})
+
+    def tearDown(self):
+        self.svc.delete_table(self.name)
+
+    def test_range_projection_and_paging(self):
+        rows = list(query_tenant_entities(self.table, "NICO", select=["PartitionKey", "RowKey"], page_size=1))
+        self.assertEqual(sorted(r["PartitionKey"] for r in rows), ["NICO|ID", "NICO|NS"])
+        self.assertTrue(all("Notes" not in r for r in rows))
+        tools = list(query_partition_entities(self.table, "NICO"))
+        self.assertEqual([t["RowKey"] for t in tools], ["tool"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark: ModelLayer agent calls against a local fake Azure OpenAI endpoint.
+
+Starts an OpenAI-compatible chat-completions server on 127.0.0.1 that answers after a
+fixed delay, fires N concurrent agent calls (reasoning / classify / generate in rotation,
+as the agents do) from one event loop, and reports wall time, per-call latency, the
+worst event-loop stall and the peak number of requests the server saw in flight.
+
+Modes:
+    blocking  the old behaviour: the sync AzureOpenAIService is called on the loop
+    service   MODEL_LAYER_MODE=service: the sync service in worker threads
+    provider  MODEL_LAYER_MODE=provider: async role providers on the shared HTTP pool
+
+Usage (from the repository root; needs openai, azure-identity, pyyaml):
+    python scripts/bench_model_layer.py --concurrency 24 --rounds 3
+    python scripts/bench_model_layer.py --mode provider --concurrency 200 --delay-ms 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "api"))
+
+from src.models.config import ModelConfig, ModelRoleConfig  # noqa: E402
+from src.models.model_layer import ModelLayer  # noqa: E402
+from src.models.providers import aclose_http_client  # noqa: E402
+
+ROLES = ("reasoning_model", "classification_model", "generation_model")
+
+
+class _FakeOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, delay: float):
+        super().__init__(("127.0.0.1", 0), _ChatHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections are reused
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+        payload = json.dumps({
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body.get("model", "bench"),
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "ok"},
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _BlockingModelLayer(ModelLayer):
+    """ModelLayer as it was: the sync service call runs on the event loop."""
+
+    async def _complete(self, role, system_prompt, user_content, temperature, max_tokens):
+        response = self.ai_service.chat_completion(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            stream=False,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content
+
+
+def _model_config(endpoint: str) -> ModelConfig:
+    roles = {
+        role: ModelRoleConfig(
+            provider="azure_openai",
+            deployment="bench",
+            account="bench",
+            resource_group="",
+            subscription_id="",
+            tenant_id="",
+            parameters={"max_tokens": 16},
+            system_prompt="",
+            endpoint=endpoint,
+        )
+        for role in ROLES
+    }
+    providers = {"azure_openai": {"type": "azure_openai", "auth_method": "api_key"}}
+    return ModelConfig(roles=roles, providers=providers)
+
+
+def build_layer(mode: str, endpoint: str) -> ModelLayer:
+    if mode == "provider":
+        return ModelLayer(model_config=_model_config(endpoint))
+    from shared.ai_service import AzureOpenAIService
+
+    os.environ["AZURE_OPENAI_ENDPOINT"] = endpoint + "/"
+    os.environ["AZURE_OPENAI_DEPLOYMENT"] = "bench"
+    service = AzureOpenAIService()
+    cls = _BlockingModelLayer if mode == "blocking" else ModelLayer
+    return cls(ai_service=service)
+
+
+async def _agent_call(layer: ModelLayer, i: int) -> float:
+    role = ROLES[i % len(ROLES)]
+    if role == "reasoning_model":
+        result = await layer.reasoning(f"Assess control {i}", {"controlId": f"SEC-NET-{i:04d}"})
+    elif role == "classification_model":
+        result = await layer.classify({"evidence": f"file-{i}.pdf"})
+    else:
+        result = await layer.generate("findings", {"controlId": f"SEC-NET-{i:04d}"})
+    if result.get("error"):
+        raise RuntimeError(result["content"])
+    return time.perf_counter()
+
+
+async def _loop_monitor(stop: asyncio.Event, interval: float, stalls: list) -> None:
+    """Record how late the loop wakes up; large values mean something blocked it."""
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(interval)
+        stalls.append(time.perf_counter() - t0 - interval)
+
+
+async def run_mode(mode: str, server: _FakeOpenAIServer, concurrency: int, rounds: int) -> dict:
+    layer = build_layer(mode, server.url)
+    await _agent_call(layer, 0)  # warm up clients and connections
+    server.max_in_flight = 0
+
+    latencies: list = []
+    stalls: list = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_loop_monitor(stop, 0.005, stalls))
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        dispatched = time.perf_counter()
+        finished = await asyncio.gather(*(_agent_call(layer, i) for i in range(concurrency)))
+        latencies.extend(done - dispatched for done in finished)
+    wall = time.perf_counter() - t0
+    stop.set()
+    await monitor
+    if mode == "provider":
+        await aclose_http_client()
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "calls": len(latencies),
+        "wall_s": round(wall, 3),
+        "calls_per_s": round(len(latencies) / wall, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+        "max_loop_stall_ms": round(max(stalls, default=0.0) * 1000, 1),
+        "server_max_in_flight": server.max_in_flight,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["blocking", "service", "provider", "all"], default="all")
+    parser.add_argument("--concurrency", type=int, default=24)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--delay-ms", type=float, default=200.0, help="fake model latency per call")
+    args = parser.parse_args()
+
+    os.environ.setdefault("AZURE_OPENAI_API_KEY", "bench-key")
+    os.environ.setdefault("LLM_CACHE_TTL_HOURS", "0")  # measure model calls, not cache hits
+    server = _FakeOpenAIServer(args.delay_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        modes = ["blocking", "service", "provider"] if args.mode == "all" else [args.mode]
+        for mode in modes:
+            print(json.dumps(asyncio.run(run_mode(mode, server, args.concurrency, args.rounds))))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
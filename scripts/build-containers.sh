@@ -60,7 +60,9 @@ echo ""
 echo "Building Publisher worker container..."
 cd apps/workers/publisher
 
-docker build -t secai-radar-publisher:local . 2>/dev/null && echo "✅ Publisher container built: secai-radar-publisher:local" || echo "⚠️  Publisher build skipped or failed (optional)"
+docker build -t secai-radar-publisher:local \
+  --build-context packages=../../../packages \
+  . 2>/dev/null && echo "✅ Publisher container built: secai-radar-publisher:local" || echo "⚠️  Publisher build skipped or failed (optional)"
 
 cd ../../..
 
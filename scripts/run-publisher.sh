@@ -22,4 +22,6 @@ if [ ! -d "$VENV" ]; then
   exit 1
 fi
 
+# Feed renderers shared with the public API
+"$VENV/bin/pip" install -q ./packages/feeds
 "$VENV/bin/python" apps/workers/publisher/src/publisher.py
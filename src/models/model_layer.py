@@ -2,11 +2,26 @@
 Model Layer Adapter
 
 Bridges the existing Azure OpenAI service with the multi-agent system interface.
+
+Two modes:
+- provider: each role (reasoning_model, classification_model, generation_model) is
+  routed through its ModelProvider from config/models.yaml, using the async clients
+  and the shared HTTP pool, with the role's parameters, system prompt and fallback.
+- service (default): the shared AzureOpenAIService; its blocking calls run in a worker
+  thread so they do not stall the event loop.
+
+Both modes go through the LLM response cache (api/shared/llm_cache.py): the service
+caches in chat_completion, provider mode caches around each provider call.
+
+Environment:
+    MODEL_LAYER_MODE: "provider" or "service" (default "service")
+    MODEL_CONFIG_PATH: models.yaml for provider mode (default config/models.yaml)
 """
 
+import asyncio
 import os
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 # Add api directory to path to import shared modules
@@ -21,22 +36,52 @@ except (ImportError, ValueError):
     AI_SERVICE_AVAILABLE = False
     AzureOpenAIService = None
 
+try:
+    from shared.llm_cache import get_llm_cache
+    LLM_CACHE_AVAILABLE = True
+except ImportError:
+    LLM_CACHE_AVAILABLE = False
+
+try:
+    from .config import ModelConfig, ModelRoleConfig, load_model_config
+    from .providers import ModelProvider, create_provider
+    PROVIDERS_AVAILABLE = True
+except ImportError:
+    PROVIDERS_AVAILABLE = False
+    ModelConfig = ModelRoleConfig = ModelProvider = None
+
+NOT_AVAILABLE = "Model layer not available. AI service not configured."
+
 
 class ModelLayer:
     """
     Model Layer adapter that provides a unified interface for agent LLM access.
     
-    Wraps the existing Azure OpenAI service to match the interface expected by agents.
+    Wraps the existing Azure OpenAI service, or the per-role providers from
+    models.yaml, to match the interface expected by agents.
     """
     
-    def __init__(self, ai_service: Optional[AzureOpenAIService] = None):
+    def __init__(
+        self,
+        ai_service: Optional[AzureOpenAIService] = None,
+        model_config: Optional[ModelConfig] = None,
+    ):
         """
         Initialize Model Layer.
         
         Args:
             ai_service: AzureOpenAIService instance (or None to auto-initialize)
+            model_config: Model configuration; when given, calls go through the
+                async role providers instead of the AI service
         """
-        if ai_service:
+        self.model_config = model_config
+        self.cache = get_llm_cache() if LLM_CACHE_AVAILABLE and model_config is not None else None
+        # role -> [(provider, role config)], primary first, then the fallback
+        self._routes: Dict[str, List[Tuple[ModelProvider, ModelRoleConfig]]] = {}
+        if model_config is not None:
+            self.ai_service = None
+            self._routes = self._build_routes(model_config)
+        elif ai_service:
             self.ai_service = ai_service
         elif AI_SERVICE_AVAILABLE:
             try:
@@ -47,6 +92,111 @@ class ModelLayer:
         else:
             self.ai_service = None
     
+    @classmethod
+    def from_config(cls, config_path: Optional[Path] = None) -> "ModelLayer":
+        """Create a provider-mode Model Layer from models.yaml."""
+        if not PROVIDERS_AVAILABLE:
+            raise ImportError("Model providers are not available (openai / azure-identity missing)")
+        return cls(model_config=load_model_config(config_path))
+    
+    @staticmethod
+    def _build_routes(config: ModelConfig) -> Dict[str, List[Tuple[ModelProvider, ModelRoleConfig]]]:
+        routes = {}
+        for role, role_config in config.roles.items():
+            provider_config = config.providers.get(role_config.provider, {})
+            route = [(create_provider(provider_config.get("type", role_config.provider), role_config, provider_config), role_config)]
+            fallback = (config.fallbacks or {}).get(role)
+            if fallback:
+                fallback_provider_config = config.providers.get(fallback.provider, {})
+                try:
+                    route.append((create_provider(fallback_provider_config.get("type", fallback.provider), fallback, fallback_provider_config), fallback))
+                except Exception as e:
+                    print(f"Warning: Could not initialize fallback for {role}: {e}")
+            routes[role] = route
+        return routes
+    
+    @property
+    def available(self) -> bool:
+        return bool(self._routes) or self.ai_service is not None
+    
+    async def _complete(
+        self,
+        role: str,
+        system_prompt: str,
+        user_content: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """
+        Run one chat completion for a role and return the response text.
+        
+        In provider mode the role's configured parameters override the task
+        defaults and its system prompt is prepended to the task instructions.
+        """
+        if self._routes:
+            route = self._routes.get(role)
+            if not route:
+                raise KeyError(f"Role '{role}' not configured. Available roles: {list(self._routes)}")
+            messages = [{"role": "user", "content": user_content}]
+            for i, (provider, role_config) in enumerate(route):
+                parameters = {"temperature": temperature, "max_tokens": max_tokens, **role_config.parameters}
+                prompt = "\n\n".join(p for p in (role_config.system_prompt.strip(), system_prompt) if p)
+                try:
+                    return await self._provider_completion(provider, role_config, messages, prompt, parameters)
+                except Exception as e:
+                    if i == len(route) - 1:
+                        raise
+                    print(f"Warning: {role} ({role_config.deployment}) failed, trying fallback: {e}")
+        
+        # The service client is synchronous; keep it off the event loop
+        response = await asyncio.to_thread(
+            self.ai_service.chat_completion,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            stream=False,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content
+    
+    async def _provider_completion(
+        self,
+        provider: ModelProvider,
+        role_config: ModelRoleConfig,
+        messages: List[Dict[str, str]],
+        system_prompt: str,
+        parameters: Dict[str, Any],
+    ) -> str:
+        """Call a role provider, answering from the response cache when possible"""
+        lookup = None
+        if self.cache is not None:
+            extra = {k: v for k, v in parameters.items() if k not in ("temperature", "max_tokens")}
+            lookup = await asyncio.to_thread(
+                self.cache.lookup,
+                "model_layer",
+                role_config.deployment,
+                [{"role": "system", "content": system_prompt}] + messages,
+                temperature=parameters.get("temperature"),
+                max_tokens=parameters.get("max_tokens"),
+                endpoint=provider.get_endpoint(),
+                **extra,
+            )
+            if lookup.hit:
+                return lookup.value
+        
+        response = await provider.chat_completion(messages, system_prompt, parameters)
+        content = response["content"]
+        if lookup is not None and content:
+            await asyncio.to_thread(self.cache.store, lookup, content)
+        return content
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the response cache used by this layer ({} when disabled)."""
+        cache = self.cache or getattr(self.ai_service, "cache", None)
+        return cache.stats() if cache is not None else {}
+    
     async def reasoning(
         self,
         prompt: str,
@@ -62,21 +212,13 @@ class ModelLayer:
         Returns:
             Dict with 'content' key containing the response
         """
-        if not self.ai_service:
+        if not self.available:
             return {
-                "content": "Model layer not available. AI service not configured.",
+                "content": NOT_AVAILABLE,
                 "error": True
             }
         
         try:
-            # Build messages from prompt and context
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are an expert security consultant. Provide clear, reasoned analysis based on the given context."
-                }
-            ]
-            
             # Add context if provided
             if context:
                 context_str = self._format_context(context)
@@ -84,18 +226,14 @@ class ModelLayer:
             else:
                 user_content = prompt
             
-            messages.append({"role": "user", "content": user_content})
-            
-            # Call AI service
-            response = self.ai_service.chat_completion(
-                messages=messages,
-                stream=False,
+            content = await self._complete(
+                "reasoning_model",
+                "You are an expert security consultant. Provide clear, reasoned analysis based on the given context.",
+                user_content,
                 temperature=0.7,
                 max_tokens=4096
             )
             
-            content = response.choices[0].message.content
-            
             return {
                 "content": content,
                 "error": False
@@ -120,9 +258,9 @@ class ModelLayer:
         Returns:
             Dict with 'content' key containing classification result
         """
-        if not self.ai_service:
+        if not self.available:
             return {
-                "content": "Model layer not available. AI service not configured.",
+                "content": NOT_AVAILABLE,
                 "error": True
             }
         
@@ -130,26 +268,14 @@ class ModelLayer:
             # Format context for classification
             context_str = self._format_context(context)
             
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a classification expert. Analyze the provided context and classify it appropriately. Respond with JSON format when possible."
-                },
-                {
-                    "role": "user",
-                    "content": f"Classify the following context:\n\n{context_str}\n\nProvide a classification with reasoning."
-                }
-            ]
-            
-            response = self.ai_service.chat_completion(
-                messages=messages,
-                stream=False,
+            content = await self._complete(
+                "classification_model",
+                "You are a classification expert. Analyze the provided context and classify it appropriately. Respond with JSON format when possible.",
+                f"Classify the following context:\n\n{context_str}\n\nProvide a classification with reasoning.",
                 temperature=0.3,
                 max_tokens=2048
             )
             
-            content = response.choices[0].message.content
-            
             return {
                 "content": content,
                 "error": False
@@ -176,9 +302,9 @@ class ModelLayer:
         Returns:
             Dict with 'content' key containing generated content
         """
-        if not self.ai_service:
+        if not self.available:
             return {
-                "content": "Model layer not available. AI service not configured.",
+                "content": NOT_AVAILABLE,
                 "error": True
             }
         
@@ -186,26 +312,14 @@ class ModelLayer:
             # Format data for generation
             data_str = self._format_context(data)
             
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"You are a security assessment expert. Generate professional, accurate content for {section_type} sections."
-                },
-                {
-                    "role": "user",
-                    "content": f"Generate a {section_type} section based on the following data:\n\n{data_str}\n\nProvide comprehensive, actionable content."
-                }
-            ]
-            
-            response = self.ai_service.chat_completion(
-                messages=messages,
-                stream=False,
+            content = await self._complete(
+                "generation_model",
+                f"You are a security assessment expert. Generate professional, accurate content for {section_type} sections.",
+                f"Generate a {section_type} section based on the following data:\n\n{data_str}\n\nProvide comprehensive, actionable content.",
                 temperature=0.8,
                 max_tokens=4096
             )
             
-            content = response.choices[0].message.content
-            
             return {
                 "content": content,
                 "error": False
@@ -254,6 +368,13 @@ def get_model_layer() -> ModelLayer:
     """
     global _model_layer_instance
     if _model_layer_instance is None:
-        _model_layer_instance = ModelLayer()
+        if os.getenv("MODEL_LAYER_MODE", "service").lower() == "provider":
+            config_path = os.getenv("MODEL_CONFIG_PATH")
+            try:
+                _model_layer_instance = ModelLayer.from_config(Path(config_path) if config_path else None)
+            except Exception as e:
+                print(f"Warning: Could not initialize model providers, using AI service: {e}")
+        if _model_layer_instance is None:
+            _model_layer_instance = ModelLayer()
     return _model_layer_instance
 
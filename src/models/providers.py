@@ -2,14 +2,70 @@
 Model Provider Implementations
 
 Abstract base class and concrete implementations for different AI model providers.
+
+All async clients on an event loop share one HTTP connection pool (get_http_client), so
+concurrent agent calls reuse keep-alive connections instead of opening a pool per
+provider. Pools and async clients are bound to the loop that created them, so each
+running loop gets its own (the Functions host runs every assessment on a new loop);
+providers themselves hold no loop state and are cached across loops.
+
+Environment:
+    MODEL_HTTP_MAX_CONNECTIONS: max open connections in the shared pool (default 100)
+    MODEL_HTTP_MAX_KEEPALIVE: idle connections kept for reuse (default 20)
+    MODEL_HTTP_TIMEOUT_SEC: per-request timeout (default 120)
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 import os
+import threading
+import weakref
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from azure.core.credentials import AzureKeyCredential
-from openai import AzureOpenAI, AsyncAzureOpenAI
+from openai import (
+    AzureOpenAI,
+    AsyncAzureOpenAI,
+    DEFAULT_CONNECTION_LIMITS,
+    DefaultAsyncHttpxClient,
+    Timeout,
+)
+
+MAX_CONNECTIONS = int(os.getenv("MODEL_HTTP_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE = int(os.getenv("MODEL_HTTP_MAX_KEEPALIVE", "20"))
+TIMEOUT_SEC = float(os.getenv("MODEL_HTTP_TIMEOUT_SEC", "120"))
+
+# Event loop -> its HTTP pool; entries go away with their loop
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DefaultAsyncHttpxClient]" = weakref.WeakKeyDictionary()
+_http_clients_lock = threading.Lock()
+
+
+def get_http_client() -> DefaultAsyncHttpxClient:
+    """
+    Async HTTP client (connection pool) shared by all providers on the running loop.
+
+    Must be called from a coroutine; connections cannot be reused across loops.
+    """
+    loop = asyncio.get_running_loop()
+    with _http_clients_lock:
+        client = _http_clients.get(loop)
+        if client is None or client.is_closed:
+            # Limits/Timeout from the same httpx build the openai client uses
+            limits_cls = type(DEFAULT_CONNECTION_LIMITS)
+            client = DefaultAsyncHttpxClient(
+                limits=limits_cls(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE),
+                timeout=Timeout(TIMEOUT_SEC, connect=10.0),
+            )
+            _http_clients[loop] = client
+    return client
+
+
+async def aclose_http_client() -> None:
+    """Close the running loop's pool; call before closing a loop that made model calls."""
+    with _http_clients_lock:
+        client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
 
 class ModelProvider(ABC):
@@ -60,6 +116,8 @@ class AzureOpenAIProvider(ModelProvider):
         tenant_id: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        http_client: Optional[DefaultAsyncHttpxClient] = None,
     ):
         """
         Initialize Azure OpenAI provider.
@@ -73,12 +131,18 @@ class AzureOpenAIProvider(ModelProvider):
             tenant_id: Tenant ID (if using service principal)
             client_id: Client ID (if using service principal)
             client_secret: Client secret (if using service principal)
+            endpoint: Endpoint URL override (defaults to https://{account}.openai.azure.com)
+            http_client: Async HTTP client to use on every loop (defaults to the running
+                loop's shared pool)
         """
         self.deployment = deployment
         self.account = account
         self.api_version = api_version
         self.auth_method = auth_method
-        self.endpoint = f"https://{account}.openai.azure.com"
+        self.endpoint = endpoint or f"https://{account}.openai.azure.com"
+        self._http_client = http_client
+        # Event loop -> AsyncAzureOpenAI on that loop's pool (see async_client)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAzureOpenAI]" = weakref.WeakKeyDictionary()
         
         # Initialize client based on auth method
         if auth_method == "api_key":
@@ -91,11 +155,7 @@ class AzureOpenAIProvider(ModelProvider):
                 api_key=api_key,
                 api_version=api_version,
             )
-            self.async_client = AsyncAzureOpenAI(
-                azure_endpoint=self.endpoint,
-                api_key=api_key,
-                api_version=api_version,
-            )
+            self._async_auth = {"api_key": api_key}
         else:  # azure_ad
             # Use DefaultAzureCredential (supports managed identity, service principal, etc.)
             credential = DefaultAzureCredential()
@@ -111,11 +171,22 @@ class AzureOpenAIProvider(ModelProvider):
                 azure_ad_token_provider=token_provider,
                 api_version=api_version,
             )
-            self.async_client = AsyncAzureOpenAI(
+            self._async_auth = {"azure_ad_token_provider": token_provider}
+    
+    @property
+    def async_client(self) -> AsyncAzureOpenAI:
+        """Async client for the running event loop (created on first use on that loop)."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncAzureOpenAI(
                 azure_endpoint=self.endpoint,
-                azure_ad_token_provider=token_provider,
-                api_version=api_version,
+                api_version=self.api_version,
+                http_client=self._http_client or get_http_client(),
+                **self._async_auth,
             )
+            self._async_clients[loop] = client
+        return client
     
     async def chat_completion(
         self,
@@ -174,10 +245,17 @@ class AzureOpenAIProvider(ModelProvider):
         return self.deployment
 
 
+# (provider type, endpoint, deployment, auth method) -> provider, so roles that
+# point at the same deployment share one client per event loop
+_providers: Dict[Tuple[str, str, str, str], ModelProvider] = {}
+
+
 def create_provider(provider_type: str, role_config, provider_config: Dict[str, Any]) -> ModelProvider:
     """
     Factory function to create appropriate provider instance.
     
+    Providers are cached per endpoint and deployment.
+    
     Args:
         provider_type: Provider type (e.g., "azure_openai")
         role_config: ModelRoleConfig for the role
@@ -188,8 +266,11 @@ def create_provider(provider_type: str, role_config, provider_config: Dict[str,
     """
     if provider_type == "azure_openai":
         auth_method = provider_config.get("auth_method", "azure_ad")
+        key = (provider_type, role_config.endpoint, role_config.deployment, auth_method)
+        if key in _providers:
+            return _providers[key]
         
-        return AzureOpenAIProvider(
+        provider = AzureOpenAIProvider(
             deployment=role_config.deployment,
             account=role_config.account,
             api_version=provider_config.get("api_version", "2024-02-15-preview"),
@@ -198,7 +279,10 @@ def create_provider(provider_type: str, role_config, provider_config: Dict[str,
             tenant_id=role_config.tenant_id,
             client_id=os.getenv("AZURE_CLIENT_ID"),
             client_secret=os.getenv("AZURE_CLIENT_SECRET"),
+            endpoint=role_config.endpoint,
         )
+        _providers[key] = provider
+        return provider
     else:
         raise ValueError(f"Unknown provider type: {provider_type}")
 
@@ -46,7 +46,9 @@ class LeoVance(BaseAgent):
         """
         task_description = handoff.task_description if handoff else "Design identity solution"
         
-        if "identity" in task_description.lower() and "analysis" in task_description.lower():
+        if "identity" in task_description.lower() and (
+            "analysis" in task_description.lower() or "analyze" in task_description.lower()
+        ):
             return await self._analyze_legacy_identity(state, handoff)
         elif "mca" in task_description.lower() or "billing" in task_description.lower():
             return await self._design_mca_billing_hierarchy(state, handoff)
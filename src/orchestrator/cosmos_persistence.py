@@ -2,14 +2,30 @@
 Azure Cosmos DB State Persistence
 
 Implements state persistence using Azure Cosmos DB for multi-agent orchestration.
+
+Incremental mode (COSMOS_STATE_INCREMENTAL=true) keeps events and large artifacts in
+separate documents (see state_delta.py), writes only what changed since the last write
+(one patch request on the state document, upserts of the event pages that grew), and
+coalesces persist_state calls made within COSMOS_STATE_DEBOUNCE_SEC into one write.
+
+Retrying a failed flush is idempotent: event pages and artifacts are upserted whole,
+and once they are written the baseline moves past them even if the state document
+write then fails. A state document write that failed (it may or may not have been
+applied) is redone as a full upsert of the document, as is a change that needs more
+than one patch request.
 """
 
 import os
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, List, Set
 from azure.cosmos import CosmosClient, PartitionKey
 from azure.cosmos.exceptions import CosmosResourceNotFoundError
 
 from .state import AssessmentState, StateManager
+from .state_delta import ARTIFACT_DOC_TYPE, EVENTS_DOC_TYPE, StateDeltaTracker, StateView
+
+# Cosmos DB accepts at most 10 operations per patch request
+_MAX_PATCH_OPERATIONS = 10
 
 
 class CosmosStatePersistence:
@@ -22,7 +38,11 @@ class CosmosStatePersistence:
         cosmos_endpoint: Optional[str] = None,
         cosmos_key: Optional[str] = None,
         database_name: str = "secai_radar",
-        container_name: str = "assessment_states"
+        container_name: str = "assessment_states",
+        incremental: Optional[bool] = None,
+        debounce_seconds: Optional[float] = None,
+        events_per_page: Optional[int] = None,
+        artifact_inline_limit: Optional[int] = None
     ):
         """
         Initialize Cosmos DB persistence.
@@ -32,6 +52,14 @@ class CosmosStatePersistence:
             cosmos_key: Cosmos DB key (or set COSMOS_KEY env var)
             database_name: Database name
             container_name: Container name
+            incremental: Write deltas instead of the whole state (or set COSMOS_STATE_INCREMENTAL)
+            debounce_seconds: Incremental mode: coalesce writes within this window
+                (or set COSMOS_STATE_DEBOUNCE_SEC, default 2; 0 writes immediately)
+            events_per_page: Incremental mode: events per event page document
+                (or set COSMOS_STATE_EVENTS_PER_PAGE, default 100)
+            artifact_inline_limit: Incremental mode: artifacts larger than this (JSON
+                characters) get their own document (or set COSMOS_STATE_ARTIFACT_INLINE_CHARS,
+                default 16384)
         """
         self.cosmos_endpoint = cosmos_endpoint or os.getenv("COSMOS_ENDPOINT")
         self.cosmos_key = cosmos_key or os.getenv("COSMOS_KEY")
@@ -42,6 +70,27 @@ class CosmosStatePersistence:
         self.database = None
         self.container = None
         
+        if incremental is None:
+            incremental = os.getenv("COSMOS_STATE_INCREMENTAL", "false").lower() in ("1", "true", "yes")
+        self.incremental = incremental
+        self.debounce_seconds = debounce_seconds if debounce_seconds is not None else float(
+            os.getenv("COSMOS_STATE_DEBOUNCE_SEC", "2"))
+        self.events_per_page = events_per_page or int(os.getenv("COSMOS_STATE_EVENTS_PER_PAGE", "100"))
+        self.artifact_inline_limit = artifact_inline_limit or int(
+            os.getenv("COSMOS_STATE_ARTIFACT_INLINE_CHARS", "16384"))
+        
+        # Incremental mode: last written and latest views per assessment, pending flush timers
+        self._tracker: Optional[StateDeltaTracker] = None
+        self._persisted: Dict[str, StateView] = {}
+        self._latest: Dict[str, StateView] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        # Assessments whose state document may not match the baseline (failed write)
+        self._stale_documents: Set[str] = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.write_stats = {"persist_calls": 0, "flushes": 0, "full_writes": 0,
+                            "patch_requests": 0, "documents_written": 0}
+        
         if self.cosmos_endpoint and self.cosmos_key:
             self._initialize_client()
     
@@ -100,6 +149,9 @@ class CosmosStatePersistence:
         if not self.container:
             return False
         
+        if self.incremental:
+            return self._persist_incremental(state, state_manager)
+        
         try:
             # Convert state to dict
             state_dict = state_manager._state_to_dict(state)
@@ -114,6 +166,139 @@ class CosmosStatePersistence:
             print(f"Error persisting state to Cosmos DB: {e}")
             return False
     
+    def _get_tracker(self, state_manager: StateManager) -> StateDeltaTracker:
+        if self._tracker is None or self._tracker.state_manager is not state_manager:
+            self._tracker = StateDeltaTracker(
+                state_manager,
+                events_per_page=self.events_per_page,
+                artifact_inline_limit=self.artifact_inline_limit
+            )
+        return self._tracker
+    
+    def _persist_incremental(self, state: AssessmentState, state_manager: StateManager) -> bool:
+        """Record the latest view; write it now or when the debounce window closes."""
+        assessment_id = state["assessment_id"]
+        tracker = self._get_tracker(state_manager)
+        with self._lock:
+            self.write_stats["persist_calls"] += 1
+            previous = self._latest.get(assessment_id) or self._persisted.get(assessment_id)
+            self._latest[assessment_id] = tracker.view(state, previous)
+            if self.debounce_seconds > 0:
+                if assessment_id not in self._timers:
+                    timer = threading.Timer(self.debounce_seconds, self.flush, args=(assessment_id,))
+                    timer.daemon = True
+                    self._timers[assessment_id] = timer
+                    timer.start()
+                return True
+        return self.flush(assessment_id)
+    
+    def flush(self, assessment_id: Optional[str] = None) -> bool:
+        """
+        Write pending incremental changes now.
+        
+        Args:
+            assessment_id: Assessment to flush, or None for all pending assessments
+            
+        Returns:
+            True if every write succeeded
+        """
+        with self._lock:
+            ids = [assessment_id] if assessment_id else list(self._latest)
+            for aid in ids:
+                timer = self._timers.pop(aid, None)
+                if timer:
+                    timer.cancel()
+        
+        ok = True
+        with self._flush_lock:
+            for aid in ids:
+                with self._lock:
+                    latest = self._latest.pop(aid, None)
+                if latest is None:
+                    continue
+                baseline = self._write_view(latest, self._persisted.get(aid))
+                if baseline is not None:
+                    self._persisted[aid] = baseline
+                if baseline is not latest:
+                    ok = False
+                    # Keep it pending so the next flush retries what was not written
+                    with self._lock:
+                        self._latest.setdefault(aid, latest)
+        return ok
+    
+    def _write_view(self, view: StateView, persisted: Optional[StateView]) -> Optional[StateView]:
+        """
+        Write the view's changes since ``persisted``.
+
+        Returns:
+            The new baseline: ``view`` when everything was written, a partial baseline
+            when only the event pages and artifacts were, None when nothing was
+        """
+        self.write_stats["flushes"] += 1
+        tracker = self._tracker
+        assessment_id = view.assessment_id
+        delta = tracker.diff(persisted, view) if persisted is not None else None
+        if delta is None:
+            return view if self._write_full(view) else None
+        rewrite_document = (assessment_id in self._stale_documents
+                            or len(delta.patch_operations) > _MAX_PATCH_OPERATIONS)
+        if delta.empty and not rewrite_document:
+            return view
+        
+        # Referenced documents first, so the state document never points at a missing one
+        try:
+            for document in delta.artifacts:
+                self._upsert(document)
+            for page, events in delta.event_pages.items():
+                self._upsert(tracker.event_page_document(assessment_id, page, events))
+        except Exception as e:
+            print(f"Error persisting state delta to Cosmos DB: {e}")
+            return None
+        
+        try:
+            if rewrite_document:
+                self._upsert(tracker.state_document(view))
+            elif delta.patch_operations:
+                self._patch(assessment_id, assessment_id, delta.patch_operations)
+        except CosmosResourceNotFoundError:
+            # Deleted or never written by this process's layout: write everything
+            return view if self._write_full(view) else tracker.with_documents(persisted, view)
+        except Exception as e:
+            print(f"Error persisting state delta to Cosmos DB: {e}")
+            # The request may have been applied; write the whole document next time
+            self._stale_documents.add(assessment_id)
+            return tracker.with_documents(persisted, view)
+        self._stale_documents.discard(assessment_id)
+        return view
+    
+    def _write_full(self, view: StateView) -> bool:
+        tracker = self._tracker
+        try:
+            self.write_stats["full_writes"] += 1
+            for document in view.artifacts.values():
+                self._upsert(document)
+            for page, events in tracker.event_pages(view).items():
+                self._upsert(tracker.event_page_document(view.assessment_id, page, events))
+            self._upsert(tracker.state_document(view))
+            self._stale_documents.discard(view.assessment_id)
+            return True
+        except Exception as e:
+            print(f"Error persisting state to Cosmos DB: {e}")
+            return False
+    
+    def _upsert(self, document: Dict[str, Any]) -> None:
+        self.container.upsert_item(document)
+        self.write_stats["documents_written"] += 1
+    
+    def _patch(self, item_id: str, partition_key: str, operations: List[Dict[str, Any]]) -> None:
+        # One request, so the operations apply together or not at all
+        self.container.patch_item(
+            item=item_id,
+            partition_key=partition_key,
+            patch_operations=operations
+        )
+        self.write_stats["patch_requests"] += 1
+    
     def load_state(
         self,
         assessment_id: str,
@@ -142,14 +327,46 @@ class CosmosStatePersistence:
                 partition_key=assessment_id
             )
             
+            incremental_layout = "event_count" in item
+            if incremental_layout:
+                item = self._assemble_incremental(item)
+            
             # Convert dict back to state
-            return state_manager._dict_to_state(item)
+            state = state_manager._dict_to_state(item)
+            if self.incremental and incremental_layout:
+                # What Cosmos now holds: the next write is a delta against it
+                with self._flush_lock:
+                    self._persisted[assessment_id] = self._get_tracker(state_manager).view(state)
+            return state
         except CosmosResourceNotFoundError:
             return None
         except Exception as e:
             print(f"Error loading state from Cosmos DB: {e}")
             return None
     
+    def _partition_documents(self, assessment_id: str, doc_type: str, order_by: str = "") -> List[Dict[str, Any]]:
+        return list(self.container.query_items(
+            query=f"SELECT * FROM c WHERE c.doc_type = @doc_type{order_by}",
+            parameters=[{"name": "@doc_type", "value": doc_type}],
+            partition_key=assessment_id
+        ))
+    
+    def _assemble_incremental(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Inline the event pages and large artifacts of an incremental state document."""
+        assessment_id = item["assessment_id"]
+        events = []
+        for page in self._partition_documents(assessment_id, EVENTS_DOC_TYPE, " ORDER BY c.page"):
+            events.extend(page.get("events", []))
+        item["events"] = events[: item.pop("event_count")]
+        item.pop("events_per_page", None)
+        
+        artifacts = {doc["id"]: doc["content"] for doc in self._partition_documents(assessment_id, ARTIFACT_DOC_TYPE)}
+        for context in item.get("agent_contexts", {}).values():
+            for artifact_id, artifact in context.get("artifacts", {}).items():
+                if isinstance(artifact, dict) and set(artifact) == {"artifact_ref"}:
+                    context["artifacts"][artifact_id] = artifacts.get(artifact["artifact_ref"])
+        return item
+    
     def list_assessments(
         self,
         tenant_id: Optional[str] = None
@@ -167,9 +384,10 @@ class CosmosStatePersistence:
             return []
         
         try:
-            query = "SELECT c.assessment_id, c.tenant_id, c.phase, c.created_at, c.updated_at FROM c"
+            # State documents only (event pages and artifacts carry a doc_type)
+            query = "SELECT c.assessment_id, c.tenant_id, c.phase, c.created_at, c.updated_at FROM c WHERE NOT IS_DEFINED(c.doc_type)"
             if tenant_id:
-                query += f" WHERE c.tenant_id = '{tenant_id}'"
+                query += f" AND c.tenant_id = '{tenant_id}'"
             query += " ORDER BY c.updated_at DESC"
             
             items = list(self.container.query_items(
@@ -195,7 +413,22 @@ class CosmosStatePersistence:
         if not self.container:
             return False
         
+        with self._flush_lock:
+            self._persisted.pop(assessment_id, None)
+            self._stale_documents.discard(assessment_id)
+            with self._lock:
+                self._latest.pop(assessment_id, None)
+                timer = self._timers.pop(assessment_id, None)
+                if timer:
+                    timer.cancel()
+        
         try:
+            # Event pages and artifact documents of incremental mode
+            for doc in self.container.query_items(
+                query="SELECT c.id FROM c WHERE IS_DEFINED(c.doc_type)",
+                partition_key=assessment_id
+            ):
+                self.container.delete_item(item=doc["id"], partition_key=assessment_id)
             self.container.delete_item(
                 item=assessment_id,
                 partition_key=assessment_id
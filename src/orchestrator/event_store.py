@@ -0,0 +1,208 @@
+"""
+Event Store
+
+Append-only event log for visualization, kept in ``state["events"]``.
+
+EventLog is a list (so it persists, copies and serializes like the plain list it
+replaces) that indexes every appended event:
+
+- per-domain and per-agent buckets, in append order
+- a bounded, time-ordered ring buffer of the most recent events
+- running aggregates: event count and impact sum per domain, per agent and in total,
+  and counts per event type
+
+Recent-N and per-domain/per-agent queries cost O(k) in the result size; radar charts
+and metrics read the aggregates in O(domains). Mutations other than append/extend
+(insert, remove, assignment, sort, ...) mark the indexes stale; they are rebuilt on the
+next query.
+"""
+
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_RECENT_CAPACITY = 1000
+
+
+def _stale_after(name: str):
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        self._stale = True
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = name
+    return mutate
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    # Events are stamped with naive UTC (datetime.utcnow)
+    return parsed.replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+class EventLog(list):
+    """
+    Event list with per-domain/per-agent buckets, a recent-events ring buffer and
+    running aggregates.
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]] = (), recent_capacity: int = DEFAULT_RECENT_CAPACITY):
+        """
+        Initialize EventLog.
+
+        Args:
+            events: Existing events, oldest first
+            recent_capacity: Events kept in the recent-events ring buffer
+        """
+        super().__init__(events)
+        self.recent_capacity = max(1, recent_capacity)
+        self._reindex()
+
+    def __reduce__(self):
+        # Rebuild from the events on copy/pickle instead of restoring the indexes
+        return (type(self), (list(self), self.recent_capacity))
+
+    @classmethod
+    def for_state(cls, state: Dict[str, Any]) -> "EventLog":
+        """The state's event log, converting a plain events list in place."""
+        events = state.get("events")
+        if not isinstance(events, EventLog):
+            events = cls(events or [])
+            state["events"] = events
+        return events
+
+    def _reindex(self) -> None:
+        self._recent: deque = deque(maxlen=self.recent_capacity)
+        self._by_domain: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_agent: Dict[str, List[Dict[str, Any]]] = {}
+        self._domain_stats: Dict[str, Dict[str, float]] = {}
+        self._agent_stats: Dict[str, Dict[str, float]] = {}
+        self._type_counts: Dict[str, int] = {}
+        self._impact_sum = 0.0
+        self._stale = False
+        for event in self:
+            self._index(event)
+
+    def _fresh(self) -> None:
+        if self._stale:
+            self._reindex()
+
+    def _index(self, event: Dict[str, Any]) -> None:
+        domain = event.get("domain", "Unknown")
+        agent_id = event.get("agent_id", "unknown")
+        impact = event.get("impact_score", 0) or 0
+        self._by_domain.setdefault(domain, []).append(event)
+        self._by_agent.setdefault(agent_id, []).append(event)
+        for stats in (self._domain_stats.setdefault(domain, {"count": 0, "impact_sum": 0.0}),
+                      self._agent_stats.setdefault(agent_id, {"count": 0, "impact_sum": 0.0})):
+            stats["count"] += 1
+            stats["impact_sum"] += impact
+        event_type = event.get("type", "unknown")
+        self._type_counts[event_type] = self._type_counts.get(event_type, 0) + 1
+        self._impact_sum += impact
+        self._add_recent(event)
+
+    def _add_recent(self, event: Dict[str, Any]) -> None:
+        recent = self._recent
+        timestamp = event.get("timestamp", "")
+        if not recent or recent[-1].get("timestamp", "") <= timestamp:
+            recent.append(event)
+            return
+        # Out of order (e.g. merged from a concurrent branch): insert at its place
+        if len(recent) == recent.maxlen:
+            if recent[0].get("timestamp", "") > timestamp:
+                return
+            recent.popleft()
+        position = len(recent)
+        while position > 0 and recent[position - 1].get("timestamp", "") > timestamp:
+            position -= 1
+        recent.insert(position, event)
+
+    def append(self, event: Dict[str, Any]) -> None:
+        super().append(event)
+        if not self._stale:
+            self._index(event)
+
+    def extend(self, events: Iterable[Dict[str, Any]]) -> None:
+        for event in events:
+            self.append(event)
+
+    def __iadd__(self, events: Iterable[Dict[str, Any]]) -> "EventLog":
+        self.extend(events)
+        return self
+
+    insert = _stale_after("insert")
+    remove = _stale_after("remove")
+    pop = _stale_after("pop")
+    clear = _stale_after("clear")
+    sort = _stale_after("sort")
+    reverse = _stale_after("reverse")
+    __setitem__ = _stale_after("__setitem__")
+    __delitem__ = _stale_after("__delitem__")
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recent events, newest first."""
+        self._fresh()
+        if limit <= len(self._recent) or len(self._recent) == len(self):
+            return list(islice(reversed(self._recent), limit))
+        # Deeper than the ring buffer (reversed first, so equal timestamps keep the
+        # ring buffer's order: the later-appended event counts as newer)
+        return sorted(reversed(self), key=lambda e: e.get("timestamp", ""), reverse=True)[:limit]
+
+    def since(self, cutoff: datetime) -> List[Dict[str, Any]]:
+        """Events at or after ``cutoff`` (naive UTC), newest first; unparsable timestamps included."""
+        self._fresh()
+        result = []
+        for event in reversed(self._recent):
+            event_time = _parse_timestamp(event.get("timestamp", ""))
+            if event_time is not None and event_time < cutoff:
+                return result
+            result.append(event)
+        if len(self._recent) == len(self):
+            return result
+        # The window reaches past the ring buffer
+        result = [e for e in reversed(self)
+                  if (t := _parse_timestamp(e.get("timestamp", ""))) is None or t >= cutoff]
+        return sorted(result, key=lambda e: e.get("timestamp", ""), reverse=True)
+
+    def by_domain(self, domain: str) -> List[Dict[str, Any]]:
+        """Events of one domain, oldest first."""
+        self._fresh()
+        return list(self._by_domain.get(domain, []))
+
+    def by_agent(self, agent_id: str) -> List[Dict[str, Any]]:
+        """Events of one agent, oldest first."""
+        self._fresh()
+        return list(self._by_agent.get(agent_id, []))
+
+    def domains(self) -> Dict[str, List[Dict[str, Any]]]:
+        self._fresh()
+        return {domain: list(events) for domain, events in self._by_domain.items()}
+
+    def agents(self) -> Dict[str, List[Dict[str, Any]]]:
+        self._fresh()
+        return {agent_id: list(events) for agent_id, events in self._by_agent.items()}
+
+    def domain_stats(self) -> Dict[str, Dict[str, float]]:
+        """Event count and impact sum per domain."""
+        self._fresh()
+        return {domain: dict(stats) for domain, stats in self._domain_stats.items()}
+
+    def agent_stats(self) -> Dict[str, Dict[str, float]]:
+        """Event count and impact sum per agent."""
+        self._fresh()
+        return {agent_id: dict(stats) for agent_id, stats in self._agent_stats.items()}
+
+    def type_counts(self) -> Dict[str, int]:
+        self._fresh()
+        return dict(self._type_counts)
+
+    @property
+    def impact_sum(self) -> float:
+        self._fresh()
+        return self._impact_sum
@@ -0,0 +1,238 @@
+"""
+Event Stream
+
+In-process pub/sub for live assessment dashboards. EventEmitter.emit_event and
+StateManager.add_event publish every event here as it is added to the state, so
+subscribers get incremental events instead of polling and re-aggregating the full
+AssessmentState.
+
+Each assessment has a channel: a bounded replay buffer of (event id, event) with event
+ids counting up from 1. Subscribers are cursors into that buffer (the id of the last
+event they received), which gives per-subscriber backpressure without per-subscriber
+queues:
+
+- publishing is O(1) and never waits for a subscriber
+- each subscriber reads at its own pace, in batches of at most ``limit`` events
+- a subscriber that falls more than ``buffer_size`` events behind (or resumes from an
+  id the channel no longer holds) gets ``reset=True`` and continues from the oldest
+  buffered event; it should reload the state once
+
+Resuming from an event id (SSE Last-Event-ID) is a read with that id as the cursor.
+"""
+
+import asyncio
+import os
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class StreamBatch:
+    """Events read from a channel after a cursor."""
+    events: List[Tuple[int, Dict[str, Any]]] = field(default_factory=list)
+    last_event_id: int = 0
+    reset: bool = False
+    missed: int = 0
+    closed: bool = False
+
+
+class _Channel:
+    def __init__(self, buffer_size: int, tenant_id: Optional[str]):
+        self.buffer: deque = deque(maxlen=buffer_size)
+        self.last_id = 0
+        self.tenant_id = tenant_id
+        self.closed = False
+        self.ready = threading.Condition(threading.Lock())
+
+
+class EventBroker:
+    """
+    Bounded per-assessment event channels with resume-from-event-id.
+    """
+
+    def __init__(self, buffer_size: int = 1000, max_channels: int = 256):
+        """
+        Initialize EventBroker.
+
+        Args:
+            buffer_size: Events kept per assessment for replay and slow subscribers
+            max_channels: Assessments kept; the least recently active (closed ones
+                first) are dropped beyond this
+        """
+        self.buffer_size = max(1, buffer_size)
+        self.max_channels = max(1, max_channels)
+        self._lock = threading.Lock()
+        self._channels: "OrderedDict[str, _Channel]" = OrderedDict()
+
+    def _channel(self, assessment_id: str, tenant_id: Optional[str] = None) -> _Channel:
+        with self._lock:
+            channel = self._channels.get(assessment_id)
+            if channel is None:
+                channel = _Channel(self.buffer_size, tenant_id)
+                self._channels[assessment_id] = channel
+                self._evict()
+            else:
+                if tenant_id and not channel.tenant_id:
+                    channel.tenant_id = tenant_id
+                self._channels.move_to_end(assessment_id)
+            return channel
+
+    def _evict(self) -> None:
+        while len(self._channels) > self.max_channels:
+            victim = next((a for a, c in self._channels.items() if c.closed), None)
+            if victim is None:
+                victim = next(iter(self._channels))
+            channel = self._channels.pop(victim)
+            with channel.ready:
+                channel.closed = True
+                channel.ready.notify_all()
+
+    def publish(self, assessment_id: str, event: Dict[str, Any], tenant_id: Optional[str] = None) -> int:
+        """
+        Append an event to the assessment's channel and wake its subscribers.
+
+        Returns:
+            The event id
+        """
+        channel = self._channel(assessment_id, tenant_id)
+        with channel.ready:
+            channel.last_id += 1
+            channel.buffer.append((channel.last_id, event))
+            channel.ready.notify_all()
+            return channel.last_id
+
+    def close(self, assessment_id: str) -> None:
+        """Mark the assessment's stream finished; buffered events stay readable."""
+        with self._lock:
+            channel = self._channels.get(assessment_id)
+        if channel is None:
+            return
+        with channel.ready:
+            channel.closed = True
+            channel.ready.notify_all()
+
+    def has_channel(self, assessment_id: str) -> bool:
+        with self._lock:
+            return assessment_id in self._channels
+
+    def tenant(self, assessment_id: str) -> Optional[str]:
+        with self._lock:
+            channel = self._channels.get(assessment_id)
+        return channel.tenant_id if channel else None
+
+    def read(
+        self,
+        assessment_id: str,
+        last_event_id: Optional[int] = None,
+        limit: int = 100,
+        timeout: float = 0.0
+    ) -> Optional[StreamBatch]:
+        """
+        Events after ``last_event_id``, waiting up to ``timeout`` seconds for new ones.
+
+        Args:
+            assessment_id: Assessment to read
+            last_event_id: Id of the last event received (None or 0: from the start)
+            limit: Most events returned
+            timeout: Seconds to wait when there is nothing to return yet
+
+        Returns:
+            StreamBatch, or None if the broker has no channel for the assessment
+        """
+        with self._lock:
+            channel = self._channels.get(assessment_id)
+        if channel is None:
+            return None
+
+        cursor = last_event_id or 0
+        with channel.ready:
+            if timeout > 0:
+                channel.ready.wait_for(lambda: channel.last_id != cursor or channel.closed, timeout)
+            return self._take(channel, cursor, limit)
+
+    @staticmethod
+    def _take(channel: _Channel, cursor: int, limit: int) -> StreamBatch:
+        batch = StreamBatch()
+        first_id = channel.buffer[0][0] if channel.buffer else channel.last_id + 1
+        if cursor > channel.last_id:
+            # Unknown id (e.g. the process restarted): replay what is buffered
+            batch.reset = True
+            cursor = first_id - 1
+        elif cursor < first_id - 1:
+            batch.reset = True
+            batch.missed = first_id - 1 - cursor
+            cursor = first_id - 1
+        start = cursor - first_id + 1
+        batch.events = [channel.buffer[i] for i in range(start, min(start + max(1, limit), len(channel.buffer)))]
+        batch.last_event_id = batch.events[-1][0] if batch.events else cursor
+        # Closed only once the subscriber has everything
+        batch.closed = channel.closed and batch.last_event_id == channel.last_id
+        return batch
+
+    def subscribe(self, assessment_id: str, last_event_id: Optional[int] = None) -> "EventSubscription":
+        """Cursor over the assessment's events, resuming after ``last_event_id``."""
+        return EventSubscription(self, assessment_id, last_event_id or 0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            channels = list(self._channels.values())
+        return {
+            "channels": len(channels),
+            "open_channels": sum(1 for c in channels if not c.closed),
+            "published": sum(c.last_id for c in channels),
+            "buffered": sum(len(c.buffer) for c in channels),
+        }
+
+
+class EventSubscription:
+    """
+    One subscriber's position in an assessment's event stream.
+    """
+
+    def __init__(self, broker: EventBroker, assessment_id: str, last_event_id: int = 0):
+        self.broker = broker
+        self.assessment_id = assessment_id
+        self.last_event_id = last_event_id
+        self.closed = False
+
+    def poll(self, limit: int = 100, timeout: float = 0.0) -> StreamBatch:
+        """Next batch after this subscriber's last event; advances the cursor."""
+        batch = self.broker.read(self.assessment_id, self.last_event_id, limit, timeout)
+        if batch is None:
+            batch = StreamBatch(last_event_id=self.last_event_id, closed=True)
+        self.last_event_id = batch.last_event_id
+        self.closed = batch.closed
+        return batch
+
+    async def apoll(self, limit: int = 100, timeout: float = 0.0) -> StreamBatch:
+        """poll() without blocking the event loop."""
+        return await asyncio.to_thread(self.poll, limit, timeout)
+
+
+_broker: Optional[EventBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_event_broker() -> EventBroker:
+    """
+    Process-wide broker (EVENT_STREAM_BUFFER_SIZE, EVENT_STREAM_MAX_CHANNELS).
+    """
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = EventBroker(
+                    buffer_size=int(os.getenv("EVENT_STREAM_BUFFER_SIZE", "1000")),
+                    max_channels=int(os.getenv("EVENT_STREAM_MAX_CHANNELS", "256")),
+                )
+    return _broker
+
+
+def publish_state_event(state: Dict[str, Any], event: Dict[str, Any]) -> Optional[int]:
+    """Publish an event just added to the state; no-op for states without an assessment_id."""
+    assessment_id = state.get("assessment_id")
+    if not assessment_id:
+        return None
+    return get_event_broker().publish(assessment_id, event, tenant_id=state.get("tenant_id"))
@@ -2,6 +2,8 @@
 Event Emission for Visualization
 
 Structured event emission for real-time visualization in SecAI Radar.
+Events are appended to the state's EventLog, which indexes them for queries, and
+published to the live event stream (event_stream.py).
 """
 
 from typing import Dict, Any, List, Optional, Tuple
@@ -9,6 +11,8 @@ from datetime import datetime
 from enum import Enum
 
 from .state import AssessmentState
+from .event_store import EventLog
+from .event_stream import publish_state_event
 
 
 class EventType(str, Enum):
@@ -68,10 +72,8 @@ class EventEmitter:
             "metadata": metadata or {}
         }
         
-        if "events" not in state:
-            state["events"] = []
-        
-        state["events"].append(event)
+        EventLog.for_state(state).append(event)
+        publish_state_event(state, event)
         state["updated_at"] = datetime.utcnow()
         
         return state
@@ -91,8 +93,7 @@ class EventEmitter:
         Returns:
             List of events for the domain
         """
-        events = state.get("events", [])
-        return [e for e in events if e.get("domain") == domain]
+        return EventLog.for_state(state).by_domain(domain)
     
     @staticmethod
     def get_recent_events(
@@ -109,12 +110,5 @@ class EventEmitter:
         Returns:
             List of recent events
         """
-        events = state.get("events", [])
-        # Sort by timestamp (most recent first)
-        sorted_events = sorted(
-            events,
-            key=lambda e: e.get("timestamp", ""),
-            reverse=True
-        )
-        return sorted_events[:limit]
+        return EventLog.for_state(state).recent(limit)
 
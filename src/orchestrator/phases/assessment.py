@@ -2,14 +2,15 @@
 Phase 1: Assessment and Discovery
 
 Workflow:
-- Aris queries CAF knowledge base
-- Leo analyzes identity
-- Ravi scans infrastructure
-- Kenji collates findings
+- Aris queries CAF knowledge base    \
+- Leo analyzes identity               }  independent, may run concurrently
+- Ravi scans infrastructure          /
+- Kenji collates findings (after all three)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from ..state import AssessmentState, AgentID
+from .tasks import phase_complete_task, ready_tasks, task_done
 
 
 class AssessmentPhase:
@@ -17,6 +18,37 @@ class AssessmentPhase:
     Phase 1: Assessment and Discovery phase implementation.
     """
     
+    TASKS = (
+        {
+            "agent": AgentID.ARIS_THORNE.value,
+            "key": "caf_query",
+            "task": "Query CAF knowledge base for assessment checklist",
+            "description": "Query Azure Cloud Adoption Framework knowledge base",
+            "depends_on": ()
+        },
+        {
+            "agent": AgentID.LEO_VANCE.value,
+            "key": "identity_analysis",
+            "task": "Analyze legacy identity configuration",
+            "description": "Analyze identity and map to Entra ID",
+            "depends_on": ()
+        },
+        {
+            "agent": AgentID.RAVI_PATEL.value,
+            "key": "infrastructure_scan",
+            "task": "Scan legacy CSP infrastructure",
+            "description": "Run security scan of networking and infrastructure",
+            "depends_on": ()
+        },
+        {
+            "agent": AgentID.KENJI_SATO.value,
+            "key": "findings_collation",
+            "task": "Collate assessment findings",
+            "description": "Aggregate findings into status report",
+            "depends_on": ("caf_query", "identity_analysis", "infrastructure_scan")
+        },
+    )
+    
     @staticmethod
     def is_complete(state: AssessmentState) -> bool:
         """
@@ -28,20 +60,20 @@ class AssessmentPhase:
         Returns:
             True if phase is complete
         """
-        agent_contexts = state.get("agent_contexts", {})
-        
-        # Check if all required tasks are completed
-        aris_ctx = agent_contexts.get(AgentID.ARIS_THORNE.value)
-        leo_ctx = agent_contexts.get(AgentID.LEO_VANCE.value)
-        ravi_ctx = agent_contexts.get(AgentID.RAVI_PATEL.value)
-        kenji_ctx = agent_contexts.get(AgentID.KENJI_SATO.value)
+        return all(task_done(state, t["agent"], t["key"]) for t in AssessmentPhase.TASKS)
+    
+    @staticmethod
+    def get_ready_tasks(state: AssessmentState) -> List[Dict[str, Any]]:
+        """
+        Get every assessment task that can start now.
         
-        return (
-            aris_ctx and "caf_query" in aris_ctx.completed_tasks and
-            leo_ctx and "identity_analysis" in leo_ctx.completed_tasks and
-            ravi_ctx and "infrastructure_scan" in ravi_ctx.completed_tasks and
-            kenji_ctx and "findings_collation" in kenji_ctx.completed_tasks
-        )
+        Args:
+            state: Current assessment state
+            
+        Returns:
+            Ready task dicts (empty when the phase is complete)
+        """
+        return ready_tasks(state, AssessmentPhase.TASKS)
     
     @staticmethod
     def get_next_task(state: AssessmentState) -> Dict[str, Any]:
@@ -54,45 +86,5 @@ class AssessmentPhase:
         Returns:
             Task information dict
         """
-        agent_contexts = state.get("agent_contexts", {})
-        
-        # Check tasks in order
-        aris_ctx = agent_contexts.get(AgentID.ARIS_THORNE.value)
-        if not aris_ctx or "caf_query" not in aris_ctx.completed_tasks:
-            return {
-                "agent": AgentID.ARIS_THORNE.value,
-                "task": "Query CAF knowledge base for assessment checklist",
-                "description": "Query Azure Cloud Adoption Framework knowledge base"
-            }
-        
-        leo_ctx = agent_contexts.get(AgentID.LEO_VANCE.value)
-        if not leo_ctx or "identity_analysis" not in leo_ctx.completed_tasks:
-            return {
-                "agent": AgentID.LEO_VANCE.value,
-                "task": "Analyze legacy identity configuration",
-                "description": "Analyze identity and map to Entra ID"
-            }
-        
-        ravi_ctx = agent_contexts.get(AgentID.RAVI_PATEL.value)
-        if not ravi_ctx or "infrastructure_scan" not in ravi_ctx.completed_tasks:
-            return {
-                "agent": AgentID.RAVI_PATEL.value,
-                "task": "Scan legacy CSP infrastructure",
-                "description": "Run security scan of networking and infrastructure"
-            }
-        
-        kenji_ctx = agent_contexts.get(AgentID.KENJI_SATO.value)
-        if not kenji_ctx or "findings_collation" not in kenji_ctx.completed_tasks:
-            return {
-                "agent": AgentID.KENJI_SATO.value,
-                "task": "Collate assessment findings",
-                "description": "Aggregate findings into status report"
-            }
-        
-        # Phase complete
-        return {
-            "agent": None,
-            "task": "Phase complete",
-            "description": "Assessment phase completed"
-        }
-
+        ready = AssessmentPhase.get_ready_tasks(state)
+        return ready[0] if ready else phase_complete_task("Assessment phase completed")
@@ -7,8 +7,9 @@ Workflow:
 - Marcus resolves conflicts if needed
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from ..state import AssessmentState, AgentID
+from .tasks import phase_complete_task, ready_tasks, task_done
 
 
 class DesignPhase:
@@ -16,6 +17,24 @@ class DesignPhase:
     Phase 2: Design and Conflict Resolution phase implementation.
     """
     
+    TASKS = (
+        {
+            "agent": AgentID.ARIS_THORNE.value,
+            "key": "architecture_design",
+            "task": "Design Azure Landing Zone architecture",
+            "description": "Design architecture based on assessment findings",
+            "depends_on": ()
+        },
+        {
+            "agent": AgentID.ELENA_BRIDGES.value,
+            "key": "business_impact_assessment",
+            "task": "Assess business impact",
+            "description": "Evaluate business impact and downtime requirements",
+            # Elena reviews the proposed architecture
+            "depends_on": ("architecture_design",)
+        },
+    )
+    
     @staticmethod
     def is_complete(state: AssessmentState) -> bool:
         """
@@ -27,70 +46,53 @@ class DesignPhase:
         Returns:
             True if phase is complete
         """
-        agent_contexts = state.get("agent_contexts", {})
-        
-        aris_ctx = agent_contexts.get(AgentID.ARIS_THORNE.value)
-        elena_ctx = agent_contexts.get(AgentID.ELENA_BRIDGES.value)
-        
-        # Check if architecture is designed
-        architecture_designed = (
-            aris_ctx and "architecture_design" in aris_ctx.completed_tasks
-        )
-        
-        # Check if business impact is assessed
-        impact_assessed = (
-            elena_ctx and "business_impact_assessment" in elena_ctx.completed_tasks
-        )
+        designed = all(task_done(state, t["agent"], t["key"]) for t in DesignPhase.TASKS)
         
         # Check if conflicts are resolved
         conflicts_resolved = len(state.get("active_conflicts", [])) == 0
         
-        return architecture_designed and impact_assessed and conflicts_resolved
+        return designed and conflicts_resolved
     
     @staticmethod
-    def get_next_task(state: AssessmentState) -> Dict[str, Any]:
+    def get_ready_tasks(state: AssessmentState) -> List[Dict[str, Any]]:
         """
-        Get the next task for the design phase.
+        Get every design task that can start now.
+        
+        Conflict resolution is ready once design and impact assessment are done
+        and conflicts are still active.
         
         Args:
             state: Current assessment state
             
         Returns:
-            Task information dict
+            Ready task dicts (empty when the phase is complete)
         """
-        agent_contexts = state.get("agent_contexts", {})
-        
-        # Check if architecture is designed
-        aris_ctx = agent_contexts.get(AgentID.ARIS_THORNE.value)
-        if not aris_ctx or "architecture_design" not in aris_ctx.completed_tasks:
-            return {
-                "agent": AgentID.ARIS_THORNE.value,
-                "task": "Design Azure Landing Zone architecture",
-                "description": "Design architecture based on assessment findings"
-            }
-        
-        # Check if business impact is assessed
-        elena_ctx = agent_contexts.get(AgentID.ELENA_BRIDGES.value)
-        if not elena_ctx or "business_impact_assessment" not in elena_ctx.completed_tasks:
-            return {
-                "agent": AgentID.ELENA_BRIDGES.value,
-                "task": "Assess business impact",
-                "description": "Evaluate business impact and downtime requirements"
-            }
+        ready = ready_tasks(state, DesignPhase.TASKS)
+        if ready:
+            return ready
         
         # Check for conflicts
         active_conflicts = state.get("active_conflicts", [])
         if active_conflicts:
-            return {
+            return [{
                 "agent": AgentID.MARCUS_STERLING.value,
+                "key": "conflict_resolution",
                 "task": "Resolve conflicts",
-                "description": f"Resolve {len(active_conflicts)} active conflicts"
-            }
+                "description": f"Resolve {len(active_conflicts)} active conflicts",
+                "depends_on": tuple(t["key"] for t in DesignPhase.TASKS)
+            }]
+        return []
+    
+    @staticmethod
+    def get_next_task(state: AssessmentState) -> Dict[str, Any]:
+        """
+        Get the next task for the design phase.
         
-        # Phase complete
-        return {
-            "agent": None,
-            "task": "Phase complete",
-            "description": "Design phase completed"
-        }
-
+        Args:
+            state: Current assessment state
+            
+        Returns:
+            Task information dict
+        """
+        ready = DesignPhase.get_ready_tasks(state)
+        return ready[0] if ready else phase_complete_task("Design phase completed")
@@ -7,8 +7,9 @@ Workflow:
 - Final report generation
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from ..state import AssessmentState, AgentID
+from .tasks import phase_complete_task, ready_tasks, task_done
 
 
 class MigrationPhase:
@@ -16,6 +17,23 @@ class MigrationPhase:
     Phase 3: Migration Planning phase implementation.
     """
     
+    TASKS = (
+        {
+            "agent": AgentID.LEO_VANCE.value,
+            "key": "mca_billing_design",
+            "task": "Design MCA billing hierarchy",
+            "description": "Design MCA billing structure and management groups",
+            "depends_on": ()
+        },
+        {
+            "agent": AgentID.ELENA_BRIDGES.value,
+            "key": "customer_validation",
+            "task": "Validate with customer",
+            "description": "Validate migration plan with customer",
+            "depends_on": ("mca_billing_design",)
+        },
+    )
+    
     @staticmethod
     def is_complete(state: AssessmentState) -> bool:
         """
@@ -27,22 +45,20 @@ class MigrationPhase:
         Returns:
             True if phase is complete
         """
-        agent_contexts = state.get("agent_contexts", {})
-        
-        leo_ctx = agent_contexts.get(AgentID.LEO_VANCE.value)
-        elena_ctx = agent_contexts.get(AgentID.ELENA_BRIDGES.value)
-        
-        # Check if MCA billing is designed
-        billing_designed = (
-            leo_ctx and "mca_billing_design" in leo_ctx.completed_tasks
-        )
-        
-        # Check if customer validation is done
-        customer_validated = (
-            elena_ctx and "customer_validation" in elena_ctx.completed_tasks
-        )
+        return all(task_done(state, t["agent"], t["key"]) for t in MigrationPhase.TASKS)
+    
+    @staticmethod
+    def get_ready_tasks(state: AssessmentState) -> List[Dict[str, Any]]:
+        """
+        Get every migration task that can start now.
         
-        return billing_designed and customer_validated
+        Args:
+            state: Current assessment state
+            
+        Returns:
+            Ready task dicts (empty when the phase is complete)
+        """
+        return ready_tasks(state, MigrationPhase.TASKS)
     
     @staticmethod
     def get_next_task(state: AssessmentState) -> Dict[str, Any]:
@@ -55,30 +71,5 @@ class MigrationPhase:
         Returns:
             Task information dict
         """
-        agent_contexts = state.get("agent_contexts", {})
-        
-        # Check if MCA billing is designed
-        leo_ctx = agent_contexts.get(AgentID.LEO_VANCE.value)
-        if not leo_ctx or "mca_billing_design" not in leo_ctx.completed_tasks:
-            return {
-                "agent": AgentID.LEO_VANCE.value,
-                "task": "Design MCA billing hierarchy",
-                "description": "Design MCA billing structure and management groups"
-            }
-        
-        # Check if customer validation is done
-        elena_ctx = agent_contexts.get(AgentID.ELENA_BRIDGES.value)
-        if not elena_ctx or "customer_validation" not in elena_ctx.completed_tasks:
-            return {
-                "agent": AgentID.ELENA_BRIDGES.value,
-                "task": "Validate with customer",
-                "description": "Validate migration plan with customer"
-            }
-        
-        # Phase complete
-        return {
-            "agent": None,
-            "task": "Phase complete",
-            "description": "Migration planning phase completed"
-        }
-
+        ready = MigrationPhase.get_ready_tasks(state)
+        return ready[0] if ready else phase_complete_task("Migration planning phase completed")
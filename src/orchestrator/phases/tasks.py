@@ -0,0 +1,49 @@
+"""
+Phase Task Graph
+
+Each phase declares its agent tasks with the tasks they depend on. A task is
+ready when its dependencies are done and it is not done itself; ready tasks of
+different agents are independent and may run concurrently.
+"""
+
+from typing import Dict, Any, List, Sequence
+from ..state import AssessmentState
+
+
+def task_done(state: AssessmentState, agent_id: str, task_key: str) -> bool:
+    """
+    Check whether an agent has finished a task.
+
+    Agents record a task in their context once it is finished; the latest one is
+    kept as current_task until the agent's next task moves it to completed_tasks.
+    """
+    ctx = state.get("agent_contexts", {}).get(agent_id)
+    return bool(ctx) and (task_key in ctx.completed_tasks or ctx.current_task == task_key)
+
+
+def ready_tasks(state: AssessmentState, tasks: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Tasks whose dependencies are done and that are not done yet, in declaration order.
+
+    Args:
+        state: Current assessment state
+        tasks: Task dicts with 'agent', 'key', 'task', 'description' and 'depends_on'
+            (keys of tasks in the same list)
+
+    Returns:
+        Ready task dicts
+    """
+    done = {t["key"] for t in tasks if task_done(state, t["agent"], t["key"])}
+    return [
+        t for t in tasks
+        if t["key"] not in done and all(dep in done for dep in t.get("depends_on", ()))
+    ]
+
+
+def phase_complete_task(description: str) -> Dict[str, Any]:
+    """Task dict returned by get_next_task once nothing is left"""
+    return {
+        "agent": None,
+        "task": "Phase complete",
+        "description": description
+    }
@@ -0,0 +1,240 @@
+"""
+Phase Scheduler
+
+Runs a workflow phase as waves of ready agent tasks:
+
+1. The phase handler reports every task whose dependencies are done (get_ready_tasks).
+2. At most one task per agent is taken per wave. Each task runs on its own copy of
+   the state, concurrently, bounded by max_concurrency.
+3. Branch updates are merged back in task declaration order, not completion order,
+   so the resulting state does not depend on which agent answered first.
+
+Phase wall time is then roughly the critical path of the task graph instead of the
+sum of all agent latencies.
+
+Environment:
+    ORCHESTRATOR_MAX_CONCURRENCY: agent tasks running at once (default 4)
+    ORCHESTRATOR_TASK_BUDGET: max agent tasks per phase run (default 20)
+"""
+
+import asyncio
+import copy
+import os
+import re
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from .state import AssessmentState, AgentContext
+from .event_store import EventLog
+from .handoff import HandoffManager
+
+MAX_CONCURRENCY = int(os.getenv("ORCHESTRATOR_MAX_CONCURRENCY", "4"))
+TASK_BUDGET = int(os.getenv("ORCHESTRATOR_TASK_BUDGET", "20"))
+
+# Sequential ids agents derive from list length ("finding_{len + 1}"); branches
+# started from the same state pick the same one, so merged items are renumbered
+_SEQUENTIAL_IDS = {
+    "findings": "finding_",
+    "active_conflicts": "conflict_",
+}
+
+
+def _merge_list(base: List[Any], branches: List[List[Any]]) -> List[Any]:
+    """Keep base items no branch removed, then append each branch's new items in order"""
+    kept = [item for item in base if all(item in branch for branch in branches)]
+    added = [item for branch in branches for item in branch if item not in base]
+    return kept + added
+
+
+def _merge_dict(base: Optional[Dict[str, Any]], branches: List[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """Apply each branch's changed keys in order (later branches win on the same key)"""
+    merged = dict(base) if base is not None else None
+    for branch in branches:
+        if branch == base or branch is None:
+            continue
+        if merged is None:
+            merged = {}
+        for key, value in branch.items():
+            if base is None or base.get(key) != value:
+                merged[key] = value
+    return merged
+
+
+def _renumber(items: List[Any], start: int, prefix: str) -> List[Any]:
+    """
+    ``items`` placed after ``start`` others, with "{prefix}{n}" ids set to their position.
+
+    Renumbered items are copies: branch items may already be published (event stream)
+    or referenced by the branch state, so they are never modified in place.
+    """
+    pattern = re.compile(rf"^{re.escape(prefix)}\d+$")
+    result = []
+    for position, item in enumerate(items, start=start + 1):
+        if isinstance(item, dict) and pattern.match(str(item.get("id", ""))) and item["id"] != f"{prefix}{position}":
+            item = {**item, "id": f"{prefix}{position}"}
+        result.append(item)
+    return result
+
+
+def merge_states(base: AssessmentState, branches: List[AssessmentState]) -> AssessmentState:
+    """
+    Merge states produced by concurrent tasks that all started from ``base``.
+
+    Args:
+        base: State the branches were copied from
+        branches: Branch states, in task declaration order
+
+    Returns:
+        Merged state (``base`` is not modified)
+    """
+    if not branches:
+        return base
+    merged = dict(base)
+    for key, base_value in base.items():
+        values = [branch.get(key, base_value) for branch in branches]
+        if key == "agent_contexts":
+            contexts: Dict[str, AgentContext] = dict(base_value)
+            for branch_contexts in values:
+                for agent_id, ctx in branch_contexts.items():
+                    if ctx != base_value.get(agent_id):
+                        contexts[agent_id] = ctx
+            merged[key] = contexts
+        elif key == "budget_remaining":
+            merged[key] = base_value + sum(value - base_value for value in values)
+        elif key == "updated_at":
+            merged[key] = max(values, key=lambda v: v if isinstance(v, datetime) else datetime.min)
+        elif key == "events":
+            # Append-only: each branch's new events are the ones past the base length.
+            # The first branch's log (already indexed) is extended; branches are discarded.
+            events = values[0] if isinstance(values[0], EventLog) and values[0] is not base_value else EventLog(values[0])
+            # The first branch's events already have the ids of their positions
+            for branch_events in values[1:]:
+                events.extend(_renumber(branch_events[len(base_value):], len(events), "event_"))
+            merged[key] = events
+        elif isinstance(base_value, list):
+            merged[key] = _merge_list(base_value, values)
+            if key in _SEQUENTIAL_IDS:
+                kept = sum(1 for item in base_value if item in merged[key])
+                merged[key][kept:] = _renumber(merged[key][kept:], kept, _SEQUENTIAL_IDS[key])
+        elif isinstance(base_value, dict) or (base_value is None and any(isinstance(v, dict) for v in values)):
+            merged[key] = _merge_dict(base_value, values)
+        else:
+            # Scalars: the last branch that changed the value wins
+            for value in values:
+                if value != base_value:
+                    merged[key] = value
+    return AssessmentState(**merged)
+
+
+class PhaseScheduler:
+    """
+    Runs the ready tasks of a phase concurrently and merges their state updates.
+    """
+
+    def __init__(
+        self,
+        handoff_manager: HandoffManager,
+        agents: Dict[str, Any],
+        max_concurrency: int = MAX_CONCURRENCY,
+        task_budget: int = TASK_BUDGET
+    ):
+        """
+        Initialize PhaseScheduler.
+
+        Args:
+            handoff_manager: HandoffManager instance
+            agents: Agent instances by agent ID
+            max_concurrency: Max agent tasks running at once
+            task_budget: Max agent tasks started per run_phase call
+        """
+        self.handoff_manager = handoff_manager
+        self.agents = agents
+        self.max_concurrency = max(1, max_concurrency)
+        self.task_budget = max(1, task_budget)
+
+    async def run_phase(self, state: AssessmentState, phase_handler) -> AssessmentState:
+        """
+        Run a phase until it is complete, stalls, or the task budget is spent.
+
+        Args:
+            state: Current assessment state
+            phase_handler: Phase class with is_complete and get_ready_tasks
+
+        Returns:
+            Updated state after the phase
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = 0
+
+        while not phase_handler.is_complete(state):
+            ready = phase_handler.get_ready_tasks(state)
+            if not ready:
+                break
+
+            # One task per agent per wave: agent contexts record one task at a time
+            wave, agents_in_wave = [], set()
+            for task in ready:
+                if task["agent"] in self.agents and task["agent"] not in agents_in_wave:
+                    wave.append(task)
+                    agents_in_wave.add(task["agent"])
+            wave = wave[:self.task_budget - started]
+            if not wave:
+                if started >= self.task_budget:
+                    state["termination_reason"] = f"Task budget of {self.task_budget} exhausted"
+                else:
+                    state["termination_reason"] = f"No agent available for tasks: {', '.join(t['key'] for t in ready)}"
+                break
+            started += len(wave)
+
+            state = await self._run_wave(state, wave, semaphore)
+
+            ready_after = [t["key"] for t in phase_handler.get_ready_tasks(state)]
+            if ready_after == [t["key"] for t in ready] and not phase_handler.is_complete(state):
+                # Nothing finished (every task failed); stop instead of retrying forever
+                state["termination_reason"] = f"No progress on tasks: {', '.join(ready_after)}"
+                break
+
+        return state
+
+    async def _run_wave(
+        self,
+        state: AssessmentState,
+        wave: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> AssessmentState:
+        """Run independent tasks on copies of the state and merge the results"""
+        handoffs = await asyncio.gather(*(
+            self.handoff_manager.create_handoff(
+                state,
+                from_agent="supervisor",
+                to_agent=task["agent"],
+                task_description=task["task"]
+            )
+            for task in wave
+        ))
+        for handoff in handoffs:
+            state = self.handoff_manager.apply_handoff(state, handoff)
+
+        async def run(task: Dict[str, Any], handoff) -> AssessmentState:
+            async with semaphore:
+                branch = copy.deepcopy(state)
+                branch["current_agent"] = task["agent"]
+                return await self.agents[task["agent"]].process_task(branch, handoff)
+
+        results = await asyncio.gather(
+            *(run(task, handoff) for task, handoff in zip(wave, handoffs)),
+            return_exceptions=True
+        )
+
+        branches = []
+        for task, handoff, result in zip(wave, handoffs, results):
+            if isinstance(result, BaseException):
+                print(f"Error in {task['agent']} task '{task['key']}': {result}")
+                continue
+            branches.append(result)
+
+        state = merge_states(state, branches)
+        for handoff, result in zip(handoffs, results):
+            if not isinstance(result, BaseException):
+                state = self.handoff_manager.complete_handoff(state, handoff)
+        return state
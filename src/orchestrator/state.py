@@ -10,6 +10,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from .event_store import EventLog
+from .event_stream import publish_state_event
+
 
 class AssessmentPhase(str, Enum):
     """Assessment workflow phases"""
@@ -162,7 +165,7 @@ class StateManager:
             migration_plan=None,
             active_conflicts=[],
             resolved_conflicts=[],
-            events=[],
+            events=EventLog(),
             is_complete=False,
             termination_reason=None
         )
@@ -272,7 +275,8 @@ class StateManager:
             "description": description
         }
         
-        state["events"].append(event)
+        EventLog.for_state(state).append(event)
+        publish_state_event(state, event)
         state["updated_at"] = datetime.utcnow()
         
         return state
@@ -354,48 +358,49 @@ class StateManager:
     
     def _state_to_dict(self, state: AssessmentState) -> Dict[str, Any]:
         """Convert AssessmentState to dictionary for persistence"""
-        # Convert TypedDict to regular dict
-        result = dict(state)
-        
+        # Convert TypedDict to regular dict, field by field
+        return {key: self._field_to_dict(key, value) for key, value in state.items()}
+    
+    def _field_to_dict(self, key: str, value: Any) -> Any:
+        """Convert one AssessmentState field to its persisted form"""
         # Convert enums to strings
-        result["phase"] = state["phase"].value if isinstance(state["phase"], AssessmentPhase) else state["phase"]
+        if key == "phase":
+            return value.value if isinstance(value, AssessmentPhase) else value
         
         # Convert datetimes to ISO strings
-        for key in ["created_at", "updated_at"]:
-            if key in result and isinstance(result[key], datetime):
-                result[key] = result[key].isoformat()
+        if key in ("created_at", "updated_at"):
+            return value.isoformat() if isinstance(value, datetime) else value
         
         # Convert agent contexts
-        if "agent_contexts" in result:
-            result["agent_contexts"] = {
-                k: {
-                    "agent_id": v.agent_id,
-                    "current_task": v.current_task,
-                    "completed_tasks": v.completed_tasks,
-                    "pending_tasks": v.pending_tasks,
-                    "artifacts": v.artifacts,
-                    "last_updated": v.last_updated.isoformat() if isinstance(v.last_updated, datetime) else v.last_updated
-                }
-                for k, v in result["agent_contexts"].items()
-            }
+        if key == "agent_contexts":
+            return {k: self._agent_context_to_dict(v) for k, v in value.items()}
         
         # Convert handoff packets
-        for key in ["pending_handoffs", "completed_handoffs"]:
-            if key in result:
-                result[key] = [
-                    {
-                        "from_agent": p.from_agent,
-                        "to_agent": p.to_agent,
-                        "task_description": p.task_description,
-                        "context_summary": p.context_summary,
-                        "required_artifacts": p.required_artifacts,
-                        "constraints": p.constraints,
-                        "timestamp": p.timestamp.isoformat() if isinstance(p.timestamp, datetime) else p.timestamp
-                    }
-                    for p in result[key]
-                ]
+        if key in ("pending_handoffs", "completed_handoffs"):
+            return [self._handoff_to_dict(p) for p in value]
         
-        return result
+        return value
+    
+    def _agent_context_to_dict(self, context: AgentContext) -> Dict[str, Any]:
+        return {
+            "agent_id": context.agent_id,
+            "current_task": context.current_task,
+            "completed_tasks": context.completed_tasks,
+            "pending_tasks": context.pending_tasks,
+            "artifacts": context.artifacts,
+            "last_updated": context.last_updated.isoformat() if isinstance(context.last_updated, datetime) else context.last_updated
+        }
+    
+    def _handoff_to_dict(self, packet: HandoffPacket) -> Dict[str, Any]:
+        return {
+            "from_agent": packet.from_agent,
+            "to_agent": packet.to_agent,
+            "task_description": packet.task_description,
+            "context_summary": packet.context_summary,
+            "required_artifacts": packet.required_artifacts,
+            "constraints": packet.constraints,
+            "timestamp": packet.timestamp.isoformat() if isinstance(packet.timestamp, datetime) else packet.timestamp
+        }
     
     def _dict_to_state(self, data: Dict[str, Any]) -> AssessmentState:
         """Convert dictionary to AssessmentState"""
@@ -422,6 +427,10 @@ class StateManager:
                 for k, v in data["agent_contexts"].items()
             }
         
+        # Index events for visualization queries
+        if "events" in data:
+            data["events"] = EventLog(data["events"] or [])
+        
         # Convert handoff packets back
         for key in ["pending_handoffs", "completed_handoffs"]:
             if key in data:
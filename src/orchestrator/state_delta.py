@@ -0,0 +1,259 @@
+"""
+Incremental State Persistence
+
+Tracks what changed in an AssessmentState between writes, for the incremental mode of
+CosmosStatePersistence. The state is stored as several documents in the assessment's
+partition:
+
+- the state document (id = assessment_id): every field except ``events``, with large
+  agent artifacts replaced by ``{"artifact_ref": <document id>}`` and ``event_count``
+- append-only event pages (``<assessment_id>:events:<page>``, events_per_page each)
+- one document per large artifact (``<assessment_id>:artifact:<digest>``)
+
+A StateView is the JSON image of one state in that layout, plus per-field encodings for
+change detection. diff() compares the last persisted view with the latest one and
+returns patch operations (``set`` for changed fields and agent contexts, ``add`` for
+items appended to list fields), the event pages to write and the changed artifacts.
+Event pages are always written whole (the open page up to event_count included), so
+writing a page again after a failed flush leaves it unchanged.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from .state import AgentContext, AssessmentState, StateManager
+
+# Lists the workflow only appends to; appended items become "add" patch operations
+APPEND_FIELDS = (
+    "critical_risks",
+    "pending_handoffs",
+    "completed_handoffs",
+    "findings",
+    "active_conflicts",
+    "resolved_conflicts",
+)
+
+EVENTS_DOC_TYPE = "assessment_events"
+ARTIFACT_DOC_TYPE = "assessment_artifact"
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _pointer(*parts: str) -> str:
+    """JSON Pointer path for a patch operation."""
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+def event_page_id(assessment_id: str, page: int) -> str:
+    return f"{assessment_id}:events:{page:06d}"
+
+
+@dataclass
+class StateView:
+    """JSON image of one AssessmentState in the incremental layout."""
+    assessment_id: str
+    fields: Dict[str, Any] = field(default_factory=dict)
+    encoded: Dict[str, str] = field(default_factory=dict)
+    items: Dict[str, List[str]] = field(default_factory=dict)
+    contexts: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    context_encoded: Dict[str, str] = field(default_factory=dict)
+    context_marks: Dict[str, Tuple] = field(default_factory=dict)
+    artifacts: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    artifact_digests: Dict[str, str] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    event_count: int = 0
+
+
+@dataclass
+class StateDelta:
+    """Writes that bring the persisted documents from one view to the next."""
+    patch_operations: List[Dict[str, Any]]
+    # page -> all of its events up to the new event_count (upserted whole)
+    event_pages: Dict[int, List[Dict[str, Any]]]
+    artifacts: List[Dict[str, Any]]
+
+    @property
+    def empty(self) -> bool:
+        return not (self.patch_operations or self.event_pages or self.artifacts)
+
+
+class StateDeltaTracker:
+    """Builds StateViews and the delta between them."""
+
+    def __init__(
+        self,
+        state_manager: StateManager,
+        events_per_page: int = 100,
+        artifact_inline_limit: int = 16384
+    ):
+        """
+        Initialize StateDeltaTracker.
+
+        Args:
+            state_manager: StateManager for field conversion
+            events_per_page: Events per append-only event page document
+            artifact_inline_limit: Artifacts whose JSON exceeds this many characters
+                are stored as separate documents
+        """
+        self.state_manager = state_manager
+        self.events_per_page = max(1, events_per_page)
+        self.artifact_inline_limit = artifact_inline_limit
+
+    def view(self, state: AssessmentState, previous: Optional[StateView] = None) -> StateView:
+        """
+        JSON image of the state; agent contexts unchanged since ``previous`` are reused.
+
+        The events list is referenced, not copied: it is append-only, so event_count
+        marks the part this view covers.
+        """
+        view = StateView(assessment_id=state["assessment_id"])
+        for key in AssessmentState.__annotations__:
+            if key not in state:
+                continue
+            value = state[key]
+            if key == "events":
+                view.events = value
+                view.event_count = len(value)
+            elif key == "agent_contexts":
+                for agent_id, context in value.items():
+                    self._view_context(view, agent_id, context, previous)
+            elif key in APPEND_FIELDS:
+                # Copied: items appended after this view belong to the next one
+                converted = list(self.state_manager._field_to_dict(key, value))
+                view.fields[key] = converted
+                view.items[key] = [_encode(item) for item in converted]
+            else:
+                converted = self.state_manager._field_to_dict(key, value)
+                view.fields[key] = converted
+                view.encoded[key] = _encode(converted)
+        return view
+
+    def _view_context(
+        self,
+        view: StateView,
+        agent_id: str,
+        context: AgentContext,
+        previous: Optional[StateView]
+    ) -> None:
+        mark = (context.last_updated, context.current_task, len(context.completed_tasks),
+                len(context.pending_tasks), tuple(context.artifacts))
+        if previous is not None and previous.context_marks.get(agent_id) == mark:
+            view.contexts[agent_id] = previous.contexts[agent_id]
+            view.context_encoded[agent_id] = previous.context_encoded[agent_id]
+            view.context_marks[agent_id] = mark
+            for ref in self._artifact_refs(previous.contexts[agent_id]):
+                view.artifacts[ref] = previous.artifacts[ref]
+                view.artifact_digests[ref] = previous.artifact_digests[ref]
+            return
+
+        converted = self.state_manager._agent_context_to_dict(context)
+        artifacts = {}
+        for artifact_id, artifact in converted["artifacts"].items():
+            encoded = _encode(artifact)
+            if len(encoded) <= self.artifact_inline_limit:
+                artifacts[artifact_id] = artifact
+                continue
+            key = hashlib.sha1(f"{agent_id}\0{artifact_id}".encode("utf-8")).hexdigest()[:20]
+            ref = f"{view.assessment_id}:artifact:{key}"
+            artifacts[artifact_id] = {"artifact_ref": ref}
+            view.artifacts[ref] = {
+                "id": ref,
+                "assessment_id": view.assessment_id,
+                "doc_type": ARTIFACT_DOC_TYPE,
+                "agent_id": agent_id,
+                "artifact_id": artifact_id,
+                "content": artifact,
+            }
+            view.artifact_digests[ref] = hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+        converted["artifacts"] = artifacts
+        view.contexts[agent_id] = converted
+        view.context_encoded[agent_id] = _encode(converted)
+        view.context_marks[agent_id] = mark
+
+    @staticmethod
+    def _artifact_refs(context: Dict[str, Any]) -> List[str]:
+        return [a["artifact_ref"] for a in context["artifacts"].values()
+                if isinstance(a, dict) and set(a) == {"artifact_ref"}]
+
+    def state_document(self, view: StateView) -> Dict[str, Any]:
+        """Full state document for the view."""
+        return {
+            "id": view.assessment_id,
+            **view.fields,
+            "agent_contexts": view.contexts,
+            "event_count": view.event_count,
+            "events_per_page": self.events_per_page,
+        }
+
+    def event_pages(self, view: StateView, start: int = 0) -> Dict[int, List[Dict[str, Any]]]:
+        """Events from ``start`` up to the view's event_count, grouped by page."""
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        for index in range(start, view.event_count):
+            pages.setdefault(index // self.events_per_page, []).append(view.events[index])
+        return pages
+
+    def event_page_document(self, assessment_id: str, page: int, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "id": event_page_id(assessment_id, page),
+            "assessment_id": assessment_id,
+            "doc_type": EVENTS_DOC_TYPE,
+            "page": page,
+            "events": events,
+        }
+
+    def diff(self, old: StateView, new: StateView) -> Optional[StateDelta]:
+        """
+        Delta from ``old`` (persisted) to ``new``; None when only a full rewrite fits
+        (events were removed).
+        """
+        if new.event_count < old.event_count:
+            return None
+
+        operations: List[Dict[str, Any]] = []
+        for key, value in new.fields.items():
+            if key in APPEND_FIELDS:
+                old_items, new_items = old.items.get(key), new.items[key]
+                if old_items == new_items:
+                    continue
+                if old_items is not None and new_items[:len(old_items)] == old_items:
+                    operations.extend({"op": "add", "path": _pointer(key, "-"), "value": item}
+                                      for item in value[len(old_items):])
+                else:
+                    operations.append({"op": "set", "path": _pointer(key), "value": value})
+            elif old.encoded.get(key) != new.encoded[key]:
+                operations.append({"op": "set", "path": _pointer(key), "value": value})
+
+        for agent_id, context in new.contexts.items():
+            if old.context_encoded.get(agent_id) != new.context_encoded[agent_id]:
+                operations.append({"op": "set", "path": _pointer("agent_contexts", agent_id), "value": context})
+        for agent_id in old.contexts.keys() - new.contexts.keys():
+            operations.append({"op": "remove", "path": _pointer("agent_contexts", agent_id)})
+
+        event_pages: Dict[int, List[Dict[str, Any]]] = {}
+        if new.event_count != old.event_count:
+            operations.append({"op": "set", "path": "/event_count", "value": new.event_count})
+            # From the start of the last persisted (possibly partly filled) page
+            first_page = old.event_count // self.events_per_page
+            event_pages = self.event_pages(new, first_page * self.events_per_page)
+
+        artifacts = [doc for ref, doc in new.artifacts.items()
+                     if old.artifact_digests.get(ref) != new.artifact_digests[ref]]
+        return StateDelta(operations, event_pages, artifacts)
+
+    @staticmethod
+    def with_documents(persisted: StateView, view: StateView) -> StateView:
+        """
+        Baseline after ``view``'s event pages and artifacts were written but its state
+        document was not: ``persisted``'s fields with ``view``'s events and artifacts.
+        """
+        return replace(
+            persisted,
+            events=view.events,
+            event_count=view.event_count,
+            artifacts={**persisted.artifacts, **view.artifacts},
+            artifact_digests={**persisted.artifact_digests, **view.artifact_digests},
+        )
@@ -5,12 +5,16 @@ Orchestrates the complete assessment workflow through three phases:
 1. Assessment and Discovery
 2. Design and Conflict Resolution
 3. Migration Planning
+
+Within a phase, tasks that do not depend on each other run concurrently
+(see scheduler.PhaseScheduler).
 """
 
 from typing import Dict, Any, Optional
-from .state import AssessmentState, AssessmentPhase, StateManager
+from .state import AssessmentState, AssessmentPhase, AgentID, StateManager
 from .supervisor import Supervisor
 from .handoff import HandoffManager
+from .scheduler import PhaseScheduler, MAX_CONCURRENCY, TASK_BUDGET
 from .phases import AssessmentPhase as AssessmentPhaseHandler, DesignPhase, MigrationPhase
 
 
@@ -23,7 +27,11 @@ class WorkflowOrchestrator:
         self,
         state_manager: StateManager,
         supervisor: Supervisor,
-        handoff_manager: HandoffManager
+        handoff_manager: HandoffManager,
+        agents: Optional[Dict[str, Any]] = None,
+        rag_retriever=None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        task_budget: int = TASK_BUDGET
     ):
         """
         Initialize WorkflowOrchestrator.
@@ -32,10 +40,48 @@ class WorkflowOrchestrator:
             state_manager: StateManager instance
             supervisor: Supervisor instance
             handoff_manager: HandoffManager instance
+            agents: Agent instances by agent ID (or None to create all personas)
+            rag_retriever: RAG retriever for the created agents
+            max_concurrency: Max agent tasks running at once
+            task_budget: Max agent tasks started per phase
         """
         self.state_manager = state_manager
         self.supervisor = supervisor
         self.handoff_manager = handoff_manager
+        if agents is None:
+            agents = self._create_agents(supervisor.model_layer, state_manager, rag_retriever)
+        self.scheduler = PhaseScheduler(
+            handoff_manager,
+            agents,
+            max_concurrency=max_concurrency,
+            task_budget=task_budget
+        )
+    
+    @staticmethod
+    def _create_agents(model_layer, state_manager: StateManager, rag_retriever) -> Dict[str, Any]:
+        """Create one instance of every agent persona"""
+        from .agents import (
+            MarcusSterling, ElenaBridges, ArisThorne, LeoVance,
+            PriyaDesai, RaviPatel, KenjiSato
+        )
+        
+        agent_classes = {
+            AgentID.MARCUS_STERLING.value: MarcusSterling,
+            AgentID.ELENA_BRIDGES.value: ElenaBridges,
+            AgentID.ARIS_THORNE.value: ArisThorne,
+            AgentID.LEO_VANCE.value: LeoVance,
+            AgentID.PRIYA_DESAI.value: PriyaDesai,
+            AgentID.RAVI_PATEL.value: RaviPatel,
+            AgentID.KENJI_SATO.value: KenjiSato
+        }
+        return {
+            agent_id: agent_class(
+                model_layer=model_layer,
+                state_manager=state_manager,
+                rag_retriever=rag_retriever
+            )
+            for agent_id, agent_class in agent_classes.items()
+        }
     
     async def execute_phase(
         self,
@@ -63,79 +109,12 @@ class WorkflowOrchestrator:
     
     async def _execute_assessment_phase(self, state: AssessmentState) -> AssessmentState:
         """Execute Phase 1: Assessment and Discovery"""
-        phase_handler = AssessmentPhaseHandler
-        
-        while not phase_handler.is_complete(state):
-            next_task = phase_handler.get_next_task(state)
-            
-            if not next_task.get("agent"):
-                break
-            
-            # Create handoff for the task
-            handoff = await self.handoff_manager.create_handoff(
-                state,
-                from_agent="supervisor",
-                to_agent=next_task["agent"],
-                task_description=next_task["task"]
-            )
-            
-            # Apply handoff
-            state = self.handoff_manager.apply_handoff(state, handoff)
-            
-            # Route through supervisor (which will delegate to agent)
-            state = self.supervisor.route(state)
-        
-        return state
+        return await self.scheduler.run_phase(state, AssessmentPhaseHandler)
     
     async def _execute_design_phase(self, state: AssessmentState) -> AssessmentState:
         """Execute Phase 2: Design and Conflict Resolution"""
-        phase_handler = DesignPhase
-        
-        while not phase_handler.is_complete(state):
-            next_task = phase_handler.get_next_task(state)
-            
-            if not next_task.get("agent"):
-                break
-            
-            # Create handoff
-            handoff = await self.handoff_manager.create_handoff(
-                state,
-                from_agent="supervisor",
-                to_agent=next_task["agent"],
-                task_description=next_task["task"]
-            )
-            
-            # Apply handoff
-            state = self.handoff_manager.apply_handoff(state, handoff)
-            
-            # Route through supervisor
-            state = self.supervisor.route(state)
-        
-        return state
+        return await self.scheduler.run_phase(state, DesignPhase)
     
     async def _execute_migration_phase(self, state: AssessmentState) -> AssessmentState:
         """Execute Phase 3: Migration Planning"""
-        phase_handler = MigrationPhase
-        
-        while not phase_handler.is_complete(state):
-            next_task = phase_handler.get_next_task(state)
-            
-            if not next_task.get("agent"):
-                break
-            
-            # Create handoff
-            handoff = await self.handoff_manager.create_handoff(
-                state,
-                from_agent="supervisor",
-                to_agent=next_task["agent"],
-                task_description=next_task["task"]
-            )
-            
-            # Apply handoff
-            state = self.handoff_manager.apply_handoff(state, handoff)
-            
-            # Route through supervisor
-            state = self.supervisor.route(state)
-        
-        return state
-
+        return await self.scheduler.run_phase(state, MigrationPhase)
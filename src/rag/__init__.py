@@ -2,12 +2,16 @@
 RAG Layer Module
 
 Retrieval-Augmented Generation for agent knowledge base queries.
-Supports both Google File Search and Azure AI Search.
+Supports Google File Search, a local vector index (optionally hybrid with BM25)
+and Azure AI Search.
 """
 
 from .base_retriever import BaseRetriever
 from .google_file_search import GoogleFileSearchRetriever
+from .local_vector_index import LocalVectorRetriever
+from .hybrid_retriever import HybridRetriever
 from .agentic_retrieval import AgenticRetriever
+from .retrieval_policy import RetrievalPolicy
 from .factory import (
     load_rag_config,
     create_rag_retriever,
@@ -18,7 +22,10 @@ from .factory import (
 __all__ = [
     "BaseRetriever",
     "GoogleFileSearchRetriever",
+    "LocalVectorRetriever",
+    "HybridRetriever",
     "AgenticRetriever",
+    "RetrievalPolicy",
     "load_rag_config",
     "create_rag_retriever",
     "create_agentic_retriever",
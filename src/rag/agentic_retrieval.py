@@ -3,10 +3,16 @@ Agentic RAG Retrieval
 
 Implements agentic retrieval pattern where agents decide when to search
 and generate their own queries based on context.
+
+Each decision (retrieve?, query, relevant?) is first made by the local
+RetrievalPolicy; the model is asked only when the local answer is unsure.
 """
 
+import asyncio
 from typing import Dict, Any, Optional, Tuple
 from .base_retriever import BaseRetriever
+from .hybrid_retriever import format_citations
+from .retrieval_policy import Decision, RetrievalPolicy
 
 
 class AgenticRetriever:
@@ -19,16 +25,30 @@ class AgenticRetriever:
     - Agents evaluate retrieved documents for relevance
     """
     
-    def __init__(self, retriever: BaseRetriever, model_layer=None):
+    def __init__(self, retriever: BaseRetriever, model_layer=None, policy: Optional[RetrievalPolicy] = None):
         """
         Initialize Agentic Retriever.
         
         Args:
             retriever: Base retriever implementation (Google File Search, Azure AI Search, etc.)
             model_layer: Model Layer for query generation and relevance evaluation
+            policy: Local decision policy; None sends every decision to the model
         """
         self.retriever = retriever
         self.model_layer = model_layer
+        self.policy = policy
+    
+    def _local(self, tier: str, decision: Optional[Decision]) -> bool:
+        """True when the local decision stands (confident, or no model to ask)."""
+        if decision is None:
+            return False
+        local = not self.model_layer or self.policy.confident(decision)
+        self.policy.record(tier, local)
+        return local
+    
+    def stats(self) -> Dict[str, Any]:
+        """Local vs model decisions per tier (empty without a policy)."""
+        return self.policy.stats() if self.policy else {}
     
     async def should_retrieve(
         self,
@@ -45,6 +65,15 @@ class AgenticRetriever:
         Returns:
             True if retrieval is recommended
         """
+        decision = self.policy.should_retrieve(task_description, agent_context) if self.policy else None
+        return await self._should_retrieve(decision, agent_context, task_description)
+    
+    async def _should_retrieve(self, decision: Optional[Decision], agent_context: str, task_description: str) -> bool:
+        if self._local("should_retrieve", decision):
+            return decision.value
+        return await self._model_should_retrieve(agent_context, task_description)
+    
+    async def _model_should_retrieve(self, agent_context: str, task_description: str) -> bool:
         if not self.model_layer:
             # Without model layer, always retrieve if task suggests it
             retrieval_keywords = ["caf", "mca", "azure", "landing zone", "security", "framework"]
@@ -82,6 +111,20 @@ class AgenticRetriever:
         Returns:
             Generated search query
         """
+        decision = self.policy.generate_query(task_description, agent_context) if self.policy else None
+        return await self._generate_query(decision, task_description, agent_context)
+    
+    async def _generate_query(
+        self,
+        decision: Optional[Decision],
+        task_description: str,
+        agent_context: Optional[str]
+    ) -> str:
+        if self._local("generate_query", decision):
+            return decision.value
+        return await self._model_generate_query(task_description, agent_context)
+    
+    async def _model_generate_query(self, task_description: str, agent_context: Optional[str]) -> str:
         if not self.model_layer:
             # Simple keyword extraction
             return task_description
@@ -120,6 +163,12 @@ class AgenticRetriever:
         Returns:
             Tuple of (is_relevant, explanation)
         """
+        decision = self.policy.evaluate_relevance(retrieved_content, task_description) if self.policy else None
+        if self._local("evaluate_relevance", decision):
+            return decision.value, decision.reason
+        return await self._model_evaluate_relevance(retrieved_content, task_description)
+    
+    async def _model_evaluate_relevance(self, retrieved_content: str, task_description: str) -> Tuple[bool, str]:
         if not self.model_layer:
             # Simple heuristic: if content is not empty, consider it relevant
             return len(retrieved_content) > 0, "Content retrieved"
@@ -173,30 +222,56 @@ class AgenticRetriever:
         Returns:
             Retrieved and evaluated context, or None
         """
-        # Step 1: Decide if retrieval is needed
-        should_retrieve = await self.should_retrieve(
-            agent_context or "",
-            task_description
-        )
-        
-        if not should_retrieve:
-            return None
-        
-        # Step 2: Generate search query
-        query = await self.generate_query(task_description, agent_context)
+        # Step 1 and 2: Decide if retrieval is needed and generate the search query.
+        # When neither can be settled locally, ask the model for both at once; the
+        # query is discarded if retrieval turns out to be unnecessary.
+        retrieve_decision = query_decision = None
+        if self.policy:
+            retrieve_decision = self.policy.should_retrieve(task_description, agent_context or "")
+            query_decision = self.policy.generate_query(task_description, agent_context)
+        if self.policy and self.model_layer and not (
+            self.policy.confident(retrieve_decision) or self.policy.confident(query_decision)
+        ):
+            self.policy.record("should_retrieve", False)
+            self.policy.record("generate_query", False)
+            should_retrieve, query = await asyncio.gather(
+                self._model_should_retrieve(agent_context or "", task_description),
+                self._model_generate_query(task_description, agent_context)
+            )
+            if not should_retrieve:
+                return None
+        else:
+            should_retrieve = await self._should_retrieve(
+                retrieve_decision,
+                agent_context or "",
+                task_description
+            )
+            
+            if not should_retrieve:
+                return None
+            
+            query = await self._generate_query(query_decision, task_description, agent_context)
         
-        # Step 3: Retrieve from knowledge base
-        retrieved_content = await self.retrieve(query, {
+        # Step 3: Retrieve from knowledge base. Retrievers with chunk citations let the
+        # relevance check read short snippets instead of a prefix of the whole result.
+        retrieval_context = {
             "task": task_description,
             "agent_context": agent_context
-        })
+        }
+        citations = await self.retriever.retrieve_citations(query, retrieval_context)
+        if citations:
+            retrieved_content = format_citations(citations)
+            evaluated_content = "\n\n".join(c["snippet"] for c in citations)
+        else:
+            retrieved_content = await self.retrieve(query, retrieval_context)
+            evaluated_content = retrieved_content
         
         if not retrieved_content:
             return None
         
         # Step 4: Evaluate relevance
         is_relevant, explanation = await self.evaluate_relevance(
-            retrieved_content,
+            evaluated_content,
             task_description
         )
         
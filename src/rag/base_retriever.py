@@ -34,6 +34,26 @@ class BaseRetriever(ABC):
         """
         pass
     
+    async def retrieve_citations(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve matching chunks with citations.
+        
+        Args:
+            query: Search query
+            context: Additional context for the query
+            top_k: Number of results to return
+            
+        Returns:
+            Chunks as dicts with source, chunk, text and snippet; empty if the
+            retriever does not return chunk-level results
+        """
+        return []
+    
     @abstractmethod
     async def upload_document(
         self,
@@ -10,7 +10,10 @@ from pathlib import Path
 from typing import Optional
 
 from .google_file_search import GoogleFileSearchRetriever
+from .local_vector_index import LocalVectorRetriever, azure_openai_batch_embedder, hashing_embedder
+from .hybrid_retriever import HybridRetriever
 from .agentic_retrieval import AgenticRetriever
+from .retrieval_policy import RetrievalPolicy
 from .base_retriever import BaseRetriever
 
 
@@ -61,6 +64,10 @@ def create_rag_retriever(
     
     if provider == "google_file_search":
         return _create_google_file_search_retriever(config)
+    elif provider == "local_vector":
+        return _create_local_vector_retriever(config)
+    elif provider == "hybrid":
+        return _create_hybrid_retriever(config)
     elif provider == "azure_ai_search":
         # Azure AI Search not yet implemented
         print("Warning: Azure AI Search not yet implemented, using Google File Search")
@@ -94,6 +101,57 @@ def _create_google_file_search_retriever(config: dict) -> Optional[GoogleFileSea
         return None
 
 
+def _create_local_vector_retriever(config: dict) -> Optional[LocalVectorRetriever]:
+    """Create local vector index retriever"""
+    local_config = config.get("local_vector", {})
+    ingestion = config.get("ingestion", {})
+    
+    index_dir = os.getenv(local_config.get("index_dir_env", "RAG_INDEX_DIR")) or local_config.get("index_dir", "data/rag-index")
+    if not os.path.isabs(index_dir):
+        index_dir = str(Path(__file__).resolve().parents[2] / index_dir)
+    
+    embedding = local_config.get("embedding", "hashing")
+    if embedding == "azure_openai":
+        deployment_env = local_config.get("embedding_deployment_env", "AZURE_OPENAI_EMBEDDING_DEPLOYMENT")
+        deployment = os.getenv(deployment_env)
+        if not deployment:
+            print(f"Warning: {deployment_env} not set, RAG will not be available")
+            return None
+        embed = azure_openai_batch_embedder(deployment)
+    else:
+        embed = hashing_embedder(int(local_config.get("dimensions", 512)))
+    
+    try:
+        return LocalVectorRetriever(
+            index_dir=index_dir,
+            embed=embed,
+            chunk_size=int(ingestion.get("chunk_size", 1000)),
+            chunk_overlap=int(ingestion.get("chunk_overlap", 200)),
+            batch_size=int(ingestion.get("batch_size", 64))
+        )
+    except Exception as e:
+        print(f"Error creating local vector retriever: {e}")
+        return None
+
+
+def _create_hybrid_retriever(config: dict) -> Optional[HybridRetriever]:
+    """Create hybrid BM25 + vector retriever over the local vector index"""
+    vector_retriever = _create_local_vector_retriever(config)
+    if vector_retriever is None:
+        return None
+    
+    hybrid_config = config.get("hybrid", {})
+    return HybridRetriever(
+        vector_retriever=vector_retriever,
+        k1=float(hybrid_config.get("bm25_k1", 1.5)),
+        b=float(hybrid_config.get("bm25_b", 0.75)),
+        rrf_k=int(hybrid_config.get("rrf_k", 60)),
+        candidates=int(hybrid_config.get("candidates", 20)),
+        cache_size=int(hybrid_config.get("cache_size", 256)),
+        snippet_length=int(hybrid_config.get("snippet_length", 240))
+    )
+
+
 def create_agentic_retriever(
     base_retriever: Optional[BaseRetriever],
     config: Optional[dict] = None,
@@ -122,7 +180,8 @@ def create_agentic_retriever(
     if enabled:
         return AgenticRetriever(
             retriever=base_retriever,
-            model_layer=model_layer
+            model_layer=model_layer,
+            policy=RetrievalPolicy.from_config(agentic_config.get("heuristics"))
         )
     else:
         # Return base retriever without agentic wrapper
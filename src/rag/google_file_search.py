@@ -5,8 +5,11 @@ Implementation using Google Gemini API File Search for RAG.
 This is a fully managed RAG system that handles embeddings and retrieval automatically.
 """
 
+import asyncio
 import os
-from typing import Dict, Any, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional
 import google.generativeai as genai
 from .base_retriever import BaseRetriever
 
@@ -20,8 +23,15 @@ class GoogleFileSearchRetriever(BaseRetriever):
     - Chunking
     - Embeddings
     - Vector search
+    
+    Resolved file handles and the model object are kept for the session: a handle is
+    fetched again (concurrently with the other stale ones) only once it is close to
+    its expiration_time, and blocking SDK calls run in worker threads.
     """
     
+    # Refresh a handle this long before Google expires the file
+    HANDLE_REFRESH_MARGIN = timedelta(minutes=5)
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -52,6 +62,57 @@ class GoogleFileSearchRetriever(BaseRetriever):
         # Track uploaded files
         self.uploaded_files = []
         self.model_name = "gemini-flash-latest"
+        
+        # Session cache: file name -> resolved handle, in-flight refreshes, model object
+        self._file_handles: Dict[str, Any] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._model = None
+        self._model_key = None
+    
+    def _handle_expired(self, file_obj) -> bool:
+        expires = getattr(file_obj, "expiration_time", None)
+        if not expires:
+            return False
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=timezone.utc)
+        return expires - self.HANDLE_REFRESH_MARGIN <= datetime.now(timezone.utc)
+    
+    async def _refresh_handle(self, file_name: str):
+        try:
+            file_obj = await asyncio.to_thread(self.client.get_file, file_name)
+            self._file_handles[file_name] = file_obj
+            return file_obj
+        except Exception as e:
+            print(f"Error getting file {file_name}: {e}")
+            self._file_handles.pop(file_name, None)
+            return None
+        finally:
+            if self._refreshing.get(file_name) is asyncio.current_task():
+                del self._refreshing[file_name]
+    
+    async def _get_file_handles(self) -> List[Any]:
+        """Cached handles for the uploaded files, refreshing missing or expiring ones in parallel."""
+        loop = asyncio.get_running_loop()
+        pending = []
+        for file_name in self.uploaded_files:
+            cached = self._file_handles.get(file_name)
+            if cached is not None and not self._handle_expired(cached):
+                continue
+            # Share a refresh already started by a concurrent retrieve() on this loop
+            task = self._refreshing.get(file_name)
+            if task is None or task.get_loop() is not loop:
+                task = loop.create_task(self._refresh_handle(file_name))
+                self._refreshing[file_name] = task
+            pending.append(task)
+        if pending:
+            await asyncio.gather(*pending)
+        return [self._file_handles[name] for name in self.uploaded_files if name in self._file_handles]
+    
+    def _get_model(self):
+        if self._model is None or self._model_key != self.model_name:
+            self._model = self.client.GenerativeModel(model_name=self.model_name)
+            self._model_key = self.model_name
+        return self._model
     
     async def retrieve(
         self,
@@ -75,20 +136,11 @@ class GoogleFileSearchRetriever(BaseRetriever):
                 print("Warning: No files uploaded for retrieval")
                 return None
                 
-            # Get file handles
-            file_handles = []
-            for file_name in self.uploaded_files:
-                try:
-                    file_obj = self.client.get_file(file_name)
-                    file_handles.append(file_obj)
-                except Exception as e:
-                    print(f"Error getting file {file_name}: {e}")
-            
+            file_handles = await self._get_file_handles()
             if not file_handles:
                 return None
-                
-            # Create model
-            model = self.client.GenerativeModel(model_name=self.model_name)
+            
+            model = self._get_model()
             
             # Build prompt
             prompt = f"Answer the following query based on the provided documents: {query}\n\n"
@@ -98,7 +150,7 @@ class GoogleFileSearchRetriever(BaseRetriever):
             
             # Generate content with files in context
             content = [prompt] + file_handles
-            response = model.generate_content(content)
+            response = await asyncio.to_thread(model.generate_content, content)
             
             if response and response.text:
                 return response.text
@@ -126,27 +178,32 @@ class GoogleFileSearchRetriever(BaseRetriever):
         try:
             display_name = metadata.get("display_name", os.path.basename(document_path)) if metadata else os.path.basename(document_path)
             
-            uploaded_file = self.client.upload_file(
-                path=document_path,
-                display_name=display_name
-            )
-            
-            # Wait for processing
-            import time
-            while uploaded_file.state.name == "PROCESSING":
-                time.sleep(1)
-                uploaded_file = self.client.get_file(uploaded_file.name)
+            uploaded_file = await asyncio.to_thread(self._upload_and_wait, document_path, display_name)
                 
             if uploaded_file.state.name == "FAILED":
                 print(f"File upload failed: {uploaded_file.state.name}")
                 return False
                 
+            self._file_handles[uploaded_file.name] = uploaded_file
             self.uploaded_files.append(uploaded_file.name)
             return True
         except Exception as e:
             print(f"Error uploading document: {e}")
             return False
     
+    def _upload_and_wait(self, document_path: str, display_name: str):
+        """Upload a file and poll until Google has processed it (blocking)."""
+        uploaded_file = self.client.upload_file(
+            path=document_path,
+            display_name=display_name
+        )
+        
+        # Wait for processing
+        while uploaded_file.state.name == "PROCESSING":
+            time.sleep(1)
+            uploaded_file = self.client.get_file(uploaded_file.name)
+        return uploaded_file
+    
     async def upload_text(
         self,
         text: str,
@@ -0,0 +1,265 @@
+"""
+Hybrid Retriever
+
+BM25 keyword search plus vector search over the chunks of a LocalVectorRetriever,
+merged with reciprocal-rank fusion (RRF):
+
+    score(chunk) = sum over result lists of 1 / (rrf_k + rank)
+
+BM25 finds exact control IDs and product names (SEC-NET-0001, Defender for Cloud)
+that embeddings blur; the vector side finds paraphrases. Results carry citations
+(source, chunk number, short snippet around the matched terms), and recent queries are
+cached until the index changes.
+"""
+
+import asyncio
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base_retriever import BaseRetriever
+from .local_vector_index import LocalVectorRetriever
+
+# Whole identifiers (sec-net-0001, 10.0.0.0) are kept as one term; their parts are
+# indexed too so "network" style partial matches still score.
+_TOKEN = re.compile(r"[a-z0-9]+(?:[-_.][a-z0-9]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or that the this to with".split()
+)
+
+
+def bm25_terms(text: str) -> List[str]:
+    terms = []
+    for token in _TOKEN.findall(text.lower()):
+        if token in _STOPWORDS:
+            continue
+        terms.append(token)
+        if not token.isalnum():
+            terms.extend(p for p in re.split(r"[-_.]", token) if p and p not in _STOPWORDS)
+    return terms
+
+
+def make_snippet(text: str, terms: List[str], length: int = 240) -> str:
+    """~length characters of text around the first matched term (first given first)."""
+    if len(text) <= length:
+        return text
+    lowered = text.lower()
+    position = next((i for i in (lowered.find(t) for t in terms) if i >= 0), 0)
+    start = max(0, min(position - length // 3, len(text) - length))
+    end = start + length
+    if start > 0:
+        start = text.find(" ", start, position if position > start else end) + 1 or start
+    cut = text.rfind(" ", start, end)
+    if end < len(text) and cut > start:
+        end = cut
+    return ("..." if start > 0 else "") + text[start:end].strip() + ("..." if end < len(text) else "")
+
+
+class HybridRetriever(BaseRetriever):
+    """
+    BM25 + vector retriever with reciprocal-rank fusion and chunk citations.
+
+    Uploads go to the wrapped LocalVectorRetriever; the BM25 index follows its chunk
+    list (new rows are indexed on the next search).
+    """
+
+    def __init__(
+        self,
+        vector_retriever: LocalVectorRetriever,
+        k1: float = 1.5,
+        b: float = 0.75,
+        rrf_k: int = 60,
+        candidates: int = 20,
+        cache_size: int = 256,
+        snippet_length: int = 240,
+    ):
+        """
+        Initialize HybridRetriever.
+
+        Args:
+            vector_retriever: Local vector index holding the chunks
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+            rrf_k: RRF rank constant (higher flattens the rank differences)
+            candidates: Results taken from each list before fusion (at least top_k)
+            cache_size: Queries kept in the result cache (0 disables it)
+            snippet_length: Characters per citation snippet
+        """
+        self.vector = vector_retriever
+        self.k1 = k1
+        self.b = b
+        self.rrf_k = rrf_k
+        self.candidates = candidates
+        self.cache_size = cache_size
+        self.snippet_length = snippet_length
+
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._lengths: List[int] = []
+        self._cache: "OrderedDict[Tuple[str, int], List[Dict[str, Any]]]" = OrderedDict()
+        self._cache_version: Tuple[int, int] = (0, 0)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _sync(self) -> None:
+        """Index chunks added to the vector retriever since the last search."""
+        chunks = self.vector.chunks
+        for row in range(len(self._lengths), len(chunks)):
+            terms = bm25_terms(chunks[row]["text"])
+            self._lengths.append(len(terms))
+            counts: Dict[str, int] = {}
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            for term, tf in counts.items():
+                rows, tfs = self._postings.setdefault(term, ([], []))
+                rows.append(row)
+                tfs.append(tf)
+
+    def _bm25(self, terms: List[str], removed: np.ndarray) -> np.ndarray:
+        lengths = np.asarray(self._lengths, dtype=np.float32)
+        live = np.ones(len(lengths), dtype=bool)
+        live[: len(removed)] = ~removed[: len(lengths)]
+        n = max(int(live.sum()), 1)
+        avg_length = float(lengths[live].mean()) if live.any() else 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths / max(avg_length, 1e-9))
+        scores = np.zeros(len(lengths), dtype=np.float32)
+        for term in set(terms):
+            if term not in self._postings:
+                continue
+            rows, tfs = (np.asarray(x) for x in self._postings[term])
+            df = int(live[rows].sum())
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            scores[rows] += idf * tfs * (self.k1 + 1) / (tfs + norm[rows])
+        scores[~live] = 0.0
+        return scores
+
+    def search(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Top-k chunks by reciprocal-rank fusion of BM25 and vector results.
+
+        Each result has source, chunk, text, snippet, score (RRF) and the chunk's rank
+        in each list (None when it was not a candidate there).
+        """
+        key = (" ".join(query.lower().split()), top_k)
+        with self._lock:
+            version = (self.vector.meta["count"], len(self.vector.meta["removed"]))
+            if version != self._cache_version:
+                self._cache.clear()
+                self._cache_version = version
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                # A copy, so callers reordering or trimming results do not change the cache
+                return list(self._cache[key])
+            self.cache_misses += 1
+            self._sync()
+            terms = bm25_terms(query)
+            bm25 = self._bm25(terms, self.vector._removed)
+
+        n_candidates = max(self.candidates, top_k)
+        vector_ranks = {
+            hit["row"]: rank for rank, hit in enumerate(self.vector.search(query, n_candidates), start=1)
+        }
+
+        matched = np.flatnonzero(bm25 > 0)
+        top_bm25 = matched[np.argsort(-bm25[matched], kind="stable")][:n_candidates]
+        bm25_ranks = {int(row): rank for rank, row in enumerate(top_bm25, start=1)}
+
+        fused: Dict[int, float] = {}
+        for ranks in (bm25_ranks, vector_ranks):
+            for row, rank in ranks.items():
+                fused[row] = fused.get(row, 0.0) + 1.0 / (self.rrf_k + rank)
+        best = sorted(fused, key=lambda row: (-fused[row], row))[:top_k]
+
+        # Rarest query terms first, so the snippet centres on the most specific match
+        snippet_terms = sorted(set(terms), key=lambda t: len(self._postings.get(t, ([], []))[0]))
+        results = []
+        for row in best:
+            chunk = self.vector.chunks[row]
+            results.append({
+                "source": chunk["source"],
+                "chunk": chunk["chunk"],
+                "text": chunk["text"],
+                "snippet": make_snippet(chunk["text"], snippet_terms, self.snippet_length),
+                "score": fused[row],
+                "bm25_rank": bm25_ranks.get(row),
+                "vector_rank": vector_ranks.get(row),
+            })
+
+        with self._lock:
+            if self.cache_size > 0 and version == self._cache_version:
+                self._cache[key] = results
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return list(results)
+
+    async def retrieve_citations(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Top-k fused chunks with citations (see search())."""
+        try:
+            return await asyncio.to_thread(self.search, query, top_k)
+        except Exception as e:
+            print(f"Error searching hybrid index: {e}")
+            return []
+
+    async def retrieve(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        top_k: int = 5
+    ) -> Optional[str]:
+        """
+        Retrieve the top-k fused chunks.
+
+        Args:
+            query: Search query
+            context: Additional context (not used)
+            top_k: Number of chunks to return
+
+        Returns:
+            Chunks as cited paragraphs, or None if nothing matched
+        """
+        citations = await self.retrieve_citations(query, context, top_k)
+        return format_citations(citations) if citations else None
+
+    async def upload_document(
+        self,
+        document_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Chunk and index a document in the vector index (BM25 follows on the next search)."""
+        return await self.vector.upload_document(document_path, metadata)
+
+    async def upload_text(
+        self,
+        text: str,
+        display_name: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Chunk and index text content in the vector index."""
+        return await self.vector.upload_text(text, display_name, metadata)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.cache_hits + self.cache_misses
+            return {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "entries": len(self._cache),
+                "hit_rate": round(self.cache_hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def format_citations(citations: List[Dict[str, Any]]) -> str:
+    """Cited chunks as "[n] source #chunk" paragraphs."""
+    return "\n\n".join(
+        f"[{i}] {c['source']} #{c['chunk']}\n{c['text']}" for i, c in enumerate(citations, start=1)
+    )
@@ -0,0 +1,329 @@
+"""
+Local Vector Index Retriever
+
+Offline RAG: documents are chunked and embedded once at upload time into an on-disk
+index, and queries are answered with a top-k cosine search over a memory-mapped matrix.
+
+Index directory layout:
+    vectors.f32   float32 rows (unit length, so cosine is a dot product), append-only
+    chunks.jsonl  one line per row: source, chunk number, text
+    meta.json     dimensions, row count, embedder name, document hashes, removed rows
+
+Re-uploading a changed document appends the new chunks and marks the old rows removed;
+an unchanged document is skipped.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .base_retriever import BaseRetriever
+
+# Batch of texts -> (len(texts), dimensions) array
+BatchEmbedder = Callable[[List[str]], Any]
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9\-]*")
+
+
+def hashing_embedder(dimensions: int = 512) -> BatchEmbedder:
+    """
+    Offline embedding: signed feature hashing of words and word bigrams.
+
+    No model or network needed; similar wording gives similar vectors, which is enough
+    for the keyword-heavy CAF/MCA/security corpus. Swap in a model embedder for
+    semantic matches.
+    """
+    def embed(texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = _TOKEN.findall(text.lower())
+            for feature in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                matrix[row, value % dimensions] += 1.0 if value >> 63 else -1.0
+        return matrix
+
+    embed.name = f"hashing-{dimensions}"
+    return embed
+
+
+def azure_openai_batch_embedder(deployment: str) -> BatchEmbedder:
+    """Embedding deployment on the Azure OpenAI account configured for chat (AZURE_OPENAI_*)."""
+    from openai import AzureOpenAI
+
+    client = AzureOpenAI(
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT", "https://zimax.cognitiveservices.azure.com/"),
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+    )
+
+    def embed(texts: List[str]) -> np.ndarray:
+        response = client.embeddings.create(model=deployment, input=texts)
+        return np.array([item.embedding for item in response.data], dtype=np.float32)
+
+    embed.name = f"azure-openai-{deployment}"
+    return embed
+
+
+def chunk_text(text: str, chunk_size: int = 1000, chunk_overlap: int = 200) -> List[str]:
+    """
+    Split text into ~chunk_size character chunks overlapping by chunk_overlap.
+
+    Chunk ends are moved back to the last paragraph, sentence or word break in the
+    window so chunks do not cut words in half.
+    """
+    text = text.strip()
+    if len(text) <= chunk_size:
+        return [text] if text else []
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            window = text[start:end]
+            for separator in ("\n\n", ". ", "\n", " "):
+                cut = window.rfind(separator)
+                if cut > chunk_size // 2:
+                    end = start + cut + len(separator)
+                    break
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        if end >= len(text):
+            break
+        overlap_start = max(end - chunk_overlap, start + 1)
+        # Begin the overlap at a word start
+        space = text.find(" ", overlap_start, end)
+        start = space + 1 if space != -1 and text[overlap_start - 1] != " " else overlap_start
+    return chunks
+
+
+class LocalVectorRetriever(BaseRetriever):
+    """
+    Retriever over a local, memory-mapped vector index.
+
+    Uploads chunk and embed documents (in a worker thread); retrieve() embeds the query
+    and scores every row with one matrix-vector product.
+    """
+
+    def __init__(
+        self,
+        index_dir: str,
+        embed: Optional[BatchEmbedder] = None,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        batch_size: int = 64,
+    ):
+        """
+        Initialize LocalVectorRetriever.
+
+        Args:
+            index_dir: Directory holding the index (created if missing)
+            embed: Batch embedding function; defaults to the offline hashing embedder
+            chunk_size: Characters per chunk
+            chunk_overlap: Characters shared by consecutive chunks
+            batch_size: Chunks per embedding call
+        """
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.embed = embed or hashing_embedder()
+        self.embedder_name = getattr(self.embed, "name", getattr(self.embed, "__name__", "custom"))
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.batch_size = max(1, batch_size)
+
+        self._vectors_path = self.index_dir / "vectors.f32"
+        self._chunks_path = self.index_dir / "chunks.jsonl"
+        self._meta_path = self.index_dir / "meta.json"
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.ndarray] = None
+        self._load()
+
+    def _load(self) -> None:
+        if self._meta_path.exists():
+            self.meta = json.loads(self._meta_path.read_text())
+            if self.meta.get("embedder") != self.embedder_name:
+                raise ValueError(
+                    f"Index at {self.index_dir} was built with embedder '{self.meta.get('embedder')}', "
+                    f"not '{self.embedder_name}'; use another index_dir or rebuild it"
+                )
+        else:
+            self.meta = {"dimensions": None, "count": 0, "embedder": self.embedder_name,
+                         "documents": {}, "removed": []}
+        count = self.meta["count"]
+        # Cut rows past meta.count (left by a crash mid-add), so later adds append after
+        # the last committed row
+        vector_bytes = count * (self.meta["dimensions"] or 0) * 4
+        if self._vectors_path.exists() and self._vectors_path.stat().st_size > vector_bytes:
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(vector_bytes)
+        self.chunks: List[Dict[str, Any]] = []
+        if self._chunks_path.exists():
+            with open(self._chunks_path, "r+b") as f:
+                lines = list(itertools.islice(f, count))
+                f.truncate(sum(len(line) for line in lines))
+            self.chunks = [json.loads(line) for line in lines]
+        self._removed = np.zeros(self.meta["count"], dtype=bool)
+        self._removed[self.meta["removed"]] = True
+
+    def _vectors(self) -> Optional[np.ndarray]:
+        """Memory-mapped (count, dimensions) matrix, remapped after adds."""
+        count = self.meta["count"]
+        if not count:
+            return None
+        if self._matrix is None or self._matrix.shape[0] != count:
+            self._matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r",
+                                     shape=(count, self.meta["dimensions"]))
+        return self._matrix
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        parts = [np.asarray(self.embed(texts[i:i + self.batch_size]), dtype=np.float32)
+                 for i in range(0, len(texts), self.batch_size)]
+        vectors = np.vstack(parts)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    def add_text(self, text: str, source: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Chunk, embed and append a document; returns the number of chunks added.
+
+        Args:
+            text: Document text
+            source: Document name; re-adding a source replaces its previous chunks
+            metadata: Stored with every chunk
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if self.meta["documents"].get(source, {}).get("sha256") == digest:
+            return 0
+        chunks = chunk_text(text, self.chunk_size, self.chunk_overlap)
+        if not chunks:
+            return 0
+        vectors = self._embed(chunks)  # outside the lock: may be a remote call
+
+        with self._lock:
+            dimensions = self.meta["dimensions"] or vectors.shape[1]
+            if vectors.shape[1] != dimensions:
+                raise ValueError(f"Embedding has {vectors.shape[1]} dimensions, index has {dimensions}")
+            start = self.meta["count"]
+            previous = self.meta["documents"].get(source)
+            if previous:
+                removed = range(previous["start"], previous["start"] + previous["chunks"])
+                self.meta["removed"] = sorted(set(self.meta["removed"]).union(removed))
+
+            with open(self._vectors_path, "ab") as f:
+                f.write(vectors.astype(np.float32).tobytes())
+            with open(self._chunks_path, "a", encoding="utf-8") as f:
+                for i, chunk in enumerate(chunks):
+                    f.write(json.dumps({"source": source, "chunk": i, "text": chunk,
+                                        "metadata": metadata or {}}) + "\n")
+
+            self.chunks.extend({"source": source, "chunk": i, "text": chunk, "metadata": metadata or {}}
+                               for i, chunk in enumerate(chunks))
+            self.meta.update(dimensions=dimensions, count=start + len(chunks))
+            self.meta["documents"][source] = {"sha256": digest, "start": start, "chunks": len(chunks)}
+            self._removed = np.zeros(self.meta["count"], dtype=bool)
+            self._removed[self.meta["removed"]] = True
+            # meta.json last: rows past its count (from a crash mid-add) are cut on load
+            tmp = self._meta_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.meta))
+            os.replace(tmp, self._meta_path)
+        return len(chunks)
+
+    def search(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """Top-k chunks by cosine similarity, best first, each with its score and index row."""
+        with self._lock:
+            matrix = self._vectors()
+            removed = self._removed
+        if matrix is None or not query.strip():
+            return []
+        scores = matrix @ self._embed([query])[0]
+        scores[removed] = -np.inf
+        k = min(top_k, int((~removed).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [{**self.chunks[i], "score": float(scores[i]), "row": int(i)} for i in top]
+
+    async def retrieve(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        top_k: int = 5
+    ) -> Optional[str]:
+        """
+        Retrieve the top-k chunks for the query.
+
+        Args:
+            query: Search query
+            context: Additional context (not used)
+            top_k: Number of chunks to return
+
+        Returns:
+            Chunks as "[source] text" paragraphs, or None if the index is empty
+        """
+        try:
+            results = await asyncio.to_thread(self.search, query, top_k)
+        except Exception as e:
+            print(f"Error searching local vector index: {e}")
+            return None
+        if not results:
+            return None
+        return "\n\n".join(f"[{r['source']}] {r['text']}" for r in results)
+
+    async def upload_document(
+        self,
+        document_path: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Chunk and index a text document.
+
+        Args:
+            document_path: Path to document file (read as UTF-8 text)
+            metadata: Document metadata (display_name names the source)
+
+        Returns:
+            True if successful
+        """
+        try:
+            source = (metadata or {}).get("display_name", os.path.basename(document_path))
+            with open(document_path, "r", encoding="utf-8", errors="replace") as f:
+                text = f.read()
+            await asyncio.to_thread(self.add_text, text, source, metadata)
+            return True
+        except Exception as e:
+            print(f"Error indexing document: {e}")
+            return False
+
+    async def upload_text(
+        self,
+        text: str,
+        display_name: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Chunk and index text content directly.
+
+        Args:
+            text: Text content
+            display_name: Source name for the document
+            metadata: Document metadata
+
+        Returns:
+            True if successful
+        """
+        try:
+            await asyncio.to_thread(self.add_text, text, display_name, metadata)
+            return True
+        except Exception as e:
+            print(f"Error indexing text: {e}")
+            return False
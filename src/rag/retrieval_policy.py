@@ -0,0 +1,192 @@
+"""
+Retrieval Decision Policy
+
+Cheap local classifiers for the three agentic retrieval decisions, each returning a
+confidence so AgenticRetriever only asks the model when the local answer is unsure:
+
+- should retrieve: compiled knowledge-base / internal-task keyword sets
+- search query: the task description, trimmed to its key terms, when it already
+  names a knowledge-base topic
+- relevance: TF-IDF cosine between the task and the best-matching paragraph of the
+  retrieved content
+
+Counters record how often each tier answered locally (one model call saved each).
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+# Topics covered by the knowledge base (CAF, WAF, MCA guides, Azure security docs)
+KNOWLEDGE_BASE_KEYWORDS = (
+    "caf", "cloud adoption framework", "waf", "well-architected", "mca",
+    "microsoft customer agreement", "billing", "invoice section", "management group",
+    "landing zone", "azure", "entra", "rbac", "conditional access", "policy",
+    "security", "framework", "best practice", "compliance", "benchmark", "guidance",
+)
+# Bookkeeping tasks that work on assessment state, not reference material
+INTERNAL_TASK_KEYWORDS = (
+    "collate", "status report", "schedule", "timeline", "dependency",
+    "budget approval", "summarize findings", "track",
+)
+
+_STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or that the this to
+with within without based using use via per all any each our their your we you they
+task context please provide generate create perform run do make need needs required
+""".split())
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9\-]*")
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> "re.Pattern[str]":
+    alternatives = sorted((re.escape(k) for k in keywords), key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(alternatives) + r")s?\b")
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS and len(t) > 1]
+
+
+def tfidf_relevance(task: str, content: str) -> float:
+    """
+    Max TF-IDF cosine between the task and any paragraph of the content.
+
+    Paragraphs (blank-line separated, or ~80-word windows for unbroken text) plus the
+    task form the corpus, so terms common to every paragraph weigh little.
+    """
+    paragraphs = [p for p in re.split(r"\n\s*\n", content) if p.strip()]
+    if len(paragraphs) <= 1:
+        words = content.split()
+        paragraphs = [" ".join(words[i:i + 80]) for i in range(0, len(words), 80)]
+    docs = [Counter(tokenize(task))] + [Counter(tokenize(p)) for p in paragraphs]
+    docs = [d for d in docs if d]
+    if len(docs) < 2 or not docs[0]:
+        return 0.0
+
+    df = Counter(term for doc in docs for term in doc)
+    n = len(docs)
+
+    def vector(doc: Counter) -> Dict[str, float]:
+        return {t: (1 + math.log(c)) * math.log((1 + n) / (1 + df[t]) + 1) for t, c in doc.items()}
+
+    def cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+        dot = sum(w * b.get(t, 0.0) for t, w in a.items())
+        norm = math.sqrt(sum(w * w for w in a.values())) * math.sqrt(sum(w * w for w in b.values()))
+        return dot / norm if norm else 0.0
+
+    query = vector(docs[0])
+    return max(cosine(query, vector(doc)) for doc in docs[1:])
+
+
+@dataclass(frozen=True)
+class Decision:
+    """A local answer and how sure the classifier is (0-1)."""
+    value: Any
+    confidence: float
+    reason: str = ""
+
+
+class RetrievalPolicy:
+    """
+    Local classifiers for AgenticRetriever with per-tier counters.
+
+    A decision with confidence below ``min_confidence`` should be escalated to the model.
+    """
+
+    TIERS = ("should_retrieve", "generate_query", "evaluate_relevance")
+
+    def __init__(
+        self,
+        min_confidence: float = 0.75,
+        relevance_accept: float = 0.2,
+        relevance_reject: float = 0.05,
+        max_query_terms: int = 16,
+    ):
+        """
+        Initialize RetrievalPolicy.
+
+        Args:
+            min_confidence: Local decisions below this are escalated to the model
+            relevance_accept: TF-IDF score at or above which content is relevant
+            relevance_reject: TF-IDF score at or below which content is not relevant
+            max_query_terms: Longest task (in key terms) used directly as a query
+        """
+        self.min_confidence = min_confidence
+        self.relevance_accept = relevance_accept
+        self.relevance_reject = relevance_reject
+        self.max_query_terms = max_query_terms
+        self._kb = _keyword_pattern(KNOWLEDGE_BASE_KEYWORDS)
+        self._internal = _keyword_pattern(INTERNAL_TASK_KEYWORDS)
+        self._lock = threading.Lock()
+        self._counts = {tier: {"local": 0, "model": 0} for tier in self.TIERS}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["RetrievalPolicy"]:
+        """Policy from the agentic_retrieval.heuristics section of rag.yaml (None if disabled)."""
+        config = config or {}
+        if not config.get("enabled", True):
+            return None
+        return cls(
+            min_confidence=float(config.get("min_confidence", 0.75)),
+            relevance_accept=float(config.get("relevance_accept", 0.2)),
+            relevance_reject=float(config.get("relevance_reject", 0.05)),
+        )
+
+    def confident(self, decision: Decision) -> bool:
+        return decision.confidence >= self.min_confidence
+
+    def record(self, tier: str, local: bool) -> None:
+        with self._lock:
+            self._counts[tier]["local" if local else "model"] += 1
+
+    def should_retrieve(self, task_description: str, agent_context: str = "") -> Decision:
+        task = task_description.lower()
+        topics = set(self._kb.findall(task))
+        internal = set(self._internal.findall(task))
+        if topics and not internal:
+            confidence = 0.9 if len(topics) >= 2 else 0.8
+            return Decision(True, confidence, f"knowledge base topics: {', '.join(sorted(topics))}")
+        if internal and not topics:
+            return Decision(False, 0.85, f"internal task: {', '.join(sorted(internal))}")
+        if topics and internal:
+            return Decision(True, 0.5, "mixed internal and knowledge base terms")
+        # Nothing in the task; the context may still point at the knowledge base
+        if self._kb.search(agent_context.lower()):
+            return Decision(True, 0.55, "knowledge base topic in context only")
+        return Decision(False, 0.6, "no knowledge base topic")
+
+    def generate_query(self, task_description: str, agent_context: Optional[str] = None) -> Decision:
+        terms = tokenize(task_description)
+        if not terms:
+            return Decision(task_description, 0.0, "empty task")
+        query = " ".join(dict.fromkeys(terms))  # key terms, first occurrence order
+        names_topic = bool(self._kb.search(task_description.lower()))
+        if names_topic and len(terms) <= self.max_query_terms:
+            return Decision(query, 0.85, "task names a knowledge base topic")
+        return Decision(query, 0.5, "task too long or too vague for a direct query")
+
+    def evaluate_relevance(self, retrieved_content: str, task_description: str) -> Decision:
+        if not retrieved_content.strip():
+            return Decision(False, 1.0, "empty content")
+        score = tfidf_relevance(task_description, retrieved_content)
+        if score >= self.relevance_accept:
+            return Decision(True, 0.9, f"tf-idf {score:.2f}")
+        if score <= self.relevance_reject:
+            return Decision(False, 0.85, f"tf-idf {score:.2f}")
+        return Decision(score >= (self.relevance_accept + self.relevance_reject) / 2, 0.5, f"tf-idf {score:.2f}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-tier local/model counts; every local decision saved one model call."""
+        with self._lock:
+            tiers = {tier: dict(c) for tier, c in self._counts.items()}
+        saved = {tier: c["local"] for tier, c in tiers.items()}
+        return {
+            "tiers": tiers,
+            "model_calls": sum(c["model"] for c in tiers.values()),
+            "model_calls_saved": sum(saved.values()),
+            "model_calls_saved_by_tier": saved,
+        }
@@ -2,12 +2,15 @@
 Event Aggregator
 
 Aggregates and processes events for visualization.
+Reads the indexes and running aggregates of the state's EventLog instead of walking
+every event.
 """
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
 from ..orchestrator.state import AssessmentState
+from ..orchestrator.event_store import EventLog
 
 
 class EventAggregator:
@@ -32,16 +35,7 @@ class EventAggregator:
         Returns:
             Dictionary mapping domains to event lists
         """
-        events = state.get("events", [])
-        
-        domain_events = {}
-        for event in events:
-            domain = event.get("domain", "Unknown")
-            if domain not in domain_events:
-                domain_events[domain] = []
-            domain_events[domain].append(event)
-        
-        return domain_events
+        return EventLog.for_state(state).domains()
     
     def aggregate_by_agent(
         self,
@@ -56,16 +50,7 @@ class EventAggregator:
         Returns:
             Dictionary mapping agent IDs to event lists
         """
-        events = state.get("events", [])
-        
-        agent_events = {}
-        for event in events:
-            agent_id = event.get("agent_id", "unknown")
-            if agent_id not in agent_events:
-                agent_events[agent_id] = []
-            agent_events[agent_id].append(event)
-        
-        return agent_events
+        return EventLog.for_state(state).agents()
     
     def get_timeline(
         self,
@@ -82,28 +67,10 @@ class EventAggregator:
         Returns:
             List of events within the time window
         """
-        events = state.get("events", [])
-        
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
         
-        timeline_events = []
-        for event in events:
-            event_time_str = event.get("timestamp", "")
-            try:
-                event_time = datetime.fromisoformat(event_time_str.replace("Z", "+00:00"))
-                if event_time >= cutoff_time:
-                    timeline_events.append(event)
-            except Exception:
-                # If timestamp parsing fails, include the event
-                timeline_events.append(event)
-        
-        # Sort by timestamp
-        timeline_events.sort(
-            key=lambda e: e.get("timestamp", ""),
-            reverse=True
-        )
-        
-        return timeline_events
+        # Newest first, stopping at the cutoff
+        return EventLog.for_state(state).since(cutoff_time)
     
     def calculate_metrics(
         self,
@@ -118,21 +85,17 @@ class EventAggregator:
         Returns:
             Dictionary with calculated metrics
         """
-        events = state.get("events", [])
+        events = EventLog.for_state(state)
         findings = state.get("findings", [])
         
         total_events = len(events)
         total_findings = len(findings)
         
         # Average impact score
-        impact_scores = [e.get("impact_score", 0) for e in events]
-        avg_impact = sum(impact_scores) / len(impact_scores) if impact_scores else 0
+        avg_impact = events.impact_sum / total_events if total_events else 0
         
         # Events by type
-        event_types = {}
-        for event in events:
-            event_type = event.get("type", "unknown")
-            event_types[event_type] = event_types.get(event_type, 0) + 1
+        event_types = events.type_counts()
         
         # Critical findings count
         critical_findings = len([
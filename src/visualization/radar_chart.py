@@ -9,6 +9,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 
 from ..orchestrator.state import AssessmentState
+from ..orchestrator.event_store import EventLog
 
 
 class RadarChartGenerator:
@@ -49,7 +50,7 @@ class RadarChartGenerator:
         Returns:
             Dictionary mapping domain names to scores (0-100)
         """
-        events = state.get("events", [])
+        domain_stats = EventLog.for_state(state).domain_stats()
         findings = state.get("findings", [])
         
         domain_scores = {domain: 0.0 for domain in self.DOMAINS}
@@ -68,15 +69,13 @@ class RadarChartGenerator:
             "Logging": "Monitoring"
         }
         
-        # Calculate scores from events
-        for event in events:
-            domain = event.get("domain", "")
+        # Calculate scores from the running per-domain event aggregates
+        for domain, stats in domain_stats.items():
             mapped_domain = domain_mapping.get(domain, domain)
             
             if mapped_domain in domain_scores:
-                impact_score = event.get("impact_score", 0)
-                domain_scores[mapped_domain] += impact_score
-                domain_weights[mapped_domain] += 1
+                domain_scores[mapped_domain] += stats["impact_sum"]
+                domain_weights[mapped_domain] += stats["count"]
         
         # Calculate scores from findings
         for finding in findings: